@@ -24,6 +24,21 @@ if _MOCK_ALL_TOOLS:
     coordinator_agent.before_tool_callback = mock_all_tools_callback
     logger.info("🎭 Evaluation mode: All tools will be mocked")
 
+# Record or replay model calls when EVAL_CASSETTE_MODE is set
+if os.getenv("EVAL_CASSETTE_MODE"):
+    from application.agents.eval_cassettes import (
+        get_cassette_recorder,
+        install_cassette_callbacks,
+    )
+
+    _recorder = get_cassette_recorder()
+    if _recorder is not None:
+        _count = install_cassette_callbacks(coordinator_agent, _recorder)
+        logger.info(
+            f"📼 Evaluation mode: model calls {_recorder.mode} "
+            f"via cassettes in {_recorder.store.directory} ({_count} agents)"
+        )
+
 # Use coordinator agent as root agent for evaluation
 root_agent = coordinator_agent
 
@@ -12,16 +12,19 @@ from application.agents.environment.agent import root_agent as environment_agent
 from application.agents.github.agent import root_agent as github_agent
 from application.agents.qa.agent import root_agent as qa_agent
 from application.agents.shared import get_model_config
-from application.agents.shared.prompts import create_instruction_provider
+from application.agents.shared.prompts import create_split_instruction
 
 logger = logging.getLogger(__name__)
 
+_instructions = create_split_instruction("coordinator")
+
 # Create coordinator agent with sub-agents
 root_agent = LlmAgent(
     name="coordinator",
     model=get_model_config(),
     description="Coordinator - routes user requests to the appropriate specialist agent",
-    instruction=create_instruction_provider("coordinator"),
+    static_instruction=_instructions.static_instruction,
+    instruction=_instructions.instruction,
     tools=[],
     sub_agents=[
         qa_agent,
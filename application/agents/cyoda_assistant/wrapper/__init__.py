@@ -46,6 +46,8 @@ class CyodaAssistantWrapper:
         from google.adk.runners import Runner
 
         from application.agents.shared.cyoda_response_plugin import CyodaResponsePlugin
+        from application.agents.shared.prompt_cache import get_context_cache_config
+        from application.agents.shared.prompt_cache_plugin import PromptCachePlugin
         from application.services.cyoda_session_service import CyodaSessionService
 
         self.agent = adk_agent
@@ -54,13 +56,15 @@ class CyodaAssistantWrapper:
         # Create ADK Runner with Cyoda-backed session service for persistence
         session_service = CyodaSessionService(entity_service)
 
-        # Create plugins for response validation and quality
+        # Create plugins for response validation and quality, and prompt
+        # cache metrics
         plugins = [
             CyodaResponsePlugin(
                 name="cyoda_response_plugin",
                 provide_tool_summary=True,
                 default_message="Task completed successfully.",
-            )
+            ),
+            PromptCachePlugin(),
         ]
 
         self.runner = Runner(
@@ -69,6 +73,10 @@ class CyodaAssistantWrapper:
             session_service=session_service,
             plugins=plugins,
         )
+        # Gemini context caching of the agents' static instructions. Runner only
+        # takes it from an App, whose name must be an identifier, and sessions
+        # are stored under "cyoda-assistant"
+        self.runner.context_cache_config = get_context_cache_config()
 
         logger.info(
             f"✓ CyodaAssistantWrapper initialized with agent: {adk_agent.name} and persistent sessions"
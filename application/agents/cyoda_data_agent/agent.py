@@ -10,18 +10,21 @@ from google.adk.agents import LlmAgent
 from google.adk.tools import AgentTool
 
 from application.agents.shared import get_model_config
-from application.agents.shared.prompts import create_instruction_provider
+from application.agents.shared.prompts import create_split_instruction
 from application.agents.shared.streaming_callback import accumulate_streaming_response
 
 from .subagents.entity_management import entity_management_agent
 from .subagents.entity_model import entity_model_agent
 from .subagents.search import search_agent
 
+_instructions = create_split_instruction("cyoda_data_agent")
+
 root_agent = LlmAgent(
     name="cyoda_data_agent",
     model=get_model_config(),
     description="Multi-tenant Cyoda data agent. Accepts user credentials and interacts with their Cyoda environment.",
-    instruction=create_instruction_provider("cyoda_data_agent"),
+    static_instruction=_instructions.static_instruction,
+    instruction=_instructions.instruction,
     tools=[
         # Entity Management subagent handles CRUD operations on entities
         AgentTool(entity_management_agent),
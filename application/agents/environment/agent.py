@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from google.adk.agents import LlmAgent
 
-from application.agents.environment.prompts import create_instruction_provider
+from application.agents.environment.prompts import create_split_instruction
 from application.agents.monitoring.agent import create_deployment_monitor
 from application.agents.shared import get_model_config
 from application.agents.shared.streaming_callback import accumulate_streaming_response
 
 from .tools import (
+    aggregate_logs,
     check_environment_exists,
     delete_environment,
     delete_user_app,
@@ -33,6 +34,8 @@ from .tools import (
     update_user_app_image,
 )
 
+_instructions = create_split_instruction("environment_agent")
+
 root_agent = LlmAgent(
     name="environment_agent",
     model=get_model_config(),
@@ -40,7 +43,8 @@ root_agent = LlmAgent(
         "Cyoda environment management specialist. Handles environment provisioning, application deployment, "
         "build monitoring, troubleshooting, and credential management."
     ),
-    instruction=create_instruction_provider("environment_agent"),
+    static_instruction=_instructions.static_instruction,
+    instruction=_instructions.instruction,
     tools=[
         check_environment_exists,
         deploy_cyoda_environment,
@@ -63,6 +67,7 @@ root_agent = LlmAgent(
         get_user_app_pods,
         delete_user_app,
         search_logs,
+        aggregate_logs,
     ],
     sub_agents=[create_deployment_monitor()],
     after_agent_callback=accumulate_streaming_response,
@@ -12,6 +12,7 @@ Agent = _openai_agents.Agent
 
 from application.agents.environment.prompts import create_instruction_provider
 from application.agents.environment.tools import (
+    aggregate_logs,
     check_environment_exists,
     delete_environment,
     delete_user_app,
@@ -70,6 +71,7 @@ def create_openai_environment_agent() -> Agent:
         get_user_app_pods,
         delete_user_app,
         search_logs,
+        aggregate_logs,
     ]
     openai_tools = adapt_adk_tools_list(adk_tools)
 
@@ -1,9 +1,11 @@
 """Other environment agent tools."""
 
+from .aggregate_logs_tool import aggregate_logs
 from .issue_technical_user_tool import issue_technical_user
 from .search_logs_tool import search_logs
 
 __all__ = [
     "search_logs",
+    "aggregate_logs",
     "issue_technical_user",
 ]
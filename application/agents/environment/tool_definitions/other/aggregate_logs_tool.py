@@ -0,0 +1,96 @@
+"""Tool for summarizing application logs with Elasticsearch aggregations."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Optional
+
+from google.adk.tools.tool_context import ToolContext
+
+from application.services.core.logs_service import get_log_search_engine
+
+from ..common.utils.utils import handle_tool_errors, require_authenticated_user
+from .search_logs_tool import (
+    DEFAULT_TIME_RANGE,
+    ElkConfig,
+    _build_elasticsearch_query,
+    _build_log_query,
+    _resolve_index_pattern,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GROUP_BY = "level"
+DEFAULT_INTERVAL = "5m"
+
+
+@require_authenticated_user
+@handle_tool_errors
+async def aggregate_logs(
+    tool_context: ToolContext,
+    env_name: str,
+    app_name: str,
+    group_by: str = DEFAULT_GROUP_BY,
+    interval: str = DEFAULT_INTERVAL,
+    query: Optional[str] = None,
+    time_range: Optional[str] = DEFAULT_TIME_RANGE,
+    since_timestamp: Optional[str] = None,
+) -> str:
+    """Count logs over time, grouped by log level or pod, without fetching raw logs.
+
+    Use this to summarize log volume and error spikes (e.g. "how many errors
+    per pod in the last hour?") before drilling into entries with search_logs.
+
+    Args:
+        tool_context: The ADK tool context
+        env_name: Environment name (e.g., "dev", "staging", "prod")
+        app_name: Application name (use "cyoda" for Cyoda platform logs)
+        group_by: "level" (INFO/WARN/ERROR counts) or "pod" (counts per pod)
+        interval: Time bucket size, e.g. "1m", "5m", "1h" (default: "5m")
+        query: Optional Lucene query string to filter logs before counting
+        time_range: Time range for logs (default: "15m"). Ignored if
+                   since_timestamp is provided.
+        since_timestamp: ISO 8601 timestamp; only count logs after it
+
+    Returns:
+        JSON string with total count and per-interval buckets, or error message
+
+    Examples:
+        - Errors per level: aggregate_logs(env_name="dev", app_name="cyoda", time_range="1h")
+        - Per pod: aggregate_logs(env_name="dev", app_name="my-app", group_by="pod")
+    """
+    if not env_name or not app_name:
+        return json.dumps(
+            {"error": "Both env_name and app_name parameters are required."}
+        )
+
+    try:
+        elk_config = ElkConfig.from_env()
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+
+    index_pattern = _resolve_index_pattern(tool_context, env_name, app_name)
+    es_query = _build_elasticsearch_query(0, query, time_range, since_timestamp)
+    log_query = _build_log_query(elk_config, index_pattern, es_query["query"], 0)
+
+    logger.info(
+        f"Aggregating logs for env={env_name}, app={app_name}, "
+        f"index={index_pattern}, group_by={group_by}, interval={interval}"
+    )
+
+    try:
+        summary = await get_log_search_engine().aggregate(log_query, group_by, interval)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+
+    return json.dumps(
+        {
+            "environment": env_name,
+            "app_name": app_name,
+            "index_pattern": index_pattern,
+            "group_by": group_by,
+            "interval": interval,
+            **summary,
+        }
+    )
@@ -7,10 +7,10 @@ import json
 import logging
 from typing import Optional
 
-import httpx
 from google.adk.tools.tool_context import ToolContext
 from pydantic import BaseModel
 
+from application.services.core.logs_service import LogQuery, get_log_search_engine
 from application.services.environment_management_service import (
     get_environment_management_service,
 )
@@ -23,10 +23,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_LOG_SIZE = 50
 MAX_LOG_SIZE = 50
 DEFAULT_TIME_RANGE = "15m"
-ELK_REQUEST_TIMEOUT_SECONDS = 30.0
 CYODA_APP_NAME = "cyoda"
 INDEX_PATTERN_CYODA = "logs-client-{org_id}-{env}*"
 INDEX_PATTERN_USER_APP = "logs-client-1-{org_id}-{env}-{app}*"
+LOG_SOURCE_FIELDS = [
+    "@timestamp",
+    "level",
+    "message",
+    "kubernetes.pod_name",
+    "kubernetes.container_name",
+    "kubernetes.namespace_name",
+]
 
 
 class ElkConfig(BaseModel):
@@ -83,6 +90,7 @@ class LogSearchResult(BaseModel):
     since_timestamp: Optional[str]
     query: Optional[str]
     logs: list[LogEntry]
+    next_cursor: Optional[str] = None
 
 
 def _get_index_pattern(org_id: str, env: str, app_name: str, is_cyoda: bool) -> str:
@@ -102,6 +110,44 @@ def _get_index_pattern(org_id: str, env: str, app_name: str, is_cyoda: bool) ->
     return INDEX_PATTERN_USER_APP.format(org_id=org_id, env=env, app=app_name)
 
 
+def _resolve_index_pattern(
+    tool_context: ToolContext, env_name: str, app_name: str
+) -> str:
+    """Resolve the current user's log index pattern for an env/app.
+
+    Args:
+        tool_context: The ADK tool context (provides user_id)
+        env_name: Environment name
+        app_name: Application name ("cyoda" for platform logs)
+
+    Returns:
+        Index pattern for Elasticsearch query
+    """
+    user_id = tool_context.state.get("user_id", "guest")
+    env_service = get_environment_management_service()
+    org_id = env_service._normalize_for_namespace(user_id)
+    normalized_env = env_service._normalize_for_namespace(env_name)
+
+    is_cyoda = app_name.lower() == CYODA_APP_NAME
+    normalized_app = "" if is_cyoda else env_service._normalize_for_namespace(app_name)
+    return _get_index_pattern(org_id, normalized_env, normalized_app, is_cyoda)
+
+
+def _build_log_query(
+    elk_config: ElkConfig, index_pattern: str, query: dict, size: int
+) -> LogQuery:
+    """Build a LogQuery authenticated with the ELK service account."""
+    auth_header = _create_basic_auth_header(elk_config.user, elk_config.password)
+    return LogQuery(
+        host=elk_config.host,
+        index_pattern=index_pattern,
+        authorization=f"Basic {auth_header}",
+        query=query,
+        source_fields=LOG_SOURCE_FIELDS,
+        page_size=size,
+    )
+
+
 def _build_elasticsearch_query(
     size: int,
     query: Optional[str] = None,
@@ -207,28 +253,35 @@ async def search_logs(
     size: int = DEFAULT_LOG_SIZE,
     time_range: Optional[str] = DEFAULT_TIME_RANGE,
     since_timestamp: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> str:
     """Search logs in Elasticsearch for a specific environment and application.
 
     This function searches logs for the current user's namespaces in ELK.
     It supports searching both Cyoda environment logs (app_name="cyoda") and
-    user application logs.
+    user application logs. Results are paginated: when more logs match than
+    one page holds, the result contains a next_cursor; pass it back as
+    `cursor` to read the next page.
 
     IMPORTANT: For newly deployed/redeployed applications, use since_timestamp
-    to avoid retrieving logs from previous deployments.
+    to avoid retrieving logs from previous deployments. To summarize large
+    volumes of logs, prefer aggregate_logs over paging through raw entries.
 
     Args:
         tool_context: The ADK tool context
         env_name: Environment name (e.g., "dev", "staging", "prod")
         app_name: Application name (use "cyoda" for Cyoda platform logs)
         query: Optional search query string (Lucene syntax). If not provided, returns all logs.
-        size: Number of log entries to return (default: 50, max: 1000)
+        size: Number of log entries per page (default: 50, max: 50)
         time_range: Time range for logs (default: "15m" for last 15 minutes)
                    Examples: "15m", "1h", "24h", "7d"
                    NOTE: Ignored if since_timestamp is provided
         since_timestamp: ISO 8601 timestamp (e.g., "2025-12-10T14:30:00Z")
                         Get logs ONLY after this timestamp. Use this after deployments
                         to avoid getting logs from previous deployments.
+        cursor: next_cursor from a previous search_logs result to fetch the
+                next page. query, time_range and since_timestamp are taken
+                from the cursor when it is provided.
 
     Returns:
         JSON string with log search results, or error message
@@ -239,6 +292,7 @@ async def search_logs(
         - Search with query: search_logs(env_name="dev", app_name="cyoda", query="ERROR")
         - Custom time range: search_logs(env_name="dev", app_name="cyoda", time_range="1h")
         - After deployment: search_logs(env_name="prod", app_name="my-app", since_timestamp="2025-12-10T14:30:00Z")
+        - Next page: search_logs(env_name="dev", app_name="cyoda", cursor="<next_cursor>")
     """
     # Validate required parameters
     if not env_name or not app_name:
@@ -255,64 +309,43 @@ async def search_logs(
     except ValueError as e:
         return json.dumps({"error": str(e)})
 
-    # Get user ID and normalize namespace values
     user_id = tool_context.state.get("user_id", "guest")
-    env_service = get_environment_management_service()
-    org_id = env_service._normalize_for_namespace(user_id)
-    normalized_env = env_service._normalize_for_namespace(env_name)
-
-    # Determine index pattern based on app type
-    is_cyoda = app_name.lower() == CYODA_APP_NAME
-    if not is_cyoda:
-        normalized_app = env_service._normalize_for_namespace(app_name)
-    else:
-        normalized_app = ""
-
-    index_pattern = _get_index_pattern(org_id, normalized_env, normalized_app, is_cyoda)
+    index_pattern = _resolve_index_pattern(tool_context, env_name, app_name)
 
-    # Build Elasticsearch query
+    # Build Elasticsearch query (only the first page; later pages reuse the cursor)
     es_query = _build_elasticsearch_query(size, query, time_range, since_timestamp)
-
-    # Prepare HTTP request
-    auth_header = _create_basic_auth_header(elk_config.user, elk_config.password)
-    search_url = f"https://{elk_config.host}/{index_pattern}/_search"
+    log_query = _build_log_query(elk_config, index_pattern, es_query["query"], size)
 
     logger.info(
         f"Searching logs for user={user_id}, env={env_name}, "
-        f"app={app_name}, index={index_pattern}"
+        f"app={app_name}, index={index_pattern}, paged={cursor is not None}"
     )
 
     # Execute search and transform results
-    async with httpx.AsyncClient(timeout=ELK_REQUEST_TIMEOUT_SECONDS) as client:
-        headers = {
-            "Authorization": f"Basic {auth_header}",
-            "Content-Type": "application/json",
-        }
-        response = await client.post(search_url, headers=headers, json=es_query)
-        response.raise_for_status()
-
-        es_result = response.json()
-        hits = es_result.get("hits", {})
-        total_hits = hits.get("total", {}).get("value", 0)
-
-        # Transform raw hits to structured LogEntry objects
-        logs = [_transform_log_entry(hit) for hit in hits.get("hits", [])]
-
-        # Build result summary
-        result = LogSearchResult(
-            environment=env_name,
-            app_name=app_name,
-            index_pattern=index_pattern,
-            total_hits=total_hits,
-            returned=len(logs),
-            time_range=time_range if not since_timestamp else None,
-            since_timestamp=since_timestamp,
-            query=query,
-            logs=logs,
-        )
+    try:
+        page = await get_log_search_engine().search_page(log_query, cursor)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
 
-        logger.info(
-            f"Found {total_hits} log entries for {env_name}/{app_name}, "
-            f"returning {len(logs)}"
-        )
-        return result.model_dump_json()
+    # Transform raw hits to structured LogEntry objects
+    logs = [_transform_log_entry(hit) for hit in page.hits]
+
+    # Build result summary
+    result = LogSearchResult(
+        environment=env_name,
+        app_name=app_name,
+        index_pattern=index_pattern,
+        total_hits=page.total,
+        returned=len(logs),
+        time_range=time_range if not since_timestamp else None,
+        since_timestamp=since_timestamp,
+        query=query,
+        logs=logs,
+        next_cursor=page.next_cursor,
+    )
+
+    logger.info(
+        f"Found {page.total} log entries for {env_name}/{app_name}, "
+        f"returning {len(logs)}"
+    )
+    return result.model_dump_json()
@@ -63,6 +63,7 @@ from .tool_definitions.environment import (
 
 # Other tools
 from .tool_definitions.other import (
+    aggregate_logs,
     issue_technical_user,
     search_logs,
 )
@@ -0,0 +1,289 @@
+"""Model call record/replay for ADK evaluations.
+
+``eval_mocking`` stubs out tools; this module does the same for model calls so
+an eval pass can run offline and deterministically. Every LLM request is
+normalized and hashed, and the model's response is stored in a cassette file
+named after that hash. On replay the response is served from the cassette and
+the model is never called.
+
+Modes (``EVAL_CASSETTE_MODE``):
+
+* ``record`` - call the model and write every response to a cassette.
+* ``replay`` - serve responses from cassettes; a missing cassette is an error.
+* ``auto`` - replay when a cassette exists, otherwise call the model and record.
+
+Cassettes live under ``EVAL_CASSETTE_DIR`` as ``<key[:2]>/<key>.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "auto")
+
+DEFAULT_CASSETTE_DIR = str(Path(__file__).parent / "tests" / "evals" / "cassettes")
+
+# Fields that change from run to run without changing what the model sees:
+# function call ids are generated client-side per run
+_VOLATILE_KEYS = frozenset({"id", "thought_signature"})
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when no cassette matches a model request."""
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item)
+            for key, item in value.items()
+            if key not in _VOLATILE_KEYS
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def normalize_request(llm_request: LlmRequest) -> Dict[str, Any]:
+    """Reduce a model request to the parts that determine the response.
+
+    Args:
+        llm_request: Request about to be sent to the model
+
+    Returns:
+        JSON-serializable dict: model, system instruction, declared tool names
+        and conversation contents
+    """
+    config = llm_request.config
+    system_instruction = None
+    tool_names: list[str] = []
+    if config is not None:
+        system_instruction = config.system_instruction
+        if system_instruction is not None and not isinstance(system_instruction, str):
+            system_instruction = system_instruction.model_dump(
+                mode="json", exclude_none=True
+            )
+        for tool in config.tools or []:
+            for declaration in getattr(tool, "function_declarations", None) or []:
+                tool_names.append(declaration.name)
+    contents = [
+        content.model_dump(mode="json", exclude_none=True)
+        for content in llm_request.contents
+    ]
+    return _strip_volatile(
+        {
+            "model": llm_request.model,
+            "system_instruction": system_instruction,
+            "tools": sorted(tool_names),
+            "contents": contents,
+        }
+    )
+
+
+def cassette_key(llm_request: LlmRequest) -> str:
+    """Content address of a model request (sha256 of its normalized form)."""
+    payload = json.dumps(
+        normalize_request(llm_request), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CassetteStore:
+    """Directory of cassettes addressed by request hash."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[LlmResponse]:
+        """Return the recorded response for ``key``, or None."""
+        path = self.path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return LlmResponse.model_validate(data["response"])
+
+    def save(self, key: str, request: Dict[str, Any], response: LlmResponse) -> None:
+        """Write a cassette atomically, so parallel workers never see half a file."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "key": key,
+            "request": request,
+            "response": response.model_dump(mode="json", exclude_none=True),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+@dataclass
+class CassetteStats:
+    """Counters for the model calls seen by a recorder."""
+
+    model_calls: int = 0
+    hits: int = 0
+    recorded: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+    def add_usage(self, llm_response: LlmResponse) -> None:
+        usage = llm_response.usage_metadata
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_token_count or 0
+        self.completion_tokens += usage.candidates_token_count or 0
+        self.total_tokens += usage.total_token_count or 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class CassetteRecorder:
+    """Model callbacks that record or replay responses through a store.
+
+    Token counts are taken from the recorded usage metadata, so replayed runs
+    report the same numbers as the live run that produced the cassettes.
+    """
+
+    def __init__(self, store: CassetteStore, mode: str = "auto"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.store = store
+        self.mode = mode
+        self.stats = CassetteStats()
+        self._pending: Dict[tuple[str, str], tuple[str, Dict[str, Any]]] = {}
+
+    def reset_stats(self) -> CassetteStats:
+        """Return the counters collected so far and start new ones."""
+        stats, self.stats = self.stats, CassetteStats()
+        return stats
+
+    def before_model_callback(
+        self, callback_context: Any, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Serve the response from a cassette, or remember the request to record."""
+        self.stats.model_calls += 1
+        request = normalize_request(llm_request)
+        key = cassette_key(llm_request)
+
+        if self.mode != "record":
+            response = self.store.load(key)
+            if response is not None:
+                self.stats.hits += 1
+                self.stats.add_usage(response)
+                logger.debug(f"📼 [EVAL CASSETTE] Replaying {key[:12]}")
+                return response
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No cassette for model request {key} "
+                    f"(agent {callback_context.agent_name}); record it first"
+                )
+
+        self._pending[self._pending_key(callback_context)] = (key, request)
+        return None
+
+    def after_model_callback(
+        self, callback_context: Any, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """Record the live response for the pending request."""
+        if llm_response.partial:
+            return None
+        pending = self._pending.pop(self._pending_key(callback_context), None)
+        if pending is None:
+            return None
+        key, request = pending
+        self.stats.add_usage(llm_response)
+        try:
+            self.store.save(key, request, llm_response)
+            self.stats.recorded += 1
+            logger.info(f"📼 [EVAL CASSETTE] Recorded {key[:12]}")
+        except OSError as e:
+            logger.warning(f"⚠️ [EVAL CASSETTE] Failed to record {key[:12]}: {e}")
+        return None
+
+    @staticmethod
+    def _pending_key(callback_context: Any) -> tuple[str, str]:
+        return (callback_context.invocation_id, callback_context.agent_name)
+
+
+def install_cassette_callbacks(agent: Any, recorder: CassetteRecorder) -> int:
+    """Attach the recorder's model callbacks to an agent and all its sub-agents.
+
+    Existing model callbacks are kept and run first, so the cassette sees the
+    final request and records the final response.
+
+    Args:
+        agent: Root agent
+        recorder: Recorder whose callbacks to attach
+
+    Returns:
+        Number of agents the callbacks were attached to
+    """
+    installed = 0
+    seen: set[int] = set()
+    stack = [agent]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        stack.extend(getattr(current, "sub_agents", None) or [])
+        if not hasattr(current, "before_model_callback"):
+            continue
+        for attr, callback in (
+            ("before_model_callback", recorder.before_model_callback),
+            ("after_model_callback", recorder.after_model_callback),
+        ):
+            existing = getattr(current, attr)
+            if existing is None:
+                setattr(current, attr, callback)
+            elif isinstance(existing, list):
+                setattr(current, attr, [*existing, callback])
+            else:
+                setattr(current, attr, [existing, callback])
+        installed += 1
+    return installed
+
+
+# Global recorder used by the eval entry point
+_recorder: Optional[CassetteRecorder] = None
+
+
+def get_cassette_recorder() -> Optional[CassetteRecorder]:
+    """Get the recorder configured by ``EVAL_CASSETTE_MODE``, if enabled."""
+    global _recorder
+    if _recorder is None:
+        mode = os.getenv("EVAL_CASSETTE_MODE", "").lower()
+        if mode not in MODES:
+            return None
+        directory = os.getenv("EVAL_CASSETTE_DIR") or DEFAULT_CASSETTE_DIR
+        _recorder = CassetteRecorder(CassetteStore(directory), mode)
+    return _recorder
+
+
+def reset_cassette_recorder() -> None:
+    """Drop the global recorder (used by tests)."""
+    global _recorder
+    _recorder = None
@@ -12,7 +12,7 @@ from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 from application.agents.environment.tools import (
     deploy_cyoda_environment,
 )
-from application.agents.github.prompts import create_instruction_provider
+from application.agents.github.prompts import create_split_instruction
 from application.agents.shared import get_model_config
 from application.agents.shared.repository_tools import (
     check_existing_branch_configuration,
@@ -223,6 +223,13 @@ if github_mcp_toolset is not None:
 else:
     logger.warning("⚠ GitHub MCP toolset not available, using custom tools only")
 
+_instructions = create_split_instruction(
+    "github_agent",
+    repository_owner="<unknown>",
+    repository_name="<unknown>",
+    branch_name="<unknown>",
+)
+
 # Main GitHub agent
 root_agent = LlmAgent(
     name="github_agent",
@@ -231,12 +238,8 @@ root_agent = LlmAgent(
         "GitHub repository operations specialist. Handles repository analysis, file operations, "
         "commits, and canvas integration."
     ),
-    instruction=create_instruction_provider(
-        "github_agent",
-        repository_owner="<unknown>",
-        repository_name="<unknown>",
-        branch_name="<unknown>",
-    ),
+    static_instruction=_instructions.static_instruction,
+    instruction=_instructions.instruction,
     tools=tools,
     before_tool_callback=_before_tool_callback,  # Enable mocking in eval mode
     after_agent_callback=accumulate_streaming_response,
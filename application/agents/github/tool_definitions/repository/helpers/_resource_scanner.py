@@ -1,26 +1,41 @@
-"""Resource scanning utilities for repository analysis.
+"""Resource scanning for repository analysis.
 
-This module provides utilities for scanning versioned resources (entities, workflows, etc.)
-in repository directories.
+Scans go through the process-wide ResourceScanner of the repository analysis
+service, so agent tools and the analyze route share its single directory walk,
+pooled JSON parsing and parse cache.
 """
 
 from __future__ import annotations
 
-from ._resource_scanner import create_resource_dict as _create_resource_dict
-from ._resource_scanner import (
-    extract_workflow_entity_name as _extract_workflow_entity_name,
-)
-from ._resource_scanner import (
-    find_json_file_in_directory as _find_json_file_in_directory,  # Main scanner function; File operations; Resource builders; Directory scanner
-)
-from ._resource_scanner import get_version_sort_key as _get_version_sort_key
-from ._resource_scanner import parse_direct_resource_file as _parse_direct_resource_file
-from ._resource_scanner import parse_json_file as _parse_json_file
-from ._resource_scanner import parse_versioned_resource as _parse_versioned_resource
-from ._resource_scanner import scan_unversioned_directory as _scan_unversioned_directory
-from ._resource_scanner import scan_versioned_directory as _scan_versioned_directory
-from ._resource_scanner import (
-    scan_versioned_resources,
+from pathlib import Path
+from typing import Any, Dict, List
+
+from application.services.github.repository_analysis_service.analysis import (
+    get_resource_scanner,
 )
 
+
+def scan_versioned_resources(
+    resources_dir: Path, resource_type: str, repo_path_obj: Path
+) -> List[Dict[str, Any]]:
+    """Scan for versioned resources (entities, workflows, etc.).
+
+    Finds both direct files (resource_name.json) and versioned directories
+    (resource_name/version_N/resource_name.json). Blocks while reading files,
+    so async callers run it in an executor. The returned content is shared
+    with later scans and must not be modified.
+
+    Args:
+        resources_dir: Path to the resource directory (e.g., .../entity, .../workflow)
+        resource_type: Type of resource ("entity", "workflow", etc.)
+        repo_path_obj: Repository root path for relative path calculation
+
+    Returns:
+        List of resource dictionaries with name, version, path, and content
+    """
+    return get_resource_scanner().scan_versioned_resources(
+        resources_dir, resource_type, repo_path_obj
+    )
+
+
 __all__ = ["scan_versioned_resources"]
@@ -125,21 +125,12 @@ async def _scan_resources(
         Tuple of (entities, workflows, requirements)
     """
     repo_path_obj = Path(repository_path)
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     logger.info("🔍 Starting comprehensive resource scan...")
 
-    # Scan entities
     entities_dir = repo_path_obj / paths["entities_path"]
-    entities = await loop.run_in_executor(
-        None, scan_versioned_resources, entities_dir, "entity", repo_path_obj
-    )
-
-    # Scan workflows
     workflows_dir = repo_path_obj / paths["workflows_path"]
-    workflows = await loop.run_in_executor(
-        None, scan_versioned_resources, workflows_dir, "workflow", repo_path_obj
-    )
 
     # Scan requirements
     requirements_dir = repo_path_obj / paths["requirements_path"]
@@ -163,7 +154,16 @@ async def _scan_resources(
                         logger.warning(f"Failed to read requirement {req_file}: {e}")
         return requirements
 
-    requirements = await loop.run_in_executor(None, _read_requirements)
+    # The three scans touch separate directories, so run them side by side
+    entities, workflows, requirements = await asyncio.gather(
+        loop.run_in_executor(
+            None, scan_versioned_resources, entities_dir, "entity", repo_path_obj
+        ),
+        loop.run_in_executor(
+            None, scan_versioned_resources, workflows_dir, "workflow", repo_path_obj
+        ),
+        loop.run_in_executor(None, _read_requirements),
+    )
 
     return entities, workflows, requirements
 
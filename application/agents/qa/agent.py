@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from google.adk.agents import LlmAgent
 
-from application.agents.qa.prompts import create_instruction_provider
+from application.agents.qa.prompts import create_split_instruction
 from application.agents.shared import get_model_config
 from application.agents.shared.streaming_callback import accumulate_streaming_response
 from application.agents.shared.tools import load_web_page, read_documentation
 
 from .tools import explain_cyoda_pattern, search_cyoda_concepts
 
+_instructions = create_split_instruction("qa_agent")
+
 root_agent = LlmAgent(
     name="qa_agent",
     model=get_model_config(),
@@ -18,7 +20,8 @@ root_agent = LlmAgent(
         "Cyoda platform expert. Answers questions about architecture, concepts, entity management, "
         "workflows, and troubleshooting."
     ),
-    instruction=create_instruction_provider("qa_agent"),
+    static_instruction=_instructions.static_instruction,
+    instruction=_instructions.instruction,
     tools=[
         search_cyoda_concepts,
         explain_cyoda_pattern,
@@ -0,0 +1,332 @@
+"""
+Change-driven progress commits for long-running CLI builds.
+
+Instead of committing and pushing on a fixed timer, the build monitors poll a
+``CommitScheduler``. Each poll takes one cheap snapshot of the working tree
+(``git status --porcelain -z`` plus the size and mtime of every changed path)
+and commits once the tree has been quiet for the debounce window, or has kept
+changing for the max delay. A diff-summary progress update is written to the
+BackgroundTask only when a commit lands, so the task entity is not rewritten
+on every poll in which the set of changed files moved.
+
+Pushes are coalesced per branch: a branch is pushed at most once per push
+interval and never twice at the same time, so changes that settle in between
+ride along with the next push.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from common.config.config import (
+    CLI_COMMIT_DEBOUNCE_SECONDS,
+    CLI_COMMIT_MAX_DELAY_SECONDS,
+)
+from services.services import get_task_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PUSH_INTERVAL_SECONDS = 60.0
+COMMIT_TIMEOUT_SECONDS = 120.0
+
+# Changed files listed in progress metadata
+MAX_LISTED_FILES = 20
+
+# (status, path) pairs reported by git status
+TreeEntries = Tuple[Tuple[str, str], ...]
+
+CommitFn = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class TreeScan:
+    """One snapshot of a working tree's uncommitted changes."""
+
+    entries: TreeEntries
+    # entries plus (mtime_ns, size) per path, so files that keep changing
+    # after their status is first reported still count as changes
+    signature: Tuple[Any, ...]
+
+    @property
+    def clean(self) -> bool:
+        return not self.entries
+
+    @property
+    def changed_files(self) -> List[str]:
+        return [path for _, path in self.entries]
+
+
+def parse_porcelain_z(output: bytes) -> TreeEntries:
+    """
+    Parse ``git status --porcelain -z`` output.
+
+    Args:
+        output: Raw command output.
+
+    Returns:
+        (status, path) pairs; renames and copies report the new path.
+    """
+    entries = []
+    fields = output.split(b"\0")
+    index = 0
+    while index < len(fields):
+        field = fields[index]
+        index += 1
+        if len(field) < 4:
+            continue
+        status = field[:2].decode("ascii", "replace")
+        entries.append((status, field[3:].decode("utf-8", "surrogateescape")))
+        if status[0] in "RC":
+            # The original path follows as its own field
+            index += 1
+    return tuple(entries)
+
+
+def _stat_entries(repository_path: str, entries: TreeEntries) -> Tuple[Any, ...]:
+    signature = []
+    for status, path in entries:
+        try:
+            stat = os.stat(os.path.join(repository_path, path))
+            signature.append((status, path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((status, path, None, None))
+    return tuple(signature)
+
+
+async def scan_working_tree(repository_path: str) -> Optional[TreeScan]:
+    """
+    Snapshot uncommitted changes in a repository.
+
+    Args:
+        repository_path: Path to the working tree.
+
+    Returns:
+        The scan, or None if git status could not be run.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "status",
+            "--porcelain",
+            "-z",
+            "--untracked-files=all",
+            cwd=repository_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+    except (OSError, ValueError) as e:
+        logger.debug(f"git status failed in {repository_path}: {e}")
+        return None
+    if process.returncode != 0:
+        return None
+
+    entries = parse_porcelain_z(stdout)
+    signature = await asyncio.to_thread(_stat_entries, repository_path, entries)
+    return TreeScan(entries=entries, signature=signature)
+
+
+class _BranchPushGate:
+    """Serializes and rate-limits pushes per (working tree, branch).
+
+    A branch's entry is dropped when its build's monitor finishes, and
+    entries whose push interval has passed are pruned on each push, so the
+    gate only holds branches that are still rate-limited or pushing.
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # Last push time and the interval it blocks further pushes for
+        self._last_push: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+    def lock(self, key: Tuple[str, str]) -> asyncio.Lock:
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def ready(self, key: Tuple[str, str], now: float, interval: float) -> bool:
+        last = self._last_push.get(key)
+        return last is None or now - last[0] >= interval
+
+    def pushed(self, key: Tuple[str, str], now: float, interval: float) -> None:
+        self._prune(now)
+        self._last_push[key] = (now, interval)
+
+    def forget(self, key: Tuple[str, str]) -> None:
+        """Drop a branch's entry unless a push of it is in progress."""
+        lock = self._locks.get(key)
+        if lock is not None and lock.locked():
+            return
+        self._locks.pop(key, None)
+        self._last_push.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key
+            for key, (last, interval) in self._last_push.items()
+            if now - last >= interval
+        ]
+        for key in expired:
+            self.forget(key)
+        # Locks of branches that never finished a push
+        for key in [key for key in self._locks if key not in self._last_push]:
+            self.forget(key)
+
+    def clear(self) -> None:
+        self._locks.clear()
+        self._last_push.clear()
+
+
+_push_gate = _BranchPushGate()
+
+
+def reset_push_gate() -> None:
+    """Forget push history for all branches (used by tests)."""
+    _push_gate.clear()
+
+
+class CommitScheduler:
+    """Commits a build's working tree when its changes settle."""
+
+    def __init__(
+        self,
+        repository_path: str,
+        branch_name: str,
+        commit: CommitFn,
+        task_id: Optional[str] = None,
+        task_service: Any = None,
+        debounce_seconds: float = CLI_COMMIT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = CLI_COMMIT_MAX_DELAY_SECONDS,
+        push_interval_seconds: float = DEFAULT_PUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            repository_path: Working tree of the build.
+            branch_name: Branch the build pushes to.
+            commit: Coroutine function taking a commit message; commits all
+                changes and pushes the branch.
+            task_id: BackgroundTask receiving a diff summary per commit.
+            task_service: Task service (defaults to the global one).
+            debounce_seconds: Quiet period after the last change before
+                committing.
+            max_delay_seconds: Commit anyway once changes have been pending
+                this long, even if the tree never goes quiet.
+            push_interval_seconds: Minimum time between pushes of the branch.
+            clock: Monotonic time source.
+        """
+        self.repository_path = repository_path
+        self.branch_name = branch_name
+        self.task_id = task_id
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.push_interval_seconds = push_interval_seconds
+        self.commits = 0
+        self._commit = commit
+        self._task_service = task_service
+        self._clock = clock
+        self._key = (os.path.realpath(repository_path), branch_name)
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._changed_at = 0.0
+        self._dirty_since: Optional[float] = None
+
+    def close(self) -> None:
+        """Release the branch's push-gate entry once the build is done."""
+        _push_gate.forget(self._key)
+
+    async def poll(self, elapsed_time: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Scan the tree once and commit if due.
+
+        Args:
+            elapsed_time: Seconds since the build started (for messages).
+
+        Returns:
+            The commit result if a commit was made, else None.
+        """
+        scan = await scan_working_tree(self.repository_path)
+        if scan is None:
+            return None
+
+        now = self._clock()
+        if scan.signature != self._signature:
+            self._signature = scan.signature
+            self._changed_at = now
+        if scan.clean:
+            self._dirty_since = None
+            return None
+        if self._dirty_since is None:
+            self._dirty_since = now
+
+        settled = now - self._changed_at >= self.debounce_seconds
+        overdue = now - self._dirty_since >= self.max_delay_seconds
+        if not (settled or overdue):
+            return None
+        return await self._commit_scan(scan, elapsed_time)
+
+    async def _commit_scan(
+        self, scan: TreeScan, elapsed_time: int
+    ) -> Optional[Dict[str, Any]]:
+        lock = _push_gate.lock(self._key)
+        # Skipped commits stay pending and are coalesced into the next push
+        if lock.locked() or not _push_gate.ready(
+            self._key, self._clock(), self.push_interval_seconds
+        ):
+            return None
+
+        async with lock:
+            try:
+                result = await asyncio.wait_for(
+                    self._commit(
+                        f"Progress on {self.branch_name} ({int(elapsed_time)}s)"
+                    ),
+                    timeout=COMMIT_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ [{self.branch_name}] Progress commit timed out")
+                return None
+            except Exception as e:
+                logger.warning(f"⚠️ [{self.branch_name}] Progress commit failed: {e}")
+                return None
+            finally:
+                # Failed attempts count too, so a broken remote is not retried
+                # on every poll
+                _push_gate.pushed(self._key, self._clock(), self.push_interval_seconds)
+
+        result = result or {}
+        if not (result.get("success") or result.get("status") == "success"):
+            return None
+
+        self.commits += 1
+        self._dirty_since = None
+        metadata = self._file_metadata(scan, elapsed_time)
+        for key in ("canvas_resources", "diff"):
+            if result.get(key):
+                metadata[key] = result[key]
+        await self._publish(f"Progress committed ({len(scan.entries)} files)", metadata)
+        logger.info(
+            f"📊 [{self.branch_name}] Progress committed: " f"{len(scan.entries)} files"
+        )
+        return result
+
+    @staticmethod
+    def _file_metadata(scan: TreeScan, elapsed_time: int) -> Dict[str, Any]:
+        return {
+            "changed_files": scan.changed_files[:MAX_LISTED_FILES],
+            "total_files": len(scan.entries),
+            "elapsed_time": int(elapsed_time),
+        }
+
+    async def _publish(self, message: str, metadata: Dict[str, Any]) -> None:
+        if not self.task_id:
+            return
+        try:
+            task_service = self._task_service or get_task_service()
+            await task_service.add_progress_update(
+                task_id=self.task_id, message=message, metadata=metadata
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to publish commit summary: {e}")
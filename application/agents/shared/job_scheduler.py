@@ -0,0 +1,499 @@
+"""
+Priority job scheduler for CLI code-generation and build processes.
+
+Jobs get a slot immediately while the pod budget has room. Otherwise they wait
+in a queue whose entries are pending ``BackgroundTask`` entities, so queued
+work is visible (and its position reported) through the normal task API.
+Queued jobs are dispatched by priority, then by fair share (the user with the
+fewest running jobs goes first), then in submission order.
+
+Each CLI child process runs under CPU-time and memory rlimits derived from the
+per-job reservation used to size the budget.
+
+A queued job's task records the scheduler that owns it (``host:pid``) and a
+heartbeat the owner refreshes while the job waits. Recovery fails queued jobs
+at once when their owner was a process on this pod that no longer exists, and
+otherwise only when their heartbeat has gone stale, so it never fails work a
+sibling worker or another live pod is still holding.
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import os
+import resource
+import socket
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from application.entity.background_task import BackgroundTask
+from common.config.config import (
+    CLI_DEFAULT_MAX_JOBS,
+    CLI_JOB_CPU_CORES,
+    CLI_JOB_CPU_SECONDS,
+    CLI_JOB_MEMORY_MB,
+    CLI_POD_CPU_BUDGET,
+    CLI_POD_MEMORY_BUDGET_MB,
+    CLI_QUEUED_JOB_STALE_SECONDS,
+)
+from common.service.entity_service import SearchConditionRequest
+from services.services import get_task_service
+
+logger = logging.getLogger(__name__)
+
+# Seconds between capacity re-checks while jobs are queued; covers CLI
+# processes started outside the scheduler, whose exit sends no wake-up
+QUEUE_RECHECK_INTERVAL = 10.0
+
+# Seconds between heartbeats written to the tasks of queued jobs
+QUEUE_HEARTBEAT_INTERVAL = 60.0
+
+# Seconds between sweeps for queued jobs orphaned by other processes
+ORPHAN_RECOVERY_INTERVAL = 300.0
+
+# workflow_cache key marking a BackgroundTask as a queued CLI job
+QUEUED_JOB_KEY = "cli_job_queue"
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this pid exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+class JobPriority(IntEnum):
+    """Dispatch priority; lower values run first."""
+
+    INTERACTIVE = 0
+    BATCH = 10
+
+
+def pod_job_capacity(
+    cpu_budget: Optional[str] = CLI_POD_CPU_BUDGET,
+    memory_budget_mb: Optional[str] = CLI_POD_MEMORY_BUDGET_MB,
+    job_cpu_cores: float = CLI_JOB_CPU_CORES,
+    job_memory_mb: int = CLI_JOB_MEMORY_MB,
+) -> int:
+    """
+    Number of CLI jobs the pod budget fits.
+
+    Args:
+        cpu_budget: Pod CPU cores available to CLI jobs (None if unset).
+        memory_budget_mb: Pod memory available to CLI jobs (None if unset).
+        job_cpu_cores: Cores reserved per job.
+        job_memory_mb: Memory reserved per job.
+
+    Returns:
+        Concurrent job slots (at least 1), or CLI_DEFAULT_MAX_JOBS when no
+        budget is configured.
+    """
+    limits = []
+    if cpu_budget and job_cpu_cores > 0:
+        limits.append(math.floor(float(cpu_budget) / job_cpu_cores))
+    if memory_budget_mb and job_memory_mb > 0:
+        limits.append(int(memory_budget_mb) // job_memory_mb)
+    if not limits:
+        return CLI_DEFAULT_MAX_JOBS
+    return max(1, min(limits))
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """rlimits applied to each CLI child process (0 disables a limit)."""
+
+    cpu_seconds: int = CLI_JOB_CPU_SECONDS
+    memory_mb: int = CLI_JOB_MEMORY_MB
+
+    def apply(self) -> None:
+        """Set the limits on the current process (runs in the forked child)."""
+        if self.cpu_seconds:
+            resource.setrlimit(
+                resource.RLIMIT_CPU, (self.cpu_seconds, self.cpu_seconds)
+            )
+        if self.memory_mb:
+            # RLIMIT_DATA rather than RLIMIT_AS: node and the JVM reserve far
+            # more address space than they ever commit
+            limit = self.memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+
+    def preexec_fn(self) -> Optional[Callable[[], None]]:
+        """Callable for ``create_subprocess_exec(preexec_fn=...)``, if any."""
+        return self.apply if (self.cpu_seconds or self.memory_mb) else None
+
+
+class JobSlot:
+    """A held unit of scheduler capacity; release it when the job ends."""
+
+    def __init__(self, scheduler: "CLIJobScheduler", user_id: str):
+        self._scheduler = scheduler
+        self.user_id = user_id
+        self.released = False
+
+    @property
+    def limits(self) -> "ResourceLimits":
+        """rlimits for the process started with this slot."""
+        return self._scheduler.limits
+
+    def release(self) -> None:
+        """Return the slot to the scheduler (idempotent)."""
+        if not self.released:
+            self.released = True
+            self._scheduler._release(self)
+
+
+@dataclass
+class QueuedJob:
+    """A job waiting for capacity.
+
+    ``start`` launches the job with the slot it was granted and owns that
+    slot from then on.
+    """
+
+    task_id: str
+    user_id: str
+    priority: JobPriority
+    start: Callable[[JobSlot], Awaitable[Any]]
+    seq: int = 0
+    published: Optional[Tuple[int, int]] = field(default=None, repr=False)
+
+
+class CLIJobScheduler:
+    """Admits CLI jobs up to a capacity and queues the rest."""
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        limits: Optional[ResourceLimits] = None,
+        owner_id: Optional[str] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            capacity: Concurrent job slots (defaults to the pod budget).
+            limits: rlimits for CLI child processes.
+            owner_id: Identity recorded on queued jobs (defaults to host:pid).
+        """
+        self.capacity = capacity or pod_job_capacity()
+        self.limits = limits or ResourceLimits()
+        self.owner_id = owner_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._queue: List[QueuedJob] = []
+        self._running_by_user: Dict[str, int] = defaultdict(int)
+        self._running = 0
+        self._seq = itertools.count()
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._watcher: Optional[asyncio.Task] = None
+        self._recovery: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def running_count(self) -> int:
+        return self._running
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queue)
+
+    def queue_position(self, task_id: str) -> Optional[int]:
+        """1-based dispatch position of a queued job, or None if not queued."""
+        for position, job in enumerate(self._ordered_queue(), start=1):
+            if job.task_id == task_id:
+                return position
+        return None
+
+    async def try_acquire(
+        self, user_id: str, priority: JobPriority = JobPriority.INTERACTIVE
+    ) -> Optional[JobSlot]:
+        """
+        Take a slot now if capacity allows and no equal or higher priority
+        job is already waiting.
+
+        Args:
+            user_id: Owner of the job.
+            priority: Job priority.
+
+        Returns:
+            The slot, or None if the job should be queued.
+        """
+        async with self._lock:
+            if any(job.priority <= priority for job in self._queue):
+                return None
+            return await self._acquire_locked(user_id)
+
+    async def enqueue(self, job: QueuedJob) -> int:
+        """
+        Queue a job until capacity frees up.
+
+        Args:
+            job: Job to queue; its BackgroundTask must already exist.
+
+        Returns:
+            The job's queue position.
+        """
+        async with self._lock:
+            job.seq = next(self._seq)
+            self._queue.append(job)
+        logger.info(
+            f"⏳ Queued CLI job {job.task_id} for {job.user_id} "
+            f"(priority={job.priority.name}, queued={len(self._queue)})"
+        )
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch_queue())
+        self._wakeup.set()
+        return self.queue_position(job.task_id) or 0
+
+    def queue_entry(self, priority: JobPriority) -> Dict[str, Any]:
+        """
+        Build the workflow_cache entry marking a task as queued here.
+
+        Args:
+            priority: Job priority.
+
+        Returns:
+            Value to store under QUEUED_JOB_KEY on the job's BackgroundTask.
+        """
+        return {
+            "priority": int(priority),
+            "owner": self.owner_id,
+            "heartbeat_at": time.time(),
+        }
+
+    def start_recovery(self) -> None:
+        """Sweep for orphaned queued jobs now and periodically, in the background."""
+        if self._recovery is None or self._recovery.done():
+            self._recovery = asyncio.create_task(self._recover_periodically())
+
+    def stop_recovery(self) -> None:
+        """Stop the periodic orphan sweep."""
+        if self._recovery is not None:
+            self._recovery.cancel()
+            self._recovery = None
+
+    async def recover_orphaned_jobs(self) -> int:
+        """
+        Mark queued-job tasks whose owning process is gone as failed.
+
+        A job is orphaned if it was queued by a process on this pod that is
+        no longer running, or if its heartbeat is older than
+        CLI_QUEUED_JOB_STALE_SECONDS. Jobs owned by this scheduler and fresh
+        jobs of sibling workers or other live pods are left alone.
+
+        Launch arguments are not persisted, so orphaned jobs are failed for
+        the owner to resubmit rather than resumed: they reference pod-local
+        state (the repository clone, the prompt file) and the repository
+        credentials, which must not be written into the task entity.
+
+        Returns:
+            Number of tasks marked failed.
+        """
+        task_service = get_task_service()
+        try:
+            pending = await task_service.entity_service.search(
+                entity_class=BackgroundTask.ENTITY_NAME,
+                condition=SearchConditionRequest.builder()
+                .equals("status", "pending")
+                .build(),
+                entity_version=str(BackgroundTask.ENTITY_VERSION),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not look up queued CLI jobs: {e}")
+            return 0
+
+        known = {job.task_id for job in self._queue}
+        now = time.time()
+        failed = 0
+        for response in pending or []:
+            data = response.data if hasattr(response, "data") else response
+            if not isinstance(data, dict):
+                continue
+            task_id = data.get("technical_id") or getattr(
+                getattr(response, "metadata", None), "id", None
+            )
+            entry = (data.get("workflow_cache") or {}).get(QUEUED_JOB_KEY)
+            if (
+                not task_id
+                or task_id in known
+                or not isinstance(entry, dict)
+                or not self._is_orphaned(entry, now)
+            ):
+                continue
+            try:
+                await task_service.update_task_status(
+                    task_id=task_id,
+                    status="failed",
+                    message="Job was queued on a service instance that stopped; "
+                    "please resubmit",
+                    error="Queued job lost on restart",
+                )
+                failed += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to close orphaned job {task_id}: {e}")
+        if failed:
+            logger.info(f"🧹 Marked {failed} orphaned queued CLI job(s) failed")
+        return failed
+
+    def _is_orphaned(self, entry: Dict[str, Any], now: float) -> bool:
+        owner = entry.get("owner")
+        if owner == self.owner_id:
+            # Ours, possibly between task creation and enqueue
+            return False
+        host, _, pid = (owner or "").rpartition(":")
+        if host and host == self.owner_id.rpartition(":")[0] and pid.isdigit():
+            if not _process_alive(int(pid)):
+                # An earlier process on this pod; nothing else can still hold it
+                return True
+        heartbeat = entry.get("heartbeat_at")
+        if not isinstance(heartbeat, (int, float)):
+            return True
+        return now - heartbeat > CLI_QUEUED_JOB_STALE_SECONDS
+
+    async def _recover_periodically(self) -> None:
+        while True:
+            await self.recover_orphaned_jobs()
+            await asyncio.sleep(ORPHAN_RECOVERY_INTERVAL)
+
+    async def _heartbeat(self) -> None:
+        """Refresh the heartbeat on the tasks of jobs still queued here."""
+        task_service = get_task_service()
+        for job in list(self._queue):
+            try:
+                task = await task_service.get_task(job.task_id)
+                entry = task.workflow_cache.get(QUEUED_JOB_KEY) if task else None
+                if not isinstance(entry, dict):
+                    continue
+                entry["heartbeat_at"] = time.time()
+                await task_service.update_task(task)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to heartbeat queued job {job.task_id}: {e}")
+
+    async def _acquire_locked(self, user_id: str) -> Optional[JobSlot]:
+        # Resolved at call time so the process manager can be swapped in tests
+        from application.agents.shared import process_manager
+
+        if self._running >= self.capacity:
+            return None
+        # Other code paths start CLI processes too; respect the global count
+        if not await process_manager.get_process_manager().can_start_process():
+            return None
+        self._running += 1
+        self._running_by_user[user_id] += 1
+        return JobSlot(self, user_id)
+
+    def _release(self, slot: JobSlot) -> None:
+        self._running = max(0, self._running - 1)
+        self._running_by_user[slot.user_id] -= 1
+        if self._running_by_user[slot.user_id] <= 0:
+            del self._running_by_user[slot.user_id]
+        self._wakeup.set()
+
+    def _ordered_queue(self) -> List[QueuedJob]:
+        return sorted(
+            self._queue,
+            key=lambda job: (
+                job.priority,
+                self._running_by_user.get(job.user_id, 0),
+                job.seq,
+            ),
+        )
+
+    async def _watch_queue(self) -> None:
+        last_heartbeat = time.monotonic()
+        while self._queue:
+            self._wakeup.clear()
+            await self._dispatch()
+            if not self._queue:
+                return
+            if time.monotonic() - last_heartbeat >= QUEUE_HEARTBEAT_INTERVAL:
+                last_heartbeat = time.monotonic()
+                await self._heartbeat()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), QUEUE_RECHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(self) -> None:
+        async with self._lock:
+            while self._queue:
+                job = self._ordered_queue()[0]
+                slot = await self._acquire_locked(job.user_id)
+                if slot is None:
+                    break
+                self._queue.remove(job)
+                logger.info(f"🚀 Dispatching queued CLI job {job.task_id}")
+                self._spawn(self._start(job, slot))
+        await self._publish_positions()
+
+    async def _start(self, job: QueuedJob, slot: JobSlot) -> None:
+        try:
+            await job.start(slot)
+        except Exception as e:
+            logger.error(f"❌ Queued CLI job {job.task_id} failed to start: {e}")
+            slot.release()
+            try:
+                await get_task_service().update_task_status(
+                    task_id=job.task_id,
+                    status="failed",
+                    message=f"Failed to start: {e}",
+                    error=str(e),
+                )
+            except Exception as update_error:
+                logger.warning(
+                    f"⚠️ Failed to mark job {job.task_id} failed: {update_error}"
+                )
+
+    async def _publish_positions(self) -> None:
+        ordered = self._ordered_queue()
+        task_service = get_task_service()
+        for position, job in enumerate(ordered, start=1):
+            state = (position, len(ordered))
+            if job.published == state:
+                continue
+            job.published = state
+            try:
+                await task_service.add_progress_update(
+                    task_id=job.task_id,
+                    message=f"Queued: position {position} of {len(ordered)}",
+                    progress=0,
+                    metadata={
+                        "queue_position": position,
+                        "queue_length": len(ordered),
+                    },
+                )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Failed to publish queue position for {job.task_id}: {e}"
+                )
+
+    def _spawn(self, coro: Awaitable[Any]) -> None:
+        task = asyncio.create_task(coro)  # type: ignore[arg-type]
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+# Global singleton instance
+_job_scheduler: Optional[CLIJobScheduler] = None
+
+
+def get_job_scheduler() -> CLIJobScheduler:
+    """Get or create the global CLI job scheduler."""
+    global _job_scheduler
+    if _job_scheduler is None:
+        _job_scheduler = CLIJobScheduler()
+    return _job_scheduler
+
+
+def reset_job_scheduler() -> None:
+    """Drop the global scheduler (used by tests)."""
+    global _job_scheduler
+    _job_scheduler = None
@@ -132,9 +132,18 @@ class CLIProcessManager:
 _process_manager: Optional[CLIProcessManager] = None
 
 
-def get_process_manager(max_concurrent: int = 5) -> CLIProcessManager:
-    """Get or create the global process manager instance."""
+def get_process_manager(max_concurrent: Optional[int] = None) -> CLIProcessManager:
+    """Get or create the global process manager instance.
+
+    Args:
+        max_concurrent: Process limit on first creation; defaults to the
+            capacity of the configured pod budget.
+    """
     global _process_manager
     if _process_manager is None:
+        if max_concurrent is None:
+            from application.agents.shared.job_scheduler import pod_job_capacity
+
+            max_concurrent = pod_job_capacity()
         _process_manager = CLIProcessManager(max_concurrent_processes=max_concurrent)
     return _process_manager
@@ -6,6 +6,7 @@ Provides status checks and control functions for the process manager.
 import logging
 from typing import Any, Dict
 
+from application.agents.shared.job_scheduler import get_job_scheduler
 from application.agents.shared.process_manager import get_process_manager
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ async def get_process_status() -> Dict[str, Any]:
         "utilization_percent": int(
             (active_count / process_manager.max_concurrent_processes) * 100
         ),
+        "queued_jobs": get_job_scheduler().queued_count,
     }
 
 
@@ -81,6 +83,7 @@ async def set_process_limit(max_concurrent: int) -> Dict[str, Any]:
     process_manager = get_process_manager()
     old_limit = process_manager.max_concurrent_processes
     process_manager.max_concurrent_processes = max_concurrent
+    get_job_scheduler().capacity = max_concurrent
 
     logger.info(f"Process limit changed from {old_limit} to {max_concurrent}")
 
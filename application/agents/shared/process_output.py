@@ -0,0 +1,413 @@
+"""
+Output capture for CLI build processes.
+
+Each captured process gets a ``ProcessOutput``:
+
+* a fixed-size byte ring buffer holding the most recent output,
+* a local spool file with the full log, written off the event loop by a
+  shared writer thread and kept for ``OUTPUT_RETENTION_SECONDS`` after the
+  process ends, and
+* a tail API (``follow``) that SSE handlers subscribe to, reading from the
+  buffer, or from the spool for offsets the buffer no longer holds.
+
+Byte positions are absolute (bytes written since the process started), so a
+subscriber can resume from the offset it last saw; if that data is neither in
+the buffer nor in the spool it continues from the oldest retained byte.
+
+The BackgroundTask entity only receives coarse checkpoints (the tail of the
+buffer every ``CLI_OUTPUT_CHECKPOINT_SECONDS``, overwriting the previous one),
+not every chunk.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from common.config.config import CLI_OUTPUT_BUFFER_BYTES, CLI_OUTPUT_SPOOL_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested per read; StreamReader.read returns whatever is buffered
+# (up to this size) as soon as any output is available
+READ_CHUNK_SIZE = 64 * 1024
+
+# workflow_cache key holding a BackgroundTask's latest output checkpoint
+OUTPUT_CHECKPOINT_KEY = "output_checkpoint"
+
+# How long finished outputs (and their spool files) stay subscribable
+OUTPUT_RETENTION_SECONDS = 600.0
+
+# Most bytes returned by one read from a spool file
+SPOOL_READ_BYTES = 1024 * 1024
+
+# One thread writes all spool files; it runs jobs in submission order, so the
+# chunks of each file stay in sequence, reads see every earlier write and
+# closes follow the last write
+_spool_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-spool")
+
+
+class OutputRingBuffer:
+    """Fixed-capacity byte buffer addressed by absolute offsets."""
+
+    def __init__(self, capacity: int = CLI_OUTPUT_BUFFER_BYTES):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._end = 0
+
+    @property
+    def start(self) -> int:
+        """Offset of the oldest retained byte."""
+        return max(0, self._end - self.capacity)
+
+    @property
+    def end(self) -> int:
+        """Total bytes written."""
+        return self._end
+
+    def write(self, data: bytes) -> None:
+        """Append bytes, overwriting the oldest ones when full."""
+        end = self._end + len(data)
+        data = data[-self.capacity :]
+        position = (end - len(data)) % self.capacity
+        first = min(len(data), self.capacity - position)
+        self._buffer[position : position + first] = data[:first]
+        self._buffer[: len(data) - first] = data[first:]
+        self._end = end
+
+    def read(self, offset: int, limit: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Read retained bytes from ``offset``.
+
+        Args:
+            offset: Absolute offset; clamped to the oldest retained byte.
+            limit: Maximum bytes to return.
+
+        Returns:
+            (data, offset just past the returned data)
+        """
+        offset = max(offset, self.start)
+        stop = self._end if limit is None else min(self._end, offset + limit)
+        if offset >= stop:
+            return b"", offset
+        position = offset % self.capacity
+        length = stop - offset
+        first = min(length, self.capacity - position)
+        data = bytes(self._buffer[position : position + first]) + bytes(
+            self._buffer[: length - first]
+        )
+        return data, stop
+
+    def tail(self, size: int) -> bytes:
+        """The last ``size`` retained bytes."""
+        return self.read(self._end - size)[0]
+
+
+class ProcessOutput:
+    """Captured output of one process: ring buffer, spool file and subscribers."""
+
+    def __init__(
+        self,
+        key: str,
+        capacity: int = CLI_OUTPUT_BUFFER_BYTES,
+        spool_dir: Optional[str] = CLI_OUTPUT_SPOOL_DIR,
+    ):
+        """
+        Initialize the output.
+
+        Args:
+            key: Task ID (or PID) the output belongs to.
+            capacity: Ring buffer size in bytes.
+            spool_dir: Directory for the full log (None disables spooling).
+        """
+        self.key = key
+        self.buffer = OutputRingBuffer(capacity)
+        self.closed = False
+        self.finished_at: Optional[float] = None
+        self.spool_path: Optional[str] = None
+        self._spool: Any = None
+        # Position in the spool file of this output's offset 0 (a rerun of the
+        # same task appends to the earlier run's file); None until opened
+        self._spool_base: Optional[int] = None
+        self._changed = asyncio.Event()
+        if spool_dir:
+            safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+            self.spool_path = os.path.join(spool_dir, f"{safe_key}.log")
+            # Opened by the writer thread, after earlier outputs' pending writes
+            _spool_writer.submit(self._open_spool)
+
+    def append(self, data: bytes) -> None:
+        """Record a chunk of output and wake subscribers."""
+        if not data or self.closed:
+            return
+        self.buffer.write(data)
+        if self.spool_path is not None:
+            _spool_writer.submit(self._write_spool, data)
+        self._notify()
+
+    def close(self) -> None:
+        """Mark the output finished and wake subscribers."""
+        if self.closed:
+            return
+        self.closed = True
+        self.finished_at = time.monotonic()
+        _spool_writer.submit(self._close_spool)
+        self._notify()
+
+    def discard_spool(self) -> None:
+        """Delete the spool file once pending writes are done (on expiry)."""
+        if self.spool_path is not None:
+            _spool_writer.submit(self._remove_spool, self.spool_path)
+            self.spool_path = None
+
+    async def flush(self) -> None:
+        """Wait until all spool writes submitted so far have finished."""
+        await asyncio.wrap_future(_spool_writer.submit(lambda: None))
+
+    async def read(self, offset: int, limit: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Read output from ``offset``, from the spool if the buffer has moved on.
+
+        Args:
+            offset: Absolute offset.
+            limit: Maximum bytes to return.
+
+        Returns:
+            (data, offset just past the returned data); data older than the
+            buffer that the spool cannot provide is skipped.
+        """
+        start = self.buffer.start
+        if offset < start and self.spool_path is not None:
+            size = min(start - offset, SPOOL_READ_BYTES)
+            if limit is not None:
+                size = min(size, limit)
+            data = await asyncio.wrap_future(
+                _spool_writer.submit(self._read_spool, self.spool_path, offset, size)
+            )
+            if data:
+                return data, offset + len(data)
+        return self.buffer.read(offset, limit)
+
+    def tail_text(self, size: int) -> str:
+        """The last ``size`` bytes decoded as text."""
+        return self.buffer.tail(size).decode("utf-8", errors="replace")
+
+    async def follow(
+        self, offset: Optional[int] = None, idle_timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[int, bytes]]:
+        """
+        Yield output from ``offset`` as it arrives, until the output closes.
+
+        Args:
+            offset: Absolute offset to start from (None for the oldest byte
+                in the buffer; older offsets are read from the spool).
+            idle_timeout: If set, yield ``(offset, b"")`` after this many
+                seconds without output, so callers can send heartbeats.
+
+        Yields:
+            (offset just past the chunk, chunk)
+        """
+        position = self.buffer.start if offset is None else offset
+        while True:
+            changed = self._changed
+            data, position = await self.read(position)
+            if data:
+                yield position, data
+                continue
+            if self.closed:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), idle_timeout)
+            except asyncio.TimeoutError:
+                yield position, b""
+
+    def _notify(self) -> None:
+        # Swap in a fresh event so later waiters block until the next change
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _open_spool(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)
+            self._spool = open(self.spool_path, "ab")
+            self._spool_base = self._spool.tell()
+        except OSError as e:
+            logger.warning(f"⚠️ Output spool unavailable for {self.key}: {e}")
+
+    def _read_spool(self, path: str, offset: int, size: int) -> bytes:
+        if self._spool_base is None:
+            return b""
+        try:
+            if self._spool is not None:
+                self._spool.flush()
+            with open(path, "rb") as f:
+                f.seek(self._spool_base + offset)
+                return f.read(size)
+        except OSError as e:
+            logger.debug(f"Could not read output spool of {self.key}: {e}")
+            return b""
+
+    def _write_spool(self, data: bytes) -> None:
+        if self._spool is None:
+            return
+        try:
+            self._spool.write(data)
+        except OSError as e:
+            logger.warning(f"⚠️ Output spool write failed for {self.key}: {e}")
+            self._close_spool()
+
+    def _close_spool(self) -> None:
+        if self._spool is not None:
+            try:
+                self._spool.close()
+            except OSError:
+                pass
+            self._spool = None
+
+    def _remove_spool(self, path: str) -> None:
+        self._close_spool()
+        self._spool_base = None
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.debug(f"Could not remove output spool {path}: {e}")
+
+
+class ProcessOutputRegistry:
+    """Live and recently finished process outputs, by task ID."""
+
+    def __init__(
+        self,
+        retention_seconds: float = OUTPUT_RETENTION_SECONDS,
+        spool_dir: Optional[str] = CLI_OUTPUT_SPOOL_DIR,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            retention_seconds: How long finished outputs and their spool
+                files are kept.
+            spool_dir: Directory swept for spool files older than the
+                retention (e.g. left by an earlier process).
+        """
+        self.retention_seconds = retention_seconds
+        self.spool_dir = spool_dir
+        self._outputs: Dict[str, ProcessOutput] = {}
+        self._last_sweep: Optional[float] = None
+
+    def open(self, key: str, **kwargs: Any) -> ProcessOutput:
+        """
+        Start capturing output under ``key``, replacing any previous capture.
+
+        Args:
+            key: Task ID (or PID).
+            **kwargs: ProcessOutput options.
+
+        Returns:
+            The new output.
+        """
+        self._prune()
+        self._sweep_spool_dir()
+        previous = self._outputs.get(key)
+        if previous is not None:
+            previous.close()
+        output = ProcessOutput(key, **kwargs)
+        self._outputs[key] = output
+        return output
+
+    def get(self, key: str) -> Optional[ProcessOutput]:
+        """The output captured under ``key``, if still retained."""
+        self._prune()
+        return self._outputs.get(key)
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        expired = [
+            key
+            for key, output in self._outputs.items()
+            if output.finished_at is not None and output.finished_at < cutoff
+        ]
+        for key in expired:
+            self._outputs.pop(key).discard_spool()
+
+    def _sweep_spool_dir(self) -> None:
+        """Remove expired spool files, at most once per retention period."""
+        now = time.monotonic()
+        if not self.spool_dir or (
+            self._last_sweep is not None
+            and now - self._last_sweep < self.retention_seconds
+        ):
+            return
+        self._last_sweep = now
+        live = {
+            output.spool_path
+            for output in self._outputs.values()
+            if output.spool_path is not None
+        }
+        _spool_writer.submit(
+            _remove_expired_spools, self.spool_dir, self.retention_seconds, live
+        )
+
+
+def _remove_expired_spools(spool_dir: str, retention: float, live: set) -> None:
+    """Delete spool files in ``spool_dir`` not written for ``retention`` seconds."""
+    cutoff = time.time() - retention
+    try:
+        entries = list(os.scandir(spool_dir))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.endswith(".log") or entry.path in live:
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not remove expired output spool {entry.path}: {e}")
+
+
+# Global singleton instance
+_output_registry: Optional[ProcessOutputRegistry] = None
+
+
+def get_output_registry() -> ProcessOutputRegistry:
+    """Get or create the global process output registry."""
+    global _output_registry
+    if _output_registry is None:
+        _output_registry = ProcessOutputRegistry()
+    return _output_registry
+
+
+def reset_output_registry() -> None:
+    """Drop the global registry (used by tests)."""
+    global _output_registry
+    _output_registry = None
+
+
+async def pump_stream(stream: Any, output: ProcessOutput) -> int:
+    """
+    Copy a subprocess stream into ``output`` until EOF.
+
+    Args:
+        stream: StreamReader (stdout or stderr).
+        output: Destination.
+
+    Returns:
+        Bytes copied.
+    """
+    copied = 0
+    if stream is None:
+        return copied
+    try:
+        while True:
+            chunk = await stream.read(READ_CHUNK_SIZE)
+            if not chunk or not isinstance(chunk, (bytes, bytearray)):
+                return copied
+            output.append(chunk)
+            copied += len(chunk)
+    except Exception as e:
+        logger.debug(f"Output stream for {output.key} ended: {e}")
+        return copied
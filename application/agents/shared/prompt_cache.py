@@ -0,0 +1,109 @@
+"""
+Prompt-prefix cache settings and metrics.
+
+Agents send a static instruction prefix (see prompt_loader.create_split_instruction)
+that providers can cache. PromptCachePlugin measures, per agent turn, how often
+the prefix sent to the model was unchanged from the previous call and how many
+input tokens the provider served from its cache; the totals are kept here.
+
+This module does not import the agent SDK, so the metrics can be read from
+the web app without loading it.
+"""
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class TurnCacheMetrics:
+    """Prompt cache counters for one agent turn."""
+
+    model_calls: int = 0
+    prefix_hits: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def prefix_hit_ratio(self) -> float:
+        """Share of model calls whose instruction prefix was unchanged."""
+        return self.prefix_hits / self.model_calls if self.model_calls else 0.0
+
+    @property
+    def cached_token_ratio(self) -> float:
+        """Share of input tokens the provider served from its cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "prefix_hit_ratio": round(self.prefix_hit_ratio, 3),
+            "cached_token_ratio": round(self.cached_token_ratio, 3),
+            "tokens_saved": self.cached_tokens,
+        }
+
+
+@dataclass
+class PromptCacheStats:
+    """Prompt cache counters accumulated over all turns."""
+
+    turns: int = 0
+    totals: TurnCacheMetrics = field(default_factory=TurnCacheMetrics)
+    last_turn: Optional[TurnCacheMetrics] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_turn(self, turn: TurnCacheMetrics) -> None:
+        """Add a finished turn to the totals."""
+        with self._lock:
+            self.turns += 1
+            self.totals.model_calls += turn.model_calls
+            self.totals.prefix_hits += turn.prefix_hits
+            self.totals.prompt_tokens += turn.prompt_tokens
+            self.totals.cached_tokens += turn.cached_tokens
+            self.last_turn = turn
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "turns": self.turns,
+                **self.totals.to_dict(),
+                "last_turn": self.last_turn.to_dict() if self.last_turn else None,
+            }
+
+
+_stats: Optional[PromptCacheStats] = None
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """Get the process-wide prompt cache counters."""
+    global _stats
+    if _stats is None:
+        _stats = PromptCacheStats()
+    return _stats
+
+
+def reset_prompt_cache_stats() -> None:
+    """Start new prompt cache counters (for tests)."""
+    global _stats
+    _stats = None
+
+
+def get_context_cache_config() -> Any:
+    """Build the ADK context cache config for runners, or None when disabled.
+
+    ADK applies it to Gemini models only; other models ignore it.
+    """
+    from common.config.config import (
+        PROMPT_CACHE_ENABLED,
+        PROMPT_CACHE_MIN_TOKENS,
+        PROMPT_CACHE_TTL_SECONDS,
+    )
+
+    if not PROMPT_CACHE_ENABLED:
+        return None
+
+    from google.adk.agents.context_cache_config import ContextCacheConfig
+
+    return ContextCacheConfig(
+        ttl_seconds=PROMPT_CACHE_TTL_SECONDS, min_tokens=PROMPT_CACHE_MIN_TOKENS
+    )
@@ -0,0 +1,104 @@
+"""
+Prompt Cache Plugin for measuring instruction prefix reuse.
+
+For every model call the plugin fingerprints the system instruction (the
+static prefix of the agent's prompt) and compares it with the previous call
+of the same agent, and reads how many input tokens the provider reports as
+served from its cache. Counters are collected per agent turn, logged when the
+turn ends and added to the process-wide prompt cache stats.
+
+Based on ADK BasePlugin pattern:
+https://google.github.io/adk-docs/callbacks/
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+
+from application.agents.shared.prompt_cache import (
+    TurnCacheMetrics,
+    get_prompt_cache_stats,
+)
+from application.agents.shared.prompt_loader import prompt_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Turns tracked at once per runner (a pooled runner serves one turn at a time)
+MAX_OPEN_TURNS = 64
+
+
+def _system_instruction_text(llm_request: LlmRequest) -> str:
+    """Get the system instruction of a request as text."""
+    config = llm_request.config
+    instruction = config.system_instruction if config is not None else None
+    if instruction is None:
+        return ""
+    if isinstance(instruction, str):
+        return instruction
+    parts = getattr(instruction, "parts", None) or []
+    return "".join(getattr(part, "text", None) or "" for part in parts)
+
+
+class PromptCachePlugin(BasePlugin):
+    """Per-turn metrics for prompt-prefix reuse and provider cache hits."""
+
+    def __init__(self, name: str = "prompt_cache_plugin") -> None:
+        super().__init__(name=name)
+        self._turns: Dict[str, TurnCacheMetrics] = {}
+        self._last_prefix: Dict[str, str] = {}
+
+    def _turn(self, invocation_id: str) -> TurnCacheMetrics:
+        if invocation_id not in self._turns:
+            # Turns that failed before after_run_callback are never popped
+            while len(self._turns) >= MAX_OPEN_TURNS:
+                self._turns.pop(next(iter(self._turns)))
+            self._turns[invocation_id] = TurnCacheMetrics()
+        return self._turns[invocation_id]
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Count the call and whether the agent's prefix was unchanged."""
+        turn = self._turn(callback_context.invocation_id)
+        fingerprint = prompt_fingerprint(_system_instruction_text(llm_request))
+        agent_name = callback_context.agent_name
+
+        turn.model_calls += 1
+        if self._last_prefix.get(agent_name) == fingerprint:
+            turn.prefix_hits += 1
+        self._last_prefix[agent_name] = fingerprint
+        return None
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """Add the provider-reported input and cached token counts."""
+        usage = llm_response.usage_metadata
+        if llm_response.partial or usage is None:
+            return None
+        turn = self._turn(callback_context.invocation_id)
+        turn.prompt_tokens += usage.prompt_token_count or 0
+        turn.cached_tokens += usage.cached_content_token_count or 0
+        return None
+
+    async def after_run_callback(
+        self, *, invocation_context: InvocationContext
+    ) -> None:
+        """Log the turn's counters and add them to the process totals."""
+        turn = self._turns.pop(invocation_context.invocation_id, None)
+        if turn is None or not turn.model_calls:
+            return
+        get_prompt_cache_stats().record_turn(turn)
+        logger.info(
+            f"🧊 Prompt cache: {turn.model_calls} model calls, "
+            f"prefix hit ratio {turn.prefix_hit_ratio:.0%}, "
+            f"{turn.cached_tokens}/{turn.prompt_tokens} input tokens cached "
+            f"({turn.cached_token_ratio:.0%})"
+        )
@@ -7,14 +7,37 @@ Design Philosophy:
 - Prompts are colocated with their agents for better cohesion
 - Shared prompts live in shared/prompts/ directory
 - Loader checks agent-local prompts first, then falls back to shared
+- Instructions can be split into a static prefix that is identical on every
+  turn (and so can be cached by the model provider) and a small volatile
+  suffix rendered from session state
 """
 
+import hashlib
 import inspect
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from google.adk.agents.readonly_context import ReadonlyContext
 
+# Session state keys that may be interpolated into agent instructions
+SESSION_VARIABLE_NAMES = (
+    "git_branch",
+    "programming_language",
+    "repository_name",
+    "environment",
+    "cyoda_version",
+    "project_type",
+    "entity_name",
+    "language",
+)
+
+CONDITIONAL_TEMPLATE_PATTERN = r"\{template_if:([^:]+)==([^:]+):([^}]+)\}"
+SESSION_PLACEHOLDER_PATTERN = re.compile(
+    r"(?<!\{)\{(" + "|".join(SESSION_VARIABLE_NAMES) + r")\}(?!\})"
+)
+
 
 def load_template(template_name: str, caller_file: Optional[str] = None) -> str:
     """Load a template file with support for per-agent and shared prompts.
@@ -96,8 +119,6 @@ def load_nested_template(template_name: str, **variables: Any) -> str:
     Returns:
         Template content with nested templates resolved and variables substituted
     """
-    import re
-
     # Get caller's file for proper template resolution
     frame = inspect.currentframe()
     caller_file = None
@@ -136,19 +157,7 @@ def _extract_session_variables(context: ReadonlyContext) -> Dict[str, Any]:
     try:
         session_state = context._invocation_context.session.state
 
-        # Common variable names to extract
-        variable_names = [
-            "git_branch",
-            "programming_language",
-            "repository_name",
-            "environment",
-            "cyoda_version",
-            "project_type",
-            "entity_name",
-            "language",
-        ]
-
-        for var_name in variable_names:
+        for var_name in SESSION_VARIABLE_NAMES:
             if var_name in session_state:
                 variables[var_name] = session_state[var_name]
 
@@ -173,9 +182,6 @@ def _replace_conditional_templates(
     Returns:
         Template with conditional templates replaced
     """
-    import re
-
-    conditional_pattern = r"\{template_if:([^:]+)==([^:]+):([^}]+)\}"
 
     def replace_conditional(match):
         var_name = match.group(1).strip()
@@ -187,7 +193,7 @@ def _replace_conditional_templates(
             return load_template(nested_template_name, caller_file=caller_file)
         return ""
 
-    return re.sub(conditional_pattern, replace_conditional, template_content)
+    return re.sub(CONDITIONAL_TEMPLATE_PATTERN, replace_conditional, template_content)
 
 
 def _replace_nested_templates(
@@ -203,8 +209,6 @@ def _replace_nested_templates(
     Returns:
         Template with nested templates replaced
     """
-    import re
-
     template_pattern = r"\{template:([^}]+)\}"
 
     def replace_nested(match):
@@ -307,6 +311,124 @@ def create_instruction_provider(
     return instruction_provider
 
 
+@dataclass(frozen=True)
+class SplitInstruction:
+    """An agent instruction split for provider-side prompt caching.
+
+    Attributes:
+        static_instruction: Prefix that is identical on every turn; pass it as
+            the agent's ``static_instruction`` so it is sent as the system
+            instruction and can be cached
+        instruction: Provider for the volatile suffix rendered from session
+            state, or "" when the template has no session-dependent parts
+        fingerprint: Short hash of the static prefix (changes only when the
+            template or the agent's default variables change)
+    """
+
+    static_instruction: str
+    instruction: Union[str, Callable[[ReadonlyContext], str]]
+    fingerprint: str
+
+
+def prompt_fingerprint(text: str) -> str:
+    """Short stable hash identifying a prompt prefix."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def create_split_instruction(
+    template_name: str, **default_vars: Any
+) -> SplitInstruction:
+    """Create a static instruction prefix and a volatile suffix for an ADK agent.
+
+    Session variables are kept out of the prefix: a ``{repository_name}``
+    placeholder is rendered as ``<repository_name>`` and its value is listed in
+    a "Session context" section of the suffix, and ``{template_if:...}`` blocks
+    that test a session variable are moved to the suffix. Everything else is
+    rendered once, with ``default_vars``, into the prefix.
+
+    Args:
+        template_name: Name of the template file (without .template extension)
+        **default_vars: Default variable values to use in template substitution
+
+    Returns:
+        SplitInstruction for the agent's ``static_instruction``/``instruction``
+
+    Example:
+        >>> split = create_split_instruction("qa_agent")
+        >>> agent = LlmAgent(
+        ...     name="qa_agent",
+        ...     static_instruction=split.static_instruction,
+        ...     instruction=split.instruction,
+        ...     ...
+        ... )
+    """
+    frame = inspect.currentframe()
+    caller_file = None
+    if frame and frame.f_back:
+        caller_file = frame.f_back.f_code.co_filename
+
+    template_content = load_template(template_name, caller_file=caller_file)
+
+    # Conditionals on session state are volatile; the rest are resolved now
+    volatile_blocks: List[str] = []
+
+    def defer_session_conditional(match):
+        if match.group(1).strip() in SESSION_VARIABLE_NAMES:
+            volatile_blocks.append(match.group(0))
+            return ""
+        return match.group(0)
+
+    template_content = re.sub(
+        CONDITIONAL_TEMPLATE_PATTERN, defer_session_conditional, template_content
+    )
+    template_content = _replace_conditional_templates(
+        template_content, default_vars, caller_file
+    )
+    template_content = _replace_nested_templates(template_content, caller_file)
+
+    session_placeholders = sorted(
+        set(SESSION_PLACEHOLDER_PATTERN.findall(template_content))
+    )
+    template_content = SESSION_PLACEHOLDER_PATTERN.sub(r"<\1>", template_content)
+    static_instruction = _substitute_variables(template_content, default_vars)
+
+    if not session_placeholders and not volatile_blocks:
+        return SplitInstruction(
+            static_instruction, "", prompt_fingerprint(static_instruction)
+        )
+
+    def instruction_provider(context: ReadonlyContext) -> str:
+        """Render the session-dependent suffix of the instruction."""
+        variables = {**default_vars}
+        variables.update(_extract_session_variables(context))
+
+        sections = []
+        if session_placeholders:
+            lines = [
+                f"- {name}: {variables.get(name, 'not set')}"
+                for name in session_placeholders
+            ]
+            sections.append(
+                "## Session context\n"
+                "Values of the <placeholders> used in your instructions:\n"
+                + "\n".join(lines)
+            )
+        if volatile_blocks:
+            blocks = _replace_conditional_templates(
+                "\n\n".join(volatile_blocks), variables, caller_file
+            )
+            blocks = _replace_nested_templates(blocks, caller_file).strip()
+            if blocks:
+                sections.append(_substitute_variables(blocks, variables))
+        return "\n\n".join(sections) or "## Session context\nNo session context."
+
+    return SplitInstruction(
+        static_instruction,
+        instruction_provider,
+        prompt_fingerprint(static_instruction),
+    )
+
+
 def extract_session_variable(
     context: ReadonlyContext, variable_name: str, default: Optional[Any] = None
 ) -> Any:
@@ -6,8 +6,14 @@ or by the coordinator.
 
 from application.agents.shared.prompt_loader import (
     create_instruction_provider,
+    create_split_instruction,
     load_nested_template,
     load_template,
 )
 
-__all__ = ["create_instruction_provider", "load_template", "load_nested_template"]
+__all__ = [
+    "create_instruction_provider",
+    "create_split_instruction",
+    "load_template",
+    "load_nested_template",
+]
@@ -7,6 +7,8 @@ from pathlib import Path
 MAX_LOCK_RETRIES = 10
 INITIAL_RETRY_DELAY_SECONDS = 0.2
 MAX_RETRY_DELAY_SECONDS = 2.0
+CONVERSATION_LEASE_TTL_SECONDS = 30.0
+CONVERSATION_LEASE_ACQUIRE_TIMEOUT_SECONDS = 30.0
 
 # Constants for error messages
 UNKNOWN_ERROR_MESSAGE = "Unknown error"
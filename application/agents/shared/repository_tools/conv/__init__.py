@@ -2,12 +2,13 @@
 
 from .files import (
     _collect_file_ids_from_conversation,
-    _decode_file_content,
-    _extract_file_from_edge_data,
-    _extract_file_from_edge_object,
-    _extract_filename_from_metadata,
     _retrieve_and_decode_files,
-    _retrieve_edge_message,
+)
+from .leases import (
+    ConversationLockManager,
+    Lease,
+    LeaseUnavailableError,
+    get_conversation_lock_manager,
 )
 from .locking import (
     _acquire_lock,
@@ -28,6 +29,11 @@ from .updates import (
 )
 
 __all__ = [
+    # Leases
+    "ConversationLockManager",
+    "Lease",
+    "LeaseUnavailableError",
+    "get_conversation_lock_manager",
     # Locking
     "_fetch_conversation",
     "_acquire_lock",
@@ -44,10 +50,5 @@ __all__ = [
     "_get_conversation_entity",
     # Files
     "_collect_file_ids_from_conversation",
-    "_retrieve_edge_message",
-    "_extract_filename_from_metadata",
-    "_decode_file_content",
-    "_extract_file_from_edge_data",
-    "_extract_file_from_edge_object",
     "_retrieve_and_decode_files",
 ]
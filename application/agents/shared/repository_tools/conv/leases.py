@@ -0,0 +1,467 @@
+"""Lease-based conversation locks.
+
+Writers to a conversation hold a short-lived lease stored in a separate
+ConversationLease record, so taking, renewing and releasing a lock never
+rewrites the conversation document. Tasks in the same process queue on a
+per-conversation asyncio.Lock and only the winner talks to Cyoda. Each
+acquisition bumps a fencing token that the holder re-checks right before its
+guarded write; a holder whose lease lapsed (e.g. a long GC pause or a lost
+renewal) sees a newer token and aborts instead of clobbering newer changes.
+
+Cyoda has no conditional writes, so cross-process exclusion is write-then-read
+verification plus fencing: best effort, but it never loses chat history to a
+lock write. When two processes create the first lease record for a
+conversation at the same time, the record with the lowest technical ID wins
+and the other claimer deletes its own record and backs off.
+"""
+
+import abc
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Dict, List, Optional
+
+from application.agents.shared.repository_tools.constants import (
+    CONVERSATION_LEASE_ACQUIRE_TIMEOUT_SECONDS,
+    CONVERSATION_LEASE_TTL_SECONDS,
+    INITIAL_RETRY_DELAY_SECONDS,
+    MAX_LOCK_RETRIES,
+    MAX_RETRY_DELAY_SECONDS,
+)
+from application.entity.conversation_lease import ConversationLease
+from common.service.entity_service import SearchConditionRequest
+from services.services import get_entity_service
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseUnavailableError(Exception):
+    """Raised when a conversation lease cannot be acquired in time."""
+
+
+@dataclass
+class LeaseRecord:
+    """Durable state of a conversation lease."""
+
+    conversation_id: str
+    holder_id: str = ""
+    fencing_token: int = 0
+    expires_at: float = 0.0
+    technical_id: Optional[str] = None
+
+    def is_active(self, now: float) -> bool:
+        return self.expires_at > now
+
+
+@dataclass
+class Lease:
+    """A lease held by this process."""
+
+    conversation_id: str
+    holder_id: str
+    fencing_token: int
+    expires_at: float
+    lost: bool = False
+
+    def matches(self, record: Optional[LeaseRecord]) -> bool:
+        return (
+            record is not None
+            and record.holder_id == self.holder_id
+            and record.fencing_token == self.fencing_token
+        )
+
+
+def _canonical(records: List[LeaseRecord]) -> Optional[LeaseRecord]:
+    """Pick the authoritative record among duplicates: lowest technical ID."""
+    if not records:
+        return None
+    return min(records, key=lambda record: record.technical_id or "")
+
+
+class LeaseStore(abc.ABC):
+    """Storage for lease records."""
+
+    @abc.abstractmethod
+    async def get(self, conversation_id: str) -> Optional[LeaseRecord]:
+        """Return the authoritative lease record of a conversation."""
+
+    @abc.abstractmethod
+    async def put(self, record: LeaseRecord) -> LeaseRecord:
+        """Create or update a lease record; sets technical_id on create."""
+
+    @abc.abstractmethod
+    async def find_all(self, conversation_id: str) -> List[LeaseRecord]:
+        """Return every lease record stored for a conversation."""
+
+    @abc.abstractmethod
+    async def delete(self, record: LeaseRecord) -> None:
+        """Delete a single lease record."""
+
+
+class EntityLeaseStore(LeaseStore):
+    """Lease records persisted as ConversationLease entities in Cyoda."""
+
+    def __init__(self) -> None:
+        self._technical_ids: Dict[str, str] = {}
+
+    async def get(self, conversation_id: str) -> Optional[LeaseRecord]:
+        technical_id = self._technical_ids.get(conversation_id)
+        if not technical_id:
+            record = _canonical(await self.find_all(conversation_id))
+            if record is not None:
+                self._technical_ids[conversation_id] = record.technical_id
+            return record
+
+        response = await get_entity_service().get_by_id(
+            entity_id=technical_id,
+            entity_class=ConversationLease.ENTITY_NAME,
+            entity_version=str(ConversationLease.ENTITY_VERSION),
+        )
+        if not response or not response.data:
+            self._technical_ids.pop(conversation_id, None)
+            return None
+        return self._to_record(conversation_id, response)
+
+    async def find_all(self, conversation_id: str) -> List[LeaseRecord]:
+        responses = await get_entity_service().search(
+            entity_class=ConversationLease.ENTITY_NAME,
+            condition=SearchConditionRequest.builder()
+            .equals("conversation_id", conversation_id)
+            .build(),
+            entity_version=str(ConversationLease.ENTITY_VERSION),
+        )
+        return [
+            self._to_record(conversation_id, response)
+            for response in responses or []
+            if response.data
+        ]
+
+    async def delete(self, record: LeaseRecord) -> None:
+        if not record.technical_id:
+            return
+        await get_entity_service().delete_by_id(
+            entity_id=record.technical_id,
+            entity_class=ConversationLease.ENTITY_NAME,
+            entity_version=str(ConversationLease.ENTITY_VERSION),
+        )
+        if self._technical_ids.get(record.conversation_id) == record.technical_id:
+            del self._technical_ids[record.conversation_id]
+
+    async def put(self, record: LeaseRecord) -> LeaseRecord:
+        entity_service = get_entity_service()
+        entity = ConversationLease(
+            conversation_id=record.conversation_id,
+            holder_id=record.holder_id,
+            fencing_token=record.fencing_token,
+            expires_at=record.expires_at,
+        ).model_dump(by_alias=False)
+
+        if record.technical_id:
+            response = await entity_service.update(
+                entity_id=record.technical_id,
+                entity=entity,
+                entity_class=ConversationLease.ENTITY_NAME,
+                entity_version=str(ConversationLease.ENTITY_VERSION),
+            )
+        else:
+            response = await entity_service.save(
+                entity=entity,
+                entity_class=ConversationLease.ENTITY_NAME,
+                entity_version=str(ConversationLease.ENTITY_VERSION),
+            )
+
+        record.technical_id = response.metadata.id
+        self._technical_ids[record.conversation_id] = record.technical_id
+        return record
+
+    @staticmethod
+    def _to_record(conversation_id: str, response) -> LeaseRecord:
+        data = (
+            response.data
+            if isinstance(response.data, dict)
+            else response.data.model_dump(by_alias=False)
+        )
+        return LeaseRecord(
+            conversation_id=conversation_id,
+            holder_id=data.get("holder_id") or "",
+            fencing_token=int(data.get("fencing_token") or 0),
+            expires_at=float(data.get("expires_at") or 0.0),
+            technical_id=response.metadata.id,
+        )
+
+
+class InMemoryLeaseStore(LeaseStore):
+    """Process-local lease records (single-process deployments and tests)."""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, LeaseRecord] = {}
+
+    async def get(self, conversation_id: str) -> Optional[LeaseRecord]:
+        record = self._records.get(conversation_id)
+        return replace(record) if record else None
+
+    async def put(self, record: LeaseRecord) -> LeaseRecord:
+        if not record.technical_id:
+            record.technical_id = uuid.uuid4().hex
+        self._records[record.conversation_id] = replace(record)
+        return record
+
+    async def find_all(self, conversation_id: str) -> List[LeaseRecord]:
+        record = await self.get(conversation_id)
+        return [record] if record else []
+
+    async def delete(self, record: LeaseRecord) -> None:
+        current = self._records.get(record.conversation_id)
+        if current is not None and current.technical_id == record.technical_id:
+            del self._records[record.conversation_id]
+
+
+class ConversationLockManager:
+    """Hands out conversation leases with renewal and fencing tokens."""
+
+    def __init__(
+        self,
+        store: Optional[LeaseStore] = None,
+        ttl_seconds: float = CONVERSATION_LEASE_TTL_SECONDS,
+        renew_interval_seconds: Optional[float] = None,
+        acquire_timeout_seconds: float = CONVERSATION_LEASE_ACQUIRE_TIMEOUT_SECONDS,
+        max_attempts: int = MAX_LOCK_RETRIES,
+        node_id: Optional[str] = None,
+    ):
+        self.store = store or EntityLeaseStore()
+        self.ttl_seconds = ttl_seconds
+        self.renew_interval_seconds = renew_interval_seconds or ttl_seconds / 3
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.max_attempts = max_attempts
+        self.node_id = node_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._local_locks: Dict[str, asyncio.Lock] = {}
+        self._local_users: Dict[str, int] = {}
+        self._held: Dict[str, Lease] = {}
+        self._renewals: Dict[str, tuple[asyncio.Task, asyncio.Event]] = {}
+
+    async def acquire(self, conversation_id: str) -> Lease:
+        """Acquire the conversation lease and start renewing it.
+
+        Args:
+            conversation_id: Technical ID of the conversation.
+
+        Returns:
+            The held lease. Release it with release().
+
+        Raises:
+            LeaseUnavailableError: If another holder keeps the lease.
+        """
+        local_lock = self._checkout_local_lock(conversation_id)
+        try:
+            await asyncio.wait_for(
+                local_lock.acquire(), timeout=self.acquire_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self._return_local_lock(conversation_id)
+            raise LeaseUnavailableError(
+                f"Timed out waiting for local lock on conversation {conversation_id}"
+            )
+        except BaseException:
+            self._return_local_lock(conversation_id)
+            raise
+
+        try:
+            lease = await self._claim_with_retries(conversation_id)
+        except BaseException:
+            local_lock.release()
+            self._return_local_lock(conversation_id)
+            raise
+
+        self._held[conversation_id] = lease
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._renew_until_stopped(lease, stop))
+        self._renewals[conversation_id] = (task, stop)
+        logger.info(
+            f"🔒 Lease acquired for conversation {conversation_id} "
+            f"(token={lease.fencing_token})"
+        )
+        return lease
+
+    async def release(self, lease: Lease) -> None:
+        """Stop renewing and release the lease. Never raises on store errors."""
+        conversation_id = lease.conversation_id
+        if self._held.get(conversation_id) is not lease:
+            return
+        del self._held[conversation_id]
+        task, stop = self._renewals.pop(conversation_id)
+        stop.set()
+        await task
+
+        try:
+            if not lease.lost:
+                record = await self.store.get(conversation_id)
+                if lease.matches(record):
+                    record.expires_at = 0.0
+                    await self.store.put(record)
+            logger.info(f"🔓 Lease released for conversation {conversation_id}")
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Failed to release lease for {conversation_id}, "
+                f"it will expire in {self.ttl_seconds}s: {e}"
+            )
+        finally:
+            self._local_locks[conversation_id].release()
+            self._return_local_lock(conversation_id)
+
+    @asynccontextmanager
+    async def hold(self, conversation_id: str) -> AsyncIterator[Lease]:
+        """Hold the conversation lease for the duration of the block."""
+        lease = await self.acquire(conversation_id)
+        try:
+            yield lease
+        finally:
+            await self.release(lease)
+
+    def held(self, conversation_id: str) -> Optional[Lease]:
+        """Return the lease this process holds on a conversation, if any."""
+        return self._held.get(conversation_id)
+
+    async def renew(self, lease: Lease) -> bool:
+        """Extend the lease by one TTL.
+
+        Returns:
+            False if the lease was taken over; the lease is then marked lost.
+        """
+        record = await self.store.get(lease.conversation_id)
+        if not lease.matches(record):
+            lease.lost = True
+            return False
+        record.expires_at = time.time() + self.ttl_seconds
+        await self.store.put(record)
+        lease.expires_at = record.expires_at
+        return True
+
+    async def check_fence(self, lease: Lease) -> bool:
+        """Return True if the lease is still current and may guard a write."""
+        if lease.lost:
+            return False
+        # Resolve duplicates again: a concurrently created record with a lower
+        # technical ID may only have become visible after our claim
+        record = _canonical(await self.store.find_all(lease.conversation_id))
+        if not lease.matches(record) or not record.is_active(time.time()):
+            lease.lost = True
+            return False
+        return True
+
+    async def _claim_with_retries(self, conversation_id: str) -> Lease:
+        retry_delay = INITIAL_RETRY_DELAY_SECONDS
+        for attempt in range(self.max_attempts):
+            try:
+                lease = await self._try_claim(conversation_id)
+                if lease is not None:
+                    return lease
+                logger.info(
+                    f"🔒 Conversation {conversation_id} lease is held elsewhere "
+                    f"(attempt {attempt + 1}/{self.max_attempts})"
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to claim lease for {conversation_id}: {e}")
+            if attempt + 1 < self.max_attempts:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 1.5, MAX_RETRY_DELAY_SECONDS)
+        raise LeaseUnavailableError(
+            f"Could not acquire lease on conversation {conversation_id} "
+            f"after {self.max_attempts} attempts"
+        )
+
+    async def _try_claim(self, conversation_id: str) -> Optional[Lease]:
+        now = time.time()
+        current = await self.store.get(conversation_id)
+        if current is not None and current.is_active(now):
+            return None
+
+        record = LeaseRecord(
+            conversation_id=conversation_id,
+            holder_id=f"{self.node_id}:{uuid.uuid4().hex[:12]}",
+            fencing_token=(current.fencing_token if current else 0) + 1,
+            expires_at=now + self.ttl_seconds,
+            technical_id=current.technical_id if current else None,
+        )
+        created = record.technical_id is None
+        await self.store.put(record)
+
+        lease = Lease(
+            conversation_id=conversation_id,
+            holder_id=record.holder_id,
+            fencing_token=record.fencing_token,
+            expires_at=record.expires_at,
+        )
+        if created:
+            # Another process may have created its own record concurrently;
+            # the lowest technical ID wins and every other claimer backs off
+            winner = _canonical(await self.store.find_all(conversation_id))
+            if winner is None or winner.technical_id != record.technical_id:
+                logger.info(
+                    f"🔒 Lost concurrent lease creation for conversation "
+                    f"{conversation_id}, backing off"
+                )
+                await self.store.delete(record)
+                return None
+
+        # Read back: a concurrent claimer from another process may have won
+        if not lease.matches(await self.store.get(conversation_id)):
+            return None
+        return lease
+
+    async def _renew_until_stopped(self, lease: Lease, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.renew_interval_seconds)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                if not await self.renew(lease):
+                    logger.warning(
+                        f"⚠️ Lease on conversation {lease.conversation_id} "
+                        f"was taken over (token={lease.fencing_token})"
+                    )
+                    return
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Failed to renew lease on {lease.conversation_id}: {e}"
+                )
+
+    def _checkout_local_lock(self, conversation_id: str) -> asyncio.Lock:
+        lock = self._local_locks.get(conversation_id)
+        if lock is None:
+            lock = self._local_locks[conversation_id] = asyncio.Lock()
+        self._local_users[conversation_id] = (
+            self._local_users.get(conversation_id, 0) + 1
+        )
+        return lock
+
+    def _return_local_lock(self, conversation_id: str) -> None:
+        users = self._local_users.get(conversation_id, 0) - 1
+        if users > 0:
+            self._local_users[conversation_id] = users
+        else:
+            self._local_users.pop(conversation_id, None)
+            self._local_locks.pop(conversation_id, None)
+
+
+_manager: Optional[ConversationLockManager] = None
+
+
+def get_conversation_lock_manager() -> ConversationLockManager:
+    """Return the process-wide conversation lock manager."""
+    global _manager
+    if _manager is None:
+        _manager = ConversationLockManager()
+    return _manager
+
+
+def reset_conversation_lock_manager() -> None:
+    """Discard the process-wide lock manager (useful for testing)."""
+    global _manager
+    _manager = None
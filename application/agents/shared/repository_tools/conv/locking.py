@@ -1,17 +1,16 @@
 """Conversation locking functions for pessimistic concurrency control."""
 
-import asyncio
 import logging
 from typing import Optional
 
 from application.agents.shared.repository_tools.constants import (
-    INITIAL_RETRY_DELAY_SECONDS,
-    MAX_LOCK_RETRIES,
     MAX_RETRY_DELAY_SECONDS,
 )
 from application.entity.conversation.version_1.conversation import Conversation
 from services.services import get_entity_service
 
+from .leases import Lease, LeaseUnavailableError, get_conversation_lock_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,77 +49,45 @@ async def _fetch_conversation(
         return None, False
 
 
-async def _acquire_lock(conversation_id: str) -> bool:
-    """Acquire lock on conversation entity.
+async def _acquire_lock(conversation_id: str) -> Optional[Lease]:
+    """Acquire the lease guarding writes to a conversation.
+
+    The lease is a separate ConversationLease record; the conversation
+    document itself is not touched.
 
     Args:
         conversation_id: Technical ID of the conversation.
 
     Returns:
-        True if lock acquired successfully.
+        The held lease, or None if it could not be acquired.
     """
     try:
-        conversation, success = await _fetch_conversation(conversation_id)
-        if not success or conversation is None:
-            return False
-
-        logger.info(
-            f"🔒 Sending lock acquisition request for conversation {conversation_id}..."
-        )
-        conversation.locked = True
-        entity_dict = conversation.model_dump(by_alias=False)
-
-        entity_service = get_entity_service()
-        await entity_service.update(
-            entity_id=conversation_id,
-            entity=entity_dict,
-            entity_class=Conversation.ENTITY_NAME,
-            entity_version=str(Conversation.ENTITY_VERSION),
-        )
-
-        logger.info(f"🔒 Lock acquired for conversation {conversation_id}")
-        return True
-
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to acquire lock (version conflict): {e}")
-        return False
+        return await get_conversation_lock_manager().acquire(conversation_id)
+    except LeaseUnavailableError as e:
+        logger.warning(f"⚠️ Failed to acquire lock: {e}")
+        return None
 
 
 async def _release_lock(conversation_id: str, description: str) -> bool:
-    """Release lock on conversation entity.
+    """Release the lease this process holds on a conversation.
 
     Args:
         conversation_id: Technical ID of the conversation.
         description: Description for logging.
 
     Returns:
-        True if lock released successfully.
+        True if a held lease was released.
     """
-    try:
-        logger.info(f"🔓 [{description}] Attempting to release lock...")
-        conversation, success = await _fetch_conversation(conversation_id)
-        if not success or conversation is None:
-            logger.warning(f"⚠️ Could not fetch conversation for lock release")
-            return False
-
-        conversation.locked = False
-        entity_dict = conversation.model_dump(by_alias=False)
-
-        entity_service = get_entity_service()
-        await entity_service.update(
-            entity_id=conversation_id,
-            entity=entity_dict,
-            entity_class=Conversation.ENTITY_NAME,
-            entity_version=str(Conversation.ENTITY_VERSION),
-        )
-
-        logger.info(f"🔓 [{description}] Released lock")
-        return True
-
-    except Exception as e:
-        logger.error(f"❌ [{description}] Failed to release lock: {e}", exc_info=True)
+    manager = get_conversation_lock_manager()
+    lease = manager.held(conversation_id)
+    if lease is None:
+        logger.warning(f"⚠️ [{description}] No lease held for {conversation_id}")
         return False
 
+    await manager.release(lease)
+    logger.info(f"🔓 [{description}] Released lock")
+    return True
+
 
 def _calculate_next_retry_delay(current_delay: float) -> float:
     """Calculate next retry delay with exponential backoff.
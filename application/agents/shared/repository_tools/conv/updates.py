@@ -11,12 +11,8 @@ from application.agents.shared.repository_tools.constants import (
 from application.entity.conversation.version_1.conversation import Conversation
 from services.services import get_entity_service
 
-from .locking import (
-    _acquire_lock,
-    _calculate_next_retry_delay,
-    _fetch_conversation,
-    _release_lock,
-)
+from .leases import Lease, LeaseUnavailableError, get_conversation_lock_manager
+from .locking import _calculate_next_retry_delay, _fetch_conversation
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +33,7 @@ async def _persist_and_verify_update(
         True if update persisted successfully.
     """
     try:
-        logger.info(f"🔍 [{description}] Sending update request with locked=False...")
+        logger.info(f"🔍 [{description}] Sending update request...")
         logger.info(f"🔍 [{description}] Entity dict keys: {list(entity_dict.keys())}")
 
         entity_service = get_entity_service()
@@ -107,10 +103,12 @@ async def _persist_and_verify_update(
 async def _update_conversation_with_lock(
     conversation_id: str, update_fn: Callable, description: str = "update"
 ) -> bool:
-    """Update conversation entity with pessimistic locking.
+    """Update conversation entity while holding the conversation lease.
 
     Implements centralized locking mechanism to prevent race conditions when
     multiple agents/processes update the same conversation simultaneously.
+    The lock is a lease record separate from the conversation, so the only
+    conversation write is the update itself.
 
     Args:
         conversation_id: Technical ID of the conversation.
@@ -122,6 +120,7 @@ async def _update_conversation_with_lock(
     """
     max_retries = MAX_LOCK_RETRIES
     retry_delay = INITIAL_RETRY_DELAY_SECONDS
+    manager = get_conversation_lock_manager()
 
     for attempt in range(max_retries):
         try:
@@ -130,38 +129,24 @@ async def _update_conversation_with_lock(
                 f"conversation_id={conversation_id}"
             )
 
-            # Fetch fresh conversation data before attempting lock
-            conversation, success = await _fetch_conversation(conversation_id)
-            if not success:
-                return False
+            async with manager.hold(conversation_id) as lease:
+                conversation, success = await _fetch_conversation(conversation_id)
+                if not success:
+                    return False
 
-            # Log state before changes
-            logger.info(
-                f"📊 [{description}] BEFORE update - repositoryName={conversation.repository_name}, "
-                f"repositoryOwner={conversation.repository_owner}, "
-                f"repositoryBranch={conversation.repository_branch}, locked={conversation.locked}"
-            )
+                logger.info(
+                    f"📊 [{description}] BEFORE update - repositoryName={conversation.repository_name}, "
+                    f"repositoryOwner={conversation.repository_owner}, "
+                    f"repositoryBranch={conversation.repository_branch}"
+                )
 
-            # Check if already locked by another process
-            if conversation.locked:
-                logger.warning(
-                    f"🔒 [{description}] Conversation is locked, waiting {retry_delay}s..."
+                success = await _apply_update_and_persist(
+                    conversation_id,
+                    update_fn,
+                    description,
+                    conversation=conversation,
+                    lease=lease,
                 )
-                await asyncio.sleep(retry_delay)
-                retry_delay = _calculate_next_retry_delay(retry_delay)
-                continue
-
-            # Try to acquire lock
-            lock_acquired = await _acquire_lock(conversation_id)
-            if not lock_acquired:
-                await asyncio.sleep(retry_delay)
-                retry_delay = _calculate_next_retry_delay(retry_delay)
-                continue
-
-            # Lock acquired - fetch fresh data and apply update
-            success = await _apply_update_and_persist(
-                conversation_id, update_fn, description
-            )
 
             if success:
                 logger.info(
@@ -169,11 +154,13 @@ async def _update_conversation_with_lock(
                 )
                 return True
 
-            # Update failed - release lock and retry
-            await _release_lock(conversation_id, description)
             await asyncio.sleep(retry_delay)
             retry_delay = _calculate_next_retry_delay(retry_delay)
 
+        except LeaseUnavailableError as e:
+            logger.error(f"❌ [{description}] {e}")
+            return False
+
         except Exception as e:
             logger.error(
                 f"❌ [{description}] Unexpected error in lock acquisition: {e}",
@@ -192,6 +179,8 @@ async def _apply_update_and_persist(
     conversation_id: str,
     update_fn: Callable,
     description: str,
+    conversation: Optional[Conversation] = None,
+    lease: Optional[Lease] = None,
 ) -> bool:
     """Apply update function and persist changes with verification.
 
@@ -199,23 +188,26 @@ async def _apply_update_and_persist(
         conversation_id: Technical ID of the conversation.
         update_fn: Function to apply to conversation.
         description: Description for logging.
+        conversation: Conversation already fetched under the lease, if any.
+        lease: Lease guarding the write; its fencing token is checked right
+            before persisting.
 
     Returns:
         True if update persisted successfully.
     """
     try:
-        # Fetch fresh data after acquiring lock
-        logger.info(
-            f"📥 [{description}] Fetching fresh conversation data after lock acquisition..."
-        )
-        conversation, success = await _fetch_conversation(conversation_id)
-        if not success:
-            return False
+        if conversation is None:
+            logger.info(
+                f"📥 [{description}] Fetching fresh conversation data after lock acquisition..."
+            )
+            conversation, success = await _fetch_conversation(conversation_id)
+            if not success:
+                return False
 
         # Apply the update function
         update_fn(conversation)
 
-        # Release lock before persisting
+        # Clear the legacy lock flag left behind by older writers
         conversation.locked = False
         entity_dict = conversation.model_dump(by_alias=False)
 
@@ -225,6 +217,15 @@ async def _apply_update_and_persist(
             f"repositoryBranch={entity_dict.get('repositoryBranch')}"
         )
 
+        if lease is not None and not await get_conversation_lock_manager().check_fence(
+            lease
+        ):
+            logger.warning(
+                f"⚠️ [{description}] Lease on {conversation_id} is no longer current "
+                f"(token={lease.fencing_token}), discarding stale update"
+            )
+            return False
+
         # Persist and verify update
         return await _persist_and_verify_update(
             conversation_id, entity_dict, description
@@ -5,6 +5,7 @@ This module handles conversation entity updates with pessimistic locking,
 build context management, task tracking, and file retrieval from conversations.
 
 Internal organization:
+- conv/leases.py: Conversation leases (lock manager, renewal, fencing tokens)
 - conv/locking.py: Lock acquisition and release
 - conv/updates.py: Conversation update with verification
 - conv/management.py: Build context and task management
@@ -25,16 +26,11 @@ from .conv import (
     _apply_update_and_persist,
     _calculate_next_retry_delay,
     _collect_file_ids_from_conversation,
-    _decode_file_content,
-    _extract_file_from_edge_data,
-    _extract_file_from_edge_object,
-    _extract_filename_from_metadata,
     _fetch_conversation,
     _get_conversation_entity,
     _persist_and_verify_update,
     _release_lock,
     _retrieve_and_decode_files,
-    _retrieve_edge_message,
     _update_conversation_build_context,
     _update_conversation_with_lock,
     _validate_tool_context,
@@ -123,10 +119,5 @@ __all__ = [
     "_validate_tool_context",
     "_get_conversation_entity",
     "_collect_file_ids_from_conversation",
-    "_retrieve_edge_message",
-    "_extract_filename_from_metadata",
-    "_decode_file_content",
-    "_extract_file_from_edge_data",
-    "_extract_file_from_edge_object",
     "_retrieve_and_decode_files",
 ]
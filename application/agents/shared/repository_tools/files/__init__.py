@@ -14,6 +14,7 @@ from application.agents.shared.repository_tools.git_operations import (
 from .file_operations import (
     _log_directory_debug_info,
     _save_all_files,
+    _save_attachment_to_disk,
     _save_file_to_disk,
 )
 from .git_workflow import (
@@ -42,6 +43,7 @@ __all__ = [
     "_determine_functional_requirements_dir",
     # File operations
     "_save_file_to_disk",
+    "_save_attachment_to_disk",
     "_log_directory_debug_info",
     "_save_all_files",
     # Git workflow
@@ -31,6 +31,30 @@ def _save_file_to_disk(filename: str, content: str, target_dir: Path) -> bool:
         return False
 
 
+async def _save_attachment_to_disk(filename: str, attachment, target_dir: Path) -> bool:
+    """Stream an attachment (AttachmentHandle) to disk.
+
+    Args:
+        filename: Name of the file to save (sanitized of path traversal).
+        attachment: Handle to the attachment content.
+        target_dir: Directory to write file into.
+
+    Returns:
+        True if file was saved successfully, False otherwise.
+    """
+    safe_filename = Path(filename).name
+
+    file_path = target_dir / safe_filename
+
+    try:
+        written = await attachment.write_to(str(file_path))
+        logger.info(f"✅ Saved file: {file_path} ({written} bytes)")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to save file {safe_filename}: {e}")
+        return False
+
+
 def _log_directory_debug_info(func_req_dir: Path, saved_files: list[str]) -> None:
     """Log debug information about the directory and saved files.
 
@@ -51,7 +75,8 @@ async def _save_all_files(files: list[dict[str, str]], target_dir: Path) -> list
     """Save all provided files to target directory.
 
     Args:
-        files: List of file dictionaries with 'filename' and 'content' keys.
+        files: List of file dictionaries with 'filename' and 'content' keys;
+            content is text or an AttachmentHandle.
         target_dir: Directory to save files into.
 
     Returns:
@@ -72,7 +97,11 @@ async def _save_all_files(files: list[dict[str, str]], target_dir: Path) -> list
             )
             continue
 
-        if _save_file_to_disk(filename, content, target_dir):
+        if isinstance(content, str):
+            saved = _save_file_to_disk(filename, content, target_dir)
+        else:
+            saved = await _save_attachment_to_disk(filename, content, target_dir)
+        if saved:
             saved_files.append(filename)
         else:
             return []  # Fail on first error
@@ -29,27 +29,20 @@ from .monitoring_helpers import (  # Environment status constants; Output stream
     NEEDS_LOGIN_STATUS,
     NO_TOOL_CONTEXT_ERROR,
     NOT_DEPLOYED_STATUS_TEMPLATE,
-    STREAM_READ_CHUNK_SIZE,
-    STREAM_READ_TIMEOUT_SECONDS,
-    UPDATE_INTERVAL_SECONDS,
-    UPDATE_SIZE_THRESHOLD,
     EnvironmentStatusContext,
-    OutputStreamState,
+    _build_commit_scheduler,
     _check_environment_deployed,
+    _checkpoint_output,
     _construct_environment_url,
     _extract_auth_info,
     _extract_status_context,
-    _handle_periodic_commit,
     _handle_process_completion,
     _handle_timeout_exceeded,
     _monitor_build_process,
-    _read_process_output_chunk,
     _send_initial_commit,
-    _should_update_task,
     _store_environment_info,
     _stream_process_output,
     _terminate_process,
-    _update_task_with_commit_info,
     _update_task_with_output,
     check_user_environment_status,
 )
@@ -70,14 +63,9 @@ __all__ = [
     "DEPLOYING_STATUS_TEMPLATE",
     "ERROR_STATUS_TEMPLATE",
     # Output streaming constants
-    "STREAM_READ_CHUNK_SIZE",
-    "STREAM_READ_TIMEOUT_SECONDS",
-    "UPDATE_INTERVAL_SECONDS",
-    "UPDATE_SIZE_THRESHOLD",
     "KEEP_LAST_OUTPUT_BYTES",
     # Data classes
     "EnvironmentStatusContext",
-    "OutputStreamState",
     # Environment status functions
     "_extract_status_context",
     "_construct_environment_url",
@@ -85,16 +73,14 @@ __all__ = [
     "_check_environment_deployed",
     "check_user_environment_status",
     # Output streaming functions
-    "_read_process_output_chunk",
-    "_should_update_task",
     "_update_task_with_output",
+    "_checkpoint_output",
     "_stream_process_output",
     # Process monitoring functions
     "_extract_auth_info",
     "_send_initial_commit",
     "_handle_process_completion",
-    "_handle_periodic_commit",
-    "_update_task_with_commit_info",
+    "_build_commit_scheduler",
     "_handle_timeout_exceeded",
     "_monitor_build_process",
     "_terminate_process",
@@ -27,25 +27,18 @@ from .environment_status import (
 )
 from .output_streaming import (
     KEEP_LAST_OUTPUT_BYTES,
-    STREAM_READ_CHUNK_SIZE,
-    STREAM_READ_TIMEOUT_SECONDS,
-    UPDATE_INTERVAL_SECONDS,
-    UPDATE_SIZE_THRESHOLD,
-    OutputStreamState,
-    _read_process_output_chunk,
-    _should_update_task,
+    _checkpoint_output,
     _stream_process_output,
     _update_task_with_output,
 )
 from .process_monitoring import (
+    _build_commit_scheduler,
     _extract_auth_info,
-    _handle_periodic_commit,
     _handle_process_completion,
     _handle_timeout_exceeded,
     _monitor_build_process,
     _send_initial_commit,
     _terminate_process,
-    _update_task_with_commit_info,
 )
 
 __all__ = [
@@ -60,14 +53,9 @@ __all__ = [
     "DEPLOYING_STATUS_TEMPLATE",
     "ERROR_STATUS_TEMPLATE",
     # Output streaming constants
-    "STREAM_READ_CHUNK_SIZE",
-    "STREAM_READ_TIMEOUT_SECONDS",
-    "UPDATE_INTERVAL_SECONDS",
-    "UPDATE_SIZE_THRESHOLD",
     "KEEP_LAST_OUTPUT_BYTES",
     # Data classes
     "EnvironmentStatusContext",
-    "OutputStreamState",
     # Environment status functions
     "_extract_status_context",
     "_construct_environment_url",
@@ -75,16 +63,14 @@ __all__ = [
     "_check_environment_deployed",
     "check_user_environment_status",
     # Output streaming functions
-    "_read_process_output_chunk",
-    "_should_update_task",
     "_update_task_with_output",
+    "_checkpoint_output",
     "_stream_process_output",
     # Process monitoring functions
     "_extract_auth_info",
     "_send_initial_commit",
     "_handle_process_completion",
-    "_handle_periodic_commit",
-    "_update_task_with_commit_info",
+    "_build_commit_scheduler",
     "_handle_timeout_exceeded",
     "_monitor_build_process",
     "_terminate_process",
@@ -1,6 +1,9 @@
 """Process output streaming for background tasks.
 
-This module handles streaming process output and updating task metadata.
+This module captures process output into the process output subsystem (ring
+buffer, spool file and live subscribers) and checkpoints its tail into the
+BackgroundTask. Each checkpoint overwrites the previous one, so a long build
+does not grow the task's progress messages.
 """
 
 from __future__ import annotations
@@ -9,99 +12,44 @@ import asyncio
 import logging
 from typing import Any, Optional
 
-from pydantic import BaseModel
-
+from application.agents.shared.process_output import (
+    OUTPUT_CHECKPOINT_KEY,
+    ProcessOutput,
+    get_output_registry,
+    pump_stream,
+)
+from common.config.config import CLI_OUTPUT_CHECKPOINT_SECONDS
 from services.services import get_task_service
 
 logger = logging.getLogger(__name__)
 
-# Configuration constants for output streaming
-STREAM_READ_CHUNK_SIZE = 1024  # Read 1KB at a time
-STREAM_READ_TIMEOUT_SECONDS = 0.5  # Timeout for reading from stdout
-UPDATE_INTERVAL_SECONDS = 2  # Update every 2 seconds or 5KB
-UPDATE_SIZE_THRESHOLD = 5120  # 5KB threshold
-KEEP_LAST_OUTPUT_BYTES = 10000  # Keep last 10KB of output
-
-
-class OutputStreamState(BaseModel):
-    """State for process output streaming."""
-
-    accumulated_output: list = []
-    last_update_time: float = 0.0
-    accumulated_size: int = 0
-
-
-async def _read_process_output_chunk(process: Any) -> Optional[str]:
-    """Read one chunk of output from process stdout.
-
-    Args:
-        process: The asyncio subprocess
-
-    Returns:
-        Decoded output string or None if EOF
-    """
-    try:
-        chunk = await asyncio.wait_for(
-            process.stdout.read(STREAM_READ_CHUNK_SIZE),
-            timeout=STREAM_READ_TIMEOUT_SECONDS,
-        )
-        if chunk:
-            output_str = chunk.decode("utf-8", errors="replace")
-            logger.debug(f"📤 Output chunk: {output_str[:100]}...")
-            return output_str
-        return None
-    except asyncio.TimeoutError:
-        return "TIMEOUT"  # Special marker for timeout
-
-
-async def _should_update_task(
-    accumulated_size: int, last_update_time: float, current_time: float
-) -> bool:
-    """Determine if task should be updated based on size or time interval.
-
-    Args:
-        accumulated_size: Bytes accumulated since last update
-        last_update_time: Timestamp of last update
-        current_time: Current timestamp
-
-    Returns:
-        True if update should happen
-    """
-    size_threshold_met = accumulated_size > UPDATE_SIZE_THRESHOLD
-    time_threshold_met = (current_time - last_update_time) > UPDATE_INTERVAL_SECONDS
-    return size_threshold_met or time_threshold_met
+KEEP_LAST_OUTPUT_BYTES = 10000  # Output tail kept in each task checkpoint
 
 
 async def _update_task_with_output(
-    task_id: str, accumulated_output: list, task_service: Any
+    task_id: str, output: ProcessOutput, task_service: Any
 ) -> bool:
-    """Update task with accumulated output.
+    """Overwrite the task's output checkpoint with the current output tail.
 
     Args:
         task_id: BackgroundTask ID
-        accumulated_output: List of output strings
+        output: Captured process output
         task_service: Task service instance
 
     Returns:
         True if update succeeded
     """
     try:
-        full_output = "".join(accumulated_output)
-        current_task = await task_service.get_task(task_id)
-        existing_metadata = current_task.metadata if current_task else {}
-
-        # Merge existing metadata with new output (keep last 10KB)
-        updated_metadata = {
-            **existing_metadata,
-            "output": full_output[-KEEP_LAST_OUTPUT_BYTES:],
+        task = await task_service.get_task(task_id)
+        if not task:
+            return False
+        task.workflow_cache[OUTPUT_CHECKPOINT_KEY] = {
+            "output": output.tail_text(KEEP_LAST_OUTPUT_BYTES),
+            "output_bytes": output.buffer.end,
         }
-
-        await task_service.update_task_status(
-            task_id=task_id,
-            metadata=updated_metadata,
-        )
+        await task_service.update_task(task)
         logger.info(
-            f"📤 Updated task {task_id} with {len(full_output)} bytes of output"
+            f"📤 Checkpointed output of task {task_id} ({output.buffer.end} bytes)"
         )
         return True
     except Exception as e:
@@ -109,16 +57,47 @@ async def _update_task_with_output(
         return False
 
 
+async def _checkpoint_output(
+    task_id: str,
+    output: ProcessOutput,
+    task_service: Any,
+    finished: asyncio.Event,
+) -> None:
+    """Checkpoint new output periodically until the process output ends.
+
+    Args:
+        task_id: BackgroundTask ID
+        output: Captured process output
+        task_service: Task service instance
+        finished: Set once all output has been read
+    """
+    checkpointed = 0
+    while True:
+        try:
+            await asyncio.wait_for(
+                finished.wait(), timeout=CLI_OUTPUT_CHECKPOINT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            pass
+        if output.buffer.end > checkpointed and await _update_task_with_output(
+            task_id, output, task_service
+        ):
+            checkpointed = output.buffer.end
+        if finished.is_set():
+            return
+
+
 async def _stream_process_output(
     process: Any,
     task_id: Optional[str] = None,
 ) -> None:
-    """Stream process output chunks as they arrive.
+    """Capture process output as it arrives.
 
-    Reads from stdout and stderr, updates BackgroundTask with output chunks.
-    Updates are batched to avoid excessive task service calls:
-    - Every 5KB of accumulated output
-    - Every 2 seconds
+    Reads stdout and stderr with large reads into the task's ProcessOutput,
+    where SSE clients tail it live and the full log is spooled to disk, kept
+    for the output retention period after the process ends. The
+    BackgroundTask only receives a checkpoint of the output tail every
+    CLI_OUTPUT_CHECKPOINT_SECONDS and once more at the end.
 
     Args:
         process: The asyncio subprocess
@@ -126,57 +105,29 @@ async def _stream_process_output(
     """
     try:
         task_service = get_task_service()
-        accumulated_output = []
-        last_update_time = asyncio.get_event_loop().time()
-
-        # Main streaming loop - read and batch output updates
-        while True:
-            # Step 1: Read next chunk from process output
-            output_chunk = await _read_process_output_chunk(process)
-
-            if output_chunk == "TIMEOUT":
-                # Step 2a: Handle timeout - check for periodic update
-                current_time = asyncio.get_event_loop().time()
-                accumulated_size = sum(len(s) for s in accumulated_output)
-
-                if accumulated_output and task_id:
-                    should_update = await _should_update_task(
-                        accumulated_size, last_update_time, current_time
-                    )
-                    if should_update:
-                        success = await _update_task_with_output(
-                            task_id, accumulated_output, task_service
-                        )
-                        if success:
-                            accumulated_output = []
-                            last_update_time = current_time
-
-            elif output_chunk is None:
-                # Step 2b: EOF reached, exit loop
-                break
-
+        output = get_output_registry().open(task_id or str(process.pid))
+        finished = asyncio.Event()
+
+        async def read_all() -> None:
+            try:
+                await asyncio.gather(
+                    pump_stream(process.stdout, output),
+                    pump_stream(getattr(process, "stderr", None), output),
+                )
+            finally:
+                finished.set()
+
+        try:
+            if task_id:
+                await asyncio.gather(
+                    read_all(),
+                    _checkpoint_output(task_id, output, task_service, finished),
+                )
             else:
-                # Step 2c: Got data, accumulate and check for update
-                accumulated_output.append(output_chunk)
-                current_time = asyncio.get_event_loop().time()
-                accumulated_size = sum(len(s) for s in accumulated_output)
-
-                if task_id:
-                    should_update = await _should_update_task(
-                        accumulated_size, last_update_time, current_time
-                    )
-                    if should_update:
-                        success = await _update_task_with_output(
-                            task_id, accumulated_output, task_service
-                        )
-                        if success:
-                            accumulated_output = []
-                            last_update_time = current_time
-
-        # Step 3: Final update with any remaining output
-        if accumulated_output and task_id:
-            await _update_task_with_output(task_id, accumulated_output, task_service)
-            logger.info(f"📤 Final output update completed")
+                await read_all()
+        finally:
+            output.close()
+        logger.info(f"📤 Output capture finished ({output.buffer.end} bytes)")
 
     except Exception as e:
         logger.warning(f"Error streaming process output: {e}")
@@ -1,6 +1,7 @@
-"""Build process monitoring with periodic commits.
+"""Build process monitoring with change-driven commits.
 
-This module handles monitoring build processes with timeout and periodic commits.
+This module handles monitoring build processes with timeout and commits that
+follow changes in the working tree.
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ from typing import Optional
 
 from google.adk.tools.tool_context import ToolContext
 
+from application.agents.shared.commit_scheduler import CommitScheduler
 from application.agents.shared.repository_tools.constants import (
     DEFAULT_BUILD_TIMEOUT_SECONDS,
     PROCESS_CHECK_INTERVAL_SECONDS,
@@ -133,36 +135,36 @@ async def _handle_process_completion(
             logger.warning(f"⚠️ Failed to update BackgroundTask: {e}")
 
 
-async def _handle_periodic_commit(
-    elapsed_time: int,
-    task_id: Optional[str],
+def _build_commit_scheduler(
     repository_path: str,
     branch_name: str,
+    task_id: Optional[str],
     tool_context: Optional[ToolContext],
     auth_repo_url: Optional[str],
     auth_installation_id: Optional[str],
     auth_repository_type: Optional[str],
-) -> None:
-    """Handle periodic commit during build.
+) -> Optional[CommitScheduler]:
+    """Create the change-driven commit scheduler for a build.
 
     Args:
-        elapsed_time: Elapsed time in seconds
-        task_id: Background task ID
         repository_path: Path to repository
         branch_name: Branch name
+        task_id: Background task ID
         tool_context: Tool context
         auth_repo_url: Repository URL
         auth_installation_id: Installation ID
         auth_repository_type: Repository type
+
+    Returns:
+        The scheduler, or None without a tool context to authenticate pushes
     """
-    if not tool_context or elapsed_time % PROCESS_COMMIT_INTERVAL_SECONDS != 0:
-        return
+    if not tool_context:
+        return None
 
-    try:
-        logger.info(f"📊 [{branch_name}] Committing progress...")
+    async def commit(message: str) -> dict:
         from application.agents.github.tools import _commit_and_push_changes
 
-        commit_result = await _commit_and_push_changes(
+        return await _commit_and_push_changes(
             repository_path=repository_path,
             branch_name=branch_name,
             tool_context=tool_context,
@@ -171,40 +173,13 @@ async def _handle_periodic_commit(
             repository_type=auth_repository_type,
         )
 
-        if task_id and commit_result.get("status") == "success":
-            await _update_task_with_commit_info(task_id, commit_result)
-
-        logger.info(f"✅ [{branch_name}] Progress commit completed")
-    except Exception as e:
-        logger.warning(f"⚠️ [{branch_name}] Failed to commit/push: {e}")
-
-
-async def _update_task_with_commit_info(task_id: str, commit_result: dict) -> None:
-    """Update task with commit information.
-
-    Args:
-        task_id: Background task ID
-        commit_result: Result from commit operation
-    """
-    try:
-        task_service = get_task_service()
-        current_task = await task_service.get_task(task_id)
-        existing_metadata = current_task.metadata if current_task else {}
-
-        updated_metadata = {
-            **existing_metadata,
-            "changed_files": commit_result.get("changed_files", [])[:20],
-            "diff": commit_result.get("diff", {}),
-        }
-
-        await task_service.add_progress_update(
-            task_id=task_id,
-            message="Progress committed",
-            metadata=updated_metadata,
-        )
-        logger.info(f"📊 Updated BackgroundTask {task_id} with diff info")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to update task with diff info: {e}")
+    return CommitScheduler(
+        repository_path,
+        branch_name,
+        commit=commit,
+        task_id=task_id,
+        push_interval_seconds=PROCESS_COMMIT_INTERVAL_SECONDS,
+    )
 
 
 async def _handle_timeout_exceeded(
@@ -254,7 +229,7 @@ async def _monitor_build_process(
     timeout_seconds: int = DEFAULT_BUILD_TIMEOUT_SECONDS,
     tool_context: Optional[ToolContext] = None,
 ) -> None:
-    """Monitor build process with periodic checks and git commits.
+    """Monitor build process with periodic checks and change-driven commits.
 
     Args:
         process: The asyncio subprocess
@@ -283,29 +258,35 @@ async def _monitor_build_process(
         auth_repository_type,
     )
 
+    commit_scheduler = _build_commit_scheduler(
+        repository_path,
+        branch_name,
+        task_id,
+        tool_context,
+        auth_repo_url,
+        auth_installation_id,
+        auth_repository_type,
+    )
+
     check_interval = PROCESS_CHECK_INTERVAL_SECONDS
     elapsed_time = 0
 
-    while elapsed_time < timeout_seconds:
-        try:
-            remaining_time = min(check_interval, timeout_seconds - elapsed_time)
-            await asyncio.wait_for(process.wait(), timeout=remaining_time)
-            await _handle_process_completion(process, pid, task_id, elapsed_time)
-            return
-        except asyncio.TimeoutError:
-            elapsed_time += remaining_time
-            await _handle_periodic_commit(
-                elapsed_time,
-                task_id,
-                repository_path,
-                branch_name,
-                tool_context,
-                auth_repo_url,
-                auth_installation_id,
-                auth_repository_type,
-            )
-
-    await _handle_timeout_exceeded(pid, task_id, timeout_seconds, process)
+    try:
+        while elapsed_time < timeout_seconds:
+            try:
+                remaining_time = min(check_interval, timeout_seconds - elapsed_time)
+                await asyncio.wait_for(process.wait(), timeout=remaining_time)
+                await _handle_process_completion(process, pid, task_id, elapsed_time)
+                return
+            except asyncio.TimeoutError:
+                elapsed_time += remaining_time
+                if commit_scheduler:
+                    await commit_scheduler.poll(elapsed_time)
+
+        await _handle_timeout_exceeded(pid, task_id, timeout_seconds, process)
+    finally:
+        if commit_scheduler:
+            commit_scheduler.close()
 
 
 async def _terminate_process(process: any) -> None:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Run ADK evalsets in parallel against recorded model cassettes.
+
+Each eval case runs in a worker process with tools mocked (MOCK_ALL_TOOLS) and
+model calls served from cassettes (see application/agents/eval_cassettes.py),
+so a full pass needs no network and gives the same answer every time. Reports
+per-case latency, model calls and token counts plus a simple ANY_ORDER tool
+trajectory check.
+
+Usage:
+    # Record cassettes against the live models once
+    python run_parallel_evals.py --mode record
+
+    # Replay offline (default), e.g. on CI
+    python run_parallel_evals.py -j 8 -o eval_bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from glob import glob
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parents[3]
+AGENT_DIR = PROJECT_ROOT / "application" / "agents"
+
+DEFAULT_EVALSETS = [
+    str(AGENT_DIR / name / "evals" / "*.evalset.json")
+    for name in ("coordinator", "environment", "qa", "github")
+]
+
+_root_agent = None
+
+
+def _load_evalset(path):
+    from google.adk.evaluation.eval_set import EvalSet
+
+    return EvalSet.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+def _get_root_agent():
+    """Import the eval root agent once per worker process."""
+    global _root_agent
+    if _root_agent is None:
+        from application.agents.agent import root_agent
+
+        _root_agent = root_agent
+    return _root_agent
+
+
+async def _run_case_async(evalset_path, eval_id):
+    from google.adk.evaluation.eval_case import get_all_tool_calls
+    from google.adk.runners import InMemoryRunner
+
+    from application.agents.eval_cassettes import get_cassette_recorder
+
+    evalset = _load_evalset(evalset_path)
+    case = next(c for c in evalset.eval_cases if c.eval_id == eval_id)
+    result = {
+        "evalset": evalset.eval_set_id,
+        "eval_id": eval_id,
+        "status": "passed",
+        "latency_seconds": 0.0,
+        "invocations": 0,
+        "trajectory_matches": 0,
+    }
+    if not case.conversation:
+        result["status"] = "skipped"
+        result["error"] = "Case has no static conversation"
+        return result
+
+    agent = _get_root_agent()
+    recorder = get_cassette_recorder()
+    if recorder is not None:
+        recorder.reset_stats()
+
+    session_input = case.session_input
+    app_name = session_input.app_name if session_input else "agents"
+    user_id = session_input.user_id if session_input else "eval_user"
+    runner = InMemoryRunner(agent=agent, app_name=app_name)
+    session = await runner.session_service.create_session(
+        app_name=app_name,
+        user_id=user_id,
+        state=dict(session_input.state) if session_input else {},
+    )
+
+    started = time.perf_counter()
+    try:
+        for invocation in case.conversation:
+            actual = []
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session.id,
+                new_message=invocation.user_content,
+            ):
+                actual.extend(call.name for call in event.get_function_calls())
+            expected = [
+                call.name for call in get_all_tool_calls(invocation.intermediate_data)
+            ]
+            result["invocations"] += 1
+            # ANY_ORDER: every expected call appears, extra calls are allowed
+            if Counter(expected) <= Counter(actual):
+                result["trajectory_matches"] += 1
+        if result["trajectory_matches"] < result["invocations"]:
+            result["status"] = "failed"
+    finally:
+        result["latency_seconds"] = round(time.perf_counter() - started, 3)
+        if recorder is not None:
+            result.update(recorder.reset_stats().to_dict())
+    return result
+
+
+def run_case(evalset_path, eval_id):
+    """Worker entry point: run one eval case and return its report row."""
+    try:
+        return asyncio.run(_run_case_async(evalset_path, eval_id))
+    except Exception as e:
+        return {
+            "evalset": Path(evalset_path).name,
+            "eval_id": eval_id,
+            "status": "error",
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc(),
+        }
+
+
+def print_report(results, wall_seconds):
+    """Print per-case rows and totals."""
+    header = (
+        f"{'status':<8} {'latency':>8} {'calls':>6} {'hits':>5} {'tokens':>8}  case"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(
+            f"{row['status']:<8} {row.get('latency_seconds', 0):>7.2f}s "
+            f"{row.get('model_calls', 0):>6} {row.get('hits', 0):>5} "
+            f"{row.get('total_tokens', 0):>8}  {row['evalset']}/{row['eval_id']}"
+        )
+        if row.get("error"):
+            print(f"         ↳ {row['error']}")
+
+    statuses = Counter(row["status"] for row in results)
+    case_seconds = sum(row.get("latency_seconds", 0) for row in results)
+    tokens = sum(row.get("total_tokens", 0) for row in results)
+    print()
+    print(
+        f"📊 {len(results)} cases: "
+        + ", ".join(f"{count} {status}" for status, count in sorted(statuses.items()))
+    )
+    print(
+        f"⏱️  Wall time {wall_seconds:.2f}s, summed case time {case_seconds:.2f}s, "
+        f"{tokens} tokens"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "evalsets",
+        nargs="*",
+        help="Evalset files or glob patterns (default: all agent evalsets)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("replay", "record", "auto"),
+        default="replay",
+        help="Cassette mode (default: replay, no network)",
+    )
+    parser.add_argument("--cassette-dir", help="Cassette directory override")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="Worker processes"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report here")
+    args = parser.parse_args()
+
+    # Workers inherit the environment; the eval root agent reads it on import
+    os.environ["DISABLE_MCP_TOOLSET"] = "true"
+    os.environ["MOCK_ALL_TOOLS"] = "true"
+    os.environ["EVAL_CASSETTE_MODE"] = args.mode
+    if args.cassette_dir:
+        os.environ["EVAL_CASSETTE_DIR"] = str(Path(args.cassette_dir).resolve())
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    paths = sorted(
+        {p for pattern in args.evalsets or DEFAULT_EVALSETS for p in glob(pattern)}
+    )
+    if not paths:
+        print("❌ No evalset files found")
+        sys.exit(1)
+    cases = [
+        (path, case.eval_id)
+        for path in paths
+        for case in _load_evalset(path).eval_cases
+    ]
+    print(
+        f"🧪 Running {len(cases)} cases from {len(paths)} evalsets ({args.mode}, {args.jobs} workers)"
+    )
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(run_case, path, eval_id) for path, eval_id in cases]
+        results = [future.result() for future in as_completed(futures)]
+    wall_seconds = time.perf_counter() - started
+
+    results.sort(key=lambda row: (row["evalset"], row["eval_id"]))
+    print_report(results, wall_seconds)
+
+    if args.output:
+        report = {
+            "mode": args.mode,
+            "wall_seconds": round(wall_seconds, 3),
+            "cases": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"📄 Report: {args.output}")
+
+    sys.exit(1 if any(row["status"] == "error" for row in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import sys
+import time
 from pathlib import Path
 
+# Start of the import phase, reported once the app is ready to serve
+_process_started = time.perf_counter()
+
 # Load environment variables FIRST, before any other imports
 from dotenv import load_dotenv
 
@@ -24,14 +28,14 @@ import os
 # Configure root logging to both stdout and a file for debugging/triage.
 # Default file is app-log.log in the application directory; override with APP_LOG_FILE.
 from logging.handlers import RotatingFileHandler
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from quart import Quart, Response, jsonify, request
 from quart_rate_limiter import RateLimiter
 from quart_schema import QuartSchema, ResponseSchemaValidationError, hide
 
-# Apply Google ADK monkey patches early
-import application.agents.shared  # noqa: F401
+from application.agents.shared.job_scheduler import get_job_scheduler
+from application.agents.shared.prompt_cache import get_prompt_cache_stats
 
 # Import blueprints for different route groups
 from application.routes import (
@@ -44,10 +48,25 @@ from application.routes import (
 )
 from application.routes.agent_routes import agent_bp
 from application.routes.repository_routes import repository_bp
+from application.services.structured_output_cache import get_structured_output_cache
+from common.config.config import ASSISTANT_WARMUP
 from common.exception.exception_handler import (
     register_error_handlers as _register_error_handlers,
 )
-from services.services import get_grpc_client, initialize_services
+from common.performance.tracing import configure_tracing_from_env, reset_tracing
+from common.utils.utils import close_streaming_client
+from services.services import (
+    get_assistant_pool,
+    get_grpc_client,
+    initialize_services,
+    is_cyoda_assistant_ready,
+    warm_up_cyoda_assistant,
+)
+
+# google-adk, litellm and the OpenAI agents SDK are imported when the Cyoda
+# Assistant is built (see ASSISTANT_WARMUP), not here. Run
+# scripts/profile_startup.py to see what the import phase costs.
+_imports_done = time.perf_counter()
 
 # Use absolute path to application directory for log file
 app_dir = Path(__file__).parent.resolve()
@@ -166,6 +185,7 @@ QuartSchema(
 # Global holder for the background task to satisfy mypy
 # (avoid setting arbitrary attrs on app)
 _background_task: Optional[asyncio.Task[None]] = None
+_warmup_task: Optional["asyncio.Future[None]"] = None
 
 
 # Register error handlers for custom and generic exceptions
@@ -200,6 +220,33 @@ def favicon() -> tuple[str, int]:
     return "", 200
 
 
+@app.route("/health", methods=["GET"])
+async def health() -> tuple[Dict[str, Any], int]:
+    """Liveness/readiness probe; chats are accepted while the assistant warms up.
+
+    Also reports assistant pool utilization and queueing (see AssistantPool.stats),
+    prompt-prefix cache reuse (see PromptCacheStats) and structured output
+    cache hits (see StructuredOutputCache.stats).
+    """
+    return {
+        "status": "ok",
+        "assistant": "ready" if is_cyoda_assistant_ready() else "warming",
+        "assistant_pool": get_assistant_pool().stats(),
+        "prompt_cache": get_prompt_cache_stats().to_dict(),
+        "structured_output_cache": get_structured_output_cache().stats(),
+    }, 200
+
+
+async def _run_grpc_stream() -> None:
+    """Build the gRPC client in a worker thread, then run its stream."""
+    try:
+        grpc_client = await asyncio.to_thread(get_grpc_client)
+    except Exception as e:
+        logger.error(f"❌ Failed to build the gRPC client: {e}")
+        return
+    await grpc_client.grpc_stream()
+
+
 # Startup tasks: initialize services and start the GRPC stream in the background
 @app.before_serving
 async def startup() -> None:
@@ -211,19 +258,31 @@ async def startup() -> None:
         logger.error("Service configuration validation failed!")
         raise RuntimeError("Invalid service configuration")
 
+    configure_tracing_from_env()
+
     # Initialize services with validated configuration
     config = get_service_config()
     logger.info("Initializing services at application startup...")
     initialize_services(config)
     logger.info("All services initialized successfully at startup")
 
-    # Get the gRPC client and start the stream
-    grpc_client = get_grpc_client()
+    # Close out CLI jobs left queued by processes that are no longer running
+    get_job_scheduler().start_recovery()
 
-    # The stream method is expected to be an async coroutine returning None
-    stream_coro = grpc_client.grpc_stream()
-    global _background_task
-    _background_task = asyncio.create_task(stream_coro)  # type: ignore[arg-type]
+    # Build the gRPC client (and the auth and processor services behind it)
+    # after the server is up, then run its stream
+    global _background_task, _warmup_task
+    _background_task = asyncio.create_task(_run_grpc_stream())
+
+    # Build the agent graph after the server is up instead of before it binds
+    if ASSISTANT_WARMUP == "background":
+        _warmup_task = asyncio.ensure_future(warm_up_cyoda_assistant())
+
+    logger.info(
+        f"🚀 Ready to serve after {time.perf_counter() - _process_started:.2f}s "
+        f"(imports {_imports_done - _process_started:.2f}s, "
+        f"assistant warm-up: {ASSISTANT_WARMUP})"
+    )
 
 
 # Shutdown tasks: cancel the background tasks when shutting down
@@ -232,7 +291,13 @@ async def shutdown() -> None:
     """Cleanup tasks on shutdown."""
     logger.info("Shutting down application...")
 
-    global _background_task
+    global _background_task, _warmup_task
+    if _warmup_task is not None:
+        _warmup_task.cancel()
+        _warmup_task = None
+
+    get_job_scheduler().stop_recovery()
+
     # Cancel the background gRPC stream task
     if _background_task is not None:
         _background_task.cancel()
@@ -243,6 +308,16 @@ async def shutdown() -> None:
         finally:
             _background_task = None
 
+    await close_streaming_client()
+
+    # Close pooled HTTP clients (e.g. Prometheus) held by factory services
+    from application.services.service_factory import get_service_factory
+
+    await get_service_factory().aclose()
+
+    # Flush pending spans
+    reset_tracing()
+
     logger.info("Application shutdown complete")
 
 
@@ -0,0 +1,7 @@
+"""Attachment blob entity package."""
+
+from __future__ import annotations
+
+from application.entity.attachment_blob.version_1 import AttachmentBlob
+
+__all__ = ["AttachmentBlob"]
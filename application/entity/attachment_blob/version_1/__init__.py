@@ -0,0 +1,9 @@
+"""Attachment blob entity version 1."""
+
+from __future__ import annotations
+
+from application.entity.attachment_blob.version_1.attachment_blob import (
+    AttachmentBlob,
+)
+
+__all__ = ["AttachmentBlob"]
@@ -0,0 +1,44 @@
+"""
+Attachment Blob Entity for content-addressed chat file uploads.
+
+One record per distinct file content, keyed by its SHA-256 digest. The bytes
+themselves are stored as chunk edge messages; uploading the same content
+again (into any conversation) reuses the existing chunks.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar, List
+
+from pydantic import ConfigDict, Field
+
+from common.entity.cyoda_entity import CyodaEntity
+
+
+class AttachmentBlob(CyodaEntity):
+    """
+    Index record for stored attachment content.
+
+    ``chunk_ids`` lists the edge messages holding the content in order; every
+    chunk except the last is ``chunk_size`` bytes long.
+    """
+
+    ENTITY_NAME: ClassVar[str] = "AttachmentBlob"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    digest: str = Field(..., description="SHA-256 hex digest of the content")
+
+    size: int = Field(default=0, description="Content size in bytes")
+
+    chunk_size: int = Field(default=0, description="Size of each chunk in bytes")
+
+    chunk_ids: List[str] = Field(
+        default_factory=list, description="Edge message IDs of the chunks, in order"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True,
+        validate_assignment=True,
+        extra="allow",
+    )
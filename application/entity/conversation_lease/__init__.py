@@ -0,0 +1,7 @@
+"""Conversation lease entity package."""
+
+from __future__ import annotations
+
+from application.entity.conversation_lease.version_1 import ConversationLease
+
+__all__ = ["ConversationLease"]
@@ -0,0 +1,9 @@
+"""Conversation lease entity version 1."""
+
+from __future__ import annotations
+
+from application.entity.conversation_lease.version_1.conversation_lease import (
+    ConversationLease,
+)
+
+__all__ = ["ConversationLease"]
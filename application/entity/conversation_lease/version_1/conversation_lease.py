@@ -0,0 +1,50 @@
+"""
+Conversation Lease Entity for durable conversation write locks.
+
+The lease lives in its own small record so that taking or renewing a lock
+never rewrites the conversation document (and its chat history).
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from pydantic import ConfigDict, Field
+
+from common.entity.cyoda_entity import CyodaEntity
+
+
+class ConversationLease(CyodaEntity):
+    """
+    Lease record guarding writes to a single conversation.
+
+    A lease is held while ``expires_at`` is in the future. Every acquisition
+    bumps ``fencing_token``; writers check their token is still current before
+    persisting so a holder whose lease lapsed cannot overwrite newer changes.
+    Released leases keep their record (with ``expires_at`` of 0) so tokens
+    stay monotonic.
+    """
+
+    ENTITY_NAME: ClassVar[str] = "ConversationLease"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    conversation_id: str = Field(
+        ..., description="Technical ID of the guarded conversation"
+    )
+
+    holder_id: str = Field(default="", description="Identifier of the lease holder")
+
+    fencing_token: int = Field(
+        default=0, description="Monotonic token incremented on every acquisition"
+    )
+
+    expires_at: float = Field(
+        default=0.0, description="Lease expiry (Unix timestamp), 0 when released"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True,
+        validate_assignment=True,
+        extra="allow",
+    )
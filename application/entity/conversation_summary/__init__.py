@@ -0,0 +1,7 @@
+"""Conversation summary entity package."""
+
+from __future__ import annotations
+
+from application.entity.conversation_summary.version_1 import ConversationSummary
+
+__all__ = ["ConversationSummary"]
@@ -0,0 +1,9 @@
+"""Conversation summary entity version 1."""
+
+from __future__ import annotations
+
+from application.entity.conversation_summary.version_1.conversation_summary import (
+    ConversationSummary,
+)
+
+__all__ = ["ConversationSummary"]
@@ -0,0 +1,50 @@
+"""
+Conversation Summary Entity for chat listings.
+
+A small projection of a conversation holding only what the chat sidebar
+shows, so listing chats never loads chat history, workflow cache or child
+entities.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar, Optional
+
+from pydantic import ConfigDict, Field
+
+from common.entity.cyoda_entity import CyodaEntity
+
+
+class ConversationSummary(CyodaEntity):
+    """
+    Listing projection of a single conversation.
+
+    Maintained by ``ConversationRepository`` whenever a conversation is
+    created, updated or deleted; keyed by ``conversation_id``.
+    """
+
+    ENTITY_NAME: ClassVar[str] = "ConversationSummary"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    conversation_id: str = Field(
+        ..., description="Technical ID of the summarized conversation"
+    )
+
+    user_id: str = Field(..., description="User ID who owns the conversation")
+
+    name: Optional[str] = Field(default="", description="Conversation name")
+
+    description: Optional[str] = Field(
+        default="", description="Conversation description"
+    )
+
+    date: Optional[str] = Field(
+        default="", description="Conversation creation date (ISO 8601)"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True,
+        validate_assignment=True,
+        extra="allow",
+    )
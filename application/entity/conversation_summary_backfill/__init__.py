@@ -0,0 +1,9 @@
+"""Conversation summary backfill marker entity package."""
+
+from __future__ import annotations
+
+from application.entity.conversation_summary_backfill.version_1 import (
+    ConversationSummaryBackfill,
+)
+
+__all__ = ["ConversationSummaryBackfill"]
@@ -0,0 +1,9 @@
+"""Conversation summary backfill marker entity version 1."""
+
+from __future__ import annotations
+
+from application.entity.conversation_summary_backfill.version_1.conversation_summary_backfill import (
+    ConversationSummaryBackfill,
+)
+
+__all__ = ["ConversationSummaryBackfill"]
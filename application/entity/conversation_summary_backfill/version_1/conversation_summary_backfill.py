@@ -0,0 +1,44 @@
+"""
+Conversation Summary Backfill Entity marking indexed listing scopes.
+
+Conversations created before the summary index existed have no
+ConversationSummary record. A marker records that a scope (one user, or all
+users for superuser listings) was backfilled, so the backfill runs exactly
+once per scope instead of being guessed from an empty listing.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from pydantic import ConfigDict, Field
+
+from common.entity.cyoda_entity import CyodaEntity
+
+
+class ConversationSummaryBackfill(CyodaEntity):
+    """
+    Marker that every conversation of a scope has a summary record.
+
+    Keyed by ``scope``: a user ID, or ``*`` for all users.
+    """
+
+    ENTITY_NAME: ClassVar[str] = "ConversationSummaryBackfill"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    scope: str = Field(..., description="User ID, or '*' for all users")
+
+    conversation_count: int = Field(
+        default=0, description="Number of conversations indexed by the backfill"
+    )
+
+    completed_at: str = Field(
+        default="", description="When the backfill finished (ISO 8601)"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True,
+        validate_assignment=True,
+        extra="allow",
+    )
@@ -7,10 +7,16 @@ Provides clean abstraction over entity service with conversation-specific logic.
 import asyncio
 import copy
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from application.entity.conversation import Conversation
+from application.repositories.conversation_summary_index import (
+    ConversationSummaryIndex,
+    ListCursor,
+)
+from common.constants import CHAT_TRANSFER_CONCURRENCY
 from common.exception import is_not_found
 from common.service.entity_service import EntityService, SearchConditionRequest
 
@@ -31,17 +37,56 @@ RETRYABLE_ERROR_INDICATORS = (
 )
 
 
+@dataclass
+class OwnershipTransferResult:
+    """Outcome of moving one conversation to a new owner."""
+
+    conversation_id: str
+    success: bool
+    error: Optional[str] = None
+
+
+def conversation_from_search_result(response: Any) -> Optional[Conversation]:
+    """
+    Build a Conversation from one entity service search result.
+
+    Args:
+        response: Search result (EntityResponse-like object or dict).
+
+    Returns:
+        Conversation, or None if the result carries no conversation data.
+    """
+    data = response.data if hasattr(response, "data") else response
+    if not isinstance(data, dict):
+        return None
+    if isinstance(data.get("data"), dict):
+        data = data["data"]
+
+    conversation = Conversation(**data)
+    metadata = getattr(response, "metadata", None)
+    if getattr(metadata, "id", None):
+        conversation.technical_id = metadata.id
+    return conversation
+
+
 class ConversationRepository:
     """Repository for conversation entity operations."""
 
-    def __init__(self, entity_service: EntityService):
+    def __init__(
+        self,
+        entity_service: EntityService,
+        summary_index: Optional[ConversationSummaryIndex] = None,
+    ):
         """
         Initialize conversation repository.
 
         Args:
             entity_service: Entity service for data persistence operations.
+            summary_index: Optional listing index kept in step with every
+                create, update and delete.
         """
         self.entity_service = entity_service
+        self.summary_index = summary_index
 
     async def get_by_id(self, technical_id: str) -> Optional[Conversation]:
         """
@@ -123,6 +168,30 @@ class ConversationRepository:
 
         return response_list if isinstance(response_list, list) else []
 
+    async def list_summaries(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[ListCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List conversation summaries newest first using the summary index.
+
+        Args:
+            user_id: Filter by user ID. If None, lists all conversations.
+            limit: Maximum number of results to return.
+            cursor: Keyset position (date, technical_id) of the previous page end.
+
+        Returns:
+            Summary dictionaries with technical_id, name, description and date.
+
+        Raises:
+            RuntimeError: If the repository has no summary index.
+        """
+        if self.summary_index is None:
+            raise RuntimeError("Conversation summary index is not configured")
+        return await self.summary_index.list_page(user_id, limit, cursor)
+
     async def create(self, conversation: Conversation) -> Conversation:
         """
         Create a new conversation.
@@ -141,7 +210,9 @@ class ConversationRepository:
         )
 
         saved_data = response.data if hasattr(response, "data") else response
-        return Conversation(**saved_data)
+        created = Conversation(**saved_data)
+        await self._sync_summary(created)
+        return created
 
     async def update_with_retry(self, conversation: Conversation) -> Conversation:
         """
@@ -190,7 +261,9 @@ class ConversationRepository:
                 )
 
                 saved_data = response.data if hasattr(response, "data") else response
-                return Conversation(**saved_data)
+                updated = Conversation(**saved_data)
+                await self._sync_summary(updated)
+                return updated
 
             except Exception as e:
                 if (
@@ -211,18 +284,168 @@ class ConversationRepository:
 
         raise RuntimeError("Update conversation failed after all retries")
 
-    async def delete(self, technical_id: str) -> None:
+    async def transfer_ownership(
+        self,
+        conversations: List[Conversation],
+        new_user_id: str,
+        concurrency: int = CHAT_TRANSFER_CONCURRENCY,
+    ) -> List[OwnershipTransferResult]:
+        """
+        Move conversations to a new owner.
+
+        See ``iter_transfer_ownership``.
+
+        Args:
+            conversations: Conversations to transfer (e.g. from search); only
+                their IDs are used.
+            new_user_id: User ID of the new owner.
+            concurrency: Maximum concurrent updates.
+
+        Returns:
+            One result per conversation, in completion order.
+        """
+        return [
+            result
+            async for result in self.iter_transfer_ownership(
+                conversations, new_user_id, concurrency
+            )
+        ]
+
+    async def iter_transfer_ownership(
+        self,
+        conversations: List[Conversation],
+        new_user_id: str,
+        concurrency: int = CHAT_TRANSFER_CONCURRENCY,
+    ) -> AsyncIterator[OwnershipTransferResult]:
+        """
+        Move conversations to a new owner, yielding results as they complete.
+
+        Each conversation is re-read right before its write and only the
+        owner is changed on that fresh version, so messages appended since
+        the given documents were fetched are kept. A version conflict repeats
+        the re-read and write.
+
+        Args:
+            conversations: Conversations to transfer (e.g. from search); only
+                their IDs are used.
+            new_user_id: User ID of the new owner.
+            concurrency: Maximum concurrent updates.
+
+        Yields:
+            OwnershipTransferResult per conversation, in completion order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def transfer(conversation: Conversation) -> OwnershipTransferResult:
+            async with semaphore:
+                return await self._transfer_one(conversation, new_user_id)
+
+        for next_result in asyncio.as_completed(
+            [transfer(conversation) for conversation in conversations]
+        ):
+            yield await next_result
+
+    async def _transfer_one(
+        self, conversation: Conversation, new_user_id: str
+    ) -> OwnershipTransferResult:
+        """
+        Change one conversation's owner on its current version.
+
+        Args:
+            conversation: Conversation to transfer.
+            new_user_id: User ID of the new owner.
+
+        Returns:
+            Transfer result for the conversation.
+        """
+        conversation_id = conversation.technical_id
+        for attempt in range(MAX_CONVERSATION_UPDATE_RETRIES):
+            # The given document may predate messages added since it was read
+            try:
+                fresh = await self.get_by_id(conversation_id)
+            except Exception as e:
+                logger.error(f"Failed to read conversation {conversation_id}: {e}")
+                return OwnershipTransferResult(conversation_id, False, str(e))
+            if fresh is None:
+                return OwnershipTransferResult(
+                    conversation_id, False, "Conversation not found"
+                )
+            conversation = fresh
+
+            conversation.user_id = new_user_id
+            try:
+                response = await self.entity_service.update(
+                    entity_id=conversation_id,
+                    entity=conversation.model_dump(by_alias=False),
+                    entity_class=Conversation.ENTITY_NAME,
+                    entity_version=str(Conversation.ENTITY_VERSION),
+                )
+            except Exception as e:
+                if (
+                    not self._is_retryable_error(str(e))
+                    or attempt >= MAX_CONVERSATION_UPDATE_RETRIES - 1
+                ):
+                    logger.error(
+                        f"Failed to transfer conversation {conversation_id}: {e}"
+                    )
+                    return OwnershipTransferResult(conversation_id, False, str(e))
+
+                delay = RETRY_BASE_DELAY_SECONDS * (2**attempt)
+                logger.warning(
+                    f"Version conflict transferring conversation {conversation_id} "
+                    f"(attempt {attempt + 1}). Retrying in {delay:.3f}s..."
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if not response:
+                return OwnershipTransferResult(
+                    conversation_id, False, "Update returned no entity"
+                )
+            await self._sync_summary(conversation)
+            return OwnershipTransferResult(conversation_id, True)
+
+        return OwnershipTransferResult(
+            conversation_id, False, "Transfer failed after all retries"
+        )
+
+    async def delete(self, technical_id: str, user_id: Optional[str] = None) -> None:
         """
         Delete conversation by technical ID.
 
         Args:
             technical_id: Technical UUID of the conversation to delete.
+            user_id: Owner of the conversation, if known.
         """
         await self.entity_service.delete_by_id(
             entity_id=technical_id,
             entity_class=Conversation.ENTITY_NAME,
             entity_version=str(Conversation.ENTITY_VERSION),
         )
+        if self.summary_index is not None:
+            try:
+                await self.summary_index.remove(technical_id, user_id)
+            except Exception as e:
+                logger.warning(f"Failed to remove summary for {technical_id}: {e}")
+
+    async def _sync_summary(self, conversation: Conversation) -> None:
+        """
+        Bring the conversation's summary record up to date.
+
+        Summary writes are best effort: the conversation write has already
+        succeeded, and the next update rewrites a missed summary.
+
+        Args:
+            conversation: Conversation as just persisted.
+        """
+        if self.summary_index is None:
+            return
+        try:
+            await self.summary_index.upsert(conversation)
+        except Exception as e:
+            logger.warning(
+                f"Failed to update summary for {conversation.technical_id}: {e}"
+            )
 
     def _merge_conversation_state(
         self, fresh: Conversation, target: Dict[str, Any]
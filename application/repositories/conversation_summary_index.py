@@ -0,0 +1,455 @@
+"""
+Conversation summary index for chat listings.
+
+Keeps one ``ConversationSummary`` record per conversation in step with the
+conversation itself, and pages over those records with a keyset cursor on
+``(date, technical_id)``, newest first.
+
+Search has no server-side ordering, so a page is read in date windows below
+the cursor that grow until the page is filled; only the summaries in those
+windows are loaded, not every summary of the user.
+
+Conversations created before the index existed are indexed once per scope (a
+user, or all users for superuser listings); a ConversationSummaryBackfill
+marker records that a scope is complete.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from application.entity.conversation import Conversation
+from application.entity.conversation_summary import ConversationSummary
+from application.entity.conversation_summary_backfill import (
+    ConversationSummaryBackfill,
+)
+from common.search.operators import CyodaOperator, LogicalOperator
+from common.service.entity_service import EntityService, SearchConditionRequest
+
+logger = logging.getLogger(__name__)
+
+# Concurrent summary writes when backfilling existing conversations
+SUMMARY_BACKFILL_CONCURRENCY = 8
+
+# Backfill scope covering every user (superuser listings)
+ALL_USERS_SCOPE = "*"
+
+# Conversations whose summary record ID and last written summary are kept in
+# memory; the least recently used are dropped and looked up again if needed
+SUMMARY_CACHE_MAX_ENTRIES = 10_000
+
+# A page is first searched within this many days below the cursor; each
+# further window is SUMMARY_LIST_WINDOW_GROWTH times wider, and after
+# SUMMARY_LIST_MAX_WINDOWS windows the remainder is read in one query
+SUMMARY_LIST_WINDOW_DAYS = 30
+SUMMARY_LIST_WINDOW_GROWTH = 4
+SUMMARY_LIST_MAX_WINDOWS = 3
+
+# Keyset position: (date, technical_id); technical_id may be None for legacy
+# date-only cursors
+ListCursor = Tuple[str, Optional[str]]
+
+
+def _entity_data(response: Any) -> Dict[str, Any]:
+    data = response.data if hasattr(response, "data") else response
+    if not isinstance(data, dict):
+        data = data.model_dump(by_alias=False)
+    if isinstance(data.get("data"), dict):
+        data = data["data"]
+    return data
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class ConversationSummaryIndex:
+    """Maintains ConversationSummary records and serves keyset pages over them."""
+
+    def __init__(
+        self,
+        entity_service: EntityService,
+        max_cached: int = SUMMARY_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the summary index.
+
+        Args:
+            entity_service: Entity service for data persistence operations.
+            max_cached: Conversations whose summary state is kept in memory.
+        """
+        self.entity_service = entity_service
+        self.max_cached = max_cached
+        self._technical_ids: "OrderedDict[str, str]" = OrderedDict()
+        # Last summary written per conversation, so unchanged updates (e.g.
+        # appending a message) cost no write
+        self._written: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._listeners: List[Callable[[str], None]] = []
+        # Backfill scopes known to be complete, and per-scope backfill locks
+        self._backfilled: Set[str] = set()
+        self._backfill_locks: Dict[str, asyncio.Lock] = {}
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked with each user ID whose listing changed.
+
+        Args:
+            listener: Callable taking the affected user ID.
+        """
+        self._listeners.append(listener)
+
+    @staticmethod
+    def summarize(conversation: Conversation) -> Dict[str, Any]:
+        """
+        Build the summary fields for a conversation.
+
+        Args:
+            conversation: Conversation to summarize.
+
+        Returns:
+            Summary dictionary as stored in the index.
+        """
+        return {
+            "conversation_id": conversation.technical_id,
+            "user_id": conversation.user_id,
+            "name": conversation.name or "",
+            "description": conversation.description or "",
+            "date": conversation.date or "",
+        }
+
+    async def upsert(self, conversation: Conversation) -> bool:
+        """
+        Write the conversation's summary if it changed.
+
+        Args:
+            conversation: Conversation that was created or updated.
+
+        Returns:
+            True if a summary record was written.
+        """
+        if not conversation.technical_id:
+            return False
+        return await self._write(self.summarize(conversation))
+
+    async def remove(self, conversation_id: str, user_id: Optional[str]) -> None:
+        """
+        Delete the summary for a deleted conversation.
+
+        Args:
+            conversation_id: Technical ID of the deleted conversation.
+            user_id: Owner of the conversation, for listener notification.
+        """
+        technical_id = self._technical_ids.pop(conversation_id, None)
+        previous = self._written.pop(conversation_id, None)
+        if not technical_id:
+            technical_id, previous = await self._find(conversation_id)
+        if technical_id:
+            await self.entity_service.delete_by_id(
+                entity_id=technical_id,
+                entity_class=ConversationSummary.ENTITY_NAME,
+                entity_version=str(ConversationSummary.ENTITY_VERSION),
+            )
+        self._notify(
+            [user_id, previous.get("user_id") if previous else None],
+        )
+
+    async def ensure_backfilled(self, user_id: Optional[str]) -> bool:
+        """
+        Index conversations created before the summary index, once per scope.
+
+        The scope is the user, or all users for a superuser listing. A
+        ConversationSummaryBackfill marker is saved once every conversation
+        of the scope was indexed, so later listings (on any instance) skip
+        the backfill. Failures are logged and retried on the next listing.
+
+        Args:
+            user_id: Owner whose conversations are listed (None for all users).
+
+        Returns:
+            True if a backfill ran and completed.
+        """
+        scope = user_id or ALL_USERS_SCOPE
+        if self._is_backfilled(scope):
+            return False
+
+        lock = self._backfill_locks.setdefault(scope, asyncio.Lock())
+        async with lock:
+            if self._is_backfilled(scope):
+                return False
+            try:
+                if await self._has_backfill_marker(scope):
+                    self._backfilled.add(scope)
+                    return False
+                summaries = await self._legacy_summaries(user_id)
+                failures = await self._backfill(summaries)
+                if failures:
+                    logger.warning(
+                        f"Summary backfill for {scope}: {failures} write(s) failed, "
+                        f"will retry on the next listing"
+                    )
+                    return False
+                await self.entity_service.save(
+                    entity=ConversationSummaryBackfill(
+                        scope=scope,
+                        conversation_count=len(summaries),
+                        completed_at=datetime.now(timezone.utc).isoformat(),
+                    ).model_dump(by_alias=False),
+                    entity_class=ConversationSummaryBackfill.ENTITY_NAME,
+                    entity_version=str(ConversationSummaryBackfill.ENTITY_VERSION),
+                )
+            except Exception as e:
+                logger.warning(f"Summary backfill for {scope} failed: {e}")
+                return False
+            self._backfilled.add(scope)
+            logger.info(f"Backfilled {len(summaries)} conversation summaries ({scope})")
+            return True
+
+    async def list_page(
+        self,
+        user_id: Optional[str],
+        limit: int,
+        cursor: Optional[ListCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List summaries newest first, strictly after ``cursor``.
+
+        Records are searched in date windows below the cursor date (or now),
+        newest window first, until ``limit`` rows are found; every row of a
+        later window is older than all rows already found, so only the
+        windows needed for the page are loaded. The ``(date, technical_id)``
+        tie-break is applied here, so rows sharing a date are neither skipped
+        nor repeated across pages.
+
+        Args:
+            user_id: Owner filter (None for all users - superuser).
+            limit: Maximum number of rows to return.
+            cursor: Keyset position of the last row of the previous page.
+
+        Returns:
+            Listing dictionaries with technical_id, name, description and date.
+        """
+        upper = cursor[0] if cursor and cursor[0] else None
+        anchor = _parse_date(upper) if upper else datetime.now(timezone.utc)
+        upper_operator = CyodaOperator.LESS_OR_EQUAL
+        span = timedelta(days=SUMMARY_LIST_WINDOW_DAYS)
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for window in range(SUMMARY_LIST_MAX_WINDOWS + 1):
+            lower = None
+            if anchor is not None and window < SUMMARY_LIST_MAX_WINDOWS:
+                lower = (anchor - span).isoformat()
+            for row in await self._search_window(user_id, upper, upper_operator, lower):
+                if not cursor or self._is_after(row, cursor):
+                    rows[row["technical_id"]] = row
+            if lower is None or len(rows) >= limit:
+                break
+            upper, upper_operator = lower, CyodaOperator.LESS_THAN
+            span *= SUMMARY_LIST_WINDOW_GROWTH
+
+        page = sorted(
+            rows.values(),
+            key=lambda row: (row["date"], row["technical_id"]),
+            reverse=True,
+        )
+        return page[:limit]
+
+    async def _search_window(
+        self,
+        user_id: Optional[str],
+        upper: Optional[str],
+        upper_operator: CyodaOperator,
+        lower: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        builder = SearchConditionRequest.builder()
+        if user_id:
+            builder.equals("user_id", user_id)
+        if upper:
+            builder.add_condition("date", upper_operator, upper)
+        if lower:
+            builder.add_condition("date", CyodaOperator.GREATER_OR_EQUAL, lower)
+
+        response_list = await self.entity_service.search(
+            entity_class=ConversationSummary.ENTITY_NAME,
+            condition=builder.build(),
+            entity_version=str(ConversationSummary.ENTITY_VERSION),
+        )
+
+        rows = []
+        for response in response_list or []:
+            data = _entity_data(response)
+            rows.append(
+                {
+                    "technical_id": data.get("conversation_id", ""),
+                    "name": data.get("name") or "",
+                    "description": data.get("description") or "",
+                    "date": data.get("date") or "",
+                }
+            )
+        return rows
+
+    def _is_backfilled(self, scope: str) -> bool:
+        return scope in self._backfilled or ALL_USERS_SCOPE in self._backfilled
+
+    async def _has_backfill_marker(self, scope: str) -> bool:
+        # A completed all-users backfill covers every user scope too
+        builder = (
+            SearchConditionRequest.builder()
+            .equals("scope", scope)
+            .equals("scope", ALL_USERS_SCOPE)
+            .operator(LogicalOperator.OR)
+        )
+        markers = await self.entity_service.search(
+            entity_class=ConversationSummaryBackfill.ENTITY_NAME,
+            condition=builder.build(),
+            entity_version=str(ConversationSummaryBackfill.ENTITY_VERSION),
+        )
+        return bool(markers)
+
+    async def _legacy_summaries(self, user_id: Optional[str]) -> List[Dict[str, Any]]:
+        if user_id:
+            response_list = await self.entity_service.search(
+                entity_class=Conversation.ENTITY_NAME,
+                condition=SearchConditionRequest.builder()
+                .equals("user_id", user_id)
+                .build(),
+                entity_version=str(Conversation.ENTITY_VERSION),
+            )
+        else:
+            response_list = await self.entity_service.find_all(
+                entity_class=Conversation.ENTITY_NAME,
+                entity_version=str(Conversation.ENTITY_VERSION),
+            )
+
+        summaries = []
+        for response in response_list or []:
+            data = _entity_data(response)
+            metadata = getattr(response, "metadata", None)
+            conversation_id = getattr(metadata, "id", None) or data.get("technical_id")
+            owner = data.get("user_id") or user_id
+            if not conversation_id or not owner:
+                continue
+            summaries.append(
+                {
+                    "conversation_id": conversation_id,
+                    "user_id": owner,
+                    "name": data.get("name") or "",
+                    "description": data.get("description") or "",
+                    "date": data.get("date") or data.get("created_at") or "",
+                }
+            )
+        return summaries
+
+    async def _backfill(self, summaries: List[Dict[str, Any]]) -> int:
+        semaphore = asyncio.Semaphore(SUMMARY_BACKFILL_CONCURRENCY)
+
+        async def write(summary: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self._write(summary)
+
+        results = await asyncio.gather(
+            *(write(summary) for summary in summaries), return_exceptions=True
+        )
+        return sum(1 for result in results if isinstance(result, Exception))
+
+    @staticmethod
+    def _is_after(row: Dict[str, Any], cursor: ListCursor) -> bool:
+        cursor_date, cursor_id = cursor
+        if cursor_id is None:
+            return row["date"] < cursor_date
+        return (row["date"], row["technical_id"]) < (cursor_date, cursor_id)
+
+    async def _write(self, summary: Dict[str, Any]) -> bool:
+        conversation_id = summary["conversation_id"]
+        previous = self._written.get(conversation_id)
+        if previous == summary:
+            self._written.move_to_end(conversation_id)
+            return False
+
+        technical_id = self._technical_ids.get(conversation_id)
+        if not technical_id:
+            technical_id, previous = await self._find(conversation_id)
+            if technical_id and previous == summary:
+                self._remember(conversation_id, technical_id, summary)
+                return False
+
+        entity = ConversationSummary(**summary).model_dump(by_alias=False)
+        if technical_id:
+            response = await self.entity_service.update(
+                entity_id=technical_id,
+                entity=entity,
+                entity_class=ConversationSummary.ENTITY_NAME,
+                entity_version=str(ConversationSummary.ENTITY_VERSION),
+            )
+        else:
+            response = await self.entity_service.save(
+                entity=entity,
+                entity_class=ConversationSummary.ENTITY_NAME,
+                entity_version=str(ConversationSummary.ENTITY_VERSION),
+            )
+
+        self._remember(conversation_id, response.metadata.id, summary)
+        self._notify(
+            [summary["user_id"], previous.get("user_id") if previous else None]
+        )
+        return True
+
+    async def _find(
+        self, conversation_id: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        response = await self.entity_service.find_by_business_id(
+            entity_class=ConversationSummary.ENTITY_NAME,
+            business_id=conversation_id,
+            business_id_field="conversation_id",
+            entity_version=str(ConversationSummary.ENTITY_VERSION),
+        )
+        if not response or not response.data:
+            return None, None
+
+        data = _entity_data(response)
+        stored = {
+            key: data.get(key) or ""
+            for key in ("conversation_id", "user_id", "name", "description", "date")
+        }
+        self._remember(conversation_id, response.metadata.id)
+        return response.metadata.id, stored
+
+    def _remember(
+        self,
+        conversation_id: str,
+        technical_id: str,
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Cache a conversation's summary record ID (and summary), evicting LRU."""
+        self._technical_ids[conversation_id] = technical_id
+        self._technical_ids.move_to_end(conversation_id)
+        if summary is not None:
+            self._written[conversation_id] = summary
+            self._written.move_to_end(conversation_id)
+        for cache in (self._technical_ids, self._written):
+            while len(cache) > self.max_cached:
+                cache.popitem(last=False)
+
+    def _notify(self, user_ids: Iterable[Optional[str]]) -> None:
+        for user_id in {user_id for user_id in user_ids if user_id}:
+            for listener in self._listeners:
+                listener(user_id)
+
+
+def summary_index_of(repository: Any) -> Optional[ConversationSummaryIndex]:
+    """
+    Return the summary index a conversation repository maintains, if any.
+
+    Args:
+        repository: Conversation repository (or a stand-in without an index).
+
+    Returns:
+        The repository's ConversationSummaryIndex, or None.
+    """
+    index = getattr(repository, "summary_index", None)
+    return index if isinstance(index, ConversationSummaryIndex) else None
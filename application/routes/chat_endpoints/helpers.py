@@ -2,15 +2,14 @@
 
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncContextManager, AsyncGenerator, List
 
 from quart import Response
 
 from application.entity.conversation import Conversation
 from application.services.openai.canvas_question_service import CanvasQuestionService
 from application.services.service_factory import get_service_factory
-from services.services import get_cyoda_assistant, get_repository
+from services.services import get_assistant_pool, get_repository
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)  # Enable debug logging for helpers
@@ -31,9 +30,9 @@ def get_canvas_question_service(google_adk_service: Any) -> CanvasQuestionServic
     return CanvasQuestionService(google_adk_service)
 
 
-def get_cyoda_assistant_instance() -> Any:
-    """Get the Cyoda Assistant instance."""
-    return get_cyoda_assistant()
+def lease_cyoda_assistant(conversation_id: str) -> AsyncContextManager[Any]:
+    """Lease a pooled Cyoda Assistant for one agent turn of the conversation."""
+    return get_assistant_pool().lease(conversation_id)
 
 
 async def get_conversation(technical_id: str):
@@ -86,97 +85,3 @@ def build_stream_response(event_gen: AsyncGenerator[str, None]) -> Response:
             "Content-Encoding": "none",
         },
     )
-
-
-def process_content_event(
-    sse_event: str, accumulated_response: str, streaming_events: List[Dict[str, Any]]
-) -> tuple[str, List[Dict[str, Any]]]:
-    """Process a content event from the stream."""
-    try:
-        data_start = sse_event.find("data: ") + 6
-        json_str = sse_event[data_start:].strip()
-        event_data = json.loads(json_str)
-
-        # The streaming service sends 'chunk' field, not 'content'
-        content_chunk = event_data.get("chunk") or event_data.get("content")
-
-        if content_chunk:
-            logger.debug(
-                f"📝 [helper] Extracting content chunk: '{content_chunk[:50]}...' (length: {len(content_chunk)})"
-            )
-            accumulated_response += content_chunk
-            logger.debug(
-                f"📝 [helper] New accumulated length: {len(accumulated_response)}"
-            )
-        else:
-            logger.warning(
-                f"⚠️ [helper] Content event has no 'chunk' or 'content' field: {event_data}"
-            )
-
-        # Store the full event data for debugging/timeline display
-        streaming_events.append(
-            {
-                "type": "content",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "data": event_data,
-            }
-        )
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.warning(f"Failed to parse content event: {e}")
-        logger.debug(f"Failed event data: {sse_event[:200]}")
-
-    return accumulated_response, streaming_events
-
-
-def process_done_event(
-    sse_event: str, accumulated_response: str, streaming_events: List[Dict[str, Any]]
-) -> tuple[
-    bool, str | None, str, str | None, Dict[str, Any] | None, List[Dict[str, Any]]
-]:
-    """Process a done event from the stream."""
-    done_event_sent = True
-    done_event_to_send = None
-    adk_session_id_result = None
-    hook_result = None
-
-    try:
-        data_start = sse_event.find("data: ") + 6
-        json_str = sse_event[data_start:].strip()
-        event_data = json.loads(json_str)
-
-        if "adk_session_id" in event_data:
-            adk_session_id_result = event_data["adk_session_id"]
-        if "hook" in event_data:
-            hook_result = event_data["hook"]
-
-        done_event_to_send = sse_event
-        # Store the full event data for debugging/timeline display
-        streaming_events.append(
-            {
-                "type": "done",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "data": event_data,
-            }
-        )
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.warning(f"Failed to parse done event: {e}")
-
-    return (
-        done_event_sent,
-        done_event_to_send,
-        accumulated_response,
-        adk_session_id_result,
-        hook_result,
-        streaming_events,
-    )
-
-
-def get_event_type(sse_event: str) -> str:
-    """Determine event type from SSE event string."""
-    if "event: " in sse_event:
-        event_line = [
-            line for line in sse_event.split("\n") if line.startswith("event: ")
-        ]
-        if event_line:
-            return event_line[0].replace("event: ", "").strip()
-    return "unknown"
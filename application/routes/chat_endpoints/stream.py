@@ -1,9 +1,10 @@
 """Stream chat endpoint."""
 
-import base64
-import json
+import asyncio
+import io
 import logging
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
@@ -16,19 +17,23 @@ from application.routes.chat_endpoints.helpers import (
     build_stream_response,
     error_response,
     get_chat_service,
-    get_cyoda_assistant_instance,
     get_edge_message_persistence_service,
-    get_event_type,
-    process_content_event,
-    process_done_event,
-    update_conversation,
+    lease_cyoda_assistant,
 )
 from application.routes.common.auth import get_authenticated_user
 from application.routes.common.rate_limiting import default_rate_limit_key
+from application.routes.common.response import APIResponse
+from application.services.attachment_store import get_attachment_store
+from application.services.chat.unit_of_work import ConversationUnitOfWork
 from application.services.streaming.conversation_sanitizer import (
     sanitize_conversation_history,
 )
-from application.services.streaming_service import StreamingService
+from application.services.streaming.detached_runs import (
+    DetachedRun,
+    get_run_registry,
+)
+from application.services.streaming.events import StreamItem
+from application.services.streaming_service import StreamEvent, StreamingService
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)  # Enable debug logging for stream endpoint
@@ -48,84 +53,65 @@ async def _save_user_message_to_conversation(
     user_message: str,
     file_blob_ids: List[str],
     conversation: Conversation,
-) -> tuple[str, Conversation]:
-    """Save user message to conversation and return edge message ID."""
+    adk_session_id: Optional[str] = None,
+) -> Conversation:
+    """Save the user message and pending conversation changes in one update."""
     persistence_service = get_edge_message_persistence_service()
-    user_message_edge_id = await persistence_service.save_message_as_edge_message(
-        message_type="user",
-        message_content=user_message,
-        conversation_id=technical_id,
-        user_id=user_id,
-        file_blob_ids=file_blob_ids if file_blob_ids else None,
+    unit_of_work = ConversationUnitOfWork(
+        technical_id, get_chat_service(), base=conversation
     )
-    logger.info(f"✅ User message saved as edge message: {user_message_edge_id}")
-
-    conversation.add_message(
-        "user", user_message_edge_id, file_blob_ids if file_blob_ids else None
+    unit_of_work.append_message(
+        "user",
+        persistence_service.save_message_as_edge_message(
+            message_type="user",
+            message_content=user_message,
+            conversation_id=technical_id,
+            user_id=user_id,
+            file_blob_ids=file_blob_ids if file_blob_ids else None,
+        ),
+        file_blob_ids if file_blob_ids else None,
     )
+    unit_of_work.add_file_blob_ids(file_blob_ids)
+    if adk_session_id and not conversation.adk_session_id:
+        logger.info(f"Setting adk_session_id on conversation: {adk_session_id}")
+        unit_of_work.set_adk_session_id(adk_session_id)
 
-    if file_blob_ids:
-        if conversation.file_blob_ids is None:
-            conversation.file_blob_ids = []
-        for file_id in file_blob_ids:
-            if file_id not in conversation.file_blob_ids:
-                conversation.file_blob_ids.append(file_id)
-
-    conversation = await update_conversation(conversation)
-    return user_message_edge_id, conversation
+    updated = await unit_of_work.flush()
+    if updated is None:
+        raise ValueError("Chat not found")
+    logger.info("✅ User message saved")
+    return updated
 
 
-async def _save_file_as_edge_message(
-    file_storage, filename: str, file_content: bytes, conversation_id: str, user_id: str
+async def _save_attachment(
+    file_storage, filename: str, conversation_id: str, user_id: str
 ) -> Optional[str]:
-    """Save uploaded file as an edge message.
+    """Store an uploaded file in the attachment store.
+
+    The upload is streamed in chunks; content already stored (in any
+    conversation) is reused.
 
     Args:
         file_storage: File storage object from request
         filename: Original filename
-        file_content: File content as bytes
         conversation_id: Conversation technical ID
         user_id: User ID
 
     Returns:
-        Edge message ID (blob_id) if successful, None otherwise
+        File blob ID (the upload's edge message ID) if successful, None otherwise
     """
-    from application.routes.chat_endpoints.helpers import (
-        get_edge_message_persistence_service,
+    blob_id = await get_attachment_store().save_upload(
+        file_storage.stream,
+        filename,
+        conversation_id,
+        user_id,
+        content_type=file_storage.content_type or "application/octet-stream",
     )
-
-    try:
-        # Encode file content as base64
-        base64_content = base64.b64encode(file_content).decode("utf-8")
-
-        # Prepare metadata with filename and encoding
-        metadata = {
-            "filename": filename,
-            "encoding": "base64",
-            "content_type": file_storage.content_type or "application/octet-stream",
-        }
-
-        # Save as edge message
-        edge_service = get_edge_message_persistence_service()
-        blob_id = await edge_service.save_message_as_edge_message(
-            message_type="file",
-            message_content=base64_content,
-            conversation_id=conversation_id,
-            user_id=user_id,
-            metadata=metadata,
-            file_blob_ids=None,
-        )
-
-        if blob_id:
-            logger.info(f"✅ File '{filename}' saved as edge message: {blob_id}")
-        else:
-            logger.error(f"❌ Failed to save file '{filename}' as edge message")
-
-        return blob_id
-
-    except Exception as e:
-        logger.error(f"❌ Error saving file '{filename}': {e}", exc_info=True)
-        return None
+    if blob_id:
+        logger.info(f"✅ File '{filename}' saved as attachment: {blob_id}")
+    else:
+        logger.error(f"❌ Failed to save file '{filename}' as attachment")
+    return blob_id
 
 
 async def _parse_stream_request(
@@ -157,16 +143,19 @@ async def _parse_stream_request(
         uploaded_files = files.getlist("files")
         logger.info(f"📎 Received {len(uploaded_files)} file(s) via FormData")
 
-        # Save each file as an edge message
-        for file_storage in uploaded_files:
-            filename = file_storage.filename or f"file_{uuid.uuid4().hex[:8]}.txt"
-            file_content = file_storage.read()
-
-            # Save file and get blob ID
-            blob_id = await _save_file_as_edge_message(
-                file_storage, filename, file_content, technical_id, user_id
+        # Store the files concurrently
+        filenames = [
+            file_storage.filename or f"file_{uuid.uuid4().hex[:8]}.txt"
+            for file_storage in uploaded_files
+        ]
+        blob_ids = await asyncio.gather(
+            *(
+                _save_attachment(file_storage, filename, technical_id, user_id)
+                for file_storage, filename in zip(uploaded_files, filenames)
             )
+        )
 
+        for filename, blob_id in zip(filenames, blob_ids):
             if blob_id:
                 file_blob_ids.append(blob_id)
                 logger.info(f"📎 File '{filename}' → blob_id: {blob_id}")
@@ -199,7 +188,7 @@ def _create_streaming_generator(
     assistant: Any,
     message_to_process: str,
 ):
-    """Create streaming generator from service.
+    """Create typed event generator from service.
 
     Args:
         technical_id: Conversation technical ID.
@@ -209,12 +198,12 @@ def _create_streaming_generator(
         message_to_process: Message to process.
 
     Returns:
-        Streaming generator from service.
+        Generator of StreamEvent / StreamComment items.
     """
     # Sanitize conversation history to prevent incomplete tool call sequences
     sanitized_history = sanitize_conversation_history(conversation.messages)
 
-    return StreamingService.stream_agent_response(
+    return StreamingService.stream_agent_events(
         agent_wrapper=assistant,
         user_message=message_to_process,
         conversation_history=sanitized_history,
@@ -224,83 +213,53 @@ def _create_streaming_generator(
     )
 
 
-async def _process_streaming_event(
-    sse_event: str,
-    accumulated_response: str,
-    streaming_events: List[Dict],
-    done_event_sent: bool,
-) -> tuple[str, List[Dict], bool, Optional[str], Optional[str], Optional[Dict]]:
-    """Process individual streaming event.
+@dataclass
+class _StreamState:
+    """What the route collects from the event stream for persistence."""
 
-    Args:
-        sse_event: SSE event string.
-        accumulated_response: Accumulated response so far.
-        streaming_events: List of streaming events.
-        done_event_sent: Whether done event was sent.
+    response: io.StringIO = field(default_factory=io.StringIO)
+    streaming_events: List[Dict[str, Any]] = field(default_factory=list)
+    done_event_sent: bool = False
+    adk_session_id: Optional[str] = None
+    hook: Optional[Dict[str, Any]] = None
 
-    Returns:
-        Tuple of (accumulated_response, streaming_events, done_event_sent, done_event_to_send, adk_session_id_result, hook_result).
-    """
-    done_event_to_send = None
-    hook_result = None
-    adk_session_id_result = None
+    @property
+    def accumulated_response(self) -> str:
+        return self.response.getvalue()
 
-    if "event: content" in sse_event:
-        accumulated_response, streaming_events = process_content_event(
-            sse_event, accumulated_response, streaming_events
-        )
-    elif "event: done" in sse_event:
-        (
-            done_event_sent,
-            done_event_to_send,
-            accumulated_response,
-            adk_session_id_result,
-            hook_result,
-            streaming_events,
-        ) = process_done_event(sse_event, accumulated_response, streaming_events)
-    else:
-        # Capture other event types (tool calls, thinking, etc.)
-        try:
-            event_type = get_event_type(sse_event)
-            data_start = sse_event.find("data: ") + 6
-            if data_start > 6:
-                json_str = sse_event[data_start:].strip()
-                event_data = json.loads(json_str)
-                streaming_events.append(
-                    {
-                        "type": event_type,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "data": event_data,
-                    }
-                )
-            else:
-                streaming_events.append(
-                    {
-                        "type": event_type,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-        except (json.JSONDecodeError, ValueError):
-            streaming_events.append(
-                {
-                    "type": "other",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
 
-    return (
-        accumulated_response,
-        streaming_events,
-        done_event_sent,
-        done_event_to_send,
-        adk_session_id_result,
-        hook_result,
+def _process_streaming_event(event: StreamEvent, state: _StreamState) -> None:
+    """Record a stream event: accumulate content and capture done metadata.
+
+    Args:
+        event: Typed event from the streaming service.
+        state: Stream state updated in place.
+    """
+    if event.event_type == "content":
+        # The streaming service sends 'chunk' field, not 'content'
+        chunk = event.data.get("chunk") or event.data.get("content")
+        if chunk:
+            state.response.write(chunk)
+        else:
+            logger.warning(f"⚠️ Content event has no 'chunk' or 'content' field")
+    elif event.event_type == "done":
+        state.done_event_sent = True
+        state.adk_session_id = event.data.get("adk_session_id")
+        state.hook = event.data.get("hook")
+
+    # Store the full event data for debugging/timeline display
+    state.streaming_events.append(
+        {
+            "type": event.event_type,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "data": event.payload(),
+        }
     )
 
 
 def _build_fallback_done_event(
     accumulated_response: str, stream_error: Optional[str]
-) -> str:
+) -> StreamEvent:
     """Build fallback done event if not sent by service.
 
     Args:
@@ -308,93 +267,64 @@ def _build_fallback_done_event(
         stream_error: Stream error if any.
 
     Returns:
-        SSE done event string.
+        Done stream event.
     """
     done_data = {"message": "Stream completed", "response": accumulated_response}
     if stream_error:
         done_data["error"] = stream_error
-    return f"event: done\ndata: {json.dumps(done_data)}\n\n"
+    return StreamEvent(event_type="done", data=done_data)
 
 
-def _create_stream_event_generator(
+def _create_agent_turn_generator(
     technical_id: str,
     user_id: str,
     conversation: Conversation,
-    assistant: Any,
     message_to_process: str,
-) -> AsyncGenerator[str, None]:
-    """Create the SSE event generator for streaming responses."""
+) -> AsyncGenerator[StreamItem, None]:
+    """Create the typed event generator for one agent turn.
+
+    The generator leases a pooled assistant, runs the agent, records what it
+    streams and persists the response when the turn ends. It is driven by a
+    detached run, not by the HTTP connection, so it completes even if every
+    client disconnects. The assistant is returned to the pool as soon as the
+    agent stops streaming.
+    """
 
     async def event_generator():
-        accumulated_response = ""
-        adk_session_id_result = None
-        hook_result = None
-        done_event_sent = False
-        done_event_to_send = None
+        state = _StreamState()
         stream_error = None
-        streaming_events = []
 
         try:
-            # Create streaming generator
-            streaming_generator = _create_streaming_generator(
-                technical_id, user_id, conversation, assistant, message_to_process
-            )
-
-            # Process events
-            async for sse_event in streaming_generator:
-                if "event: done" in sse_event:
-                    logger.info(f"📤 [route] Received done event from upstream")
-                if "event: content" in sse_event:
-                    logger.debug(
-                        f"📝 [route] Received content event, current accumulated length: {len(accumulated_response)}"
-                    )
-
-                result = await _process_streaming_event(
-                    sse_event, accumulated_response, streaming_events, done_event_sent
+            async with lease_cyoda_assistant(technical_id) as assistant:
+                # Create streaming generator
+                streaming_generator = _create_streaming_generator(
+                    technical_id, user_id, conversation, assistant, message_to_process
                 )
-                (
-                    accumulated_response,
-                    streaming_events,
-                    done_event_sent,
-                    done_event_to_send,
-                    adk_session_id_result,
-                    hook_result,
-                ) = result
-
-                if "event: content" in sse_event:
-                    logger.debug(
-                        f"📝 [route] After processing, accumulated length: {len(accumulated_response)}"
-                    )
-                if "event: done" in sse_event:
-                    logger.info(f"📤 [route] Yielding done event to client")
-                yield sse_event
+
+                # Process events
+                async for event in streaming_generator:
+                    if isinstance(event, StreamEvent):
+                        _process_streaming_event(event, state)
+                        if event.event_type == "done":
+                            logger.info(f"📤 [route] Yielding done event to client")
+                    yield event
 
         except Exception as e:
             stream_error = str(e)
             logger.error(f"Error in stream generator: {e}", exc_info=True)
-            yield f"event: error\ndata: {json.dumps({'error': stream_error})}\n\n"
+            yield StreamEvent(event_type="error", data={"error": stream_error})
 
         finally:
             # Finalize stream
-            await _finalize_stream(
-                technical_id,
-                user_id,
-                accumulated_response,
-                streaming_events,
-                hook_result,
-                adk_session_id_result,
-                done_event_to_send,
-                done_event_sent,
-                stream_error,
-            )
+            await _finalize_stream(technical_id, user_id, state)
 
             # Send done event only if it wasn't already sent
-            if not done_event_sent:
+            if not state.done_event_sent:
                 logger.warning(
                     "Done event was not sent by streaming service, sending fallback now"
                 )
                 fallback = _build_fallback_done_event(
-                    accumulated_response, stream_error
+                    state.accumulated_response, stream_error
                 )
                 logger.info(f"📤 [route finalize] Yielding fallback done event")
                 yield fallback
@@ -406,49 +336,76 @@ def _create_stream_event_generator(
     return event_generator()
 
 
+def _get_last_event_id() -> Optional[str]:
+    """Read the client's resume point from ``Last-Event-ID`` (or query string)."""
+    return (
+        request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    ) or None
+
+
+async def _request_has_new_message() -> bool:
+    """Check whether a POST carries a message or files, without storing them."""
+    files = await request.files
+    if files and "files" in files:
+        return True
+    form = await request.form
+    data = await request.get_json(silent=True) or {}
+    message = form.get("message") or data.get("message") or ""
+    return bool(str(message).strip())
+
+
+def _subscribe_sse(
+    run: DetachedRun, last_event_id: Optional[str]
+) -> AsyncGenerator[str, None]:
+    """SSE-encode a run subscription; each event is encoded exactly once here."""
+
+    async def event_generator():
+        async for item in run.subscribe(last_event_id):
+            yield item.to_sse()
+
+    return event_generator()
+
+
+def _attach_to_run(run: DetachedRun) -> Response:
+    """Build the SSE response for a client attaching to an existing run."""
+    last_event_id = _get_last_event_id()
+    logger.info(
+        f"🔗 Attaching to run {run.run_id} for {run.conversation_id} "
+        f"after event {last_event_id}"
+    )
+    return build_stream_response(_subscribe_sse(run, last_event_id))
+
+
 async def _finalize_stream(
     technical_id: str,
     user_id: str,
-    accumulated_response: str,
-    streaming_events: List[Dict[str, Any]],
-    hook_result: Optional[Dict[str, Any]],
-    adk_session_id_result: Optional[str],
-    done_event_to_send: Optional[str],
-    done_event_sent: bool,
-    stream_error: Optional[str],
+    state: _StreamState,
 ) -> None:
     """Finalize the stream by saving response and updating conversation."""
+    accumulated_response = state.accumulated_response
+    hook_result = state.hook
     logger.info(
         f"🔄 FINALLY BLOCK - accumulated_response length: {len(accumulated_response)}"
     )
     try:
         if accumulated_response and accumulated_response.strip():
             persistence_service = get_edge_message_persistence_service()
-            response_edge_message_id = (
-                await persistence_service.save_response_with_history(
+            unit_of_work = ConversationUnitOfWork(technical_id, get_chat_service())
+            # The response is saved while the latest conversation is read
+            unit_of_work.append_message(
+                "ai",
+                persistence_service.save_response_with_history(
                     conversation_id=technical_id,
                     user_id=user_id,
                     response_content=accumulated_response,
-                    streaming_events=streaming_events,
+                    streaming_events=state.streaming_events,
                     metadata={"hook": hook_result} if hook_result else None,
-                )
+                ),
+                metadata={"hook": hook_result} if hook_result else None,
             )
-            logger.info(
-                f"✅ Response saved as edge message: {response_edge_message_id}"
-            )
-
-            fresh_conversation = await _get_conversation(technical_id)
-            if fresh_conversation:
-                message_metadata = {"hook": hook_result} if hook_result else None
-                fresh_conversation.add_message(
-                    "ai", response_edge_message_id, metadata=message_metadata
-                )
-
-                if not fresh_conversation.adk_session_id and adk_session_id_result:
-                    fresh_conversation.adk_session_id = adk_session_id_result
-
-                await update_conversation(fresh_conversation)
-                logger.info("✅ Conversation saved")
+            unit_of_work.set_adk_session_id(state.adk_session_id)
+            if await unit_of_work.flush():
+                logger.info("✅ Response saved and conversation updated")
     except Exception as post_error:
         logger.error(f"Error in post-processing: {post_error}", exc_info=True)
 
@@ -456,7 +413,13 @@ async def _finalize_stream(
 @stream_bp.route("/<technical_id>/stream", methods=["POST"])
 @rate_limit(100, timedelta(minutes=1), key_function=default_rate_limit_key)
 async def stream_chat_message(technical_id: str) -> Response:
-    """Stream AI response in real-time using Server-Sent Events (SSE)."""
+    """Stream AI response in real-time using Server-Sent Events (SSE).
+
+    The agent turn runs detached from this request. If a turn is already
+    running for the conversation, a request without a message attaches to it,
+    replaying from ``Last-Event-ID``; a request with a new message is
+    rejected with 409 rather than dropping the message.
+    """
     try:
         user_id, is_superuser = await get_authenticated_user()
         logger.info(
@@ -470,34 +433,90 @@ async def stream_chat_message(technical_id: str) -> Response:
         if not is_superuser and conversation.user_id != user_id:
             return error_response("Access denied")
 
-        try:
-            user_message, file_blob_ids, adk_session_id = await _parse_stream_request(
-                technical_id, user_id
-            )
-        except ValueError as e:
-            return error_response(str(e))
+        # Reserve the turn before the first await, so two POSTs for the same
+        # conversation cannot both store a message for a single run
+        registry = get_run_registry()
+        run = registry.reserve(technical_id)
+        if run is None:
+            # A reconnect or a second tab joins the turn already in progress
+            active_run = registry.get_active(technical_id)
+            if await _request_has_new_message():
+                logger.info(
+                    f"⏳ Rejecting new message for {technical_id}: "
+                    f"run {active_run.run_id} is still active"
+                )
+                return APIResponse.error(
+                    "A response is still being generated for this chat; "
+                    "send the message after it finishes",
+                    409,
+                    details={"run_id": active_run.run_id},
+                )
+            return _attach_to_run(active_run)
 
-        if not user_message:
-            return error_response("Message is required")
+        launched = False
+        try:
+            try:
+                user_message, file_blob_ids, adk_session_id = (
+                    await _parse_stream_request(technical_id, user_id)
+                )
+            except ValueError as e:
+                return error_response(str(e))
 
-        # Update conversation with adk_session_id if provided
-        if adk_session_id and not conversation.adk_session_id:
-            logger.info(f"Setting adk_session_id on conversation: {adk_session_id}")
-            conversation.adk_session_id = adk_session_id
-            conversation = await update_conversation(conversation)
+            if not user_message:
+                return error_response("Message is required")
 
-        _, conversation = await _save_user_message_to_conversation(
-            technical_id, user_id, user_message, file_blob_ids, conversation
-        )
+            conversation = await _save_user_message_to_conversation(
+                technical_id,
+                user_id,
+                user_message,
+                file_blob_ids,
+                conversation,
+                adk_session_id,
+            )
 
-        assistant = get_cyoda_assistant_instance()
-        message_to_process = build_message_to_process(user_message, file_blob_ids)
-        event_gen = _create_stream_event_generator(
-            technical_id, user_id, conversation, assistant, message_to_process
-        )
+            message_to_process = build_message_to_process(user_message, file_blob_ids)
+            registry.launch(
+                run,
+                _create_agent_turn_generator(
+                    technical_id, user_id, conversation, message_to_process
+                ),
+            )
+            launched = True
+        finally:
+            if not launched:
+                await registry.release(run)
 
-        return build_stream_response(event_gen)
+        return build_stream_response(_subscribe_sse(run, None))
 
     except Exception as stream_error:
         logger.exception(f"Error setting up stream: {stream_error}")
         return error_response(str(stream_error))
+
+
+@stream_bp.route("/<technical_id>/stream", methods=["GET"])
+@rate_limit(100, timedelta(minutes=1), key_function=default_rate_limit_key)
+async def attach_chat_stream(technical_id: str) -> Response:
+    """Re-attach to the conversation's current or just-finished agent turn.
+
+    EventSource reconnects arrive here with ``Last-Event-ID`` set; only the
+    events after it are replayed before live events are tailed.
+    """
+    try:
+        user_id, is_superuser = await get_authenticated_user()
+
+        conversation = await _get_conversation(technical_id)
+        if not conversation:
+            return error_response("Chat not found")
+
+        if not is_superuser and conversation.user_id != user_id:
+            return error_response("Access denied")
+
+        run = get_run_registry().get(technical_id)
+        if not run:
+            return error_response("No active stream for this chat")
+
+        return _attach_to_run(run)
+
+    except Exception as attach_error:
+        logger.exception(f"Error attaching to stream: {attach_error}")
+        return error_response(str(attach_error))
@@ -138,19 +138,31 @@ async def transfer_chats():
             return APIResponse.error(error_msg, 400)
 
         try:
-            transferred_count = await get_chat_service().transfer_guest_chats(
+            result = await get_chat_service().transfer_guest_chats(
                 guest_user_id=guest_user_id, authenticated_user_id=current_user_id
             )
 
+            if result.task_id:
+                return APIResponse.success(
+                    {
+                        "message": "Chat transfer started",
+                        "task_id": result.task_id,
+                        "total": result.total,
+                    },
+                    status=202,
+                )
+
             logger.info(
-                f"✅ Chat transfer completed: {transferred_count} chats transferred from "
+                f"✅ Chat transfer completed: {result.transferred_count} chats transferred from "
                 f"{guest_user_id} to {current_user_id}"
             )
 
             return APIResponse.success(
                 {
                     "message": "Chats transferred successfully",
-                    "transferred_count": transferred_count,
+                    "transferred_count": result.transferred_count,
+                    "failed_count": result.failed_count,
+                    "results": result.results,
                 }
             )
 
@@ -6,26 +6,25 @@ Centralizes magic numbers and configuration values to improve maintainability.
 
 # Re-export common constants to maintain backward compatibility
 from common.constants import (
+    API_KEY_EXPIRY_DAYS,
     CACHE_TTL_SECONDS,
     CHAT_LIST_DEFAULT_LIMIT,
     CHAT_LIST_MAX_LIMIT,
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+    ELASTICSEARCH_DEFAULT_SIZE,
+    ELASTICSEARCH_MAX_CONNECTIONS,
+    ELASTICSEARCH_MAX_SIZE,
+    ELASTICSEARCH_PIT_KEEP_ALIVE,
+    ELASTICSEARCH_STREAM_MAX_HITS,
+    ELASTICSEARCH_STREAM_PAGE_SIZE,
+    HEALTH_CHECK_TIMEOUT_SECONDS,
+    LOG_AGGREGATION_FIELDS,
+    LOG_AGGREGATION_MAX_TERMS,
+    LONG_RUNNING_HTTP_TIMEOUT_SECONDS,
     MAX_CONVERSATION_UPDATE_RETRIES,
     RETRY_BASE_DELAY_SECONDS,
 )
 
-# ============================================================================
-# HTTP Timeout Configuration
-# ============================================================================
-
-# Default timeout for HTTP requests (seconds)
-DEFAULT_HTTP_TIMEOUT_SECONDS = 30.0
-
-# Timeout for long-running HTTP requests (seconds)
-LONG_RUNNING_HTTP_TIMEOUT_SECONDS = 60.0
-
-# Timeout for health check requests (seconds)
-HEALTH_CHECK_TIMEOUT_SECONDS = 10.0
-
 # ============================================================================
 # Namespace Patterns
 # ============================================================================
@@ -63,21 +62,30 @@ LOG_INDEX_PATTERN_APPLICATION = (
 # Guest token expiry duration (weeks)
 GUEST_TOKEN_EXPIRY_WEEKS = 50
 
-# API key expiry duration (days)
-API_KEY_EXPIRY_DAYS = 365
-
 # Service account token expiry duration (seconds)
 SERVICE_ACCOUNT_TOKEN_EXPIRY_SECONDS = 31536000  # 1 year
 
 # ============================================================================
-# Elasticsearch Configuration
+# Prometheus Configuration
 # ============================================================================
 
-# Maximum number of results returned by Elasticsearch queries
-ELASTICSEARCH_MAX_SIZE = 10000
+# Maximum number of concurrent Prometheus requests per batch query
+PROMETHEUS_BATCH_CONCURRENCY = 8
+
+# Maximum number of query types accepted by a single batch request
+PROMETHEUS_BATCH_MAX_QUERIES = 25
+
+# Maximum pooled HTTP connections to Prometheus
+PROMETHEUS_MAX_CONNECTIONS = 32
+
+# Maximum number of cached results per cache kind (instant / range)
+PROMETHEUS_CACHE_MAX_ENTRIES = 1000
+
+# How long an instant query result is served from cache (seconds)
+PROMETHEUS_INSTANT_CACHE_TTL_SECONDS = 15
 
-# Default page size for log search results
-ELASTICSEARCH_DEFAULT_SIZE = 50
+# How long step-aligned range samples are reused before a full refetch (seconds)
+PROMETHEUS_RANGE_CACHE_TTL_SECONDS = 600
 
 # ============================================================================
 # SSE Streaming Configuration
@@ -9,16 +9,22 @@ Handles ELK (Elasticsearch) log access:
 Uses Elasticsearch API for log management.
 """
 
+import json
 import logging
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from pydantic import BaseModel, Field
-from quart import Blueprint, request
+from quart import Blueprint, Response, request
 from quart_rate_limiter import rate_limit
 
+from application.routes.common.constants import (
+    ELASTICSEARCH_STREAM_MAX_HITS,
+    ELASTICSEARCH_STREAM_PAGE_SIZE,
+)
 from application.routes.common.rate_limiting import user_rate_limit_key
 from application.routes.common.response import APIResponse
+from application.routes.common.validation import validate_json
 from application.services.core.config_service import get_config_service
 from application.services.core.logs_service import LogsService
 from common.middleware.auth_middleware import require_auth
@@ -60,6 +66,32 @@ class LogSearchRequest(BaseModel):
         populate_by_name = True
 
 
+class LogStreamRequest(BaseModel):
+    """Streaming log search request model."""
+
+    env_name: str
+    app_name: str
+    query: Dict[str, Any] = DEFAULT_QUERY
+    sort: list = DEFAULT_SORT
+    source_fields: Optional[List[str]] = Field(
+        None, description="_source filter, e.g. ['@timestamp', 'level', 'message']"
+    )
+    page_size: int = Field(ELASTICSEARCH_STREAM_PAGE_SIZE, ge=1)
+    max_hits: int = Field(
+        ELASTICSEARCH_STREAM_MAX_HITS, ge=1, le=ELASTICSEARCH_STREAM_MAX_HITS
+    )
+
+
+class LogAggregateRequest(BaseModel):
+    """Log aggregation request model."""
+
+    env_name: str
+    app_name: str
+    query: Dict[str, Any] = DEFAULT_QUERY
+    group_by: str = Field("level", description="'level' or 'pod'")
+    interval: str = Field("5m", description="Date histogram interval")
+
+
 logs_bp = Blueprint("logs", __name__, url_prefix="/api/v1/logs")
 
 # Initialize services
@@ -240,6 +272,154 @@ async def search_logs():
         return APIResponse.error(SEARCH_FAILED_MESSAGE, SEARCH_FAILED_CODE)
 
 
+@logs_bp.route("/search/stream", methods=["POST"])
+@require_auth
+@rate_limit(30, timedelta(minutes=1), key_function=user_rate_limit_key)
+@validate_json(LogStreamRequest)
+async def stream_search_logs():
+    """Stream all matching logs using point in time + search_after pagination.
+
+    Unlike /search, results are not capped at one page: hits are fetched page
+    by page and written to the response as they arrive, so large result sets
+    never materialize as one JSON body.
+
+    Request headers:
+        Authorization: Bearer <jwt_token>
+        X-API-Key: <elk_api_key>
+        Accept: application/x-ndjson (default) or text/event-stream
+
+    Request body:
+        {
+            "env_name": "production",
+            "app_name": "cyoda",
+            "query": {"match_all": {}},
+            "sort": [{"@timestamp": {"order": "desc"}}],
+            "source_fields": ["@timestamp", "level", "message"],
+            "page_size": 500,
+            "max_hits": 100000
+        }
+
+    Returns:
+        200: NDJSON (one hit per line) or SSE (``event: hit`` per hit, then
+             ``event: done`` with the hit count; ``event: error`` on failure)
+        400: Invalid request
+        401: Unauthorized
+    """
+    api_key_result = _validate_api_key_header()
+    if isinstance(api_key_result, tuple):
+        return api_key_result
+
+    org_id = getattr(request, "org_id", request.user_id.lower())
+    data: LogStreamRequest = request.validated_data
+    log_query = logs_service.build_log_query(
+        api_key=api_key_result,
+        org_id=org_id,
+        env_name=data.env_name,
+        app_name=data.app_name,
+        query=data.query,
+        sort=data.sort,
+        source_fields=data.source_fields,
+        page_size=data.page_size,
+    )
+    hits = logs_service.stream_logs(log_query, data.max_hits)
+
+    if "text/event-stream" in request.headers.get("Accept", ""):
+        body, mimetype = _encode_hits_as_sse(hits), "text/event-stream"
+    else:
+        body, mimetype = _encode_hits_as_ndjson(hits), "application/x-ndjson"
+
+    return Response(
+        body,
+        mimetype=mimetype,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _encode_hits_as_ndjson(hits: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    """Encode hits as newline-delimited JSON, ending with an error line on failure."""
+    try:
+        async for hit in hits:
+            yield json.dumps(hit) + "\n"
+    except Exception as e:
+        logger.exception(f"Error streaming logs: {e}")
+        yield json.dumps({"error": _stream_error_message(e)}) + "\n"
+
+
+async def _encode_hits_as_sse(hits: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    """Encode hits as SSE events followed by a done (or error) event."""
+    count = 0
+    try:
+        async for hit in hits:
+            count += 1
+            yield f"event: hit\ndata: {json.dumps(hit)}\n\n"
+        yield f"event: done\ndata: {json.dumps({'count': count})}\n\n"
+    except Exception as e:
+        logger.exception(f"Error streaming logs: {e}")
+        error = {"error": _stream_error_message(e), "count": count}
+        yield f"event: error\ndata: {json.dumps(error)}\n\n"
+
+
+def _stream_error_message(error: Exception) -> str:
+    if str(error) == EXPIRED_API_KEY_ERROR:
+        return EXPIRED_API_KEY_MESSAGE
+    return SEARCH_FAILED_MESSAGE
+
+
+@logs_bp.route("/aggregate", methods=["POST"])
+@require_auth
+@rate_limit(30, timedelta(minutes=1), key_function=user_rate_limit_key)
+@validate_json(LogAggregateRequest)
+async def aggregate_logs():
+    """Count logs over time grouped by level or pod (server-side aggregation).
+
+    Request headers:
+        Authorization: Bearer <jwt_token>
+        X-API-Key: <elk_api_key>
+
+    Request body:
+        {
+            "env_name": "production",
+            "app_name": "cyoda",
+            "query": {"match_all": {}},
+            "group_by": "level",
+            "interval": "5m"
+        }
+
+    Returns:
+        200: {"total": 123, "buckets": [{"timestamp", "count", "groups": {...}}]}
+        400: Invalid request
+        401: Unauthorized
+        500: Error response
+    """
+    try:
+        api_key_result = _validate_api_key_header()
+        if isinstance(api_key_result, tuple):
+            return api_key_result
+
+        org_id = getattr(request, "org_id", request.user_id.lower())
+        data: LogAggregateRequest = request.validated_data
+        log_query = logs_service.build_log_query(
+            api_key=api_key_result,
+            org_id=org_id,
+            env_name=data.env_name,
+            app_name=data.app_name,
+            query=data.query,
+        )
+        result = await logs_service.aggregate_logs(
+            log_query, data.group_by, data.interval
+        )
+        return APIResponse.success(result)
+
+    except ValueError as e:
+        if str(e) == EXPIRED_API_KEY_ERROR:
+            return _handle_expired_api_key_error()
+        return APIResponse.error(str(e), 400)
+
+    except Exception as e:
+        logger.exception(f"Error aggregating logs: {e}")
+        return APIResponse.error(SEARCH_FAILED_MESSAGE, SEARCH_FAILED_CODE)
+
+
 @logs_bp.route("/health", methods=["GET"])
 @require_auth
 async def logs_health():
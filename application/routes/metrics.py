@@ -18,6 +18,8 @@ from quart_rate_limiter import rate_limit
 # NEW: Use common infrastructure and services
 from application.routes.common.rate_limiting import default_rate_limit_key
 from application.routes.common.response import APIResponse
+from application.routes.common.validation import validate_json
+from application.routes.models.metrics_models import MetricsBatchQueryRequest
 from application.services.service_factory import get_service_factory
 from common.middleware.auth_middleware import require_auth
 
@@ -322,6 +324,70 @@ async def query_range_metrics():
         return APIResponse.error("Internal server error", 500)
 
 
+@metrics_bp.route("/query_batch", methods=["POST"])
+@require_auth
+@rate_limit(600, timedelta(minutes=1), key_function=default_rate_limit_key)
+@validate_json(MetricsBatchQueryRequest)
+async def query_batch_metrics():
+    """
+    Query several predefined Prometheus metrics for one environment at once.
+
+    Queries run concurrently over a pooled client and are served from a shared
+    result cache. Range results are aligned to step boundaries, so repeated
+    dashboard refreshes only fetch the newest step window.
+
+    Request headers:
+        Authorization: Bearer <jwt_token>
+
+    Request body:
+        {
+            "query_types": ["cpu_usage_rate", "memory_usage", "pod_count"],
+            "env_name": "dev",
+            "app_name": "cyoda",  # Optional (default: "cyoda")
+            "time": "...",  # Optional - instant query evaluation time
+            "start": "2025-12-02T00:00:00Z",  # Optional - enables range mode
+            "end": "2025-12-02T12:00:00Z",  # Required together with start
+            "step": "15s"  # Optional - range query step (default: "15s")
+        }
+
+    Returns:
+        200: {"results": {"<query_type>": <Prometheus result or {"status": "error", ...}>}}
+        400: Invalid request
+        401: Unauthorized
+        500: Error response
+    """
+    try:
+        user_id = request.user_id
+        org_id = getattr(request, "org_id", user_id.lower())
+        data: MetricsBatchQueryRequest = request.validated_data
+
+        logger.info(
+            f"Batch querying Prometheus for user {user_id} "
+            f"(org_id: {org_id}, env_name: {data.env_name}, app_name: {data.app_name}, "
+            f"query_types: {len(data.query_types)}, range: {data.start is not None})"
+        )
+
+        try:
+            results = await metrics_service.query_prometheus_batch(
+                org_id=org_id,
+                env_name=data.env_name,
+                app_name=data.app_name,
+                query_types=data.query_types,
+                time=data.time,
+                start=data.start,
+                end=data.end,
+                step=data.step,
+            )
+        except ValueError as e:
+            return APIResponse.error(str(e), 400)
+
+        return APIResponse.success({"results": results})
+
+    except Exception as e:
+        logger.exception(f"Error batch querying Prometheus: {e}")
+        return APIResponse.error("Internal server error", 500)
+
+
 @metrics_bp.route("/health", methods=["GET"])
 @require_auth
 async def metrics_health():
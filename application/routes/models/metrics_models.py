@@ -6,7 +6,9 @@ Provides type-safe models for Prometheus and Grafana operations.
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from application.routes.common.constants import PROMETHEUS_BATCH_MAX_QUERIES
 
 # Valid Prometheus query types
 VALID_QUERY_TYPES = [
@@ -131,6 +133,68 @@ class MetricsRangeQueryRequest(BaseModel):
         return v
 
 
+class MetricsBatchQueryRequest(BaseModel):
+    """
+    Request model for batched metrics queries.
+
+    Several predefined query types for one environment; range mode when
+    start and end are given, instant mode otherwise.
+    """
+
+    query_types: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=PROMETHEUS_BATCH_MAX_QUERIES,
+        description="Predefined query types",
+        examples=[["cpu_usage_rate", "memory_usage", "pod_count"]],
+    )
+
+    env_name: str = Field(
+        ..., min_length=1, max_length=50, description="Environment name"
+    )
+
+    app_name: str = Field(
+        default="cyoda", min_length=1, max_length=50, description="Application name"
+    )
+
+    time: Optional[str] = Field(
+        None, description="Evaluation timestamp for instant queries"
+    )
+
+    start: Optional[str] = Field(
+        None, description="Range start timestamp (RFC3339 or Unix timestamp)"
+    )
+
+    end: Optional[str] = Field(
+        None, description="Range end timestamp (RFC3339 or Unix timestamp)"
+    )
+
+    step: str = Field(
+        default="15s", description="Query resolution step", examples=["15s", "1m"]
+    )
+
+    @field_validator("query_types")
+    @classmethod
+    def validate_query_types(cls, v: List[str]) -> List[str]:
+        """Validate every query type is in allowed list."""
+        invalid = [
+            query_type for query_type in v if query_type not in VALID_QUERY_TYPES
+        ]
+        if invalid:
+            raise ValueError(
+                f"Invalid query_types: {', '.join(invalid)}. "
+                f"Must be one of: {', '.join(VALID_QUERY_TYPES)}"
+            )
+        return v
+
+    @model_validator(mode="after")
+    def validate_range_bounds(self) -> "MetricsBatchQueryRequest":
+        """Require start and end together."""
+        if (self.start is None) != (self.end is None):
+            raise ValueError("start and end must be provided together")
+        return self
+
+
 class GrafanaTokenResponse(BaseModel):
     """
     Response model for Grafana token generation.
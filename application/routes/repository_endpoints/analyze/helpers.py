@@ -4,6 +4,7 @@ This module provides shared utility functions used by both conversation-based
 and legacy analysis approaches.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -119,13 +120,24 @@ async def _scan_repository_resources(
     paths = _detect_project_type(repository_path)
     repo_path_obj = Path(repository_path)
 
-    # Scan entities
-    entities_dir = repo_path_obj / paths["entities_path"]
-    entities = _scan_versioned_resources(entities_dir, "entity", repo_path_obj)
-
-    # Scan workflows
-    workflows_dir = repo_path_obj / paths["workflows_path"]
-    workflows = _scan_versioned_resources(workflows_dir, "workflow", repo_path_obj)
+    # Scans read files, so run them off the event loop, side by side
+    loop = asyncio.get_running_loop()
+    entities, workflows = await asyncio.gather(
+        loop.run_in_executor(
+            None,
+            _scan_versioned_resources,
+            repo_path_obj / paths["entities_path"],
+            "entity",
+            repo_path_obj,
+        ),
+        loop.run_in_executor(
+            None,
+            _scan_versioned_resources,
+            repo_path_obj / paths["workflows_path"],
+            "workflow",
+            repo_path_obj,
+        ),
+    )
 
     return {
         "paths": paths,
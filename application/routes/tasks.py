@@ -16,6 +16,10 @@ from quart import Blueprint, Response, request
 from quart_rate_limiter import rate_limit
 
 # NEW: Use common infrastructure
+from application.agents.shared.process_output import (
+    OUTPUT_CHECKPOINT_KEY,
+    get_output_registry,
+)
 from application.routes.common.auth import get_authenticated_user
 from application.routes.common.rate_limiting import default_rate_limit_key
 from application.routes.common.response import APIResponse
@@ -441,3 +445,90 @@ async def stream_task_progress(task_id: str) -> Response:
             yield f"event: error\ndata: {json.dumps({'error': error_msg})}\n\n"
 
         return Response(error_stream(), mimetype="text/event-stream")
+
+
+def _sse_error(message: str) -> Response:
+    async def error_stream():
+        yield f"event: error\ndata: {json.dumps({'error': message})}\n\n"
+
+    return Response(error_stream(), mimetype="text/event-stream")
+
+
+def _last_output_checkpoint(task: Any) -> str:
+    """Output tail from the task's most recent output checkpoint."""
+    checkpoint = (task.workflow_cache or {}).get(OUTPUT_CHECKPOINT_KEY)
+    if isinstance(checkpoint, dict):
+        return checkpoint.get("output") or ""
+    # Tasks checkpointed before checkpoints moved out of progress messages
+    for message in reversed(task.progress_messages or []):
+        metadata = message.get("metadata") or {}
+        if "output" in metadata:
+            return metadata["output"]
+    return ""
+
+
+def _get_output_offset() -> Optional[int]:
+    """Read the resume offset from ``Last-Event-ID`` (or the ``offset`` arg)."""
+    raw = request.headers.get("Last-Event-ID") or request.args.get("offset")
+    if raw is None:
+        return None
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"⚠️ Ignoring non-numeric output offset: {raw!r}")
+        return None
+
+
+@tasks_bp.route("/<task_id>/output", methods=["GET"])
+@rate_limit(100, timedelta(minutes=1), key_function=default_rate_limit_key)
+async def stream_task_output(task_id: str) -> Response:
+    """
+    Stream a background task's process output in real-time using SSE.
+
+    Output is read directly from the in-memory buffer of the running process,
+    not from the task entity. Event ids are byte offsets; reconnect with
+    ``Last-Event-ID`` (or ``?offset=``) to resume. Offsets older than the
+    buffer are served from the task's spool file, so ``?offset=0`` replays the
+    full log. If the process output is no longer held by this instance, the
+    last checkpoint stored on the task is sent instead.
+
+    Returns:
+        SSE stream with events: output, done, error
+    """
+    try:
+        user_id, is_superuser = await get_authenticated_user()
+
+        task_service = get_task_service()
+        task = await task_service.get_task(task_id)
+
+        if not task:
+            return _sse_error("Task not found")
+
+        # Validate ownership (unless superuser)
+        if not is_superuser and task.user_id != user_id:
+            return _sse_error("Access denied")
+
+        output = get_output_registry().get(task_id)
+        checkpoint = "" if output else _last_output_checkpoint(task)
+
+        return Response(
+            StreamingService.stream_process_output(
+                task_id=task_id,
+                output=output,
+                checkpoint=checkpoint,
+                offset=_get_output_offset(),
+            ),
+            mimetype="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Disable nginx buffering
+            },
+        )
+
+    except TokenExpiredError:
+        return _sse_error("Token expired")
+    except TokenValidationError:
+        return _sse_error("Invalid token")
+    except Exception as error:
+        logger.exception(f"Error setting up task output stream: {error}")
+        return _sse_error(str(error))
@@ -0,0 +1,307 @@
+"""
+Pool of pre-built assistant wrappers, leased one per agent turn.
+
+Every wrapper owns its own agent runner and session service, so concurrent
+chat turns never share session caches or runner state. The pool keeps
+``min_size`` wrappers warm, builds more on demand up to ``max_size`` (the
+concurrency limit for the model it serves) and queues turns beyond that for
+at most ``acquire_timeout`` seconds.
+
+Leases prefer the wrapper that last served the same conversation. When a
+conversation moves to a different wrapper, that wrapper's session cache is
+cleared first so it cannot serve a copy older than the other wrapper's writes.
+
+A build that fails frees the capacity it had claimed; the next queued turn is
+woken to build a wrapper itself rather than waiting for a release that may
+never come.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Conversations whose last wrapper is remembered for affinity
+AFFINITY_CAPACITY = 4096
+
+
+class AssistantPoolTimeoutError(Exception):
+    """Raised when no pooled assistant became free within the wait limit."""
+
+
+def parse_model_limits(spec: str) -> Dict[str, int]:
+    """
+    Parse per-model concurrency limits.
+
+    Args:
+        spec: Comma-separated ``model=limit`` pairs, e.g.
+            ``"gemini-2.5-flash=4,openai/gpt-4o=16"``
+
+    Returns:
+        Limit per model name (malformed pairs are logged and skipped)
+    """
+    limits: Dict[str, int] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        model, _, value = item.rpartition("=")
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+        if not model.strip() or limit < 1:
+            logger.warning(f"Ignoring invalid model concurrency limit: {item!r}")
+            continue
+        limits[model.strip()] = limit
+    return limits
+
+
+class _PooledAssistant:
+    """A pooled wrapper and its position in the pool."""
+
+    def __init__(self, index: int, assistant: Any) -> None:
+        self.index = index
+        self.assistant = assistant
+
+    def clear_session_cache(self) -> None:
+        """Drop cached sessions held by the wrapper's session service."""
+        runner = getattr(self.assistant, "runner", None)
+        session_service = getattr(runner, "session_service", None)
+        clear_cache = getattr(session_service, "clear_cache", None)
+        if callable(clear_cache):
+            clear_cache()
+
+
+class AssistantPool:
+    """Bounded pool of assistant wrappers for one SDK and model."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        model: str,
+        min_size: int = 1,
+        max_size: int = 8,
+        acquire_timeout: float = 30.0,
+        on_build: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Initialize the pool (nothing is built until warm-up or first lease).
+
+        Args:
+            factory: Builds one assistant wrapper; called off the event loop
+            model: Model the wrappers use (for logs and stats)
+            min_size: Wrappers built by warm-up and kept for reuse
+            max_size: Most wrappers (and concurrent turns) for the model
+            acquire_timeout: Longest a turn waits for a free wrapper, in seconds
+            on_build: Called after each wrapper is built, however the pool grew
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.factory = factory
+        self.model = model
+        self.max_size = max_size
+        self.min_size = max(0, min(min_size, max_size))
+        self.acquire_timeout = acquire_timeout
+        self.on_build = on_build
+
+        self._entries: List[_PooledAssistant] = []
+        self._idle: List[_PooledAssistant] = []
+        self._building = 0
+        # Capacity handed to woken waiters that have not started building yet
+        self._reserved = 0
+        # A waiter's result is a wrapper, or None when it may build one itself
+        self._waiters: Deque["asyncio.Future[Optional[_PooledAssistant]]"] = deque()
+        self._last_served: "OrderedDict[str, int]" = OrderedDict()
+
+        self._leases_total = 0
+        self._queued_total = 0
+        self._timeouts_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of wrappers built so far."""
+        return len(self._entries)
+
+    @property
+    def in_use(self) -> int:
+        """Number of wrappers currently leased."""
+        return len(self._entries) - len(self._idle)
+
+    def prefill(self) -> None:
+        """Build the warm wrappers synchronously (for eager startup)."""
+        while self.size + self._building < self.min_size:
+            self._idle.append(self._add(self.factory()))
+
+    async def warm_up(self) -> None:
+        """Build the warm wrappers in worker threads."""
+        while self.size + self._building < self.min_size:
+            self._release(await self._build())
+        logger.info(
+            f"🔥 Assistant pool for {self.model} warmed: "
+            f"{self.size} ready, up to {self.max_size} concurrent"
+        )
+
+    @asynccontextmanager
+    async def lease(self, conversation_id: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        Lease a wrapper exclusively for one agent turn.
+
+        Args:
+            conversation_id: Conversation the turn belongs to (for affinity)
+
+        Yields:
+            The leased assistant wrapper
+
+        Raises:
+            AssistantPoolTimeoutError: If no wrapper became free in time
+        """
+        entry = await self._acquire(conversation_id)
+        try:
+            yield entry.assistant
+        finally:
+            self._release(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Utilization and queueing metrics for the pool."""
+        return {
+            "model": self.model,
+            "size": self.size,
+            "in_use": self.in_use,
+            "idle": len(self._idle),
+            "waiting": len(self._waiters),
+            "max_size": self.max_size,
+            "utilization": round(self.in_use / self.max_size, 3),
+            "leases_total": self._leases_total,
+            "queued_total": self._queued_total,
+            "timeouts_total": self._timeouts_total,
+            "wait_seconds_avg": (
+                round(self._wait_seconds_total / self._leases_total, 4)
+                if self._leases_total
+                else 0.0
+            ),
+            "wait_seconds_max": round(self._wait_seconds_max, 4),
+        }
+
+    def _add(self, assistant: Any) -> _PooledAssistant:
+        entry = _PooledAssistant(len(self._entries), assistant)
+        self._entries.append(entry)
+        if self.on_build is not None:
+            self.on_build()
+        return entry
+
+    def _has_capacity(self) -> bool:
+        return self.size + self._building + self._reserved < self.max_size
+
+    async def _acquire(self, conversation_id: Optional[str]) -> _PooledAssistant:
+        started = time.perf_counter()
+        entry = None if self._waiters else self._take_idle(conversation_id)
+        if entry is None and self._has_capacity():
+            entry = await self._grow()
+        while entry is None:
+            entry = await self._wait(started)
+            if entry is None:
+                # A build failed and its capacity was handed to this turn
+                self._reserved -= 1
+                entry = await self._grow()
+
+        waited = time.perf_counter() - started
+        self._leases_total += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+        if conversation_id:
+            previous = self._last_served.pop(conversation_id, None)
+            if previous is not None and previous != entry.index:
+                entry.clear_session_cache()
+            self._last_served[conversation_id] = entry.index
+            while len(self._last_served) > AFFINITY_CAPACITY:
+                self._last_served.popitem(last=False)
+        return entry
+
+    def _take_idle(self, conversation_id: Optional[str]) -> Optional[_PooledAssistant]:
+        if not self._idle:
+            return None
+        preferred = self._last_served.get(conversation_id) if conversation_id else None
+        for position, entry in enumerate(self._idle):
+            if entry.index == preferred:
+                return self._idle.pop(position)
+        # Most recently released first: its caches are the warmest
+        return self._idle.pop()
+
+    async def _grow(self) -> _PooledAssistant:
+        entry = await self._build()
+        logger.info(
+            f"➕ Assistant pool for {self.model} grew to {self.size}/{self.max_size}"
+        )
+        return entry
+
+    async def _build(self) -> _PooledAssistant:
+        self._building += 1
+        try:
+            assistant = await asyncio.get_running_loop().run_in_executor(
+                None, self.factory
+            )
+        except BaseException:
+            self._building -= 1
+            self._hand_off_capacity()
+            raise
+        self._building -= 1
+        return self._add(assistant)
+
+    def _hand_off_capacity(self) -> None:
+        """Wake the next waiter to build a wrapper in place of a failed build."""
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._reserved += 1
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, started: float) -> Optional[_PooledAssistant]:
+        waiter: "asyncio.Future[Optional[_PooledAssistant]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        self._queued_total += 1
+        logger.info(
+            f"⏳ Assistant pool for {self.model} saturated "
+            f"({self.in_use}/{self.max_size} in use), {len(self._waiters)} waiting"
+        )
+        remaining = self.acquire_timeout - (time.perf_counter() - started)
+        try:
+            return await asyncio.wait_for(waiter, max(0.0, remaining))
+        except asyncio.TimeoutError:
+            self._timeouts_total += 1
+            raise AssistantPoolTimeoutError(
+                f"No assistant available for {self.model} after "
+                f"{time.perf_counter() - started:.1f}s "
+                f"({self.max_size} turns already running)"
+            ) from None
+        except asyncio.CancelledError:
+            # Handed a wrapper (or capacity) just as the caller was cancelled:
+            # pass it on
+            if waiter.done() and not waiter.cancelled():
+                entry = waiter.result()
+                if entry is None:
+                    self._reserved -= 1
+                    self._hand_off_capacity()
+                else:
+                    self._release(entry)
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _release(self, entry: _PooledAssistant) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(entry)
+                return
+        self._idle.append(entry)
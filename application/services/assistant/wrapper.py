@@ -7,6 +7,8 @@ from google.adk.runners import RunConfig, Runner
 from google.genai import types
 
 from application.agents.shared.cyoda_response_plugin import CyodaResponsePlugin
+from application.agents.shared.prompt_cache import get_context_cache_config
+from application.agents.shared.prompt_cache_plugin import PromptCachePlugin
 from application.config.streaming_config import streaming_config
 from application.services.assistant.session_manager import SessionManager
 from application.services.cyoda_session_service import CyodaSessionService
@@ -28,7 +30,8 @@ class CyodaAssistantWrapper:
                 name="cyoda_response_plugin",
                 provide_tool_summary=True,
                 default_message="Task completed successfully.",
-            )
+            ),
+            PromptCachePlugin(),
         ]
 
         self.runner = Runner(
@@ -37,6 +40,10 @@ class CyodaAssistantWrapper:
             session_service=session_service,
             plugins=plugins,
         )
+        # Gemini context caching of the agents' static instructions. Runner only
+        # takes it from an App, whose name must be an identifier, and sessions
+        # are stored under "cyoda-assistant"
+        self.runner.context_cache_config = get_context_cache_config()
 
     async def process_message(
         self,
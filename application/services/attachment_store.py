@@ -0,0 +1,553 @@
+"""
+Content-addressed store for chat file attachments.
+
+Uploads are read in ``ATTACHMENT_CHUNK_BYTES`` chunks, hashed with SHA-256
+and stored as one edge message per chunk, with a bounded number of chunk
+writes in flight, so memory use does not grow with the file size. An
+``AttachmentBlob`` entity indexes each distinct content by digest; uploading
+the same content again, into any conversation, reuses its chunks. When
+concurrent uploads of the same new content both create an index entry, the
+entry with the lowest technical ID is kept and the others are deleted along
+with their chunks.
+
+Each upload still gets its own small edge message (the ID listed in the
+conversation's ``file_blob_ids``) carrying the filename and the chunk list.
+
+Readers get an ``AttachmentHandle`` instead of a base64 string: content is
+fetched lazily, by byte range or chunk by chunk. Attachments saved before
+this store existed (a single base64 edge message) open as inline handles.
+"""
+
+import abc
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional
+
+from application.entity.attachment_blob import AttachmentBlob
+from application.services.edge_message_persistence_service.content_builders import (
+    build_edge_message_content,
+    build_edge_message_meta,
+)
+from common.config.config import (
+    ATTACHMENT_CHUNK_BYTES,
+    ATTACHMENT_INDEX_CACHE_ENTRIES,
+    ATTACHMENT_UPLOAD_CONCURRENCY,
+    CYODA_ENTITY_TYPE_EDGE_MESSAGE,
+)
+from common.service.entity_service import SearchConditionRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Edge message metadata "encoding" of upload references
+REFERENCE_ENCODING = "attachment"
+
+
+class AttachmentHandle(abc.ABC):
+    """Lazy, range-readable view of an attachment's content."""
+
+    def __init__(
+        self,
+        filename: str,
+        size: int,
+        content_type: str = DEFAULT_CONTENT_TYPE,
+        digest: Optional[str] = None,
+    ):
+        self.filename = filename
+        self.size = size
+        self.content_type = content_type
+        self.digest = digest
+
+    @abc.abstractmethod
+    async def read(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        """
+        Read a byte range of the content.
+
+        Args:
+            offset: First byte to read.
+            length: Maximum bytes to read (None for the rest of the content).
+
+        Returns:
+            The bytes in the range.
+        """
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the content in storage-sized pieces."""
+        yield await self.read()
+
+    async def read_text(self, encoding: str = "utf-8", errors: str = "replace") -> str:
+        """Read the whole content as text."""
+        return (await self.read()).decode(encoding, errors)
+
+    async def write_to(self, path: str) -> int:
+        """
+        Stream the content into a file.
+
+        Args:
+            path: Destination file path (overwritten).
+
+        Returns:
+            Bytes written.
+        """
+        written = 0
+        with open(path, "wb") as f:
+            async for chunk in self.iter_chunks():
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(filename={self.filename!r}, size={self.size}, "
+            f"content_type={self.content_type!r})"
+        )
+
+
+class InlineAttachment(AttachmentHandle):
+    """Attachment whose content is already in memory (legacy edge messages)."""
+
+    def __init__(
+        self, data: bytes, filename: str, content_type: str = DEFAULT_CONTENT_TYPE
+    ):
+        super().__init__(filename, len(data), content_type)
+        self._data = data
+
+    async def read(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        stop = self.size if length is None else offset + length
+        return self._data[offset:stop]
+
+
+class ChunkedAttachment(AttachmentHandle):
+    """Attachment stored as chunk edge messages, fetched on demand."""
+
+    def __init__(
+        self,
+        repository: Any,
+        chunk_ids: List[str],
+        chunk_size: int,
+        size: int,
+        filename: str,
+        content_type: str = DEFAULT_CONTENT_TYPE,
+        digest: Optional[str] = None,
+    ):
+        super().__init__(filename, size, content_type, digest)
+        self.chunk_ids = list(chunk_ids)
+        self.chunk_size = chunk_size
+        self._repository = repository
+
+    async def read(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        stop = self.size if length is None else min(self.size, offset + length)
+        if offset >= stop:
+            return b""
+        first = offset // self.chunk_size
+        last = (stop - 1) // self.chunk_size
+        chunks = await asyncio.gather(
+            *(self._fetch(index) for index in range(first, last + 1))
+        )
+        data = b"".join(chunks)
+        start = offset - first * self.chunk_size
+        return data[start : start + stop - offset]
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        for index in range(len(self.chunk_ids)):
+            yield await self._fetch(index)
+
+    async def _fetch(self, index: int) -> bytes:
+        edge_data = await self._repository.find_by_id(
+            meta=_chunk_meta(), entity_id=self.chunk_ids[index]
+        )
+        if not edge_data:
+            raise LookupError(
+                f"Chunk {index} ({self.chunk_ids[index]}) of {self.filename} not found"
+            )
+        return base64.b64decode(_edge_field(edge_data, "message") or "")
+
+
+def _chunk_meta() -> Dict[str, Any]:
+    # Chunks are not kept in the repository's edge message cache
+    return {**build_edge_message_meta(), "cache": False}
+
+
+def _edge_field(edge_data: Any, name: str) -> Any:
+    if isinstance(edge_data, dict):
+        return edge_data.get(name)
+    return getattr(edge_data, name, None)
+
+
+def _hash_stream(stream: BinaryIO, chunk_size: int) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := stream.read(chunk_size):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _canonical(blobs: List[AttachmentBlob]) -> Optional[AttachmentBlob]:
+    """Pick the authoritative index entry among duplicates: lowest technical ID."""
+    if not blobs:
+        return None
+    return min(blobs, key=lambda blob: blob.technical_id or "")
+
+
+def _seekable(stream: BinaryIO) -> bool:
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):
+        return False
+
+
+class AttachmentStore:
+    """Stores uploads as deduplicated chunks and opens them as handles."""
+
+    def __init__(
+        self,
+        repository: Any = None,
+        entity_service: Any = None,
+        chunk_size: int = ATTACHMENT_CHUNK_BYTES,
+        concurrency: int = ATTACHMENT_UPLOAD_CONCURRENCY,
+        index_cache_entries: int = ATTACHMENT_INDEX_CACHE_ENTRIES,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            repository: Edge message repository (defaults to the global one).
+            entity_service: Entity service for the digest index (defaults to
+                the global one).
+            chunk_size: Bytes per stored chunk.
+            concurrency: Chunk writes in flight per upload.
+            index_cache_entries: Digest index entries kept in memory.
+        """
+        self._repository = repository
+        self._entity_service = entity_service
+        self.chunk_size = chunk_size
+        self.concurrency = max(1, concurrency)
+        # Digest index entries seen by this process, least recently used first
+        self.index_cache_entries = index_cache_entries
+        self._blobs: "OrderedDict[str, AttachmentBlob]" = OrderedDict()
+
+    @property
+    def repository(self) -> Any:
+        if self._repository is None:
+            from services.services import get_repository
+
+            self._repository = get_repository()
+        return self._repository
+
+    @property
+    def entity_service(self) -> Any:
+        if self._entity_service is None:
+            from services.services import get_entity_service
+
+            self._entity_service = get_entity_service()
+        return self._entity_service
+
+    async def put(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: str = DEFAULT_CONTENT_TYPE,
+    ) -> ChunkedAttachment:
+        """
+        Store content read from a binary stream, reusing identical content.
+
+        Seekable streams (uploads spooled by the form parser) are hashed
+        first, so known content is not uploaded again.
+
+        Args:
+            stream: Binary file object positioned at the start of the content.
+            filename: Original filename.
+            content_type: MIME type.
+
+        Returns:
+            Handle to the stored content.
+        """
+        if _seekable(stream):
+            digest, _ = await asyncio.to_thread(_hash_stream, stream, self.chunk_size)
+            blob = await self._find_blob(digest)
+            if blob is not None:
+                logger.info(
+                    f"♻️ Reusing stored content for '{filename}' "
+                    f"({blob.size} bytes, {digest[:12]})"
+                )
+                return self._handle(blob, filename, content_type)
+            stream.seek(0)
+
+        blob = await self._index_blob(await self._upload_chunks(stream))
+        logger.info(
+            f"✅ Stored '{filename}': {blob.size} bytes in "
+            f"{len(blob.chunk_ids)} chunks ({blob.digest[:12]})"
+        )
+        return self._handle(blob, filename, content_type)
+
+    async def save_upload(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        conversation_id: str,
+        user_id: str,
+        content_type: str = DEFAULT_CONTENT_TYPE,
+    ) -> Optional[str]:
+        """
+        Store an uploaded file and record it for a conversation.
+
+        Args:
+            stream: Binary file object of the upload.
+            filename: Original filename.
+            conversation_id: Conversation the file is attached to.
+            user_id: Uploading user.
+            content_type: MIME type.
+
+        Returns:
+            ID of the upload's reference edge message (the file blob ID), or
+            None if the file could not be stored.
+        """
+        try:
+            attachment = await self.put(stream, filename, content_type)
+            metadata = {
+                "filename": filename,
+                "content_type": content_type,
+                "encoding": REFERENCE_ENCODING,
+                "digest": attachment.digest,
+                "size": attachment.size,
+                "chunk_size": attachment.chunk_size,
+                "chunk_ids": attachment.chunk_ids,
+            }
+            return await self.repository.save(
+                meta=build_edge_message_meta(),
+                entity=build_edge_message_content(
+                    "file", "", conversation_id, user_id, metadata, None
+                ),
+            )
+        except Exception as e:
+            logger.error(
+                f"❌ Failed to store attachment '{filename}': {e}", exc_info=True
+            )
+            return None
+
+    async def open(self, file_id: str, index: int = 0) -> Optional[AttachmentHandle]:
+        """
+        Open an attachment by its file blob ID.
+
+        Args:
+            file_id: Edge message ID from the conversation's file_blob_ids.
+            index: Position of the file, used for a default filename.
+
+        Returns:
+            Handle to the content, or None if the file cannot be found.
+        """
+        try:
+            edge_data = await self.repository.find_by_id(
+                meta={"type": CYODA_ENTITY_TYPE_EDGE_MESSAGE}, entity_id=file_id
+            )
+        except Exception as e:
+            logger.error(f"❌ Failed to retrieve attachment {file_id}: {e}")
+            return None
+        if not edge_data:
+            logger.warning(f"⚠️ Attachment {file_id} not found")
+            return None
+
+        metadata = _edge_field(edge_data, "metadata") or {}
+        filename = metadata.get("filename") or f"file_{index + 1}.txt"
+        content_type = metadata.get("content_type") or DEFAULT_CONTENT_TYPE
+        if metadata.get("encoding") == REFERENCE_ENCODING:
+            return ChunkedAttachment(
+                self.repository,
+                chunk_ids=metadata.get("chunk_ids") or [],
+                chunk_size=int(metadata.get("chunk_size") or self.chunk_size),
+                size=int(metadata.get("size") or 0),
+                filename=filename,
+                content_type=content_type,
+                digest=metadata.get("digest"),
+            )
+
+        # Legacy upload: the whole file in the edge message
+        message = _edge_field(edge_data, "message") or ""
+        data = str(message).encode("utf-8")
+        if metadata.get("encoding") == "base64":
+            try:
+                data = base64.b64decode(message)
+            except (binascii.Error, ValueError) as e:
+                logger.error(f"❌ Failed to decode {filename}: {e}")
+        return InlineAttachment(data, filename, content_type)
+
+    def _handle(
+        self, blob: AttachmentBlob, filename: str, content_type: str
+    ) -> ChunkedAttachment:
+        return ChunkedAttachment(
+            self.repository,
+            chunk_ids=blob.chunk_ids,
+            chunk_size=blob.chunk_size,
+            size=blob.size,
+            filename=filename,
+            content_type=content_type,
+            digest=blob.digest,
+        )
+
+    async def _upload_chunks(self, stream: BinaryIO) -> AttachmentBlob:
+        digest = hashlib.sha256()
+        size = 0
+        chunk_ids: List[Optional[str]] = []
+        slots = asyncio.Semaphore(self.concurrency)
+        writes: List["asyncio.Future[None]"] = []
+
+        async def write(index: int, chunk: bytes) -> None:
+            try:
+                chunk_ids[index] = await self.repository.save(
+                    meta=_chunk_meta(),
+                    entity={
+                        "type": "file_chunk",
+                        "message": base64.b64encode(chunk).decode("ascii"),
+                        "metadata": {"encoding": "base64", "chunk_index": index},
+                    },
+                )
+            finally:
+                slots.release()
+
+        try:
+            while True:
+                # At most `concurrency` chunks are held in memory at once
+                await slots.acquire()
+                chunk = await asyncio.to_thread(stream.read, self.chunk_size)
+                if not chunk:
+                    slots.release()
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                chunk_ids.append(None)
+                writes.append(asyncio.ensure_future(write(len(writes), chunk)))
+            await asyncio.gather(*writes)
+        except BaseException:
+            for pending in writes:
+                pending.cancel()
+            raise
+
+        if not all(chunk_ids):
+            raise RuntimeError("Chunk write returned no edge message ID")
+        return AttachmentBlob(
+            digest=digest.hexdigest(),
+            size=size,
+            chunk_size=self.chunk_size,
+            chunk_ids=chunk_ids,
+        )
+
+    async def _find_blob(self, digest: str) -> Optional[AttachmentBlob]:
+        blob = self._blobs.get(digest)
+        if blob is not None:
+            self._blobs.move_to_end(digest)
+            return blob
+        try:
+            blob = _canonical(await self._find_blobs(digest))
+        except Exception as e:
+            logger.warning(f"⚠️ Attachment index lookup failed for {digest[:12]}: {e}")
+            return None
+        if blob is not None:
+            self._remember_blob(blob)
+        return blob
+
+    async def _find_blobs(self, digest: str) -> List[AttachmentBlob]:
+        responses = await self.entity_service.search(
+            entity_class=AttachmentBlob.ENTITY_NAME,
+            condition=SearchConditionRequest.builder().equals("digest", digest).build(),
+            entity_version=str(AttachmentBlob.ENTITY_VERSION),
+        )
+        blobs = []
+        for response in responses or []:
+            if not response.data:
+                continue
+            data = (
+                response.data
+                if isinstance(response.data, dict)
+                else response.data.model_dump(by_alias=False)
+            )
+            blob = AttachmentBlob(**data)
+            blob.technical_id = response.metadata.id
+            blobs.append(blob)
+        return blobs
+
+    async def _index_blob(self, blob: AttachmentBlob) -> AttachmentBlob:
+        """
+        Record uploaded content in the digest index.
+
+        Args:
+            blob: Index entry of the chunks just uploaded.
+
+        Returns:
+            The entry to use: ``blob``, or the one kept when a concurrent
+            upload of the same content indexed it too.
+        """
+        try:
+            response = await self.entity_service.save(
+                entity=blob.model_dump(by_alias=False),
+                entity_class=AttachmentBlob.ENTITY_NAME,
+                entity_version=str(AttachmentBlob.ENTITY_VERSION),
+            )
+            blob.technical_id = response.metadata.id
+            winner = _canonical(await self._find_blobs(blob.digest)) or blob
+        except Exception as e:
+            # The upload is still usable, it just won't be deduplicated
+            logger.warning(f"⚠️ Failed to index attachment {blob.digest[:12]}: {e}")
+            return blob
+
+        if winner.technical_id != blob.technical_id:
+            logger.info(
+                f"♻️ Content {blob.digest[:12]} was indexed concurrently; "
+                f"keeping {winner.technical_id}"
+            )
+            await self._discard_blob(blob)
+        self._remember_blob(winner)
+        return winner
+
+    def _remember_blob(self, blob: AttachmentBlob) -> None:
+        self._blobs[blob.digest] = blob
+        self._blobs.move_to_end(blob.digest)
+        while len(self._blobs) > self.index_cache_entries:
+            self._blobs.popitem(last=False)
+
+    async def _discard_blob(self, blob: AttachmentBlob) -> None:
+        """Delete a duplicate index entry and the chunks only it references."""
+        cached = self._blobs.get(blob.digest)
+        if cached is not None and cached.technical_id == blob.technical_id:
+            del self._blobs[blob.digest]
+        try:
+            await self.entity_service.delete_by_id(
+                entity_id=blob.technical_id,
+                entity_class=AttachmentBlob.ENTITY_NAME,
+                entity_version=str(AttachmentBlob.ENTITY_VERSION),
+            )
+            await asyncio.gather(
+                *(
+                    self.repository.delete_by_id(
+                        meta=_chunk_meta(), technical_id=chunk_id
+                    )
+                    for chunk_id in blob.chunk_ids
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Failed to discard duplicate attachment {blob.technical_id}: {e}"
+            )
+
+
+# Global singleton instance
+_attachment_store: Optional[AttachmentStore] = None
+
+
+def get_attachment_store() -> AttachmentStore:
+    """Get or create the global attachment store."""
+    global _attachment_store
+    if _attachment_store is None:
+        _attachment_store = AttachmentStore()
+    return _attachment_store
+
+
+def reset_attachment_store() -> None:
+    """Drop the global store (used by tests)."""
+    global _attachment_store
+    _attachment_store = None
@@ -1,5 +1,7 @@
 """Chat service core - Re-exports for backward compatibility."""
 
+from application.repositories.conversation_summary_index import summary_index_of
+
 from .cache import ChatCacheManager
 from .constants import (
     FIELD_CREATED_AT,
@@ -27,7 +29,7 @@ from .formatters import (
     format_response,
 )
 from .list_operations import list_conversations
-from .models import CacheResult, PaginationResult
+from .models import CacheResult, ChatTransferResult, PaginationResult
 
 
 class ChatService:
@@ -45,7 +47,13 @@ class ChatService:
         """
         self.conversation_repo = conversation_repository
         self.persistence_service = persistence_service
+
         self.cache_manager = ChatCacheManager()
+        summary_index = summary_index_of(conversation_repository)
+        if summary_index:
+            # Listing changes on this instance invalidate at once; the TTL
+            # bounds staleness from other instances and superuser listings
+            summary_index.add_listener(self.cache_manager.invalidate_cache)
 
     async def create_conversation(
         self, user_id, name, description=None, file_blob_ids=None
@@ -132,6 +140,7 @@ __all__ = [
     "ChatService",
     "PaginationResult",
     "CacheResult",
+    "ChatTransferResult",
     "ChatCacheManager",
     "FIELD_DATE",
     "FIELD_TECHNICAL_ID",
@@ -18,9 +18,15 @@ logger = logging.getLogger(__name__)
 
 
 class ChatCacheManager:
-    """Manages caching for chat lists."""
+    """Manages caching for chat lists.
 
-    def __init__(self):
+    Entries expire after ``ttl_seconds``. With ``ttl_seconds=None`` entries
+    never expire and must be invalidated explicitly whenever a listing
+    changes (see ``ConversationSummaryIndex.add_listener``).
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
         self._chat_list_cache: Dict[str, tuple[List[Dict], float]] = {}
 
     def build_cache_key(self, user_id: Optional[str]) -> str:
@@ -45,8 +51,10 @@ class ChatCacheManager:
         Returns:
             True if cache is still valid
         """
+        if self.ttl_seconds is None:
+            return True
         age = current_time - cache_time
-        return age < CACHE_TTL_SECONDS
+        return age < self.ttl_seconds
 
     def get_from_cache(
         self, cache_key: str, limit: int, current_time: float
@@ -1,13 +1,23 @@
 """Conversation CRUD operations."""
 
+import asyncio
 import logging
+from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from application.entity.conversation import Conversation
-from application.repositories.conversation_repository import ConversationRepository
+from application.repositories.conversation_repository import (
+    ConversationRepository,
+    OwnershipTransferResult,
+    conversation_from_search_result,
+)
+from application.repositories.conversation_summary_index import summary_index_of
+from common.constants import CHAT_TRANSFER_BACKGROUND_THRESHOLD
+from services.services import get_task_service
 
 from .cache import ChatCacheManager
+from .models import ChatTransferResult
 
 logger = logging.getLogger(__name__)
 
@@ -98,8 +108,10 @@ async def update_conversation(
     updated = await conversation_repo.update_with_retry(conversation)
     logger.info(f"Updated conversation {updated.technical_id}")
 
-    # Invalidate cache
-    cache_manager.invalidate_cache(updated.user_id)
+    # With a summary index the cache is invalidated by the index, and only
+    # when listed fields change (not on every appended message)
+    if not summary_index_of(conversation_repo):
+        cache_manager.invalidate_cache(updated.user_id)
 
     return updated
 
@@ -121,7 +133,7 @@ async def delete_conversation(
     Example:
         >>> await delete_conversation(repo, cache, "123-456", "alice")
     """
-    await conversation_repo.delete(technical_id)
+    await conversation_repo.delete(technical_id, user_id)
     logger.info(f"Deleted conversation {technical_id}")
 
     # Invalidate cache
@@ -158,9 +170,14 @@ async def transfer_guest_chats(
     cache_manager: ChatCacheManager,
     guest_user_id: str,
     authenticated_user_id: str,
-) -> int:
+) -> ChatTransferResult:
     """Transfer chats from guest user to authenticated user.
 
+    Chats found by the search are transferred directly, with bounded
+    concurrency. More than ``CHAT_TRANSFER_BACKGROUND_THRESHOLD`` chats are
+    transferred by a background task so the login request returns
+    immediately; its progress is reported on the task.
+
     Args:
         conversation_repo: Repository for conversation data access
         cache_manager: Cache manager for invalidation
@@ -168,14 +185,14 @@ async def transfer_guest_chats(
         authenticated_user_id: Authenticated user ID (must not start with 'guest.')
 
     Returns:
-        Number of chats transferred
+        ChatTransferResult with per-chat results, or the background task ID
 
     Raises:
         ValueError: If user IDs are invalid
 
     Example:
-        >>> count = await transfer_guest_chats(repo, cache, "guest.123", "alice")
-        >>> print(f"Transferred {count} chats")
+        >>> result = await transfer_guest_chats(repo, cache, "guest.123", "alice")
+        >>> print(f"Transferred {result.transferred_count} chats")
     """
     # Validate user IDs
     if not guest_user_id.startswith("guest."):
@@ -187,26 +204,129 @@ async def transfer_guest_chats(
         f"🔄 Starting chat transfer from {guest_user_id} to {authenticated_user_id}"
     )
 
-    # Find all guest chats
+    # Find all guest chats; the search results are the documents we write
     guest_chats = await conversation_repo.search(user_id=guest_user_id)
+    conversations = [
+        conversation
+        for conversation in map(conversation_from_search_result, guest_chats)
+        if conversation and conversation.technical_id
+    ]
+
+    if len(conversations) > CHAT_TRANSFER_BACKGROUND_THRESHOLD:
+        task = await get_task_service().create_task(
+            user_id=authenticated_user_id,
+            task_type="chat_transfer",
+            name=f"Transfer {len(conversations)} guest chats",
+            description=f"Transfer chats from {guest_user_id}",
+        )
+        job = asyncio.create_task(
+            _run_transfer_task(
+                conversation_repo,
+                cache_manager,
+                task.technical_id,
+                conversations,
+                guest_user_id,
+                authenticated_user_id,
+            )
+        )
+        _background_transfers.add(job)
+        job.add_done_callback(_background_transfers.discard)
+        logger.info(
+            f"🔄 Transferring {len(conversations)} chats in background task "
+            f"{task.technical_id}"
+        )
+        return ChatTransferResult(total=len(conversations), task_id=task.technical_id)
 
-    transferred_count = 0
-    for chat_response in guest_chats:
-        if hasattr(chat_response, "metadata"):
-            conversation = await conversation_repo.get_by_id(chat_response.metadata.id)
-            if conversation:
-                conversation.user_id = authenticated_user_id
-                await conversation_repo.update_with_retry(conversation)
-                transferred_count += 1
-                logger.debug(f"✅ Transferred chat {conversation.technical_id}")
+    results = await conversation_repo.transfer_ownership(
+        conversations, authenticated_user_id
+    )
+    result = _summarize_transfer(results)
 
     # Invalidate caches
     cache_manager.invalidate_cache(guest_user_id)
     cache_manager.invalidate_cache(authenticated_user_id)
 
     logger.info(
-        f"✅ Chat transfer completed: {transferred_count} chats transferred "
+        f"✅ Chat transfer completed: {result.transferred_count} chats transferred "
         f"from {guest_user_id} to {authenticated_user_id}"
     )
 
-    return transferred_count
+    return result
+
+
+# Keeps background transfer jobs referenced until they finish
+_background_transfers: Set[asyncio.Task] = set()
+
+
+def _summarize_transfer(results: List[OwnershipTransferResult]) -> ChatTransferResult:
+    """Build a ChatTransferResult from per-chat results."""
+    transferred = sum(1 for result in results if result.success)
+    return ChatTransferResult(
+        total=len(results),
+        transferred_count=transferred,
+        failed_count=len(results) - transferred,
+        results=[asdict(result) for result in results],
+    )
+
+
+async def _run_transfer_task(
+    conversation_repo: ConversationRepository,
+    cache_manager: ChatCacheManager,
+    task_id: str,
+    conversations: List[Conversation],
+    guest_user_id: str,
+    authenticated_user_id: str,
+) -> None:
+    """Transfer chats and report progress on a BackgroundTask."""
+    task_service = get_task_service()
+    total = len(conversations)
+    results: List[OwnershipTransferResult] = []
+    reported_progress = 0
+
+    try:
+        await task_service.update_task_status(
+            task_id, "running", message="Transferring chats", progress=0
+        )
+        async for result in conversation_repo.iter_transfer_ownership(
+            conversations, authenticated_user_id
+        ):
+            results.append(result)
+            progress = len(results) * 100 // total
+            # Report every 10% so the task entity is not rewritten per chat
+            if progress - reported_progress >= 10 and len(results) < total:
+                reported_progress = progress
+                await task_service.update_task_status(
+                    task_id,
+                    "running",
+                    message=f"Transferred {len(results)}/{total} chats",
+                    progress=progress,
+                )
+
+        summary = _summarize_transfer(results)
+        await task_service.update_task_status(
+            task_id,
+            "completed",
+            message=(
+                f"Transferred {summary.transferred_count}/{total} chats"
+                + (f", {summary.failed_count} failed" if summary.failed_count else "")
+            ),
+            progress=100,
+            result=summary.model_dump(),
+        )
+        logger.info(
+            f"✅ Background chat transfer {task_id} completed: "
+            f"{summary.transferred_count}/{total} chats"
+        )
+    except Exception as e:
+        logger.error(
+            f"❌ Background chat transfer {task_id} failed: {e}", exc_info=True
+        )
+        try:
+            await task_service.update_task_status(task_id, "failed", error=str(e))
+        except Exception as status_error:
+            logger.error(
+                f"Failed to mark transfer task {task_id} failed: {status_error}"
+            )
+    finally:
+        cache_manager.invalidate_cache(guest_user_id)
+        cache_manager.invalidate_cache(authenticated_user_id)
@@ -1,7 +1,10 @@
 """Formatters for chat service responses."""
 
+import base64
+import binascii
+import json
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from .constants import (
     FIELD_CREATED_AT,
@@ -38,6 +41,39 @@ def calculate_pagination(chats: List[Dict], limit: int) -> PaginationResult:
     )
 
 
+def encode_list_cursor(chat: Dict) -> str:
+    """Encode the keyset position of a listed chat as an opaque cursor.
+
+    Args:
+        chat: Last chat of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([chat.get(FIELD_DATE, ""), chat.get(FIELD_TECHNICAL_ID, "")])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_list_cursor(cursor: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+    """Decode a cursor from ``encode_list_cursor``.
+
+    Plain ISO timestamps from older clients are accepted as date-only cursors.
+
+    Args:
+        cursor: Cursor string or None
+
+    Returns:
+        (date, technical_id) tuple, technical_id None for date-only cursors
+    """
+    if not cursor:
+        return None
+    try:
+        date, technical_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(date), str(technical_id)
+    except (binascii.Error, ValueError, TypeError):
+        return cursor, None
+
+
 def format_response(
     chats: List[Dict], pagination: PaginationResult, cached: bool
 ) -> Dict:
@@ -2,15 +2,21 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from application.repositories.conversation_repository import ConversationRepository
+from application.repositories.conversation_summary_index import (
+    ConversationSummaryIndex,
+    summary_index_of,
+)
 from common.constants import CHAT_LIST_DEFAULT_LIMIT
 
 from .cache import ChatCacheManager
 from .constants import FIELD_DATE
 from .formatters import (
     calculate_pagination,
+    decode_list_cursor,
+    encode_list_cursor,
     extract_conversations_from_response,
     format_response,
 )
@@ -34,7 +40,7 @@ async def list_conversations(
         cache_manager: Cache manager
         user_id: Filter by user ID (None for all conversations - superuser)
         limit: Maximum number of results
-        before: ISO timestamp for cursor-based pagination
+        before: Cursor from a previous page's next_cursor
         use_cache: Whether to use cache (default True)
 
     Returns:
@@ -44,6 +50,8 @@ async def list_conversations(
         >>> result = await list_conversations(repo, cache, user_id="alice", limit=50)
         >>> print(result["chats"])
     """
+    summary_index = summary_index_of(conversation_repo)
+
     # Step 1: Build cache key and check cache
     cache_key = cache_manager.build_cache_key(user_id)
     current_time = datetime.now(timezone.utc).timestamp()
@@ -53,31 +61,70 @@ async def list_conversations(
     if should_use_cache:
         cache_result = cache_manager.get_from_cache(cache_key, limit, current_time)
         if cache_result.hit:
+            next_cursor = None
+            if cache_result.chats:
+                last_chat = cache_result.chats[-1]
+                next_cursor = (
+                    encode_list_cursor(last_chat)
+                    if summary_index
+                    else last_chat[FIELD_DATE]
+                )
             pagination = PaginationResult(
-                has_more=len(cache_result.chats) == limit,
-                next_cursor=(
-                    cache_result.chats[-1][FIELD_DATE] if cache_result.chats else None
-                ),
+                has_more=len(cache_result.chats) == limit, next_cursor=next_cursor
             )
             return format_response(cache_result.chats, pagination, cached=True)
 
-    # Step 3: Fetch from repository
-    response_list = await conversation_repo.search(
-        user_id=user_id, limit=limit + 1, point_in_time=before
-    )
-
-    # Step 4: Extract and format conversations
-    user_chats = extract_conversations_from_response(response_list)
-    user_chats.sort(key=lambda x: x.get(FIELD_DATE, ""), reverse=True)
+    # Step 3: Fetch one extra row to detect further pages
+    if summary_index:
+        user_chats = await _list_from_summary_index(
+            conversation_repo, summary_index, user_id, limit, before
+        )
+    else:
+        user_chats = await _list_from_conversations(
+            conversation_repo, user_id, limit, before
+        )
 
-    # Step 5: Calculate pagination
+    # Step 4: Calculate pagination
     pagination = calculate_pagination(user_chats, limit)
     user_chats = user_chats[:limit]
+    if pagination.has_more and summary_index:
+        pagination.next_cursor = encode_list_cursor(user_chats[-1])
 
-    # Step 6: Update cache if appropriate
+    # Step 5: Update cache if appropriate
     should_cache = should_use_cache and user_id
     if should_cache:
         cache_manager.update_cache(cache_key, user_chats, current_time)
 
-    # Step 7: Format and return response
+    # Step 6: Format and return response
     return format_response(user_chats, pagination, cached=False)
+
+
+async def _list_from_summary_index(
+    conversation_repo: ConversationRepository,
+    summary_index: ConversationSummaryIndex,
+    user_id: Optional[str],
+    limit: int,
+    before: Optional[str],
+) -> List[Dict]:
+    """Page over the summary index with a (date, technical_id) keyset cursor."""
+    # Conversations older than the index are indexed once per user (or once
+    # for all users on a superuser listing) before the first page is read
+    await summary_index.ensure_backfilled(user_id)
+    return await conversation_repo.list_summaries(
+        user_id=user_id, limit=limit + 1, cursor=decode_list_cursor(before)
+    )
+
+
+async def _list_from_conversations(
+    conversation_repo: ConversationRepository,
+    user_id: Optional[str],
+    limit: int,
+    before: Optional[str],
+) -> List[Dict]:
+    """List by searching full conversation entities (no summary index)."""
+    response_list = await conversation_repo.search(
+        user_id=user_id, limit=limit + 1, point_in_time=before
+    )
+    user_chats = extract_conversations_from_response(response_list)
+    user_chats.sort(key=lambda x: x.get(FIELD_DATE, ""), reverse=True)
+    return user_chats
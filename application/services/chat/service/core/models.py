@@ -1,6 +1,6 @@
 """Data models for chat service."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -19,3 +19,18 @@ class PaginationResult(BaseModel):
     has_more: bool
     next_cursor: Optional[str] = None
     total_returned: int = 0
+
+
+class ChatTransferResult(BaseModel):
+    """Outcome of a guest-to-user chat transfer.
+
+    For transfers run in the background, ``task_id`` identifies the
+    BackgroundTask reporting progress and ``results`` is filled in on the
+    task when it completes.
+    """
+
+    total: int
+    transferred_count: int = 0
+    failed_count: int = 0
+    results: List[Dict[str, Any]] = []
+    task_id: Optional[str] = None
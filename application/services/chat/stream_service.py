@@ -24,10 +24,7 @@ from common.config.config import (
     CYODA_ENTITY_TYPE_EDGE_MESSAGE,
     ENTITY_VERSION,
 )
-from services.services import (
-    get_cyoda_assistant,
-    get_repository,
-)
+from services.services import get_repository
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +47,13 @@ class ChatStreamService:
         user_message: str,
         file_blob_ids: Optional[List[str]] = None,
         is_superuser: bool = False,
-    ) -> Tuple[Conversation, str, Any]:
+    ) -> Tuple[Conversation, str]:
         """
         Prepare for streaming: validate, save user message, update conversation.
 
+        The assistant that runs the turn is leased from the assistant pool by
+        the caller for the duration of the stream.
+
         Args:
             technical_id: Conversation ID
             user_id: User ID
@@ -62,7 +62,7 @@ class ChatStreamService:
             is_superuser: Whether user is superuser
 
         Returns:
-            Tuple of (Updated Conversation, Message text to process, Assistant instance)
+            Tuple of (Updated Conversation, Message text to process)
         """
         # Get and validate conversation
         conversation = await self.chat_service.get_conversation(technical_id)
@@ -91,15 +91,12 @@ class ChatStreamService:
 
         updated_conversation = await self.chat_service.update_conversation(conversation)
 
-        # Get assistant
-        assistant = get_cyoda_assistant()
-
         # Format message for AI
         message_to_process = user_message
         if file_blob_ids:
             message_to_process = f"{user_message} (with {len(file_blob_ids)} files)"
 
-        return updated_conversation, message_to_process, assistant
+        return updated_conversation, message_to_process
 
     def _select_stream_generator(
         self,
@@ -0,0 +1,328 @@
+"""
+Write-coalescing unit of work for conversation updates.
+
+A chat turn used to rewrite the whole Conversation document several times:
+once for the ADK session id, once for the user message and, after streaming,
+once more for the AI response (after an extra read). A
+``ConversationUnitOfWork`` stages those mutations and writes them in a single
+update per flush.
+
+Edge-message writes are started as soon as a message is staged, so they run
+concurrently with each other and with the read (or any in-flight write) of the
+conversation. The conversation write itself waits for them, since it needs the
+server-assigned edge message ids.
+
+Flushes for the same conversation within a pod are group-committed by a
+``ConversationWriteCoalescer``: while one update is in flight, later flushes
+queue their changes and are merged into the next single update. The updates
+are written by a detached writer task that callers only wait on, so a caller
+that is cancelled does not abort a write carrying other callers' changes, and
+a caller whose edge message writes failed is failed alone.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union
+
+from application.entity.conversation import Conversation
+
+logger = logging.getLogger(__name__)
+
+EdgeMessageId = Union[str, Awaitable[Optional[str]]]
+
+
+@dataclass
+class _StagedMessage:
+    message_type: str
+    edge_message_id: "asyncio.Future[Optional[str]]"
+    file_blob_ids: Optional[List[str]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class ConversationChanges:
+    """Mutations staged by one unit of work."""
+
+    messages: List[_StagedMessage] = field(default_factory=list)
+    file_blob_ids: List[str] = field(default_factory=list)
+    background_task_ids: List[str] = field(default_factory=list)
+    adk_session_id: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.messages
+            or self.file_blob_ids
+            or self.background_task_ids
+            or self.adk_session_id
+        )
+
+    async def resolve(self) -> Optional[BaseException]:
+        """
+        Wait for the edge message writes of staged messages.
+
+        Returns:
+            The first error raised by one of the writes, or None.
+        """
+        results = await asyncio.gather(
+            *(m.edge_message_id for m in self.messages), return_exceptions=True
+        )
+        return next((r for r in results if isinstance(r, BaseException)), None)
+
+    def apply(self, conversation: Conversation) -> None:
+        """Apply the changes to a conversation (edge writes must be resolved)."""
+        for message in self.messages:
+            edge_message_id = message.edge_message_id.result()
+            if not edge_message_id:
+                logger.error(
+                    f"❌ Dropping {message.message_type} message for "
+                    f"{conversation.technical_id}: edge message was not saved"
+                )
+                continue
+            conversation.add_message(
+                message.message_type,
+                edge_message_id,
+                message.file_blob_ids,
+                metadata=message.metadata,
+            )
+        if self.file_blob_ids:
+            if conversation.file_blob_ids is None:
+                conversation.file_blob_ids = []
+            for file_id in self.file_blob_ids:
+                if file_id not in conversation.file_blob_ids:
+                    conversation.file_blob_ids.append(file_id)
+        for task_id in self.background_task_ids:
+            if task_id not in conversation.background_task_ids:
+                conversation.background_task_ids.append(task_id)
+        if self.adk_session_id and not conversation.adk_session_id:
+            conversation.adk_session_id = self.adk_session_id
+
+
+_Commit = Tuple[ConversationChanges, "asyncio.Future[Optional[Conversation]]"]
+
+
+@dataclass
+class _Batch:
+    commits: List[_Commit] = field(default_factory=list)
+    base: Optional[Conversation] = None
+
+
+def _fail(done: "asyncio.Future[Any]", error: BaseException) -> None:
+    if done.done():
+        return
+    done.set_exception(error)
+    # Mark retrieved so a caller that stopped waiting is not logged by asyncio
+    done.exception()
+
+
+class ConversationWriteCoalescer:
+    """Group-commits conversation updates per conversation within a pod."""
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, _Batch] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+
+    async def commit(
+        self,
+        chat_service: Any,
+        conversation_id: str,
+        changes: ConversationChanges,
+        base: Optional[Conversation] = None,
+    ) -> Optional[Conversation]:
+        """
+        Write ``changes`` to the conversation, merged with concurrent commits.
+
+        Args:
+            chat_service: Service providing get_conversation/update_conversation.
+            conversation_id: Conversation technical ID.
+            changes: Changes to write.
+            base: Freshly read conversation to apply the changes to, saving a
+                read. Ignored when other commits are merged into the write.
+
+        Returns:
+            The updated conversation, or None if it no longer exists.
+        """
+        writing = conversation_id in self._writers
+        batch = self._pending.get(conversation_id)
+        if batch is None:
+            # A base read while another write is in flight may already be stale
+            batch = self._pending[conversation_id] = _Batch(
+                base=None if writing else base
+            )
+        else:
+            batch.base = None
+        done: "asyncio.Future[Optional[Conversation]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        batch.commits.append((changes, done))
+
+        if not writing:
+            self._writers[conversation_id] = asyncio.create_task(
+                self._drain(chat_service, conversation_id)
+            )
+        # Shielded: a cancelled caller must not cancel the shared write
+        return await asyncio.shield(done)
+
+    async def _drain(self, chat_service: Any, conversation_id: str) -> None:
+        try:
+            while conversation_id in self._pending:
+                await self._write(
+                    chat_service,
+                    conversation_id,
+                    self._pending.pop(conversation_id),
+                )
+        finally:
+            del self._writers[conversation_id]
+            orphan = self._pending.pop(conversation_id, None)
+            if orphan is not None:
+                for _, done in orphan.commits:
+                    done.cancel()
+
+    async def _write(
+        self, chat_service: Any, conversation_id: str, batch: _Batch
+    ) -> None:
+        try:
+            resolving = asyncio.gather(
+                *(changes.resolve() for changes, _ in batch.commits)
+            )
+            base = batch.base
+            if base is None:
+                # Read the latest version while the edge messages are written
+                base, failures = await asyncio.gather(
+                    chat_service.get_conversation(conversation_id), resolving
+                )
+            else:
+                failures = await resolving
+
+            # Commits whose edge message writes failed are failed on their own
+            commits = []
+            for commit, failure in zip(batch.commits, failures):
+                if failure is None:
+                    commits.append(commit)
+                else:
+                    _fail(commit[1], failure)
+            if not commits:
+                return
+
+            if base is None:
+                logger.warning(f"⚠️ Conversation {conversation_id} not found")
+                for _, done in commits:
+                    done.set_result(None)
+                return
+            for changes, _ in commits:
+                changes.apply(base)
+            updated = await chat_service.update_conversation(base)
+            if len(commits) > 1:
+                logger.info(
+                    f"✅ Coalesced {len(commits)} updates of "
+                    f"conversation {conversation_id}"
+                )
+            for _, done in commits:
+                done.set_result(updated)
+        except asyncio.CancelledError:
+            for _, done in batch.commits:
+                done.cancel()
+            raise
+        except Exception as e:
+            for _, done in batch.commits:
+                _fail(done, e)
+
+
+class ConversationUnitOfWork:
+    """Stages mutations of one conversation and writes them in one update."""
+
+    def __init__(
+        self,
+        conversation_id: str,
+        chat_service: Any,
+        base: Optional[Conversation] = None,
+        coalescer: Optional[ConversationWriteCoalescer] = None,
+    ):
+        """
+        Initialize the unit of work.
+
+        Args:
+            conversation_id: Conversation technical ID.
+            chat_service: Chat service used to read and update the conversation.
+            base: Conversation just read by the caller; the first flush applies
+                its changes to it instead of reading the conversation again.
+            coalescer: Write coalescer (defaults to the global one).
+        """
+        self.conversation_id = conversation_id
+        self._chat_service = chat_service
+        self._base = base
+        self._coalescer = coalescer or get_conversation_write_coalescer()
+        self._changes = ConversationChanges()
+
+    def append_message(
+        self,
+        message_type: str,
+        edge_message_id: EdgeMessageId,
+        file_blob_ids: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Stage a message for the conversation flow.
+
+        Args:
+            message_type: Message type ('user', 'ai', ...).
+            edge_message_id: Edge message ID, or the pending edge message
+                write returning it; the write starts immediately.
+            file_blob_ids: Attached files.
+            metadata: Message metadata (e.g. hooks).
+        """
+        if isinstance(edge_message_id, str):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(edge_message_id)
+        else:
+            future = asyncio.ensure_future(edge_message_id)
+        self._changes.messages.append(
+            _StagedMessage(message_type, future, file_blob_ids, metadata)
+        )
+
+    def add_file_blob_ids(self, file_blob_ids: Optional[List[str]]) -> None:
+        """Stage files to attach to the conversation."""
+        self._changes.file_blob_ids.extend(file_blob_ids or [])
+
+    def add_background_task(self, task_id: str) -> None:
+        """Stage a background task to link to the conversation."""
+        self._changes.background_task_ids.append(task_id)
+
+    def set_adk_session_id(self, adk_session_id: Optional[str]) -> None:
+        """Stage the ADK session id; applied only if the conversation has none."""
+        if adk_session_id:
+            self._changes.adk_session_id = adk_session_id
+
+    async def flush(self) -> Optional[Conversation]:
+        """
+        Write all staged changes in one conversation update.
+
+        Returns:
+            The updated conversation (the base if nothing was staged), or None
+            if the conversation no longer exists.
+        """
+        changes, self._changes = self._changes, ConversationChanges()
+        base, self._base = self._base, None
+        if not changes:
+            return base
+        return await self._coalescer.commit(
+            self._chat_service, self.conversation_id, changes, base
+        )
+
+
+# Global singleton instance
+_coalescer: Optional[ConversationWriteCoalescer] = None
+
+
+def get_conversation_write_coalescer() -> ConversationWriteCoalescer:
+    """Get or create the global conversation write coalescer."""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = ConversationWriteCoalescer()
+    return _coalescer
+
+
+def reset_conversation_write_coalescer() -> None:
+    """Drop the global coalescer (used by tests)."""
+    global _coalescer
+    _coalescer = None
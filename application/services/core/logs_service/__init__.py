@@ -1,5 +1,10 @@
 """Logs Service - Re-exports for backward compatibility."""
 
+from common.constants import (
+    ELASTICSEARCH_STREAM_MAX_HITS,
+    ELASTICSEARCH_STREAM_PAGE_SIZE,
+)
+
 from .api_key_operations import check_health, generate_api_key
 from .helpers import (
     build_log_index_pattern,
@@ -8,11 +13,22 @@ from .helpers import (
     encode_api_key,
     get_namespace,
 )
+from .search_engine import (
+    LogPage,
+    LogQuery,
+    LogSearchEngine,
+    decode_cursor,
+    encode_cursor,
+    get_log_search_engine,
+)
 from .search_operations import (
+    aggregate_logs,
+    build_log_query,
     build_search_query,
     execute_search_request,
     process_search_response,
     search_logs,
+    stream_logs,
 )
 
 
@@ -86,6 +102,40 @@ class LogsService:
             sort,
         )
 
+    def build_log_query(
+        self,
+        api_key: str,
+        org_id: str,
+        env_name: str,
+        app_name: str,
+        query=None,
+        sort=None,
+        source_fields=None,
+        page_size: int = ELASTICSEARCH_STREAM_PAGE_SIZE,
+    ) -> LogQuery:
+        """Build a namespace-scoped query for streaming or aggregation."""
+        return build_log_query(
+            self.config_service,
+            api_key,
+            org_id,
+            env_name,
+            app_name,
+            query,
+            sort,
+            source_fields,
+            page_size,
+        )
+
+    def stream_logs(
+        self, request: LogQuery, max_hits: int = ELASTICSEARCH_STREAM_MAX_HITS
+    ):
+        """Stream hits across pages with point in time + search_after."""
+        return stream_logs(request, max_hits)
+
+    async def aggregate_logs(self, request: LogQuery, group_by: str, interval="5m"):
+        """Count logs over time grouped by level or pod."""
+        return await aggregate_logs(request, group_by, interval)
+
     async def check_health(self):
         """Check ELK cluster health."""
         return await check_health(self.config_service)
@@ -108,4 +158,13 @@ __all__ = [
     "execute_search_request",
     "process_search_response",
     "search_logs",
+    "build_log_query",
+    "stream_logs",
+    "aggregate_logs",
+    "LogQuery",
+    "LogPage",
+    "LogSearchEngine",
+    "get_log_search_engine",
+    "encode_cursor",
+    "decode_cursor",
 ]
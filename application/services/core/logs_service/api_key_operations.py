@@ -5,11 +5,11 @@ from typing import Dict
 
 import httpx
 
-from application.routes.common.constants import (
+from application.services.core.config_service import ConfigService
+from common.constants import (
     API_KEY_EXPIRY_DAYS,
     DEFAULT_HTTP_TIMEOUT_SECONDS,
 )
-from application.services.core.config_service import ConfigService
 
 from .helpers import build_role_descriptors, create_basic_auth_header, encode_api_key
 
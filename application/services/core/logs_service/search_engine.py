@@ -0,0 +1,315 @@
+"""Cursor-paginated log search over Elasticsearch.
+
+Uses a point in time (PIT) plus ``search_after`` so result sets larger than
+one page can be scanned consistently, a pooled HTTP client shared by all
+searches, ``_source`` filtering, and server-side aggregations for summaries.
+"""
+
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from common.constants import (
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+    ELASTICSEARCH_MAX_CONNECTIONS,
+    ELASTICSEARCH_MAX_SIZE,
+    ELASTICSEARCH_PIT_KEEP_ALIVE,
+    ELASTICSEARCH_STREAM_MAX_HITS,
+    ELASTICSEARCH_STREAM_PAGE_SIZE,
+    LOG_AGGREGATION_FIELDS,
+    LOG_AGGREGATION_MAX_TERMS,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_SORT = [{"@timestamp": {"order": "desc"}}]
+
+
+@dataclass
+class LogQuery:
+    """Everything needed to run one log search against Elasticsearch."""
+
+    host: str
+    index_pattern: str
+    authorization: str
+    query: Dict[str, Any] = field(default_factory=lambda: {"match_all": {}})
+    sort: List[Dict[str, Any]] = field(default_factory=lambda: list(DEFAULT_LOG_SORT))
+    source_fields: Optional[List[str]] = None
+    page_size: int = ELASTICSEARCH_STREAM_PAGE_SIZE
+
+
+@dataclass
+class LogPage:
+    """One page of hits plus the cursor for the next page (None when done)."""
+
+    hits: List[Dict[str, Any]]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(
+    pit_id: str, search_after: List[Any], query: Dict, total: int = 0
+) -> str:
+    """Encode a continuation cursor as URL-safe base64 JSON."""
+    payload = json.dumps(
+        {"pit": pit_id, "after": search_after, "query": query, "total": total}
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(payload, dict) or not {"pit", "after", "query"} <= set(payload):
+        raise ValueError("Invalid cursor: missing fields")
+    return payload
+
+
+class LogSearchEngine:
+    """Point-in-time + search_after log search with a pooled HTTP client."""
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=ELASTICSEARCH_MAX_CONNECTIONS,
+                    max_keepalive_connections=ELASTICSEARCH_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def search_page(
+        self, request: LogQuery, cursor: Optional[str] = None
+    ) -> LogPage:
+        """Fetch one page of hits, opening a point in time on the first page.
+
+        Args:
+            request: Search parameters
+            cursor: Cursor returned by a previous page, or None to start
+
+        Returns:
+            LogPage with hits and the cursor for the next page. The point in
+            time is closed once the last page has been read.
+
+        Raises:
+            ValueError: If the cursor is invalid or the API key expired
+            Exception: If Elasticsearch returns an error
+        """
+        if cursor:
+            state = decode_cursor(cursor)
+            pit_id, search_after, query = state["pit"], state["after"], state["query"]
+        else:
+            pit_id = await self.open_point_in_time(request)
+            state, search_after, query = {}, None, request.query
+
+        result = await self._search_with_pit(request, pit_id, query, search_after)
+        hits = result.get("hits", {}).get("hits", [])
+        pit_id = result.get("pit_id", pit_id)
+        # Totals are only tracked on the first page and carried in the cursor
+        total = (
+            result.get("hits", {}).get("total", {}).get("value", state.get("total", 0))
+        )
+
+        if len(hits) < request.page_size:
+            await self.close_point_in_time(request, pit_id)
+            return LogPage(hits=hits, total=total)
+        return LogPage(
+            hits=hits,
+            total=total,
+            next_cursor=encode_cursor(pit_id, hits[-1]["sort"], query, total),
+        )
+
+    async def iter_hits(
+        self, request: LogQuery, max_hits: int = ELASTICSEARCH_STREAM_MAX_HITS
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield hits page by page until the result set or max_hits is exhausted.
+
+        The point in time is always released, including when the consumer
+        stops iterating early (e.g. the HTTP client disconnects).
+        """
+        pit_id = await self.open_point_in_time(request)
+        search_after = None
+        emitted = 0
+        try:
+            while emitted < max_hits:
+                result = await self._search_with_pit(
+                    request, pit_id, request.query, search_after
+                )
+                pit_id = result.get("pit_id", pit_id)
+                hits = result.get("hits", {}).get("hits", [])
+                for hit in hits[: max_hits - emitted]:
+                    yield hit
+                emitted += len(hits)
+                if len(hits) < request.page_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            await self.close_point_in_time(request, pit_id)
+
+    async def aggregate(
+        self, request: LogQuery, group_by: str, interval: str = "5m"
+    ) -> Dict[str, Any]:
+        """Count logs per time bucket grouped by level or pod, without hits.
+
+        Args:
+            request: Search parameters (sort and paging are ignored)
+            group_by: One of LOG_AGGREGATION_FIELDS ("level", "pod")
+            interval: Date histogram fixed interval ("1m", "5m", "1h", ...)
+
+        Returns:
+            {"total": int, "buckets": [{"timestamp", "count", "groups": {key: count}}]}
+
+        Raises:
+            ValueError: If group_by is unknown or the API key expired
+            Exception: If Elasticsearch returns an error
+        """
+        if group_by not in LOG_AGGREGATION_FIELDS:
+            available = ", ".join(LOG_AGGREGATION_FIELDS)
+            raise ValueError(f"Unknown group_by: {group_by}. Available: {available}")
+
+        body = {
+            "size": 0,
+            "track_total_hits": True,
+            "query": request.query,
+            "aggs": {
+                "over_time": {
+                    "date_histogram": {
+                        "field": "@timestamp",
+                        "fixed_interval": interval,
+                    },
+                    "aggs": {
+                        "groups": {
+                            "terms": {
+                                "field": LOG_AGGREGATION_FIELDS[group_by],
+                                "size": LOG_AGGREGATION_MAX_TERMS,
+                            }
+                        }
+                    },
+                }
+            },
+        }
+        result = await self._post(request, f"/{request.index_pattern}/_search", body)
+        return _summarize_aggregation(result)
+
+    async def open_point_in_time(self, request: LogQuery) -> str:
+        """Open a point in time over the request's index pattern."""
+        response = await self.get_client().post(
+            f"https://{request.host}/{request.index_pattern}/_pit",
+            params={"keep_alive": ELASTICSEARCH_PIT_KEEP_ALIVE},
+            headers=_headers(request),
+        )
+        pit_id = _parse_response(response).get("id")
+        if not pit_id:
+            raise Exception("Failed to open point in time for log search")
+        return pit_id
+
+    async def close_point_in_time(self, request: LogQuery, pit_id: str) -> None:
+        """Release a point in time; failures are logged, never raised."""
+        try:
+            await self.get_client().request(
+                "DELETE",
+                f"https://{request.host}/_pit",
+                headers=_headers(request),
+                json={"id": pit_id},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to close log search point in time: {e}")
+
+    async def _search_with_pit(
+        self,
+        request: LogQuery,
+        pit_id: str,
+        query: Dict[str, Any],
+        search_after: Optional[List[Any]],
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "size": min(request.page_size, ELASTICSEARCH_MAX_SIZE),
+            "query": query,
+            "sort": request.sort,
+            "pit": {"id": pit_id, "keep_alive": ELASTICSEARCH_PIT_KEEP_ALIVE},
+            "track_total_hits": search_after is None,
+        }
+        if request.source_fields is not None:
+            body["_source"] = request.source_fields
+        if search_after is not None:
+            body["search_after"] = search_after
+        return await self._post(request, "/_search", body)
+
+    async def _post(self, request: LogQuery, path: str, body: Dict) -> Dict[str, Any]:
+        response = await self.get_client().post(
+            f"https://{request.host}{path}", headers=_headers(request), json=body
+        )
+        return _parse_response(response)
+
+
+def _headers(request: LogQuery) -> Dict[str, str]:
+    return {
+        "Authorization": request.authorization,
+        "Content-Type": "application/json",
+    }
+
+
+def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+    """Return the JSON body or raise like process_search_response does."""
+    if response.status_code in [200, 201]:
+        return response.json()
+
+    logger.error(f"ELK request failed: {response.status_code} - {response.text}")
+    if response.status_code == 401:
+        error_text = response.text.lower()
+        if "api key" in error_text and (
+            "expired" in error_text or "invalid" in error_text
+        ):
+            raise ValueError("ELK_API_KEY_EXPIRED")
+    raise Exception(f"Search failed: {response.text}")
+
+
+def _summarize_aggregation(result: Dict[str, Any]) -> Dict[str, Any]:
+    buckets = result.get("aggregations", {}).get("over_time", {}).get("buckets", [])
+    return {
+        "total": result.get("hits", {}).get("total", {}).get("value", 0),
+        "buckets": [
+            {
+                "timestamp": bucket.get("key_as_string", bucket.get("key")),
+                "count": bucket.get("doc_count", 0),
+                "groups": {
+                    group["key"]: group["doc_count"]
+                    for group in bucket.get("groups", {}).get("buckets", [])
+                },
+            }
+            for bucket in buckets
+        ],
+    }
+
+
+_engine: Optional[LogSearchEngine] = None
+
+
+def get_log_search_engine() -> LogSearchEngine:
+    """Return the process-wide log search engine."""
+    global _engine
+    if _engine is None:
+        _engine = LogSearchEngine()
+    return _engine
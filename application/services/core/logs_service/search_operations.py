@@ -1,18 +1,20 @@
 """Log search operations for Elasticsearch."""
 
 import logging
-from typing import Dict
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
-from application.routes.common.constants import (
-    DEFAULT_HTTP_TIMEOUT_SECONDS,
+from application.services.core.config_service import ConfigService
+from common.constants import (
     ELASTICSEARCH_DEFAULT_SIZE,
     ELASTICSEARCH_MAX_SIZE,
+    ELASTICSEARCH_STREAM_MAX_HITS,
+    ELASTICSEARCH_STREAM_PAGE_SIZE,
 )
-from application.services.core.config_service import ConfigService
 
 from .helpers import build_log_index_pattern
+from .search_engine import LogQuery, get_log_search_engine
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +52,15 @@ async def execute_search_request(
     Returns:
         HTTP response object
     """
-    async with httpx.AsyncClient(timeout=DEFAULT_HTTP_TIMEOUT_SECONDS) as client:
-        return await client.post(
-            f"https://{host}/{index_pattern}/_search",
-            headers={
-                "Authorization": f"ApiKey {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=search_query,
-        )
+    client = get_log_search_engine().get_client()
+    return await client.post(
+        f"https://{host}/{index_pattern}/_search",
+        headers={
+            "Authorization": f"ApiKey {api_key}",
+            "Content-Type": "application/json",
+        },
+        json=search_query,
+    )
 
 
 def process_search_response(response: httpx.Response) -> Dict:
@@ -144,3 +146,85 @@ async def search_logs(
         elk_config.host, index_pattern, api_key, search_query
     )
     return process_search_response(response)
+
+
+def build_log_query(
+    config_service: ConfigService,
+    api_key: str,
+    org_id: str,
+    env_name: str,
+    app_name: str,
+    query: Optional[Dict] = None,
+    sort: Optional[list] = None,
+    source_fields: Optional[List[str]] = None,
+    page_size: int = ELASTICSEARCH_STREAM_PAGE_SIZE,
+) -> LogQuery:
+    """Build a namespace-scoped LogQuery for the user's API key.
+
+    Args:
+        config_service: Configuration service for external services
+        api_key: Elasticsearch API key
+        org_id: Organization ID
+        env_name: Environment name
+        app_name: Application name
+        query: Elasticsearch query DSL (default: match_all)
+        sort: Sort specification (default: newest first)
+        source_fields: Optional _source filter, e.g. ["@timestamp", "message"]
+        page_size: Hits fetched per search_after page
+
+    Returns:
+        LogQuery ready for the log search engine
+    """
+    elk_config = config_service.get_elk_config()
+    request = LogQuery(
+        host=elk_config.host,
+        index_pattern=build_log_index_pattern(org_id, env_name, app_name),
+        authorization=f"ApiKey {api_key}",
+        source_fields=source_fields,
+        page_size=min(int(page_size), ELASTICSEARCH_MAX_SIZE),
+    )
+    if query:
+        request.query = query
+    if sort:
+        request.sort = sort
+    return request
+
+
+async def stream_logs(
+    request: LogQuery, max_hits: int = ELASTICSEARCH_STREAM_MAX_HITS
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream hits beyond a single page using point in time + search_after.
+
+    Args:
+        request: Query built by build_log_query
+        max_hits: Upper bound on hits yielded
+
+    Yields:
+        Raw Elasticsearch hits in sort order
+    """
+    logger.info(
+        f"Streaming logs from index={request.index_pattern} "
+        f"(page_size={request.page_size}, max_hits={max_hits})"
+    )
+    async for hit in get_log_search_engine().iter_hits(request, max_hits):
+        yield hit
+
+
+async def aggregate_logs(
+    request: LogQuery, group_by: str, interval: str = "5m"
+) -> Dict[str, Any]:
+    """Count logs over time grouped by level or pod, without returning hits.
+
+    Args:
+        request: Query built by build_log_query
+        group_by: "level" or "pod"
+        interval: Date histogram interval (e.g. "1m", "5m", "1h")
+
+    Returns:
+        {"total": int, "buckets": [{"timestamp", "count", "groups"}]}
+    """
+    logger.info(
+        f"Aggregating logs from index={request.index_pattern} "
+        f"(group_by={group_by}, interval={interval})"
+    )
+    return await get_log_search_engine().aggregate(request, group_by, interval)
@@ -9,6 +9,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 from application.services.cloud_manager_service import get_cloud_manager_service
+from application.services.environment_management.namespace_inventory import (
+    get_namespace_inventory,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +107,8 @@ class DeploymentService:
         # Call Cloud Manager API
         cloud_manager = await get_cloud_manager_service()
         response = await cloud_manager.post("/deploy/cyoda-env", json=payload)
+        # The new namespace must show up in listings without waiting for a refresh
+        get_namespace_inventory().invalidate()
         data = response.json()
 
         # Extract deployment information
@@ -268,6 +273,7 @@ class DeploymentService:
 
         cloud_manager = await get_cloud_manager_service()
         response = await cloud_manager.post("/deploy/user-app", json=payload)
+        get_namespace_inventory().invalidate()
         data = response.json()
 
         deployment_build_id = data.get("build_id")
@@ -4,6 +4,7 @@ This package is organized into focused modules:
 - namespace_operations: Namespace normalization and construction
 - environment_operations: Environment-level CRUD and query operations
 - application_operations: Application-level CRUD and query operations (both general and user apps)
+- namespace_inventory: Cached, incrementally refreshed namespace listing used by list operations
 
 The main EnvironmentManagementService class is re-exported from this package for backward compatibility.
 """
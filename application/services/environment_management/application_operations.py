@@ -16,6 +16,7 @@ import httpx
 
 from application.services.cloud_manager_service import get_cloud_manager_service
 
+from .namespace_inventory import get_namespace_inventory
 from .namespace_operations import construct_user_app_namespace, normalize_for_namespace
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,7 @@ async def scale_user_app(
         f"/k8s/namespaces/{namespace}/deployments/{deployment_name}/scale", json=payload
     )
 
+    get_namespace_inventory().invalidate()
     logger.info(f"Scaled {deployment_name} in {namespace} to {replicas} replicas")
     return response.json()
 
@@ -158,6 +160,7 @@ async def delete_user_app(
 
     client = await get_cloud_manager_service()
     response = await client.delete(f"/k8s/namespaces/{namespace}")
+    get_namespace_inventory().invalidate(namespace)
 
     logger.info(f"Deleted namespace {namespace}")
     return response.json()
@@ -179,41 +182,40 @@ async def list_user_apps(
         List of user application dictionaries
     """
     client = await get_cloud_manager_service()
-    response = await client.get("/k8s/namespaces")
-    data = response.json()
-    all_namespaces = data.get("namespaces", [])
 
-    # Filter for user app namespaces (format: client-1-{user}-{env}-{app})
+    # User app namespaces have the format client-1-{user}-{env}-{app}
     normalized_user = normalize_for_namespace(user_id)
     normalized_env = normalize_for_namespace(env_name)
     app_namespace_prefix = f"client-1-{normalized_user}-{normalized_env}-"
+    app_namespaces = await get_namespace_inventory().find_by_prefix(
+        client, app_namespace_prefix
+    )
 
     user_apps = []
-    for ns in all_namespaces:
+    for ns in app_namespaces:
         ns_name = ns.get("name", "")
-        if ns_name.startswith(app_namespace_prefix):
-            # Extract app name
-            app_name = ns_name.replace(app_namespace_prefix, "")
-
-            # Check app status if auth token provided
-            app_status = "Unknown"
-            if auth_token:
-                app_status = await check_user_app_status(
-                    user_id=user_id,
-                    env_name=env_name,
-                    app_name=app_name,
-                    auth_token=auth_token,
-                )
-
-            user_apps.append(
-                {
-                    "name": app_name,
-                    "namespace": ns_name,
-                    "status": app_status,
-                    "created": ns.get("creationTimestamp", ""),
-                }
+        # Extract app name
+        app_name = ns_name.replace(app_namespace_prefix, "")
+
+        # Check app status if auth token provided
+        app_status = "Unknown"
+        if auth_token:
+            app_status = await check_user_app_status(
+                user_id=user_id,
+                env_name=env_name,
+                app_name=app_name,
+                auth_token=auth_token,
             )
 
+        user_apps.append(
+            {
+                "name": app_name,
+                "namespace": ns_name,
+                "status": app_status,
+                "created": ns.get("creationTimestamp", ""),
+            }
+        )
+
     logger.info(f"Found {len(user_apps)} user apps in {env_name}")
     return user_apps
 
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 # Import from parent module for test mocking compatibility
 # Tests patch at application.services.environment_management_service.get_cloud_manager_service
 from ..cloud_manager_service import get_cloud_manager_service
+from .namespace_inventory import get_namespace_inventory
 from .namespace_operations import construct_namespace, normalize_for_namespace
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ async def scale_application(
         f"/k8s/namespaces/{namespace}/deployments/{app_name}/scale", json=payload
     )
 
+    get_namespace_inventory().invalidate()
     logger.info(f"Scaled {app_name} in {namespace} to {replicas} replicas")
     return response.json()
 
@@ -145,6 +147,7 @@ async def delete_environment(
 
     client = await get_cloud_manager_service()
     response = await client.delete(f"/k8s/namespaces/{namespace}")
+    get_namespace_inventory().invalidate(namespace)
 
     logger.info(f"Deleted namespace {namespace}")
     return response.json()
@@ -162,30 +165,29 @@ async def list_environments(
         List of environment dictionaries with name, namespace, and status
     """
     client = await get_cloud_manager_service()
-    response = await client.get("/k8s/namespaces")
-    data = response.json()
-    all_namespaces = data.get("namespaces", [])
 
-    # Filter namespaces for this user
+    # Index lookup on the cached namespace inventory
     normalized_user = normalize_for_namespace(user_id)
     user_namespace_prefix = f"client-{normalized_user}-"
+    user_namespaces = await get_namespace_inventory().find_by_prefix(
+        client, user_namespace_prefix
+    )
     user_environments = []
 
-    for ns in all_namespaces:
+    for ns in user_namespaces:
         ns_name = ns.get("name", "")
-        if ns_name.startswith(user_namespace_prefix):
-            # Extract environment name
-            env_name = ns_name.replace(user_namespace_prefix, "")
-            # Skip app namespaces
-            if "-app-" not in env_name and not ns_name.startswith("client-1-"):
-                user_environments.append(
-                    {
-                        "name": env_name,
-                        "namespace": ns_name,
-                        "status": ns.get("status", "Unknown"),
-                        "created": ns.get("creationTimestamp", ""),
-                    }
-                )
+        # Extract environment name
+        env_name = ns_name.replace(user_namespace_prefix, "")
+        # Skip app namespaces
+        if "-app-" not in env_name and not ns_name.startswith("client-1-"):
+            user_environments.append(
+                {
+                    "name": env_name,
+                    "namespace": ns_name,
+                    "status": ns.get("status", "Unknown"),
+                    "created": ns.get("creationTimestamp", ""),
+                }
+            )
 
     logger.info(f"Found {len(user_environments)} environments for user {user_id}")
     return user_environments
@@ -0,0 +1,173 @@
+"""In-memory inventory of Kubernetes namespaces.
+
+Listing environments and user apps used to download every namespace from the
+Cloud Manager on each call and filter in Python. The inventory keeps the last
+listing indexed by name, refreshes it at most every
+NAMESPACE_INVENTORY_REFRESH_SECONDS with a conditional request (ETag /
+resourceVersion), and answers per-user listings with a prefix lookup on a
+sorted name index. Mutations invalidate the inventory so the next read
+refreshes.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from common.constants import NAMESPACE_INVENTORY_REFRESH_SECONDS
+
+logger = logging.getLogger(__name__)
+
+NAMESPACES_PATH = "/k8s/namespaces"
+
+
+class NamespaceInventory:
+    """Namespace listing cache with incremental refresh and prefix lookups."""
+
+    def __init__(self, refresh_seconds: float = NAMESPACE_INVENTORY_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._namespaces: Dict[str, Dict[str, Any]] = {}
+        self._sorted_names: List[str] = []
+        self._etag: Optional[str] = None
+        self._resource_version: Optional[str] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def find_by_prefix(self, client: Any, prefix: str) -> List[Dict[str, Any]]:
+        """Return namespaces whose name starts with prefix, refreshing if stale.
+
+        Args:
+            client: Cloud Manager client used when a refresh is due
+            prefix: Namespace name prefix, e.g. "client-alice-"
+
+        Returns:
+            Namespace dictionaries as returned by the Cloud Manager, sorted by name
+
+        Raises:
+            httpx.HTTPStatusError: If the first listing fails
+        """
+        await self.ensure_fresh(client)
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        matches = []
+        for name in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(self._namespaces[name])
+        return matches
+
+    async def ensure_fresh(self, client: Any) -> None:
+        """Refresh the inventory if it is older than refresh_seconds.
+
+        Concurrent callers share a single refresh. If a refresh fails but a
+        previous listing exists, the previous listing keeps being served.
+        """
+        if not self._is_stale():
+            return
+        async with self._lock:
+            if not self._is_stale():
+                return
+            try:
+                await self._refresh(client)
+            except httpx.HTTPError as e:
+                if self._refreshed_at is None:
+                    raise
+                logger.warning(
+                    f"Namespace inventory refresh failed, serving cached: {e}"
+                )
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Force a refresh on the next read.
+
+        Args:
+            namespace: Namespace that was deleted or changed. It is dropped
+                from the index right away so deletions are never served stale.
+        """
+        if namespace is not None and namespace in self._namespaces:
+            del self._namespaces[namespace]
+            index = bisect.bisect_left(self._sorted_names, namespace)
+            del self._sorted_names[index]
+        self._refreshed_at = None
+        # The server's version may still include the namespace (deletion is async)
+        self._etag = None
+        self._resource_version = None
+
+    def clear(self) -> None:
+        """Drop all cached namespaces."""
+        self._namespaces.clear()
+        self._sorted_names.clear()
+        self._etag = None
+        self._resource_version = None
+        self._refreshed_at = None
+
+    def _is_stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_seconds
+        )
+
+    async def _refresh(self, client: Any) -> None:
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        params = (
+            {"resourceVersion": self._resource_version}
+            if self._resource_version
+            else None
+        )
+        try:
+            response = await client.get(NAMESPACES_PATH, headers=headers, params=params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 304:
+                raise
+            self._refreshed_at = time.monotonic()
+            return
+
+        data = response.json()
+        resource_version = data.get("resourceVersion")
+        if not (resource_version and resource_version == self._resource_version):
+            self._apply(data.get("namespaces", []))
+        self._etag = response.headers.get("ETag")
+        self._resource_version = resource_version
+        self._refreshed_at = time.monotonic()
+
+    def _apply(self, namespaces: List[Dict[str, Any]]) -> None:
+        """Diff a full listing into the index, touching only changed names."""
+        current = {ns.get("name", ""): ns for ns in namespaces if ns.get("name")}
+        removed = self._namespaces.keys() - current.keys()
+        added = current.keys() - self._namespaces.keys()
+
+        for name in removed:
+            del self._namespaces[name]
+        self._namespaces.update(current)
+
+        if len(removed) + len(added) > len(self._sorted_names) // 2:
+            self._sorted_names = sorted(self._namespaces)
+        else:
+            for name in removed:
+                del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
+            for name in added:
+                bisect.insort(self._sorted_names, name)
+
+        if removed or added:
+            logger.debug(
+                f"Namespace inventory updated: +{len(added)} -{len(removed)}, "
+                f"total={len(self._namespaces)}"
+            )
+
+
+_inventory: Optional[NamespaceInventory] = None
+
+
+def get_namespace_inventory() -> NamespaceInventory:
+    """Return the process-wide namespace inventory."""
+    global _inventory
+    if _inventory is None:
+        _inventory = NamespaceInventory()
+    return _inventory
+
+
+def reset_namespace_inventory() -> None:
+    """Discard the process-wide inventory (useful for testing)."""
+    global _inventory
+    _inventory = None
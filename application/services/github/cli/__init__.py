@@ -7,13 +7,13 @@ from .monitor import (
     _handle_success_completion,
     _perform_final_commit,
     _perform_initial_commit,
-    _perform_periodic_commit,
     _unregister_process,
     _update_progress_status,
 )
 from .utils import (
     _create_output_log_file,
     _create_prompt_file,
+    _create_queued_task,
     _extract_repo_metadata,
     _finalize_output_file,
     _register_process_and_create_task,
@@ -38,11 +38,11 @@ __all__ = [
     "_start_subprocess",
     "_finalize_output_file",
     "_register_process_and_create_task",
+    "_create_queued_task",
     "_extract_repo_metadata",
     # Monitor
     "_perform_initial_commit",
     "_check_process_running",
-    "_perform_periodic_commit",
     "_update_progress_status",
     "_unregister_process",
     "_perform_final_commit",
@@ -73,64 +73,6 @@ async def _check_process_running(process: Any, pid: int) -> bool:
         return True
 
 
-async def _perform_periodic_commit(
-    git_service: Any,
-    repository_path: str,
-    branch_name: str,
-    repo_auth_config: Dict[str, Any],
-    elapsed_time: int,
-    task_id: str,
-    task_service: Any,
-    pid: int,
-) -> None:
-    """Perform periodic commit and push changes.
-
-    Args:
-        git_service: Git service instance
-        repository_path: Repository path
-        branch_name: Branch name
-        repo_auth_config: Repository auth config
-        elapsed_time: Elapsed time in seconds
-        task_id: Task ID
-        task_service: Task service instance
-        pid: Process ID
-    """
-    try:
-        commit_result = await asyncio.wait_for(
-            git_service.commit_and_push(
-                repository_path,
-                f"Progress on {branch_name} ({int(elapsed_time)}s)",
-                branch_name,
-                repo_auth_config,
-            ),
-            timeout=120.0,
-        )
-
-        if commit_result.get("success"):
-            changed_files = commit_result.get("changed_files", [])
-            canvas_resources = commit_result.get("canvas_resources", {})
-
-            metadata = {
-                "changed_files": changed_files[:20],
-                "canvas_resources": canvas_resources,
-                "elapsed_time": int(elapsed_time),
-                "pid": pid,
-            }
-
-            await task_service.add_progress_update(
-                task_id=task_id,
-                message=f"Progress committed ({len(changed_files)} files)",
-                metadata=metadata,
-            )
-            logger.info(
-                f"📊 [{branch_name}] Progress committed: {len(changed_files)} files"
-            )
-    except asyncio.TimeoutError:
-        logger.warning(f"⚠️ [{branch_name}] Periodic commit timed out")
-    except Exception as e:
-        logger.warning(f"⚠️ [{branch_name}] Periodic commit failed: {e}")
-
-
 async def _update_progress_status(
     task_id: str, elapsed_time: int, timeout_seconds: int, task_service: Any, pid: int
 ) -> None:
@@ -6,7 +6,7 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from application.agents.shared.prompt_loader import load_template
 from services.services import get_task_service
@@ -78,6 +78,7 @@ async def _start_subprocess(
     branch_name: str,
     output_fd: int,
     cwd: Optional[str] = None,
+    preexec_fn: Optional[Callable[[], None]] = None,
 ) -> asyncio.subprocess.Process:
     """Start CLI subprocess.
 
@@ -89,6 +90,7 @@ async def _start_subprocess(
         branch_name: Branch name
         output_fd: Output file descriptor
         cwd: Working directory (optional)
+        preexec_fn: Run in the child before exec, e.g. to set rlimits (optional)
 
     Returns:
         Process instance
@@ -103,7 +105,11 @@ async def _start_subprocess(
     ]
 
     process = await asyncio.create_subprocess_exec(
-        *cmd, stdout=output_fd, stderr=output_fd, cwd=cwd or str(script_path.parent)
+        *cmd,
+        stdout=output_fd,
+        stderr=output_fd,
+        cwd=cwd or str(script_path.parent),
+        preexec_fn=preexec_fn,
     )
     os.close(output_fd)
     return process
@@ -141,6 +147,7 @@ async def _register_process_and_create_task(
     repository_path: str,
     repo_auth_config: Dict[str, Any],
     output_file: str,
+    task_id: Optional[str] = None,
 ) -> str:
     """Register process and create task record.
 
@@ -158,6 +165,8 @@ async def _register_process_and_create_task(
         repository_path: Repository path
         repo_auth_config: Repository auth config
         output_file: Output log file
+        task_id: Existing task to attach the process to (queued jobs); a new
+            task is created when omitted
 
     Returns:
         Task ID
@@ -169,26 +178,22 @@ async def _register_process_and_create_task(
         raise RuntimeError("Process limit exceeded during registration")
 
     task_service = get_task_service()
-    repo_url_public = (
-        repo_auth_config.get("url")
-        if repo_auth_config.get("type") == "public"
-        else None
-    )
-
-    background_task = await task_service.create_task(
-        user_id=user_id,
-        task_type=task_type,
-        name=task_name,
-        description=task_description,
-        branch_name=branch_name,
-        language=language,
-        user_request=user_request,
-        conversation_id=conversation_id,
-        repository_path=repository_path,
-        repository_type=repo_auth_config.get("type"),
-        repository_url=repo_url_public,
-    )
-    task_id = background_task.technical_id
+    if task_id is None:
+        background_task = await task_service.create_task(
+            **_task_fields(
+                user_id,
+                task_type,
+                task_name,
+                task_description,
+                branch_name,
+                language,
+                user_request,
+                conversation_id,
+                repository_path,
+                repo_auth_config,
+            )
+        )
+        task_id = background_task.technical_id
 
     await task_service.update_task_status(
         task_id=task_id,
@@ -202,6 +207,81 @@ async def _register_process_and_create_task(
     return task_id
 
 
+def _task_fields(
+    user_id: str,
+    task_type: str,
+    task_name: str,
+    task_description: str,
+    branch_name: str,
+    language: str,
+    user_request: str,
+    conversation_id: str,
+    repository_path: str,
+    repo_auth_config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build create_task keyword arguments for a CLI job."""
+    repo_url_public = (
+        repo_auth_config.get("url")
+        if repo_auth_config.get("type") == "public"
+        else None
+    )
+    return {
+        "user_id": user_id,
+        "task_type": task_type,
+        "name": task_name,
+        "description": task_description,
+        "branch_name": branch_name,
+        "language": language,
+        "user_request": user_request,
+        "conversation_id": conversation_id,
+        "repository_path": repository_path,
+        "repository_type": repo_auth_config.get("type"),
+        "repository_url": repo_url_public,
+    }
+
+
+async def _create_queued_task(
+    task_service: Any,
+    priority: int,
+    user_id: str,
+    task_type: str,
+    task_name: str,
+    task_description: str,
+    branch_name: str,
+    language: str,
+    user_request: str,
+    conversation_id: str,
+    repository_path: str,
+    repo_auth_config: Dict[str, Any],
+) -> str:
+    """Create the pending task record for a job waiting in the scheduler queue.
+
+    Returns:
+        Task ID
+    """
+    from application.agents.shared.job_scheduler import (
+        QUEUED_JOB_KEY,
+        get_job_scheduler,
+    )
+
+    background_task = await task_service.create_task(
+        **_task_fields(
+            user_id,
+            task_type,
+            task_name,
+            task_description,
+            branch_name,
+            language,
+            user_request,
+            conversation_id,
+            repository_path,
+            repo_auth_config,
+        ),
+        **{QUEUED_JOB_KEY: get_job_scheduler().queue_entry(priority)},
+    )
+    return background_task.technical_id
+
+
 def _extract_repo_metadata(
     repo_auth_config: Dict[str, Any],
 ) -> tuple[Optional[str], Optional[str]]:
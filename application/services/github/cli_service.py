@@ -9,9 +9,17 @@ Internal organization:
 import asyncio
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
-
+from typing import Any, Awaitable, Dict, Optional, Set
+
+from application.agents.shared.commit_scheduler import CommitScheduler
+from application.agents.shared.job_scheduler import (
+    JobPriority,
+    JobSlot,
+    QueuedJob,
+    get_job_scheduler,
+)
 from application.agents.shared.prompt_loader import load_template
 from application.services.github.operations_service import GitHubOperationsService
 from common.config.config import AUGMENT_MODEL, CLAUDE_MODEL, CLI_PROVIDER, GEMINI_MODEL
@@ -26,13 +34,13 @@ from .cli.monitor import (
     _handle_success_completion,
     _perform_final_commit,
     _perform_initial_commit,
-    _perform_periodic_commit,
     _unregister_process,
     _update_progress_status,
 )
 from .cli.utils import (
     _create_output_log_file,
     _create_prompt_file,
+    _create_queued_task,
     _extract_repo_metadata,
     _finalize_output_file,
     _register_process_and_create_task,
@@ -71,6 +79,45 @@ CODEGEN_COMMIT_INTERVAL = 30  # seconds
 BUILD_COMMIT_INTERVAL = 60  # seconds
 
 
+@dataclass
+class _CLIJob:
+    """Everything needed to launch one CLI process once it gets a slot."""
+
+    script_path: Path
+    prompt_file: str
+    cli_model: str
+    log_type: str
+    log_model: str
+    cwd: Optional[str]
+    timeout_seconds: int
+    commit_interval: int
+    task_type: str
+    task_name: str
+    task_description: str
+    repository_path: str
+    branch_name: str
+    language: str
+    user_request: str
+    user_id: str
+    conversation_id: str
+    repo_auth_config: Dict[str, Any]
+
+    def task_args(self) -> tuple:
+        """Positional task arguments shared by the task helpers."""
+        return (
+            self.user_id,
+            self.task_type,
+            self.task_name,
+            self.task_description,
+            self.branch_name,
+            self.language,
+            self.user_request,
+            self.conversation_id,
+            self.repository_path,
+            self.repo_auth_config,
+        )
+
+
 class GitHubCLIService:
     """Service for handling GitHub CLI operations."""
 
@@ -115,8 +162,9 @@ class GitHubCLIService:
         user_id: str,
         conversation_id: str,
         repo_auth_config: Dict[str, Any],
+        priority: JobPriority = JobPriority.INTERACTIVE,
     ) -> Dict[str, Any]:
-        """Start code generation process.
+        """Start code generation process, or queue it if no slot is free.
 
         Args:
             repository_path: Path to repository
@@ -126,9 +174,11 @@ class GitHubCLIService:
             user_id: User ID
             conversation_id: Conversation ID
             repo_auth_config: Repository authentication config
+            priority: Scheduling priority (interactive jobs beat batch)
 
         Returns:
-            Dictionary with task_id, pid, and output_file
+            Dictionary with task_id, pid, and output_file (queued jobs: pid
+            and output_file are None and queue_position is set)
         """
         # Step 1: Validate inputs
         _validate_cli_inputs(
@@ -145,77 +195,28 @@ class GitHubCLIService:
         full_prompt = f"{prompt_template}\n\n## User Request:\n{user_request}"
         prompt_file = await _create_prompt_file(full_prompt)
 
-        # Step 4: Setup process manager
-        from application.agents.shared.process_manager import get_process_manager
-
-        process_manager = get_process_manager()
-        if not await process_manager.can_start_process():
-            raise RuntimeError("Maximum concurrent CLI processes reached")
-
-        # Step 5: Create and configure output log file
-        output_file, output_fd = _create_output_log_file(
-            CLI_PROVIDER, branch_name, "codegen"
-        )
-        _write_log_header(output_fd, branch_name, "codegen", cli_model)
-
-        # Step 6: Start subprocess
-        process = await _start_subprocess(
-            script_path, prompt_file, cli_model, repository_path, branch_name, output_fd
-        )
-
-        # Step 7: Finalize log file
-        final_output_file = _finalize_output_file(output_file, process.pid)
-
-        # Step 8: Register process and create task
-        try:
-            task_id = await _register_process_and_create_task(
-                process.pid,
-                get_task_service(),
-                user_id,
-                "code_generation",
-                f"Generate code: {user_request[:50]}...",
-                f"Generating code: {user_request[:200]}...",
-                branch_name,
-                language,
-                user_request,
-                conversation_id,
-                repository_path,
-                repo_auth_config,
-                final_output_file,
-            )
-        except RuntimeError as e:
-            # Terminate process if registration fails
-            process.terminate()
-            raise
-
-        # Step 9: Extract repository metadata
-        repository_owner, repository_name = _extract_repo_metadata(repo_auth_config)
-
-        # Step 10: Start monitoring task
-        monitoring_task = asyncio.create_task(
-            self._monitor_cli_process(
-                process=process,
-                repository_path=repository_path,
-                branch_name=branch_name,
-                timeout_seconds=DEFAULT_CODEGEN_TIMEOUT,
-                task_id=task_id,
-                prompt_file=prompt_file,
-                output_file=final_output_file,
-                repo_auth_config=repo_auth_config,
-                commit_interval=CODEGEN_COMMIT_INTERVAL,
-                conversation_id=conversation_id,
-                repository_name=repository_name,
-                repository_owner=repository_owner,
-            )
+        # Step 4: Start now or queue for a slot
+        job = _CLIJob(
+            script_path=script_path,
+            prompt_file=prompt_file,
+            cli_model=cli_model,
+            log_type="codegen",
+            log_model=cli_model,
+            cwd=None,
+            timeout_seconds=DEFAULT_CODEGEN_TIMEOUT,
+            commit_interval=CODEGEN_COMMIT_INTERVAL,
+            task_type="code_generation",
+            task_name=f"Generate code: {user_request[:50]}...",
+            task_description=f"Generating code: {user_request[:200]}...",
+            repository_path=repository_path,
+            branch_name=branch_name,
+            language=language,
+            user_request=user_request,
+            user_id=user_id,
+            conversation_id=conversation_id,
+            repo_auth_config=repo_auth_config,
         )
-
-        self._track_background_task(monitoring_task)
-
-        return {
-            "task_id": task_id,
-            "pid": process.pid,
-            "output_file": final_output_file,
-        }
+        return await self._start_or_queue(job, priority)
 
     async def _load_build_prompt_template(self, language: str) -> str:
         """Load build prompt template with patterns for language.
@@ -252,8 +253,9 @@ class GitHubCLIService:
         user_id: str,
         conversation_id: str,
         repo_auth_config: Dict[str, Any],
+        priority: JobPriority = JobPriority.INTERACTIVE,
     ) -> Dict[str, Any]:
-        """Start application build process.
+        """Start application build process, or queue it if no slot is free.
 
         Args:
             repository_path: Path to repository
@@ -263,9 +265,11 @@ class GitHubCLIService:
             user_id: User ID
             conversation_id: Conversation ID
             repo_auth_config: Repository authentication config
+            priority: Scheduling priority (interactive jobs beat batch)
 
         Returns:
-            Dictionary with task_id, pid, and output_file
+            Dictionary with task_id, pid, and output_file (queued jobs: pid
+            and output_file are None and queue_position is set)
         """
         # Step 1: Validate inputs
         _validate_cli_inputs(
@@ -282,73 +286,132 @@ class GitHubCLIService:
         full_prompt = f"{template}\n\n## User Requirements:\n{requirements}"
         prompt_file = await _create_prompt_file(full_prompt)
 
-        # Step 4: Setup process manager
-        from application.agents.shared.process_manager import get_process_manager
+        # Step 4: Start now or queue for a slot (cwd = repository_path for builds)
+        job = _CLIJob(
+            script_path=script_path,
+            prompt_file=prompt_file,
+            cli_model=cli_model,
+            log_type="build",
+            log_model="",
+            cwd=repository_path,
+            timeout_seconds=DEFAULT_BUILD_TIMEOUT,
+            commit_interval=BUILD_COMMIT_INTERVAL,
+            task_type="application_build",
+            task_name=f"Build {language} app: {branch_name}",
+            task_description=f"Building app: {requirements[:200]}...",
+            repository_path=repository_path,
+            branch_name=branch_name,
+            language=language,
+            user_request=requirements,
+            user_id=user_id,
+            conversation_id=conversation_id,
+            repo_auth_config=repo_auth_config,
+        )
+        return await self._start_or_queue(job, priority)
 
-        process_manager = get_process_manager()
-        if not await process_manager.can_start_process():
-            raise RuntimeError("Maximum concurrent CLI processes reached")
+    async def _start_or_queue(
+        self, job: _CLIJob, priority: JobPriority
+    ) -> Dict[str, Any]:
+        """Launch the job if a slot is free, otherwise queue it.
 
-        # Step 5: Create and configure output log file
-        output_file, output_fd = _create_output_log_file(
-            CLI_PROVIDER, branch_name, "build"
-        )
-        _write_log_header(output_fd, branch_name, "build")
+        Returns:
+            Dictionary with task_id, pid and output_file; queued jobs have no
+            pid/output_file yet and carry their queue_position instead.
+        """
+        scheduler = get_job_scheduler()
+        slot = await scheduler.try_acquire(job.user_id, priority)
+        if slot is not None:
+            return await self._launch_cli_job(job, slot)
 
-        # Step 6: Start subprocess (cwd = repository_path for builds)
-        process = await _start_subprocess(
-            script_path,
-            prompt_file,
-            cli_model,
-            repository_path,
-            branch_name,
-            output_fd,
-            repository_path,
+        task_id = await _create_queued_task(
+            get_task_service(), priority, *job.task_args()
+        )
+        position = await scheduler.enqueue(
+            QueuedJob(
+                task_id=task_id,
+                user_id=job.user_id,
+                priority=priority,
+                start=lambda granted: self._launch_cli_job(job, granted, task_id),
+            )
         )
+        return {
+            "task_id": task_id,
+            "pid": None,
+            "output_file": None,
+            "queue_position": position,
+        }
 
-        # Step 7: Finalize log file
-        final_output_file = _finalize_output_file(output_file, process.pid)
+    async def _launch_cli_job(
+        self, job: _CLIJob, slot: JobSlot, task_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Start the CLI process for a job holding ``slot`` and monitor it.
+
+        The slot is released when monitoring ends, or immediately if the
+        process cannot be started or registered.
+
+        Args:
+            job: Job to launch
+            slot: Scheduler slot granted to the job
+            task_id: Existing task of a queued job (a task is created if None)
 
-        # Step 8: Register process and create task
+        Returns:
+            Dictionary with task_id, pid, and output_file
+        """
         try:
-            task_id = await _register_process_and_create_task(
-                process.pid,
-                get_task_service(),
-                user_id,
-                "application_build",
-                f"Build {language} app: {branch_name}",
-                f"Building app: {requirements[:200]}...",
-                branch_name,
-                language,
-                requirements,
-                conversation_id,
-                repository_path,
-                repo_auth_config,
-                final_output_file,
+            # Create and configure output log file
+            output_file, output_fd = _create_output_log_file(
+                CLI_PROVIDER, job.branch_name, job.log_type
             )
-        except RuntimeError as e:
-            # Terminate process if registration fails
-            process.terminate()
-            raise
+            _write_log_header(output_fd, job.branch_name, job.log_type, job.log_model)
+
+            # Start subprocess under the per-job rlimits
+            process = await _start_subprocess(
+                job.script_path,
+                job.prompt_file,
+                job.cli_model,
+                job.repository_path,
+                job.branch_name,
+                output_fd,
+                job.cwd,
+                preexec_fn=slot.limits.preexec_fn(),
+            )
+            final_output_file = _finalize_output_file(output_file, process.pid)
 
-        # Step 9: Extract repository metadata
-        repository_owner, repository_name = _extract_repo_metadata(repo_auth_config)
+            # Register process and create (or take over) the task
+            try:
+                task_id = await _register_process_and_create_task(
+                    process.pid,
+                    get_task_service(),
+                    *job.task_args(),
+                    final_output_file,
+                    task_id=task_id,
+                )
+            except RuntimeError:
+                # Terminate process if registration fails
+                process.terminate()
+                raise
+        except BaseException:
+            slot.release()
+            raise
 
-        # Step 10: Start monitoring task
+        repository_owner, repository_name = _extract_repo_metadata(job.repo_auth_config)
         monitoring_task = asyncio.create_task(
-            self._monitor_cli_process(
-                process=process,
-                repository_path=repository_path,
-                branch_name=branch_name,
-                timeout_seconds=DEFAULT_BUILD_TIMEOUT,
-                task_id=task_id,
-                prompt_file=prompt_file,
-                output_file=final_output_file,
-                repo_auth_config=repo_auth_config,
-                commit_interval=BUILD_COMMIT_INTERVAL,
-                conversation_id=conversation_id,
-                repository_name=repository_name,
-                repository_owner=repository_owner,
+            self._release_when_done(
+                slot,
+                self._monitor_cli_process(
+                    process=process,
+                    repository_path=job.repository_path,
+                    branch_name=job.branch_name,
+                    timeout_seconds=job.timeout_seconds,
+                    task_id=task_id,
+                    prompt_file=job.prompt_file,
+                    output_file=final_output_file,
+                    repo_auth_config=job.repo_auth_config,
+                    commit_interval=job.commit_interval,
+                    conversation_id=job.conversation_id,
+                    repository_name=repository_name,
+                    repository_owner=repository_owner,
+                ),
             )
         )
         self._track_background_task(monitoring_task)
@@ -359,6 +422,13 @@ class GitHubCLIService:
             "output_file": final_output_file,
         }
 
+    @staticmethod
+    async def _release_when_done(slot: JobSlot, monitor: Awaitable[None]) -> None:
+        try:
+            await monitor
+        finally:
+            slot.release()
+
     async def _monitor_cli_process(
         self,
         process: Any,
@@ -374,7 +444,7 @@ class GitHubCLIService:
         repository_name: Optional[str] = None,
         repository_owner: Optional[str] = None,
     ) -> None:
-        """Monitor CLI process with periodic commits and task updates.
+        """Monitor CLI process with change-driven commits and task updates.
 
         Args:
             process: Process instance
@@ -385,21 +455,29 @@ class GitHubCLIService:
             prompt_file: Prompt file path
             output_file: Output log file path
             repo_auth_config: Repository auth config
-            commit_interval: Commit interval in seconds
+            commit_interval: Minimum seconds between pushes of the branch
             conversation_id: Conversation ID (optional)
             repository_name: Repository name (optional)
             repository_owner: Repository owner (optional)
         """
         pid = process.pid
-        start_time = asyncio.get_event_loop().time()
-        last_push_time = start_time
         elapsed_time = 0
         task_service = get_task_service()
+        commit_scheduler = CommitScheduler(
+            repository_path,
+            branch_name,
+            commit=lambda message: self.git_service.commit_and_push(
+                repository_path, message, branch_name, repo_auth_config
+            ),
+            task_id=task_id,
+            task_service=task_service,
+            push_interval_seconds=commit_interval,
+        )
 
         logger.info(f"🔍 [{branch_name}] Monitoring CLI process {pid}")
 
         # Step 1: Initial commit
-        last_push_time = await _perform_initial_commit(
+        await _perform_initial_commit(
             self.git_service, repository_path, branch_name, repo_auth_config
         )
 
@@ -411,22 +489,9 @@ class GitHubCLIService:
                     break
 
                 elapsed_time += PROCESS_CHECK_INTERVAL
-                current_time = asyncio.get_event_loop().time()
-                time_since_last_push = current_time - last_push_time
-
-                # Periodic commit if interval reached
-                if time_since_last_push >= commit_interval:
-                    await _perform_periodic_commit(
-                        self.git_service,
-                        repository_path,
-                        branch_name,
-                        repo_auth_config,
-                        elapsed_time,
-                        task_id,
-                        task_service,
-                        pid,
-                    )
-                    last_push_time = current_time
+
+                # Commit (and publish its diff summary) once changes settle
+                await commit_scheduler.poll(elapsed_time)
 
                 # Update progress status
                 await _update_progress_status(
@@ -1,11 +1,17 @@
 """Repository analysis package."""
 
 from .models import SearchMatch
-from .resource_scanner import ResourceScanner
+from .resource_scanner import (
+    ResourceScanner,
+    get_resource_scanner,
+    reset_resource_scanner,
+)
 from .service import RepositoryAnalysisService
 
 __all__ = [
     "RepositoryAnalysisService",
     "SearchMatch",
     "ResourceScanner",
+    "get_resource_scanner",
+    "reset_resource_scanner",
 ]
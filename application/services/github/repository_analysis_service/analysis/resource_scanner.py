@@ -1,98 +1,192 @@
-"""Resource scanning for versioned entities, workflows, and requirements."""
+"""Resource scanning for versioned entities, workflows, and requirements.
+
+A scan walks the resources directory once with os.scandir and then parses the
+JSON files it selected concurrently, in one thread pool shared by all scanners.
+Parsed files are cached per (path, mtime, size), so re-analysing a repository
+after a small change only re-reads the files that changed.
+"""
 
-import asyncio
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Threads parsing JSON files, shared by all scans
+MAX_PARSE_WORKERS = int(os.getenv("RESOURCE_SCAN_MAX_WORKERS", "8"))
+# Parsed files kept for re-analysis
+PARSE_CACHE_MAX_ENTRIES = int(os.getenv("RESOURCE_SCAN_CACHE_ENTRIES", "2048"))
+
+TEXTUAL_EXTENSIONS = frozenset(
+    {
+        ".pdf",
+        ".docx",
+        ".xlsx",
+        ".pptx",
+        ".xml",
+        ".json",
+        ".txt",
+        ".yml",
+        ".yaml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".properties",
+        ".env",
+        ".md",
+        ".markdown",
+        ".rst",
+        ".tex",
+        ".latex",
+        ".sql",
+        ".dockerfile",
+        ".gitignore",
+        ".gitattributes",
+        ".editorconfig",
+        ".htaccess",
+        ".robots",
+        ".mk",
+        ".cmake",
+        ".gradle",
+        ".js",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".c",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".cs",
+        ".rs",
+        ".go",
+        ".swift",
+        ".dart",
+        ".hs",
+        ".ml",
+        ".fs",
+        ".clj",
+        ".elm",
+        ".r",
+        ".jl",
+        ".f90",
+        ".f95",
+        ".php",
+        ".rb",
+        ".scala",
+        ".lua",
+        ".nim",
+        ".zig",
+        ".v",
+        ".d",
+        ".cr",
+        ".ex",
+        ".exs",
+        ".erl",
+        ".hrl",
+    }
+)
+
+FILES_WITHOUT_EXTENSION = frozenset({"dockerfile", "makefile"})
+
+VERSION_DIR_PREFIX = "version_"
+
+
+@dataclass(frozen=True)
+class _FileStamp:
+    """A file selected by the walk, identified by path, mtime and size."""
+
+    path: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass
+class _ResourceCandidate:
+    """Files that may hold one resource, in the order they are tried."""
+
+    name: str
+    versions: List[Tuple[str, _FileStamp]] = field(default_factory=list)
+    direct: Optional[_FileStamp] = None
+
+
+_parse_pool: Optional[ThreadPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    """Get the thread pool that parses JSON files for every scanner."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ThreadPoolExecutor(
+                max_workers=max(1, MAX_PARSE_WORKERS),
+                thread_name_prefix="resource-scan",
+            )
+        return _parse_pool
+
+
+def _list_dir(path: str) -> List[os.DirEntry]:
+    """List a directory sorted by name (empty if it cannot be read)."""
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entries, key=lambda entry: entry.name)
+    except OSError as e:
+        logger.warning(f"Failed to list {path}: {e}")
+        return []
+
+
+def _stamp(entry: os.DirEntry) -> Optional[_FileStamp]:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    return _FileStamp(entry.path, stat.st_mtime_ns, stat.st_size)
+
+
+def _version_sort_key(name: str) -> int:
+    try:
+        return int(name.split("_")[1])
+    except Exception:
+        return 0
+
 
 class ResourceScanner:
     """Scanner for repository resources (entities, workflows, requirements)."""
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        max_workers: int = MAX_PARSE_WORKERS,
+        cache_entries: int = PARSE_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            max_workers: Most JSON files one scan parses at once (1 parses
+                inline; otherwise also bounded by the shared pool size)
+            cache_entries: Most parsed files kept for later scans
+        """
+        self.max_workers = max(1, max_workers)
+        self.cache_entries = cache_entries
+        self._parsed: "OrderedDict[str, Tuple[int, int, Optional[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
 
     def is_textual_file(self, filename: str) -> bool:
         """Check if a file is a textual format based on extension."""
         filename_lower = filename.lower()
-        textual_extensions = {
-            ".pdf",
-            ".docx",
-            ".xlsx",
-            ".pptx",
-            ".xml",
-            ".json",
-            ".txt",
-            ".yml",
-            ".yaml",
-            ".toml",
-            ".ini",
-            ".cfg",
-            ".conf",
-            ".properties",
-            ".env",
-            ".md",
-            ".markdown",
-            ".rst",
-            ".tex",
-            ".latex",
-            ".sql",
-            ".dockerfile",
-            ".gitignore",
-            ".gitattributes",
-            ".editorconfig",
-            ".htaccess",
-            ".robots",
-            ".mk",
-            ".cmake",
-            ".gradle",
-            ".js",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".c",
-            ".cpp",
-            ".h",
-            ".hpp",
-            ".cs",
-            ".rs",
-            ".go",
-            ".swift",
-            ".dart",
-            ".hs",
-            ".ml",
-            ".fs",
-            ".clj",
-            ".elm",
-            ".r",
-            ".jl",
-            ".f90",
-            ".f95",
-            ".php",
-            ".rb",
-            ".scala",
-            ".lua",
-            ".nim",
-            ".zig",
-            ".v",
-            ".d",
-            ".cr",
-            ".ex",
-            ".exs",
-            ".erl",
-            ".hrl",
-        }
-        files_without_extension = {"dockerfile", "makefile"}
-
-        for ext in textual_extensions:
-            if filename_lower.endswith(ext):
-                return True
-        if filename_lower in files_without_extension:
+        dot = filename_lower.rfind(".")
+        if dot >= 0 and filename_lower[dot:] in TEXTUAL_EXTENSIONS:
             return True
-        return False
+        return filename_lower in FILES_WITHOUT_EXTENSION
 
     def _load_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Load and parse JSON file.
@@ -110,6 +204,43 @@ class ResourceScanner:
             logger.warning(f"Failed to parse {file_path}: {e}")
             return None
 
+    def _load_cached(self, stamp: _FileStamp) -> Optional[Dict[str, Any]]:
+        """Parse a file unless it is unchanged since it was last parsed."""
+        with self._lock:
+            cached = self._parsed.get(stamp.path)
+            if cached is not None and cached[:2] == (stamp.mtime_ns, stamp.size):
+                self._parsed.move_to_end(stamp.path)
+                return cached[2]
+
+        content = self._load_json_file(Path(stamp.path))
+
+        with self._lock:
+            self._parsed[stamp.path] = (stamp.mtime_ns, stamp.size, content)
+            self._parsed.move_to_end(stamp.path)
+            while len(self._parsed) > self.cache_entries:
+                self._parsed.popitem(last=False)
+        return content
+
+    def _load_all(
+        self, stamps: List[_FileStamp]
+    ) -> Dict[_FileStamp, Optional[Dict[str, Any]]]:
+        """Parse files in the shared pool (at most max_workers at a time)."""
+        if len(stamps) <= 1 or self.max_workers == 1:
+            return {stamp: self._load_cached(stamp) for stamp in stamps}
+
+        pool = _get_parse_pool()
+        pending: Dict[Future, _FileStamp] = {}
+        contents: Dict[_FileStamp, Optional[Dict[str, Any]]] = {}
+        for stamp in stamps:
+            if len(pending) >= self.max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    contents[pending.pop(future)] = future.result()
+            pending[pool.submit(self._load_cached, stamp)] = stamp
+        for future, stamp in pending.items():
+            contents[stamp] = future.result()
+        return contents
+
     def _create_resource_dict(
         self,
         name: str,
@@ -148,29 +279,34 @@ class ResourceScanner:
         return res_dict
 
     def _find_resource_file(
-        self, directory: Path, resource_name: str
-    ) -> Optional[Path]:
-        """Find resource JSON file in directory.
+        self, entries: List[os.DirEntry], resource_name: str
+    ) -> Optional[os.DirEntry]:
+        """Find resource JSON file among directory entries.
 
         Searches for exact match first, then case-insensitive match,
         then single JSON file fallback.
 
         Args:
-            directory: Directory to search.
+            entries: Entries of the directory to search.
             resource_name: Name of resource to find.
 
         Returns:
-            Path to resource file or None if not found.
+            Entry of the resource file or None if not found.
         """
+        json_files = [
+            e
+            for e in entries
+            if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+        ]
+
         # Try exact match
-        exact = directory / f"{resource_name}.json"
-        if exact.exists():
-            return exact
+        for j in json_files:
+            if j.name == f"{resource_name}.json":
+                return j
 
         # Try case-insensitive match
-        json_files = list(directory.glob("*.json"))
         for j in json_files:
-            if j.stem.lower() == resource_name.lower():
+            if j.name[: -len(".json")].lower() == resource_name.lower():
                 return j
 
         # Fallback: single JSON file
@@ -180,95 +316,56 @@ class ResourceScanner:
         return None
 
     def _scan_version_directories(
-        self,
-        resource_dir: Path,
-        resource_name: str,
-        resource_type: str,
-        repo_path_obj: Path,
-    ) -> List[Dict[str, Any]]:
-        """Scan version directories within resource directory.
+        self, entries: List[os.DirEntry], resource_name: str
+    ) -> List[Tuple[str, _FileStamp]]:
+        """Find the resource file of each version directory.
 
         Args:
-            resource_dir: Path to resource directory.
+            entries: Entries of the resource directory.
             resource_name: Name of resource.
-            resource_type: Type of resource (entity, workflow, etc.).
-            repo_path_obj: Repository root path.
 
         Returns:
-            List of resource dictionaries from all versions.
+            (version, file) pairs sorted by version number.
         """
-        resources = []
         version_dirs = [
-            d
-            for d in resource_dir.iterdir()
-            if d.is_dir() and d.name.startswith("version_")
+            e for e in entries if e.name.startswith(VERSION_DIR_PREFIX) and e.is_dir()
         ]
 
-        if not version_dirs:
-            return resources
-
-        # Sort by version number
-        def sort_key(d: Path) -> int:
-            try:
-                return int(d.name.split("_")[1])
-            except Exception:
-                return 0
-
-        for v_dir in sorted(version_dirs, key=sort_key):
-            res_file = self._find_resource_file(v_dir, resource_name)
-            if not res_file:
-                continue
-
-            content = self._load_json_file(res_file)
-            if content is None:
+        versions = []
+        for v_dir in sorted(version_dirs, key=lambda e: _version_sort_key(e.name)):
+            res_file = self._find_resource_file(_list_dir(v_dir.path), resource_name)
+            stamp = _stamp(res_file) if res_file else None
+            if stamp:
+                versions.append((v_dir.name, stamp))
+        return versions
+
+    def _walk(self, resources_dir: Path) -> List[_ResourceCandidate]:
+        """Select the candidate files of every resource in one directory walk."""
+        candidates = []
+        for item in _list_dir(str(resources_dir)):
+            # Skip private items
+            if item.name.startswith("_"):
                 continue
 
-            res_dict = self._create_resource_dict(
-                name=resource_name,
-                resource_type=resource_type,
-                repo_path_obj=repo_path_obj,
-                file_path=res_file,
-                content=content,
-                version=v_dir.name,
-            )
-            resources.append(res_dict)
-
-        return resources
-
-    def _scan_direct_files(
-        self,
-        resource_dir: Path,
-        resource_name: str,
-        resource_type: str,
-        repo_path_obj: Path,
-    ) -> List[Dict[str, Any]]:
-        """Scan for resource files directly in directory (no version subdirs).
-
-        Args:
-            resource_dir: Path to resource directory.
-            resource_name: Name of resource.
-            resource_type: Type of resource (entity, workflow, etc.).
-            repo_path_obj: Repository root path.
+            # Handle flat JSON files
+            stem, suffix = os.path.splitext(item.name)
+            if suffix == ".json" and item.is_file():
+                stamp = _stamp(item)
+                if stamp:
+                    candidates.append(_ResourceCandidate(name=stem, direct=stamp))
 
-        Returns:
-            List with single resource dictionary if found.
-        """
-        res_file = self._find_resource_file(resource_dir, resource_name)
-        if not res_file:
-            return []
-
-        content = self._load_json_file(res_file)
-        if content is None:
-            return []
-
-        res_dict = self._create_resource_dict(
-            name=resource_name,
-            resource_type=resource_type,
-            repo_path_obj=repo_path_obj,
-            file_path=res_file,
-            content=content,
-        )
-        return [res_dict]
+            # Handle directories with versioned or flat structures
+            elif item.is_dir():
+                entries = _list_dir(item.path)
+                res_file = self._find_resource_file(entries, item.name)
+                candidates.append(
+                    _ResourceCandidate(
+                        name=item.name,
+                        versions=self._scan_version_directories(entries, item.name),
+                        direct=_stamp(res_file) if res_file else None,
+                    )
+                )
+        return candidates
 
     def scan_versioned_resources(
         self, resources_dir: Path, resource_type: str, repo_path_obj: Path
@@ -276,7 +373,9 @@ class ResourceScanner:
         """Scan for versioned resources (entities, workflows, etc.).
 
         Supports both versioned (with version_ subdirectories) and flat directory structures.
-        Searches for JSON files matching resource naming patterns.
+        Searches for JSON files matching resource naming patterns. Blocks while
+        reading files, so async callers run it in an executor. Parsed content is
+        shared with later scans of unchanged files and must not be modified.
 
         Args:
             resources_dir: Path to resources directory.
@@ -286,49 +385,65 @@ class ResourceScanner:
         Returns:
             List of resource dictionaries with metadata and content.
         """
-        resources = []
+        resources: List[Dict[str, Any]] = []
         if not resources_dir.exists():
             logger.info(
                 f"📁 {resource_type.title()} directory not found: {resources_dir}"
             )
             return resources
 
-        for item in sorted(resources_dir.iterdir()):
-            # Skip private items
-            if item.name.startswith("_"):
-                continue
-
-            # Handle flat JSON files
-            if item.is_file() and item.suffix == ".json":
-                content = self._load_json_file(item)
-                if content is None:
-                    continue
-
-                res_dict = self._create_resource_dict(
-                    name=item.stem,
-                    resource_type=resource_type,
-                    repo_path_obj=repo_path_obj,
-                    file_path=item,
-                    content=content,
+        candidates = self._walk(resources_dir)
+        stamps = list(
+            dict.fromkeys(
+                stamp
+                for candidate in candidates
+                for stamp in [f for _, f in candidate.versions] + [candidate.direct]
+                if stamp is not None
+            )
+        )
+        contents = self._load_all(stamps)
+
+        for candidate in candidates:
+            # Version directories first, then a file directly in the directory
+            found = [
+                (version, stamp)
+                for version, stamp in candidate.versions
+                if contents[stamp] is not None
+            ]
+            if (
+                not found
+                and candidate.direct
+                and contents[candidate.direct] is not None
+            ):
+                found = [(None, candidate.direct)]
+
+            for version, stamp in found:
+                resources.append(
+                    self._create_resource_dict(
+                        name=candidate.name,
+                        resource_type=resource_type,
+                        repo_path_obj=repo_path_obj,
+                        file_path=Path(stamp.path),
+                        content=contents[stamp],
+                        version=version,
+                    )
                 )
-                resources.append(res_dict)
 
-            # Handle directories with versioned or flat structures
-            elif item.is_dir():
-                resource_name = item.name
+        return resources
 
-                # Try scanning version directories first
-                version_resources = self._scan_version_directories(
-                    item, resource_name, resource_type, repo_path_obj
-                )
-                if version_resources:
-                    resources.extend(version_resources)
-                    continue
 
-                # Fallback: scan for files directly in directory
-                direct_resources = self._scan_direct_files(
-                    item, resource_name, resource_type, repo_path_obj
-                )
-                resources.extend(direct_resources)
+_scanner: Optional[ResourceScanner] = None
 
-        return resources
+
+def get_resource_scanner() -> ResourceScanner:
+    """Get the process-wide scanner, whose parse cache every analysis shares."""
+    global _scanner
+    if _scanner is None:
+        _scanner = ResourceScanner()
+    return _scanner
+
+
+def reset_resource_scanner() -> None:
+    """Drop the process-wide scanner and its parse cache (for tests)."""
+    global _scanner
+    _scanner = None
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 from application.services.core.file_system_service import FileSystemService
 
 from .models import SearchMatch
-from .resource_scanner import ResourceScanner
+from .resource_scanner import get_resource_scanner
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +36,7 @@ class RepositoryAnalysisService:
 
     def __init__(self):
         self.fs_service = FileSystemService()
-        self.scanner = ResourceScanner()
+        self.scanner = get_resource_scanner()
 
     def scan_versioned_resources(
         self, resources_dir: Path, resource_type: str, repo_path_obj: Path
@@ -79,22 +79,6 @@ class RepositoryAnalysisService:
 
         loop = asyncio.get_event_loop()
 
-        entities = await loop.run_in_executor(
-            None,
-            self.scanner.scan_versioned_resources,
-            repo_path_obj / paths["entities_path"],
-            "entity",
-            repo_path_obj,
-        )
-
-        workflows = await loop.run_in_executor(
-            None,
-            self.scanner.scan_versioned_resources,
-            repo_path_obj / paths["workflows_path"],
-            "workflow",
-            repo_path_obj,
-        )
-
         def _read_reqs():
             reqs = []
             req_dir = repo_path_obj / paths["requirements_path"]
@@ -114,7 +98,24 @@ class RepositoryAnalysisService:
                             pass
             return reqs
 
-        requirements = await loop.run_in_executor(None, _read_reqs)
+        # The three scans touch separate directories, so run them side by side
+        entities, workflows, requirements = await asyncio.gather(
+            loop.run_in_executor(
+                None,
+                self.scanner.scan_versioned_resources,
+                repo_path_obj / paths["entities_path"],
+                "entity",
+                repo_path_obj,
+            ),
+            loop.run_in_executor(
+                None,
+                self.scanner.scan_versioned_resources,
+                repo_path_obj / paths["workflows_path"],
+                "workflow",
+                repo_path_obj,
+            ),
+            loop.run_in_executor(None, _read_reqs),
+        )
 
         return {
             "project_type": paths["type"],
@@ -13,10 +13,13 @@ import logging
 import os
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
-from google import genai
-from google.genai import types
 from pydantic import BaseModel
 
+from application.services.structured_output_cache import (
+    get_structured_output_cache,
+    token_count,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
@@ -50,8 +53,12 @@ class GoogleADKService:
         self.temperature = float(os.getenv("GOOGLE_TEMPERATURE", "0.7"))
         self.max_tokens = int(os.getenv("GOOGLE_MAX_TOKENS", "8192"))
 
-        # Initialize client
-        self.client = genai.Client(api_key=self.api_key) if self.api_key else None
+        # Initialize client (google.genai is slow to import, so only when usable)
+        self.client = None
+        if self.api_key:
+            from google import genai
+
+            self.client = genai.Client(api_key=self.api_key)
 
         logger.info(
             f"GoogleADKService initialized with model={self.model_name}, "
@@ -90,6 +97,8 @@ class GoogleADKService:
             contents = self._build_contents(prompt, context)
 
             # Configure generation
+            from google.genai import types
+
             config = types.GenerateContentConfig(
                 temperature=temperature or self.temperature,
                 top_p=0.95,
@@ -128,6 +137,7 @@ class GoogleADKService:
         Generate structured JSON output using response schema.
 
         Used for canvas questions to generate entity configs, workflow configs, etc.
+        Repeated requests are answered from the structured output cache.
 
         Args:
             prompt: User question/request
@@ -144,10 +154,22 @@ class GoogleADKService:
         if not self.client:
             raise Exception("Google ADK client not initialized - check GOOGLE_API_KEY")
 
-        try:
+        temperature = self.temperature if temperature is None else temperature
+        cache = get_structured_output_cache()
+        cache_key = cache.key_for(
+            model=self.model_name,
+            temperature=temperature,
+            schema=schema,
+            prompt=prompt,
+            system_instruction=system_instruction,
+        )
+
+        async def generate() -> tuple[Dict[str, Any], int]:
             # Configure for structured output
+            from google.genai import types
+
             config = types.GenerateContentConfig(
-                temperature=temperature or self.temperature,
+                temperature=temperature,
                 response_mime_type="application/json",
                 response_schema=schema,
                 system_instruction=system_instruction,
@@ -162,17 +184,21 @@ class GoogleADKService:
             response = await self.client.aio.models.generate_content(
                 model=self.model_name, contents=prompt, config=config
             )
+            tokens = self._total_tokens(response)
 
             # Parse JSON response
             result_data = response.json()
             # Ensure we return a dict
             if isinstance(result_data, dict):
                 logger.debug(f"Generated structured output: {list(result_data.keys())}")
-                return result_data
+                return result_data, tokens
             else:
                 # If not a dict, wrap it
                 logger.warning(f"Unexpected response type: {type(result_data)}")
-                return {"data": result_data}
+                return {"data": result_data}, tokens
+
+        try:
+            return await cache.get_or_generate(cache_key, generate)
 
         except Exception as e:
             logger.exception(f"Error generating structured output: {e}")
@@ -226,6 +252,7 @@ class GoogleADKService:
 
         This is a convenience method that converts a Pydantic model to a JSON schema,
         generates the structured output, and parses it back into the Pydantic model.
+        Repeated requests are answered from the structured output cache.
 
         Args:
             prompt: User message/question
@@ -243,7 +270,18 @@ class GoogleADKService:
         if not self.client:
             raise Exception("Google ADK client not initialized - check GOOGLE_API_KEY")
 
-        try:
+        temperature = self.temperature if temperature is None else temperature
+        cache = get_structured_output_cache()
+        cache_key = cache.key_for(
+            model=self.model_name,
+            temperature=temperature,
+            schema=response_model,
+            prompt=prompt,
+            system_instruction=system_instruction,
+            context=context,
+        )
+
+        async def generate() -> tuple[T, int]:
             # Build content from context + current prompt
             contents = self._build_contents(prompt, context)
 
@@ -263,8 +301,10 @@ class GoogleADKService:
             remove_additional_properties(schema)
 
             # Configure for structured output
+            from google.genai import types
+
             config = types.GenerateContentConfig(
-                temperature=temperature or self.temperature,
+                temperature=temperature,
                 response_mime_type="application/json",
                 response_schema=schema,
                 system_instruction=system_instruction,
@@ -286,12 +326,21 @@ class GoogleADKService:
 
             logger.debug(f"Successfully parsed response into {response_model.__name__}")
 
-            return result
+            return result, self._total_tokens(response)
+
+        try:
+            return await cache.get_or_generate(cache_key, generate)
 
         except Exception as e:
             logger.exception(f"Error generating Pydantic output: {e}")
             raise Exception(f"Failed to generate Pydantic output: {str(e)}") from e
 
+    @staticmethod
+    def _total_tokens(response: Any) -> int:
+        """Total tokens a generate_content call used, or 0 if not reported."""
+        usage = getattr(response, "usage_metadata", None)
+        return token_count(getattr(usage, "total_token_count", None))
+
     def is_configured(self) -> bool:
         """
         Check if the service is properly configured.
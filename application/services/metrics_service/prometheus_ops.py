@@ -5,16 +5,45 @@ from typing import Dict, Optional
 
 import httpx
 
-from application.routes.common.constants import DEFAULT_HTTP_TIMEOUT_SECONDS
+from application.routes.common.constants import (
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+    PROMETHEUS_MAX_CONNECTIONS,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class PrometheusOperations:
-    """Operations for querying Prometheus metrics."""
+    """Operations for querying Prometheus metrics.
+
+    Requests share one pooled ``httpx.AsyncClient`` so batched and repeated
+    queries reuse keep-alive connections instead of re-handshaking per call.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_HTTP_TIMEOUT_SECONDS,
+                verify=False,
+                limits=httpx.Limits(
+                    max_connections=PROMETHEUS_MAX_CONNECTIONS,
+                    max_keepalive_connections=PROMETHEUS_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    @staticmethod
     async def query(
+        self,
         prometheus_host: str,
         query: str,
         time: Optional[str] = None,
@@ -35,7 +64,7 @@ class PrometheusOperations:
             Exception: If query fails
 
         Example:
-            >>> result = await PrometheusOperations.query(
+            >>> result = await PrometheusOperations().query(
             ...     'prometheus.example.com',
             ...     'up{namespace="client-myorg-dev"}'
             ... )
@@ -48,22 +77,19 @@ class PrometheusOperations:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-        async with httpx.AsyncClient(
-            timeout=DEFAULT_HTTP_TIMEOUT_SECONDS, verify=False
-        ) as client:
-            response = await client.post(
-                f"https://{prometheus_host}/api/v1/query",
-                headers=headers,
-                data=params,
-            )
+        response = await self.get_client().post(
+            f"https://{prometheus_host}/api/v1/query",
+            headers=headers,
+            data=params,
+        )
 
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Prometheus query failed: {response.text}")
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Prometheus query failed: {response.text}")
 
-            return response.json()
+        return response.json()
 
-    @staticmethod
     async def query_range(
+        self,
         prometheus_host: str,
         query: str,
         start: str,
@@ -86,7 +112,7 @@ class PrometheusOperations:
             Exception: If query fails
 
         Example:
-            >>> result = await PrometheusOperations.query_range(
+            >>> result = await PrometheusOperations().query_range(
             ...     'prometheus.example.com',
             ...     'up{namespace=~"client-myorg-.*"}',
             ...     "2025-12-17T00:00:00Z",
@@ -102,16 +128,13 @@ class PrometheusOperations:
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-        async with httpx.AsyncClient(
-            timeout=DEFAULT_HTTP_TIMEOUT_SECONDS, verify=False
-        ) as client:
-            response = await client.post(
-                f"https://{prometheus_host}/api/v1/query_range",
-                headers=headers,
-                data=params,
-            )
+        response = await self.get_client().post(
+            f"https://{prometheus_host}/api/v1/query_range",
+            headers=headers,
+            data=params,
+        )
 
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Prometheus range query failed: {response.text}")
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Prometheus range query failed: {response.text}")
 
-            return response.json()
+        return response.json()
@@ -0,0 +1,296 @@
+"""Shared result cache for Prometheus queries.
+
+Instant queries are cached by (PromQL, time) for a short TTL. Range queries are
+cached by (PromQL, step): samples are stored on step-aligned timestamps and
+merged incrementally, so a dashboard refresh only fetches the newest window.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import re
+import time as time_module
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from application.routes.common.constants import (
+    PROMETHEUS_CACHE_MAX_ENTRIES,
+    PROMETHEUS_INSTANT_CACHE_TTL_SECONDS,
+    PROMETHEUS_RANGE_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+RangeFetcher = Callable[[float, float], Awaitable[Dict]]
+InstantFetcher = Callable[[], Awaitable[Dict]]
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)")
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+    "y": 31536000,
+}
+
+
+def parse_duration_seconds(step: str) -> float:
+    """Parse a Prometheus duration ("15s", "1m30s") or plain number to seconds.
+
+    Raises:
+        ValueError: If the step cannot be parsed or is not positive
+    """
+    step = str(step).strip()
+    try:
+        seconds = float(step)
+    except ValueError:
+        parts = _DURATION_PATTERN.findall(step)
+        if not parts or "".join(n + u for n, u in parts) != step:
+            raise ValueError(f"Invalid step duration: {step}")
+        seconds = sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+    if seconds <= 0:
+        raise ValueError(f"Step must be positive: {step}")
+    return seconds
+
+
+def parse_timestamp_seconds(value: str) -> float:
+    """Parse an RFC3339 or Unix timestamp to Unix seconds.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid timestamp: {value}")
+
+
+def align_to_step(timestamp: float, step_seconds: float) -> float:
+    """Align a timestamp down to the nearest step boundary."""
+    return math.floor(timestamp / step_seconds) * step_seconds
+
+
+@dataclass
+class _RangeEntry:
+    """Step-aligned samples for one (query, step) pair."""
+
+    covered_start: float
+    covered_end: float
+    created_at: float
+    span: float = 0.0
+    series: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def merge(self, result: List[Dict[str, Any]]) -> None:
+        """Merge Prometheus matrix results, newer samples overwriting older."""
+        for item in result:
+            metric = item.get("metric", {})
+            key = json.dumps(metric, sort_keys=True)
+            target = self.series.setdefault(key, {"metric": metric, "values": {}})
+            for ts, value in item.get("values", []):
+                target["values"][float(ts)] = value
+
+    def trim(self, start: float) -> None:
+        """Drop samples older than start and series left empty."""
+        for key in list(self.series):
+            values = self.series[key]["values"]
+            for ts in [ts for ts in values if ts < start]:
+                del values[ts]
+            if not values:
+                del self.series[key]
+        self.covered_start = max(self.covered_start, start)
+
+    def render(self, start: float, end: float) -> Dict[str, Any]:
+        """Render cached samples in [start, end] as a Prometheus matrix response."""
+        result = []
+        for series in self.series.values():
+            values = [
+                [_format_ts(ts), val]
+                for ts, val in sorted(series["values"].items())
+                if start <= ts <= end
+            ]
+            if values:
+                result.append({"metric": series["metric"], "values": values})
+        return {
+            "status": "success",
+            "data": {"resultType": "matrix", "result": result},
+        }
+
+
+def _format_ts(ts: float) -> Any:
+    """Render timestamps the way Prometheus does (int when whole)."""
+    return int(ts) if float(ts).is_integer() else ts
+
+
+def _is_matrix_success(response: Dict) -> bool:
+    return (
+        isinstance(response, dict)
+        and response.get("status") == "success"
+        and response.get("data", {}).get("resultType") == "matrix"
+    )
+
+
+class PrometheusResultCache:
+    """Bounded in-memory cache for Prometheus instant and range results.
+
+    Shared across requests, so identical panels refreshed by many users of the
+    same org hit Prometheus once per step window. Concurrent requests for the
+    same key wait on a per-key lock instead of issuing duplicate queries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PROMETHEUS_CACHE_MAX_ENTRIES,
+        instant_ttl_seconds: float = PROMETHEUS_INSTANT_CACHE_TTL_SECONDS,
+        range_ttl_seconds: float = PROMETHEUS_RANGE_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.instant_ttl_seconds = instant_ttl_seconds
+        self.range_ttl_seconds = range_ttl_seconds
+        self._instant: "OrderedDict[Tuple[str, str, str], Tuple[Dict, float]]" = (
+            OrderedDict()
+        )
+        self._range: "OrderedDict[Tuple[str, float], _RangeEntry]" = OrderedDict()
+        self._locks: Dict[Tuple, asyncio.Lock] = {}
+
+    async def get_instant(
+        self,
+        query: str,
+        time: Optional[str],
+        fetch: InstantFetcher,
+        timeout: Optional[str] = None,
+    ) -> Dict:
+        """Return a cached instant result or fetch and cache it.
+
+        Args:
+            query: Rendered PromQL
+            time: Evaluation timestamp as sent to Prometheus (None for "now")
+            fetch: Coroutine factory performing the actual query
+            timeout: Query timeout as sent to Prometheus; part of the key since
+                a short timeout can yield a partial or failed result
+
+        Returns:
+            Prometheus query response
+        """
+        key = (query, time or "", timeout or "")
+        async with self._lock_for(("instant",) + key):
+            cached = self._instant.get(key)
+            now = time_module.monotonic()
+            if cached and now - cached[1] < self.instant_ttl_seconds:
+                self._instant.move_to_end(key)
+                return cached[0]
+
+            response = await fetch()
+            if isinstance(response, dict) and response.get("status") == "success":
+                self._instant[key] = (response, now)
+                self._evict(self._instant)
+            return response
+
+    async def get_range(
+        self, query: str, start: str, end: str, step: str, fetch: RangeFetcher
+    ) -> Dict:
+        """Return a step-aligned range result, fetching only the missing window.
+
+        Args:
+            query: Rendered PromQL
+            start: Range start (RFC3339 or Unix timestamp)
+            end: Range end (RFC3339 or Unix timestamp)
+            step: Resolution step ("15s", "1m", ...)
+            fetch: Coroutine factory taking aligned (start, end) Unix seconds
+
+        Returns:
+            Prometheus matrix response covering the aligned [start, end] range
+
+        Raises:
+            ValueError: If start, end or step cannot be parsed
+        """
+        step_seconds = parse_duration_seconds(step)
+        aligned_start = align_to_step(parse_timestamp_seconds(start), step_seconds)
+        aligned_end = align_to_step(parse_timestamp_seconds(end), step_seconds)
+        if aligned_end < aligned_start:
+            raise ValueError("end must not be before start")
+
+        key = (query, step_seconds)
+        async with self._lock_for(("range",) + key):
+            entry = self._usable_range_entry(key, aligned_start)
+            if entry is None:
+                return await self._fetch_full_range(
+                    key, aligned_start, aligned_end, fetch
+                )
+
+            # The newest cached step may have been evaluated on incomplete data,
+            # so the incremental window starts at (and re-reads) covered_end.
+            if aligned_end >= entry.covered_end:
+                response = await fetch(entry.covered_end, aligned_end)
+                if not _is_matrix_success(response):
+                    return response
+                entry.merge(response["data"]["result"])
+                entry.covered_end = aligned_end
+
+            # Keep the widest window any caller asked for, so panels sharing a
+            # query with different ranges don't evict each other's samples.
+            entry.span = max(entry.span, aligned_end - aligned_start)
+            entry.trim(entry.covered_end - entry.span)
+            self._range.move_to_end(key)
+            return entry.render(aligned_start, aligned_end)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._instant.clear()
+        self._range.clear()
+
+    def _usable_range_entry(
+        self, key: Tuple[str, float], aligned_start: float
+    ) -> Optional[_RangeEntry]:
+        entry = self._range.get(key)
+        if entry is None:
+            return None
+        expired = time_module.monotonic() - entry.created_at >= self.range_ttl_seconds
+        outside = not entry.covered_start <= aligned_start <= entry.covered_end
+        if expired or outside:
+            del self._range[key]
+            return None
+        return entry
+
+    async def _fetch_full_range(
+        self,
+        key: Tuple[str, float],
+        aligned_start: float,
+        aligned_end: float,
+        fetch: RangeFetcher,
+    ) -> Dict:
+        response = await fetch(aligned_start, aligned_end)
+        if not _is_matrix_success(response):
+            return response
+
+        entry = _RangeEntry(
+            covered_start=aligned_start,
+            covered_end=aligned_end,
+            created_at=time_module.monotonic(),
+            span=aligned_end - aligned_start,
+        )
+        entry.merge(response["data"]["result"])
+        self._range[key] = entry
+        self._evict(self._range)
+        return entry.render(aligned_start, aligned_end)
+
+    def _lock_for(self, key: Tuple) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            if len(self._locks) > 4 * self.max_entries:
+                self._locks = {k: v for k, v in self._locks.items() if v.locked()}
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    def _evict(self, store: OrderedDict) -> None:
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
@@ -1,16 +1,25 @@
 """Metrics Service for Prometheus and Grafana operations."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import httpx
 
-from application.routes.common.constants import DEFAULT_HTTP_TIMEOUT_SECONDS
+from application.routes.common.constants import (
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+    PROMETHEUS_BATCH_CONCURRENCY,
+)
 from application.services.core.config_service import ConfigService
 
 from .grafana_ops import GrafanaOperations
 from .prometheus_ops import PrometheusOperations
 from .query_builder import PrometheusQueryBuilder
+from .result_cache import (
+    PrometheusResultCache,
+    parse_duration_seconds,
+    parse_timestamp_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,11 @@ class MetricsService:
         self.query_builder = PrometheusQueryBuilder()
         self.grafana_ops = GrafanaOperations()
         self.prometheus_ops = PrometheusOperations()
+        self.result_cache = PrometheusResultCache()
+
+    async def aclose(self) -> None:
+        """Close the pooled Prometheus HTTP client."""
+        await self.prometheus_ops.aclose()
 
     def build_namespace(
         self, org_id: str, env_name: str, app_name: str = "cyoda"
@@ -99,7 +113,7 @@ class MetricsService:
         time: Optional[str] = None,
         timeout: Optional[str] = None,
     ) -> Dict:
-        """Query Prometheus metrics.
+        """Query Prometheus metrics through the shared instant-result cache.
 
         Args:
             query: Prometheus query string
@@ -115,10 +129,7 @@ class MetricsService:
         Example:
             >>> result = await service.query_prometheus('up{namespace="client-myorg-dev"}')
         """
-        prometheus_config = self.config_service.get_prometheus_config()
-        return await self.prometheus_ops.query(
-            prometheus_config.host, query, time, timeout
-        )
+        return await self._cached_instant_query(query, time, timeout)
 
     async def query_prometheus_range(
         self,
@@ -170,12 +181,121 @@ class MetricsService:
         except ValueError as e:
             raise ValueError(f"Invalid query_type: {e}")
 
-        # Query Prometheus range endpoint
+        # Query Prometheus range endpoint through the step-aligned cache
+        return await self._cached_range_query(query, start, end, step)
+
+    async def query_prometheus_batch(
+        self,
+        org_id: str,
+        env_name: str,
+        query_types: List[str],
+        app_name: str = "cyoda",
+        time: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        step: str = "15s",
+    ) -> Dict[str, Dict]:
+        """Run several predefined queries for one environment concurrently.
+
+        Instant queries are issued when start/end are omitted, range queries
+        otherwise. Results are served from the shared result cache where
+        possible and a failing query does not fail the whole batch.
+
+        Args:
+            org_id: Organization ID for namespace
+            env_name: Environment name
+            query_types: Query types to run (cpu_usage_rate, memory_usage, etc.)
+            app_name: Application name
+            time: Optional evaluation timestamp for instant queries
+            start: Optional range start (RFC3339 or Unix timestamp)
+            end: Optional range end (RFC3339 or Unix timestamp)
+            step: Range query resolution step interval
+
+        Returns:
+            Mapping of query_type to its Prometheus result, or to
+            {"status": "error", "error": "..."} if that query failed
+
+        Raises:
+            ValueError: If any query_type, timestamp or step is invalid, or only
+                one of start/end is set
+
+        Example:
+            >>> results = await service.query_prometheus_batch(
+            ...     org_id="myorg",
+            ...     env_name="dev",
+            ...     query_types=["cpu_usage_rate", "memory_usage"],
+            ... )
+        """
+        if (start is None) != (end is None):
+            raise ValueError("start and end must be provided together")
+        if start is not None:
+            parse_timestamp_seconds(start)
+            parse_timestamp_seconds(end)
+            parse_duration_seconds(step)
+
+        namespace = self.build_namespace(
+            org_id=org_id, env_name=env_name, app_name=app_name
+        )
+        try:
+            queries = {
+                query_type: self.build_prometheus_query(query_type, namespace)
+                for query_type in dict.fromkeys(query_types)
+            }
+        except ValueError as e:
+            raise ValueError(f"Invalid query_type: {e}")
+
+        semaphore = asyncio.Semaphore(PROMETHEUS_BATCH_CONCURRENCY)
+
+        async def run(query: str) -> Dict:
+            async with semaphore:
+                if start is not None:
+                    return await self._cached_range_query(query, start, end, step)
+                return await self._cached_instant_query(query, time)
+
+        outcomes = await asyncio.gather(
+            *(run(query) for query in queries.values()), return_exceptions=True
+        )
+        return {
+            query_type: self._batch_outcome(query_type, outcome)
+            for query_type, outcome in zip(queries, outcomes)
+        }
+
+    async def _cached_instant_query(
+        self, query: str, time: Optional[str], timeout: Optional[str] = None
+    ) -> Dict:
         prometheus_config = self.config_service.get_prometheus_config()
-        return await self.prometheus_ops.query_range(
-            prometheus_config.host, query, start, end, step
+        return await self.result_cache.get_instant(
+            query,
+            time,
+            lambda: self.prometheus_ops.query(
+                prometheus_config.host, query, time, timeout
+            ),
+            timeout,
         )
 
+    async def _cached_range_query(
+        self, query: str, start: str, end: str, step: str
+    ) -> Dict:
+        prometheus_config = self.config_service.get_prometheus_config()
+
+        async def fetch(aligned_start: float, aligned_end: float) -> Dict:
+            return await self.prometheus_ops.query_range(
+                prometheus_config.host,
+                query,
+                str(aligned_start),
+                str(aligned_end),
+                step,
+            )
+
+        return await self.result_cache.get_range(query, start, end, step, fetch)
+
+    @staticmethod
+    def _batch_outcome(query_type: str, outcome) -> Dict:
+        if not isinstance(outcome, BaseException):
+            return outcome
+        logger.warning(f"Batch metrics query {query_type} failed: {outcome}")
+        return {"status": "error", "error": str(outcome)}
+
     async def query_prometheus_range_custom(
         self,
         org_id: str,
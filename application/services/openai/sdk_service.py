@@ -19,6 +19,11 @@ from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypeVar
 from openai import APIConnectionError, APIError, AsyncOpenAI, RateLimitError
 from pydantic import BaseModel, ValidationError
 
+from application.services.structured_output_cache import (
+    get_structured_output_cache,
+    token_count,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
@@ -183,6 +188,8 @@ class OpenAISDKService:
         """
         Generate structured output using Pydantic schema.
 
+        Repeated requests are answered from the structured output cache.
+
         Args:
             prompt: User question/request
             schema: Pydantic model class defining the expected output structure
@@ -199,20 +206,33 @@ class OpenAISDKService:
             raise Exception("OpenAI client not initialized - check OPENAI_API_KEY")
 
         messages = self._build_messages(prompt, None, system_instruction)
+        temperature = self.temperature if temperature is None else temperature
+        cache = get_structured_output_cache()
+        cache_key = cache.key_for(
+            model=self.model_name,
+            temperature=temperature,
+            schema=schema,
+            prompt=prompt,
+            system_instruction=system_instruction,
+        )
 
-        try:
+        async def generate() -> tuple[T, int]:
             logger.debug(f"Generating structured output with schema: {schema.__name__}")
 
             response = await self.client.beta.chat.completions.parse(
                 model=self.model_name,
                 messages=messages,
                 response_format=schema,
-                temperature=temperature or self.temperature,
+                temperature=temperature,
             )
 
             result = response.choices[0].message.parsed
             logger.debug(f"Structured output generated: {type(result).__name__}")
-            return result
+            usage = getattr(response, "usage", None)
+            return result, token_count(getattr(usage, "total_tokens", None))
+
+        try:
+            return await cache.get_or_generate(cache_key, generate)
 
         except ValidationError as e:
             logger.error(f"Schema validation failed: {e}")
@@ -9,6 +9,9 @@ import logging
 from typing import Optional
 
 from application.repositories.conversation_repository import ConversationRepository
+from application.repositories.conversation_summary_index import (
+    ConversationSummaryIndex,
+)
 from application.repositories.task_repository import TaskRepository
 from application.services.chat.service import ChatService
 from application.services.chat.stream_service import ChatStreamService
@@ -101,7 +104,10 @@ class ServiceFactory:
         """
         if self._conversation_repository is None:
             entity_service = get_entity_service()
-            self._conversation_repository = ConversationRepository(entity_service)
+            self._conversation_repository = ConversationRepository(
+                entity_service,
+                summary_index=ConversationSummaryIndex(entity_service),
+            )
             logger.debug("ConversationRepository initialized")
         return self._conversation_repository
 
@@ -199,6 +205,17 @@ class ServiceFactory:
             logger.debug("MetricsService initialized")
         return self._metrics_service
 
+    async def aclose(self) -> None:
+        """
+        Release resources held by services that have been created.
+
+        Closes the metrics service's pooled Prometheus client; services that
+        were never used are not created just to be closed.
+        """
+        if self._metrics_service is not None:
+            await self._metrics_service.aclose()
+            logger.debug("MetricsService closed")
+
     def clear_cache(self):
         """
         Clear all cached service instances.
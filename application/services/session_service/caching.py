@@ -3,18 +3,21 @@
 Implements batched event persistence to reduce HTTP calls from ~100 per message to ~2.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
-
-from google.adk.events.event import Event
+from typing import TYPE_CHECKING, Any, Optional
 
 from application.entity.adk_session import AdkSession
 from common.service.entity_service import EntityService
 from common.service.service import EntityServiceError
 
+if TYPE_CHECKING:
+    from google.adk.events.event import Event
+
 logger = logging.getLogger(__name__)
 
 
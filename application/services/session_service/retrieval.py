@@ -3,17 +3,20 @@
 Handles session fetching, searching, and optimized lookup by technical ID.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Optional
-
-from google.adk.sessions.base_session_service import GetSessionConfig
-from google.adk.sessions.session import Session
+from typing import TYPE_CHECKING, Optional
 
 from application.entity.adk_session import AdkSession
 from common.search import CyodaOperator
 from common.service.entity_service import EntityService, SearchConditionRequest
 
+if TYPE_CHECKING:
+    from google.adk.sessions.base_session_service import GetSessionConfig
+    from google.adk.sessions.session import Session
+
 logger = logging.getLogger(__name__)
 
 
@@ -1,16 +1,19 @@
 """Serialization, deserialization, and conversion utilities for CyodaSessionService."""
 
+from __future__ import annotations
+
 import copy
 import logging
-from typing import Any
-
-from google.adk.events.event import Event
-from google.adk.sessions.session import Session
+from typing import TYPE_CHECKING, Any
 
 from application.entity.adk_session import AdkSession
 
 from .message_sanitizer import sanitize_adk_session_events
 
+if TYPE_CHECKING:
+    from google.adk.events.event import Event
+    from google.adk.sessions.session import Session
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +27,8 @@ def to_adk_session(adk_session: AdkSession, deserialize_event_fn) -> Session:
     Returns:
         ADK Session object
     """
+    from google.adk.sessions.session import Session
+
     events = [deserialize_event_fn(event_data) for event_data in adk_session.events]
 
     # Sanitize events to remove incomplete tool call sequences
@@ -86,6 +91,8 @@ def deserialize_event(event_data: dict[str, Any]) -> Event:
     Returns:
         Event object
     """
+    from google.adk.events.event import Event
+
     # Filter out None values recursively to avoid Pydantic validation errors
     filtered_data = filter_none_values(event_data)
 
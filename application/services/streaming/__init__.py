@@ -1,6 +1,10 @@
 """Streaming service module for real-time agent updates via SSE."""
 
-from application.services.streaming.events import StreamEvent
+from application.services.streaming.events import (
+    StreamComment,
+    StreamEvent,
+    StreamItem,
+)
 from application.services.streaming.service import StreamingService
 
-__all__ = ["StreamingService", "StreamEvent"]
+__all__ = ["StreamingService", "StreamEvent", "StreamComment", "StreamItem"]
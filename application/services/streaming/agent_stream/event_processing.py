@@ -11,19 +11,25 @@ from application.services.streaming.constants import (
     MAX_EVENTS_PER_STREAM,
     STREAM_TIMEOUT,
 )
-from application.services.streaming.events import StreamEvent
+from application.services.streaming.events import (
+    StreamComment,
+    StreamEvent,
+    StreamItem,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def process_agent_stream_events(processor: Any) -> AsyncGenerator[str, None]:
+async def process_agent_stream_events(
+    processor: Any,
+) -> AsyncGenerator[StreamItem, None]:
     """Process events from agent runner.
 
     Args:
         processor: AgentStreamProcessor instance
 
     Yields:
-        SSE event strings
+        Stream events and heartbeat comments
     """
     adk_runner_session_id = processor.session_technical_id or processor.conversation_id
     stream_start_time = asyncio.get_event_loop().time()
@@ -58,12 +64,12 @@ async def process_agent_stream_events(processor: Any) -> AsyncGenerator[str, Non
             processor.events_processed = True
             last_heartbeat = current_time
 
-            async for sse_event in processor.event_handlers.handle_event(event):
-                if "event: done" in sse_event:
+            async for stream_event in processor.event_handlers.handle_event(event):
+                if stream_event.event_type == "done":
                     logger.warning(
                         f"⚠️ [_process_agent_stream] WARNING: Received done event from agent runner!"
                     )
-                yield sse_event
+                yield stream_event
 
                 if processor.event_counter >= MAX_EVENTS_PER_STREAM:
                     logger.warning(f"Event limit reached ({MAX_EVENTS_PER_STREAM})")
@@ -82,7 +88,7 @@ async def process_agent_stream_events(processor: Any) -> AsyncGenerator[str, Non
         await asyncio.sleep(0)
 
 
-def _handle_stream_timeout(processor: Any, elapsed: float) -> str:
+def _handle_stream_timeout(processor: Any, elapsed: float) -> StreamEvent:
     """Handle stream timeout.
 
     Args:
@@ -90,7 +96,7 @@ def _handle_stream_timeout(processor: Any, elapsed: float) -> str:
         elapsed: Elapsed time in seconds
 
     Returns:
-        SSE event string
+        Error stream event
     """
     logger.error(f"⏱️ STREAM TIMEOUT: Exceeded {STREAM_TIMEOUT}s limit.")
     event = StreamEvent(
@@ -103,18 +109,18 @@ def _handle_stream_timeout(processor: Any, elapsed: float) -> str:
         event_id=str(processor.event_counter),
     )
     processor.event_counter += 1
-    return event.to_sse()
+    return event
 
 
-def _send_heartbeat() -> str:
+def _send_heartbeat() -> StreamComment:
     """Send heartbeat to prevent timeout.
 
     Returns:
-        Heartbeat SSE string
+        Heartbeat SSE comment
     """
     current_time = asyncio.get_event_loop().time()
     logger.debug(f"💓 Sending heartbeat")
-    return f": heartbeat {int(current_time)}\n\n"
+    return StreamComment(f"heartbeat {int(current_time)}")
 
 
 __all__ = [
@@ -12,7 +12,7 @@ from application.services.streaming.session_manager import save_session_state
 logger = logging.getLogger(__name__)
 
 
-async def finalize_stream(processor: Any) -> AsyncGenerator[str, None]:
+async def finalize_stream(processor: Any) -> AsyncGenerator[StreamEvent, None]:
     """Finalize stream and send done event.
 
     IMPORTANT: Session flush happens BEFORE done event to ensure:
@@ -24,7 +24,7 @@ async def finalize_stream(processor: Any) -> AsyncGenerator[str, None]:
         processor: AgentStreamProcessor instance
 
     Yields:
-        Final SSE events
+        Final stream events
     """
     logger.info(
         f"🔚 [_finalize_stream] Starting finalization for session {processor.conversation_id}"
@@ -85,14 +85,14 @@ async def _save_final_session_state(processor: Any) -> None:
         logger.warning(f"Error saving session state: {e}")
 
 
-def _send_done_event(processor: Any) -> str:
+def _send_done_event(processor: Any) -> StreamEvent:
     """Send done event with final data.
 
     Args:
         processor: AgentStreamProcessor instance
 
     Returns:
-        Done event SSE string
+        Done stream event
     """
     done_message = (
         "Stream ended due to error"
@@ -126,17 +126,16 @@ def _send_done_event(processor: Any) -> str:
         done_data.update(processor.error_details)
         done_data["error_context"] = {
             "events_processed": processor.events_processed,
-            "response_length": len(processor.response_text),
+            "response_length": processor.response_length,
             "event_count": processor.event_counter,
             "session_id": processor.session_technical_id,
         }
 
-    event = StreamEvent(
+    return StreamEvent(
         event_type="done",
         data=done_data,
         event_id=str(processor.event_counter),
     )
-    return event.to_sse()
 
 
 async def _cleanup_session_state(processor: Any) -> None:
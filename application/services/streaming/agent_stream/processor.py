@@ -1,18 +1,17 @@
 """Agent stream processor - core streaming logic."""
 
 import asyncio
+import io
 import logging
 from typing import Any, AsyncGenerator, Dict, Optional
 
-from google.genai import types
-
 from application.services.streaming.constants import (
     HEARTBEAT_INTERVAL,
     MAX_EVENTS_PER_STREAM,
     STREAM_TIMEOUT,
 )
 from application.services.streaming.event_handlers import EventHandlers
-from application.services.streaming.events import StreamEvent
+from application.services.streaming.events import StreamEvent, StreamItem
 from application.services.streaming.loop_detector import LoopDetector
 from application.services.streaming.session_manager import (
     load_or_create_session,
@@ -22,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 
 class AgentStreamProcessor:
-    """Processes agent execution stream and yields SSE events."""
+    """Processes agent execution stream and yields typed stream events."""
 
     def __init__(
         self,
@@ -41,7 +40,7 @@ class AgentStreamProcessor:
         self.user_id = user_id
 
         self.event_counter = 0
-        self.response_text = ""
+        self._response = io.StringIO()
         self.session = None
         self.session_technical_id = None
         self.error_occurred = False
@@ -54,13 +53,27 @@ class AgentStreamProcessor:
         self.loop_detector = LoopDetector()
         self.event_handlers = EventHandlers(self)
 
-    async def process(self) -> AsyncGenerator[str, None]:
-        """Process agent stream and yield SSE events."""
+    @property
+    def response_text(self) -> str:
+        """Full response text accumulated so far."""
+        return self._response.getvalue()
+
+    @property
+    def response_length(self) -> int:
+        """Length of the accumulated response, without joining it."""
+        return self._response.tell()
+
+    def append_response(self, chunk: str) -> None:
+        """Append a content chunk to the response (amortized O(len(chunk)))."""
+        self._response.write(chunk)
+
+    async def process(self) -> AsyncGenerator[StreamItem, None]:
+        """Process agent stream and yield typed stream events."""
         try:
             yield self._send_start_event()
             await self._initialize_session()
             async for event in self._process_agent_stream():
-                if "event: done" in event:
+                if isinstance(event, StreamEvent) and event.event_type == "done":
                     logger.info(
                         f"🔄 [process] Yielding DONE event from _process_agent_stream"
                     )
@@ -74,7 +87,7 @@ class AgentStreamProcessor:
             from .finalization import finalize_stream
 
             async for event in finalize_stream(self):
-                if "event: done" in event:
+                if event.event_type == "done":
                     logger.info(
                         f"🔚 [process] Yielding DONE event from _finalize_stream()"
                     )
@@ -83,7 +96,7 @@ class AgentStreamProcessor:
                 f"🔚 [process] Finished yielding events from _finalize_stream()"
             )
 
-    def _send_start_event(self) -> str:
+    def _send_start_event(self) -> StreamEvent:
         """Send initial start event."""
         event = StreamEvent(
             event_type="start",
@@ -94,7 +107,7 @@ class AgentStreamProcessor:
             event_id=str(self.event_counter),
         )
         self.event_counter += 1
-        return event.to_sse()
+        return event
 
     async def _initialize_session(self) -> None:
         """Initialize or load session."""
@@ -126,14 +139,14 @@ class AgentStreamProcessor:
             session_state,
         )
 
-    async def _process_agent_stream(self) -> AsyncGenerator[str, None]:
+    async def _process_agent_stream(self) -> AsyncGenerator[StreamItem, None]:
         """Process events from agent runner."""
         from .event_processing import process_agent_stream_events
 
         async for event in process_agent_stream_events(self):
             yield event
 
-    def _handle_error(self, error: Exception) -> str:
+    def _handle_error(self, error: Exception) -> StreamEvent:
         """Handle error during processing."""
         self.error_occurred = True
         self.error_details = {
@@ -155,7 +168,7 @@ class AgentStreamProcessor:
             event_id=str(self.event_counter),
         )
         self.event_counter += 1
-        return event.to_sse()
+        return event
 
 
 __all__ = ["AgentStreamProcessor"]
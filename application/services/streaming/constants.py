@@ -13,3 +13,8 @@ HEARTBEAT_INTERVAL = 120  # Send heartbeat every 2 minutes (LLM can take 30-60s)
 # Session configuration
 APP_NAME = "cyoda-assistant"
 CYODA_TECHNICAL_ID_KEY = "__cyoda_technical_id__"
+
+# Detached runs: events kept per turn for Last-Event-ID replay, and how long a
+# finished run stays attachable after its last event
+STREAM_REPLAY_BUFFER_SIZE = 2000
+DETACHED_RUN_RETENTION_SECONDS = 300
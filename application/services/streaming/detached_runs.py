@@ -0,0 +1,323 @@
+"""Detached agent runs with a bounded replay buffer.
+
+An agent turn runs as a background task that is independent of any HTTP
+connection. Its events are appended to a per-turn ring buffer and numbered
+``<run_id>:<seq>`` with a monotonically increasing sequence, so a client can
+disconnect, reconnect with ``Last-Event-ID`` and receive exactly the events it
+missed before tailing live ones. Ids are unique across the turns of a
+conversation: a ``Last-Event-ID`` from an earlier turn does not match the
+current run and the client is replayed the whole current turn. Several
+clients (e.g. two browser tabs) can subscribe to the same run.
+
+The buffer is pluggable through ``RunBuffer``; ``InMemoryRunBuffer`` is the
+per-process backend used by default and in tests.
+"""
+
+import abc
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from typing import AsyncGenerator, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from application.services.streaming.constants import (
+    DETACHED_RUN_RETENTION_SECONDS,
+    HEARTBEAT_INTERVAL,
+    STREAM_REPLAY_BUFFER_SIZE,
+)
+from application.services.streaming.events import (
+    StreamComment,
+    StreamEvent,
+    StreamItem,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RunBuffer(abc.ABC):
+    """Ordered, bounded event log for one run.
+
+    Positions in the log are per-run sequence numbers starting at 1.
+    """
+
+    @property
+    @abc.abstractmethod
+    def last_event_id(self) -> int:
+        """Sequence of the newest appended event (0 when empty)."""
+
+    @property
+    @abc.abstractmethod
+    def closed(self) -> bool:
+        """Whether the run has finished appending events."""
+
+    @abc.abstractmethod
+    async def append(self, event: StreamEvent) -> None:
+        """Assign the next event id to ``event`` and store it."""
+
+    @abc.abstractmethod
+    async def read_after(self, last_event_id: int) -> List[StreamEvent]:
+        """Return retained events with a sequence greater than ``last_event_id``."""
+
+    @abc.abstractmethod
+    async def wait(self, last_event_id: int, timeout: float) -> bool:
+        """Wait until an event newer than ``last_event_id`` exists or the buffer closes.
+
+        Returns:
+            False if ``timeout`` elapsed first.
+        """
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """Mark the run finished and wake all waiters."""
+
+
+class InMemoryRunBuffer(RunBuffer):
+    """Process-local ring buffer; the oldest events are evicted when full."""
+
+    def __init__(
+        self, run_id: Optional[str] = None, maxlen: int = STREAM_REPLAY_BUFFER_SIZE
+    ):
+        self._id_prefix = f"{run_id}:" if run_id else ""
+        self._events: Deque[StreamEvent] = deque(maxlen=maxlen)
+        self._last_event_id = 0
+        self._closed = False
+        self._changed = asyncio.Event()
+
+    @property
+    def last_event_id(self) -> int:
+        return self._last_event_id
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def append(self, event: StreamEvent) -> None:
+        self._last_event_id += 1
+        event.event_id = f"{self._id_prefix}{self._last_event_id}"
+        self._events.append(event)
+        self._notify()
+
+    async def read_after(self, last_event_id: int) -> List[StreamEvent]:
+        if not self._events or last_event_id >= self._last_event_id:
+            return []
+        # Ids are contiguous, so the start offset is computed, not searched
+        first_id = self._last_event_id - len(self._events) + 1
+        if last_event_id + 1 < first_id:
+            logger.warning(
+                f"⚠️ Replay from event {last_event_id} requested, oldest retained "
+                f"is {first_id}; {first_id - last_event_id - 1} event(s) lost"
+            )
+        start = max(0, last_event_id + 1 - first_id)
+        return list(islice(self._events, start, None))
+
+    async def wait(self, last_event_id: int, timeout: float) -> bool:
+        if self._closed or self._last_event_id > last_event_id:
+            return True
+        changed = self._changed
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        self._closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        # Swap in a fresh event so later waiters block until the next change
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class DetachedRun:
+    """One agent turn running in the background, feeding a RunBuffer."""
+
+    def __init__(
+        self,
+        conversation_id: str,
+        buffer_factory: Callable[[str], RunBuffer] = InMemoryRunBuffer,
+    ):
+        self.run_id = uuid.uuid4().hex
+        self.conversation_id = conversation_id
+        self.buffer = buffer_factory(self.run_id)
+        self.task: Optional[asyncio.Task] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def resume_point(self, last_event_id: Optional[str]) -> int:
+        """Translate a client's ``Last-Event-ID`` into a sequence of this run.
+
+        Ids from another run (an earlier turn of the conversation) or in an
+        unknown format resume from the start of this run.
+        """
+        if not last_event_id:
+            return 0
+        run_id, _, seq = last_event_id.rpartition(":")
+        if run_id != self.run_id or not seq.isdigit():
+            logger.info(
+                f"🔗 Last-Event-ID {last_event_id!r} is not from run {self.run_id}, "
+                f"replaying the whole run"
+            )
+            return 0
+        return int(seq)
+
+    def start(self, producer: AsyncIterator[StreamItem]) -> None:
+        """Start consuming ``producer`` in a task not tied to any request."""
+        self.task = asyncio.create_task(self._drive(producer))
+
+    async def _drive(self, producer: AsyncIterator[StreamItem]) -> None:
+        try:
+            async for item in producer:
+                # Heartbeats are per-connection; subscribers generate their own
+                if isinstance(item, StreamEvent):
+                    await self.buffer.append(item)
+        except asyncio.CancelledError:
+            logger.info(f"🛑 Detached run {self.run_id} cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"❌ Detached run {self.run_id} failed: {e}", exc_info=True)
+            await self.buffer.append(StreamEvent("error", {"error": str(e)}))
+        finally:
+            self.finished_at = time.monotonic()
+            await self.buffer.close()
+
+    async def subscribe(
+        self,
+        last_event_id: Optional[str] = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    ) -> AsyncGenerator[StreamItem, None]:
+        """Replay events after ``last_event_id``, then tail until the run ends.
+
+        Closing the subscriber (client disconnect) does not affect the run.
+
+        Args:
+            last_event_id: Last id the client has seen; None, or an id from
+                another run, replays everything still retained.
+            heartbeat_interval: Idle seconds before a heartbeat comment is sent.
+
+        Yields:
+            Buffered StreamEvents and StreamComment heartbeats.
+        """
+        cursor = self.resume_point(last_event_id)
+        while True:
+            # Read the closed flag first so events appended just before close
+            # are still picked up by the read below
+            closed = self.buffer.closed
+            events = await self.buffer.read_after(cursor)
+            for event in events:
+                yield event
+                cursor = int(event.event_id.rpartition(":")[2])
+            if events:
+                continue
+            if closed:
+                return
+            if not await self.buffer.wait(cursor, heartbeat_interval):
+                yield StreamComment(f"heartbeat {time.time():.0f}")
+
+
+class RunRegistry:
+    """Tracks the latest detached run per conversation."""
+
+    def __init__(
+        self,
+        buffer_factory: Callable[[str], RunBuffer] = InMemoryRunBuffer,
+        retention_seconds: float = DETACHED_RUN_RETENTION_SECONDS,
+    ):
+        self.buffer_factory = buffer_factory
+        self.retention_seconds = retention_seconds
+        self._runs: Dict[str, DetachedRun] = {}
+
+    def get(self, conversation_id: str) -> Optional[DetachedRun]:
+        """Return the conversation's running or recently finished run."""
+        self._prune()
+        return self._runs.get(conversation_id)
+
+    def get_active(self, conversation_id: str) -> Optional[DetachedRun]:
+        """Return the conversation's run if it is still producing events."""
+        run = self.get(conversation_id)
+        return run if run and not run.done else None
+
+    def reserve(self, conversation_id: str) -> Optional[DetachedRun]:
+        """Register a not yet started run as the conversation's active run.
+
+        Reserving is synchronous, so a request that reserves before its first
+        await cannot race another request for the same conversation. The
+        caller either starts the run with ``launch`` or gives it up with
+        ``release``.
+
+        Returns:
+            The reserved run, or None if a run is already active.
+        """
+        if self.get_active(conversation_id):
+            return None
+        run = DetachedRun(conversation_id, self.buffer_factory)
+        self._runs[conversation_id] = run
+        return run
+
+    def launch(self, run: DetachedRun, producer: AsyncIterator[StreamItem]) -> None:
+        """Start a reserved run consuming ``producer``."""
+        run.start(producer)
+        logger.info(f"🚀 Started detached run {run.run_id} for {run.conversation_id}")
+
+    async def release(self, run: DetachedRun) -> None:
+        """Give up a reserved run that was never launched."""
+        if self._runs.get(run.conversation_id) is run:
+            del self._runs[run.conversation_id]
+        run.finished_at = time.monotonic()
+        # Subscribers that attached to the reservation stop waiting
+        await run.buffer.close()
+
+    def start(
+        self, conversation_id: str, producer: AsyncIterator[StreamItem]
+    ) -> DetachedRun:
+        """Start a detached run for the conversation.
+
+        If a run is already active for the conversation it is returned instead
+        and ``producer`` is closed without being started.
+        """
+        run = self.reserve(conversation_id)
+        if run is None:
+            active = self.get_active(conversation_id)
+            logger.info(
+                f"🔗 Run {active.run_id} already active for {conversation_id}, attaching"
+            )
+            aclose = getattr(producer, "aclose", None)
+            if aclose:
+                asyncio.create_task(aclose())
+            return active
+
+        self.launch(run, producer)
+        return run
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        expired = [
+            conversation_id
+            for conversation_id, run in self._runs.items()
+            if run.done and run.finished_at < cutoff
+        ]
+        for conversation_id in expired:
+            del self._runs[conversation_id]
+
+
+_registry: Optional[RunRegistry] = None
+
+
+def get_run_registry() -> RunRegistry:
+    """Get the process-wide detached run registry."""
+    global _registry
+    if _registry is None:
+        _registry = RunRegistry()
+    return _registry
+
+
+def reset_run_registry() -> None:
+    """Drop the registry (used by tests)."""
+    global _registry
+    _registry = None
@@ -23,18 +23,18 @@ class EventHandlers:
         self.current_tool = None
         self.current_tool_args = None
 
-    async def handle_event(self, event: Any) -> AsyncGenerator[str, None]:
+    async def handle_event(self, event: Any) -> AsyncGenerator[StreamEvent, None]:
         """Handle a single ADK event."""
         if self._is_agent_transition(event):
             yield self._handle_agent_transition(event)
 
         if hasattr(event, "content") and event.content:
-            async for sse_event in self._handle_content(event):
-                yield sse_event
+            async for stream_event in self._handle_content(event):
+                yield stream_event
 
         if hasattr(event, "actions") and event.actions:
-            async for sse_event in self._handle_actions(event):
-                yield sse_event
+            async for stream_event in self._handle_actions(event):
+                yield stream_event
 
     def _is_agent_transition(self, event: Any) -> bool:
         """Check if event represents agent transition."""
@@ -44,10 +44,10 @@ class EventHandlers:
             and event.author != self.current_agent
         )
 
-    def _handle_agent_transition(self, event: Any) -> str:
+    def _handle_agent_transition(self, event: Any) -> StreamEvent:
         """Handle agent transition event."""
         self.current_agent = event.author
-        sse_event = StreamEvent(
+        stream_event = StreamEvent(
             event_type="agent",
             data={
                 "agent_name": self.current_agent,
@@ -58,25 +58,27 @@ class EventHandlers:
             event_id=str(self.processor.event_counter),
         )
         self.processor.event_counter += 1
-        return sse_event.to_sse()
+        return stream_event
 
-    async def _handle_content(self, event: Any) -> AsyncGenerator[str, None]:
+    async def _handle_content(self, event: Any) -> AsyncGenerator[StreamEvent, None]:
         """Handle content parts (text, function calls, responses)."""
         if not event.content.parts:
             return
 
         for part in event.content.parts:
             if hasattr(part, "function_call") and part.function_call:
-                async for sse_event in self._handle_function_call(part):
-                    yield sse_event
+                async for stream_event in self._handle_function_call(part):
+                    yield stream_event
             elif hasattr(part, "function_response") and part.function_response:
-                async for sse_event in self._handle_function_response(part):
-                    yield sse_event
+                async for stream_event in self._handle_function_response(part):
+                    yield stream_event
             elif hasattr(part, "text") and part.text:
-                async for sse_event in self._handle_text_content(part):
-                    yield sse_event
+                async for stream_event in self._handle_text_content(part):
+                    yield stream_event
 
-    async def _handle_function_call(self, part: Any) -> AsyncGenerator[str, None]:
+    async def _handle_function_call(
+        self, part: Any
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Handle function call event."""
         tool_name = part.function_call.name
         tool_args = (
@@ -99,7 +101,7 @@ class EventHandlers:
                     "tool_name": tool_name,
                 },
                 event_id=str(self.processor.event_counter),
-            ).to_sse()
+            )
             self.processor.event_counter += 1
             return
 
@@ -122,10 +124,12 @@ class EventHandlers:
                     "agent": self.current_agent,
                 },
                 event_id=str(self.processor.event_counter),
-            ).to_sse()
+            )
             self.processor.event_counter += 1
 
-    async def _handle_function_response(self, part: Any) -> AsyncGenerator[str, None]:
+    async def _handle_function_response(
+        self, part: Any
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Handle function response event."""
         tool_name = part.function_response.name
         tool_response = (
@@ -165,14 +169,16 @@ class EventHandlers:
                 "hook": tool_hook,
             },
             event_id=str(self.processor.event_counter),
-        ).to_sse()
+        )
         self.processor.event_counter += 1
 
-    async def _handle_text_content(self, part: Any) -> AsyncGenerator[str, None]:
+    async def _handle_text_content(
+        self, part: Any
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Handle text content event."""
         chunk = part.text
 
-        if len(self.processor.response_text) + len(chunk) > MAX_RESPONSE_SIZE:
+        if self.processor.response_length + len(chunk) > MAX_RESPONSE_SIZE:
             if not self.processor.max_response_reached:
                 self.processor.max_response_reached = True
                 logger.warning(
@@ -182,17 +188,17 @@ class EventHandlers:
                     event_type="content",
                     data={
                         "chunk": "\n\n[Response truncated - size limit reached]",
-                        "accumulated_length": len(self.processor.response_text),
+                        "accumulated_length": self.processor.response_length,
                         "partial": False,
                         "agent": self.current_agent,
                         "truncated": True,
                     },
                     event_id=str(self.processor.event_counter),
-                ).to_sse()
+                )
                 self.processor.event_counter += 1
             return
 
-        self.processor.response_text += chunk
+        self.processor.append_response(chunk)
         is_partial = (
             getattr(part, "partial", False) if hasattr(part, "partial") else False
         )
@@ -201,15 +207,15 @@ class EventHandlers:
             event_type="content",
             data={
                 "chunk": chunk,
-                "accumulated_length": len(self.processor.response_text),
+                "accumulated_length": self.processor.response_length,
                 "partial": is_partial,
                 "agent": self.current_agent,
             },
             event_id=str(self.processor.event_counter),
-        ).to_sse()
+        )
         self.processor.event_counter += 1
 
-    async def _handle_actions(self, event: Any) -> AsyncGenerator[str, None]:
+    async def _handle_actions(self, event: Any) -> AsyncGenerator[StreamEvent, None]:
         """Handle state and artifact changes."""
         if hasattr(event.actions, "state_delta") and event.actions.state_delta:
             yield StreamEvent(
@@ -220,7 +226,7 @@ class EventHandlers:
                     "agent": self.current_agent,
                 },
                 event_id=str(self.processor.event_counter),
-            ).to_sse()
+            )
             self.processor.event_counter += 1
 
         if hasattr(event.actions, "artifact_delta") and event.actions.artifact_delta:
@@ -234,7 +240,7 @@ class EventHandlers:
                     "agent": self.current_agent,
                 },
                 event_id=str(self.processor.event_counter),
-            ).to_sse()
+            )
             self.processor.event_counter += 1
 
         if (
@@ -249,5 +255,5 @@ class EventHandlers:
                     "message": f"Transferring to agent: {event.actions.transfer_to_agent}",
                 },
                 event_id=str(self.processor.event_counter),
-            ).to_sse()
+            )
             self.processor.event_counter += 1
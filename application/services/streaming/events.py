@@ -1,8 +1,12 @@
-"""SSE event representation and formatting."""
+"""SSE event representation and formatting.
+
+The streaming pipeline passes these typed objects around in-process and only
+encodes them to SSE text (``to_sse()``) once, at the HTTP boundary.
+"""
 
 import json
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 
 class StreamEvent:
@@ -35,9 +39,26 @@ class StreamEvent:
         lines = [
             f"id: {self.event_id}",
             f"event: {self.event_type}",
+            # Encoding happens at the HTTP boundary, after the producer's
+            # error handling, so it must not fail mid-stream on odd values
+            f"data: {json.dumps(self.payload(), default=str)}",
         ]
+        return "\n".join(lines) + "\n\n"
 
-        event_data = {**self.data, "timestamp": self.timestamp}
-        lines.append(f"data: {json.dumps(event_data)}")
+    def payload(self) -> Dict[str, Any]:
+        """Return the event data as sent to the client (with timestamp)."""
+        return {**self.data, "timestamp": self.timestamp}
 
-        return "\n".join(lines) + "\n\n"
+
+class StreamComment:
+    """SSE comment line (e.g. heartbeat); ignored by EventSource clients."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def to_sse(self) -> str:
+        """Convert comment to SSE format."""
+        return f": {self.text}\n\n"
+
+
+StreamItem = Union[StreamEvent, StreamComment]
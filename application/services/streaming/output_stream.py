@@ -0,0 +1,80 @@
+"""Live process output streaming for background tasks."""
+
+import codecs
+import logging
+from typing import AsyncGenerator, Optional
+
+from application.agents.shared.process_output import ProcessOutput
+from application.services.streaming.events import StreamEvent
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 20
+
+
+class OutputStreamProcessor:
+    """Tails a task's captured process output and yields SSE events.
+
+    Event ids are byte offsets into the output, so a client reconnecting with
+    ``Last-Event-ID`` resumes where it left off. When the output is no longer
+    held in this process, the last checkpoint stored on the task is sent
+    instead.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        output: Optional[ProcessOutput],
+        checkpoint: str = "",
+        offset: Optional[int] = None,
+    ):
+        self.task_id = task_id
+        self.output = output
+        self.checkpoint = checkpoint
+        self.offset = offset
+
+    async def process(self) -> AsyncGenerator[str, None]:
+        """Yield output events until the process output ends."""
+        if self.output is None:
+            yield self._output_event(self.checkpoint, "0")
+            yield self._done_event(None)
+            return
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        position = self.offset or 0
+        try:
+            async for position, chunk in self.output.follow(
+                self.offset, idle_timeout=HEARTBEAT_INTERVAL
+            ):
+                if not chunk:
+                    yield ": heartbeat\n\n"
+                    continue
+                text = decoder.decode(chunk)
+                if text:
+                    yield self._output_event(text, str(position))
+        except Exception as e:
+            logger.error(f"Error streaming task output: {e}", exc_info=True)
+            yield StreamEvent(
+                event_type="error",
+                data={"error": str(e), "task_id": self.task_id},
+            ).to_sse()
+            return
+        yield self._done_event(position)
+
+    def _output_event(self, text: str, event_id: str) -> str:
+        return StreamEvent(
+            event_type="output",
+            data={"task_id": self.task_id, "text": text},
+            event_id=event_id,
+        ).to_sse()
+
+    def _done_event(self, offset: Optional[int]) -> str:
+        return StreamEvent(
+            event_type="done",
+            data={
+                "task_id": self.task_id,
+                "offset": offset,
+                "source": "checkpoint" if offset is None else "live",
+            },
+            event_id=str(offset or 0),
+        ).to_sse()
@@ -15,14 +15,12 @@ import asyncio
 import logging
 from typing import Any, AsyncGenerator, Optional, Tuple
 
-from google.genai import types
-
 from application.services.streaming.agent_stream import AgentStreamProcessor
 from application.services.streaming.constants import (
     HEARTBEAT_INTERVAL,
     STREAM_TIMEOUT,
 )
-from application.services.streaming.events import StreamEvent
+from application.services.streaming.events import StreamEvent, StreamItem
 
 logger = logging.getLogger(__name__)
 
@@ -31,17 +29,19 @@ class StreamingService:
     """Service for streaming agent execution events via SSE."""
 
     @staticmethod
-    async def stream_agent_response(
+    async def stream_agent_events(
         agent_wrapper: Any,
         user_message: str,
         conversation_history: list[dict[str, str]],
         conversation_id: str,
         adk_session_id: Optional[str],
         user_id: str,
-    ) -> AsyncGenerator[str, None]:
-        """Stream agent response with real-time updates.
+    ) -> AsyncGenerator[StreamItem, None]:
+        """Stream agent response as typed events.
 
-        Yields SSE-formatted events as the agent processes the message.
+        Yields StreamEvent objects (and StreamComment heartbeats) as the agent
+        processes the message. Callers encode them with ``to_sse()`` once, at
+        the HTTP boundary, instead of re-parsing SSE text.
 
         Args:
             agent_wrapper: CyodaAssistantWrapper instance
@@ -52,7 +52,7 @@ class StreamingService:
             user_id: User ID
 
         Yields:
-            SSE-formatted event strings
+            Stream events and heartbeat comments
         """
         processor = AgentStreamProcessor(
             agent_wrapper=agent_wrapper,
@@ -66,6 +66,41 @@ class StreamingService:
         async for event in processor.process():
             yield event
 
+    @staticmethod
+    async def stream_agent_response(
+        agent_wrapper: Any,
+        user_message: str,
+        conversation_history: list[dict[str, str]],
+        conversation_id: str,
+        adk_session_id: Optional[str],
+        user_id: str,
+    ) -> AsyncGenerator[str, None]:
+        """Stream agent response with real-time updates.
+
+        Yields SSE-formatted events as the agent processes the message. Use
+        stream_agent_events() when the events are inspected before sending.
+
+        Args:
+            agent_wrapper: CyodaAssistantWrapper instance
+            user_message: User's message
+            conversation_history: Previous messages
+            conversation_id: Conversation ID
+            adk_session_id: ADK session ID (if exists)
+            user_id: User ID
+
+        Yields:
+            SSE-formatted event strings
+        """
+        async for event in StreamingService.stream_agent_events(
+            agent_wrapper=agent_wrapper,
+            user_message=user_message,
+            conversation_history=conversation_history,
+            conversation_id=conversation_id,
+            adk_session_id=adk_session_id,
+            user_id=user_id,
+        ):
+            yield event.to_sse()
+
     @staticmethod
     async def stream_progress_updates(
         task_id: str,
@@ -98,6 +133,38 @@ class StreamingService:
         async for event in processor.process():
             yield event
 
+    @staticmethod
+    async def stream_process_output(
+        task_id: str,
+        output: Any,
+        checkpoint: str = "",
+        offset: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream a background task's process output.
+
+        Tails the in-memory output buffer live; falls back to the checkpoint
+        stored on the task when the output is not held by this process.
+
+        Args:
+            task_id: Background task ID.
+            output: ProcessOutput from the output registry, or None.
+            checkpoint: Output tail stored in the task metadata.
+            offset: Byte offset to resume from (e.g. from Last-Event-ID).
+
+        Yields:
+            SSE-formatted output events.
+        """
+        from application.services.streaming.output_stream import (
+            OutputStreamProcessor,
+        )
+
+        processor = OutputStreamProcessor(
+            task_id=task_id, output=output, checkpoint=checkpoint, offset=offset
+        )
+
+        async for event in processor.process():
+            yield event
+
     @staticmethod
     def _build_progress_event(
         task_id: str, task: Any, event_counter: int
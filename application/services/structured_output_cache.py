@@ -0,0 +1,274 @@
+"""
+Response cache for structured model generations.
+
+Canvas questions ask the model for schema-constrained JSON, and the same
+question is often asked again within minutes (the canvas is re-opened, the
+request is retried). Answers are cached by model, temperature, schema
+fingerprint and a hash of the normalized prompt, system instruction and
+context, in a bounded LRU with a TTL. Identical requests that arrive while the
+first one is still generating wait for its answer instead of calling the model
+again.
+
+Only deterministic requests (temperature 0) are cached unless
+STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE is set. Canvas questions use the
+configured GOOGLE_TEMPERATURE, so caching them is opt-in through that setting.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from common.config.config import (
+    STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE,
+    STRUCTURED_OUTPUT_CACHE_ENABLED,
+    STRUCTURED_OUTPUT_CACHE_MAX_ENTRIES,
+    STRUCTURED_OUTPUT_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Produces the parsed result and the total tokens the model call used
+Generator = Callable[[], Awaitable[Tuple[Any, int]]]
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_prompt(text: Optional[str]) -> str:
+    """Normalize line endings and surrounding/trailing whitespace of a prompt."""
+    if not text:
+        return ""
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def schema_fingerprint(schema: Any) -> str:
+    """
+    Fingerprint a response schema.
+
+    Args:
+        schema: JSON schema dict or Pydantic model class
+
+    Returns:
+        Short hash that changes whenever the schema (or model class) does
+    """
+    if isinstance(schema, type) and hasattr(schema, "model_json_schema"):
+        source = (
+            f"{schema.__module__}.{schema.__qualname__}:"
+            f"{json.dumps(schema.model_json_schema(), sort_keys=True)}"
+        )
+    else:
+        source = json.dumps(schema, sort_keys=True, default=str)
+    return _digest(source)
+
+
+def token_count(value: Any) -> int:
+    """Return value if it is a token count reported by the SDK, else 0."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    tokens: int
+    created_at: float
+
+
+class StructuredOutputCache:
+    """Bounded LRU + TTL cache with single-flight generation."""
+
+    def __init__(
+        self,
+        max_entries: int = STRUCTURED_OUTPUT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = STRUCTURED_OUTPUT_CACHE_TTL_SECONDS,
+        enabled: bool = STRUCTURED_OUTPUT_CACHE_ENABLED,
+        any_temperature: bool = STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Most answers kept; the least recently used go first
+            ttl_seconds: How long an answer may be reused
+            enabled: When False every request calls the model
+            any_temperature: Also cache requests with temperature > 0
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.any_temperature = any_temperature
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._in_flight: Dict[str, "asyncio.Future[Tuple[Any, int]]"] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._deduplicated = 0
+        self._bypassed = 0
+        self._evictions = 0
+        self._tokens_saved = 0
+
+    def key_for(
+        self,
+        *,
+        model: str,
+        temperature: float,
+        schema: Any,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        context: Optional[Any] = None,
+    ) -> Optional[str]:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name the request goes to
+            temperature: Effective sampling temperature
+            schema: JSON schema dict or Pydantic model class of the answer
+            prompt: User prompt
+            system_instruction: Optional system prompt
+            context: Optional conversation history
+
+        Returns:
+            Cache key, or None if the request must not be cached
+        """
+        if not self.enabled or (temperature > 0 and not self.any_temperature):
+            return None
+        content = json.dumps(
+            [
+                normalize_prompt(prompt),
+                normalize_prompt(system_instruction),
+                context or [],
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return (
+            f"{model}:{temperature:g}:{schema_fingerprint(schema)}:{_digest(content)}"
+        )
+
+    async def get_or_generate(self, key: Optional[str], generate: Generator) -> Any:
+        """
+        Return the cached answer for key, or generate and cache it.
+
+        Args:
+            key: Cache key from key_for (None bypasses the cache)
+            generate: Calls the model; returns (result, total tokens)
+
+        Returns:
+            The result (a copy, so callers may modify it)
+
+        Raises:
+            Exception: Whatever generate raised; failures are not cached
+        """
+        if key is None:
+            self._bypassed += 1
+            result, _ = await generate()
+            return result
+
+        entry = self._lookup(key)
+        if entry is not None:
+            self._hits += 1
+            self._tokens_saved += entry.tokens
+            logger.debug(f"Structured output cache hit: {key}")
+            return copy.deepcopy(entry.value)
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._deduplicated += 1
+            try:
+                result, tokens = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    # The request we joined was cancelled, not us: go again
+                    return await self.get_or_generate(key, generate)
+                raise
+            self._tokens_saved += tokens
+            return copy.deepcopy(result)
+
+        self._misses += 1
+        future: "asyncio.Future[Tuple[Any, int]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            result, tokens = await generate()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unjoined failure is not logged by asyncio
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        self._store(key, _CacheEntry(copy.deepcopy(result), tokens, time.monotonic()))
+        future.set_result((result, tokens))
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tokens saved."""
+        lookups = self._hits + self._deduplicated + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "deduplicated": self._deduplicated,
+            "bypassed": self._bypassed,
+            "evictions": self._evictions,
+            "hit_ratio": (
+                round((self._hits + self._deduplicated) / lookups, 3)
+                if lookups
+                else 0.0
+            ),
+            "tokens_saved": self._tokens_saved,
+        }
+
+    def _lookup(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+_cache: Optional[StructuredOutputCache] = None
+
+
+def get_structured_output_cache() -> StructuredOutputCache:
+    """Get the process-wide structured output cache."""
+    global _cache
+    if _cache is None:
+        _cache = StructuredOutputCache()
+    return _cache
+
+
+def reset_structured_output_cache() -> None:
+    """Drop the process-wide cache and its counters (for tests)."""
+    global _cache
+    _cache = None
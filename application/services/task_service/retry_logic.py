@@ -32,6 +32,7 @@ def _reapply_task_updates(
     fresh_task.status = original_task.status
     fresh_task.progress = original_task.progress
     fresh_task.progress_messages = copy.deepcopy(original_task.progress_messages)
+    fresh_task.workflow_cache = copy.deepcopy(original_task.workflow_cache)
     fresh_task.started_at = original_task.started_at
     fresh_task.completed_at = original_task.completed_at
     fresh_task.result = original_task.result
@@ -6,6 +6,7 @@ while using the new configuration manager under the hood.
 """
 
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -90,6 +91,13 @@ JAVA_REPOSITORY_NAME = os.getenv("JAVA_REPOSITORY_NAME", "java-client-template")
 CLIENT_GIT_BRANCH = os.getenv("CLIENT_GIT_BRANCH", "main")
 CLONE_REPO = os.getenv("CLONE_REPO", "false").lower() == "true"
 
+# Tracing Configuration
+# Spans around Cyoda HTTP calls, repository and entity service methods
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+# Log Cyoda request/response bodies at DEBUG (off by default; bodies can be large)
+LOG_CYODA_PAYLOADS = os.getenv("LOG_CYODA_PAYLOADS", "false").lower() == "true"
+
 # Testing Configuration
 ADK_TEST_MODE = os.getenv("ADK_TEST_MODE", "false").lower() == "true"
 
@@ -97,6 +105,54 @@ ADK_TEST_MODE = os.getenv("ADK_TEST_MODE", "false").lower() == "true"
 AI_MODEL = os.getenv("AI_MODEL", "gemini-2.0-flash-exp")
 AI_SDK = os.getenv("AI_SDK", "google")  # "google" or "openai"
 
+# Provider-side caching of the static instruction prefix (agents send it as
+# the system instruction, ahead of the conversation): Gemini context caches
+# for requests of at least PROMPT_CACHE_MIN_TOKENS, kept PROMPT_CACHE_TTL_SECONDS,
+# and cache_control breakpoints for Anthropic models via LiteLLM. OpenAI
+# caches stable prefixes automatically.
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "true").lower() == "true"
+PROMPT_CACHE_TTL_SECONDS = int(os.getenv("PROMPT_CACHE_TTL_SECONDS", "1800"))
+PROMPT_CACHE_MIN_TOKENS = int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "4096"))
+
+# Response cache for structured generations (canvas questions): identical
+# requests within STRUCTURED_OUTPUT_CACHE_TTL_SECONDS reuse the earlier answer.
+# Requests with temperature > 0 are only cached when
+# STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE is set, since they are not meant to
+# be repeatable
+STRUCTURED_OUTPUT_CACHE_ENABLED = (
+    os.getenv("STRUCTURED_OUTPUT_CACHE_ENABLED", "true").lower() == "true"
+)
+STRUCTURED_OUTPUT_CACHE_MAX_ENTRIES = int(
+    os.getenv("STRUCTURED_OUTPUT_CACHE_MAX_ENTRIES", "256")
+)
+STRUCTURED_OUTPUT_CACHE_TTL_SECONDS = float(
+    os.getenv("STRUCTURED_OUTPUT_CACHE_TTL_SECONDS", "600")
+)
+STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE = (
+    os.getenv("STRUCTURED_OUTPUT_CACHE_ANY_TEMPERATURE", "false").lower() == "true"
+)
+
+# When the coordinator/sub-agent graph is built: "background" (warm-up task
+# after startup), "lazy" (first chat) or "eager" (before the server binds)
+ASSISTANT_WARMUP = os.getenv("ASSISTANT_WARMUP", "background").lower()
+
+# Assistant pool: each chat turn leases one of these pre-built runners. The
+# pool warms ASSISTANT_POOL_SIZE of them and grows up to the model's limit
+# (ASSISTANT_MAX_CONCURRENCY, or a "model=limit,..." entry in
+# ASSISTANT_MODEL_CONCURRENCY); further turns queue for up to
+# ASSISTANT_LEASE_TIMEOUT seconds
+ASSISTANT_POOL_SIZE = int(os.getenv("ASSISTANT_POOL_SIZE", "2"))
+ASSISTANT_MAX_CONCURRENCY = int(os.getenv("ASSISTANT_MAX_CONCURRENCY", "8"))
+ASSISTANT_MODEL_CONCURRENCY = os.getenv("ASSISTANT_MODEL_CONCURRENCY", "")
+ASSISTANT_LEASE_TIMEOUT = float(os.getenv("ASSISTANT_LEASE_TIMEOUT", "30"))
+
+# Cached processor/criteria discovery, revalidated against the package files
+# on every start (empty disables the cache)
+PROCESSOR_MANIFEST_PATH = os.getenv(
+    "PROCESSOR_MANIFEST_PATH",
+    os.path.join(tempfile.gettempdir(), "cyoda_processor_manifest.json"),
+)
+
 # Code Generation CLI Configuration
 CLI_PROVIDER = os.getenv("CLI_PROVIDER", "augment")  # "augment", "claude", or "gemini"
 AUGMENT_MODEL = os.getenv(
@@ -117,6 +173,42 @@ CLAUDE_MAX_TOOL_CALLS = os.getenv(
     "CLAUDE_MAX_TOOL_CALLS", "100"
 )  # Default: 100 tool calls (use "0" or "unlimited" to disable)
 
+# CLI job scheduling
+# Pod budget shared by CLI code-generation/build processes; when neither budget
+# is set the scheduler falls back to CLI_DEFAULT_MAX_JOBS concurrent jobs
+CLI_POD_CPU_BUDGET = os.getenv("CLI_POD_CPU_BUDGET")  # cores
+CLI_POD_MEMORY_BUDGET_MB = os.getenv("CLI_POD_MEMORY_BUDGET_MB")
+CLI_DEFAULT_MAX_JOBS = int(os.getenv("CLI_DEFAULT_MAX_JOBS", "5"))
+# Per-job reservation, also applied as rlimits on each CLI process (0 disables)
+CLI_JOB_CPU_CORES = float(os.getenv("CLI_JOB_CPU_CORES", "1"))
+CLI_JOB_MEMORY_MB = int(os.getenv("CLI_JOB_MEMORY_MB", "4096"))
+CLI_JOB_CPU_SECONDS = int(os.getenv("CLI_JOB_CPU_SECONDS", "3600"))
+# Queued jobs are heartbeated by the pod that queued them; another pod fails a
+# queued job only once its heartbeat is older than this
+CLI_QUEUED_JOB_STALE_SECONDS = float(os.getenv("CLI_QUEUED_JOB_STALE_SECONDS", "300"))
+
+# Progress commits during CLI builds: commit once the working tree has been
+# quiet for the debounce window, or has kept changing for the max delay
+CLI_COMMIT_DEBOUNCE_SECONDS = float(os.getenv("CLI_COMMIT_DEBOUNCE_SECONDS", "20"))
+CLI_COMMIT_MAX_DELAY_SECONDS = float(os.getenv("CLI_COMMIT_MAX_DELAY_SECONDS", "300"))
+
+# CLI process output: in-memory tail per process, full log spooled to disk,
+# and how often the tail is checkpointed into the BackgroundTask entity
+CLI_OUTPUT_BUFFER_BYTES = int(os.getenv("CLI_OUTPUT_BUFFER_BYTES", str(256 * 1024)))
+CLI_OUTPUT_SPOOL_DIR = os.getenv(
+    "CLI_OUTPUT_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "cyoda_cli_output")
+)
+CLI_OUTPUT_CHECKPOINT_SECONDS = float(os.getenv("CLI_OUTPUT_CHECKPOINT_SECONDS", "30"))
+
+# Chat attachments: uploads are read and stored in chunks of this size (one
+# edge message per chunk), with this many chunk writes in flight per upload
+ATTACHMENT_CHUNK_BYTES = int(os.getenv("ATTACHMENT_CHUNK_BYTES", str(1024 * 1024)))
+ATTACHMENT_UPLOAD_CONCURRENCY = int(os.getenv("ATTACHMENT_UPLOAD_CONCURRENCY", "4"))
+# Digest index entries each process keeps in memory (least recently used dropped)
+ATTACHMENT_INDEX_CACHE_ENTRIES = int(
+    os.getenv("ATTACHMENT_INDEX_CACHE_ENTRIES", "1024")
+)
+
 # Constants
 CYODA_ENTITY_TYPE_EDGE_MESSAGE = "EDGE_MESSAGE"
 GENERAL_MEMORY_TAG = "general"
@@ -13,6 +13,12 @@ CHAT_LIST_DEFAULT_LIMIT = 100
 # Maximum limit for paginated requests
 CHAT_LIST_MAX_LIMIT = 1000
 
+# Concurrent conversation updates when transferring guest chats
+CHAT_TRANSFER_CONCURRENCY = 8
+
+# Guest chat transfers above this many chats run as a background task
+CHAT_TRANSFER_BACKGROUND_THRESHOLD = 20
+
 # ============================================================================
 # Retry Configuration
 # ============================================================================
@@ -23,10 +29,77 @@ MAX_CONVERSATION_UPDATE_RETRIES = 5
 # Base delay for exponential backoff retry logic (seconds)
 RETRY_BASE_DELAY_SECONDS = 0.1
 
+# ============================================================================
+# HTTP Timeout Configuration
+# ============================================================================
+
+# Default timeout for HTTP requests (seconds)
+DEFAULT_HTTP_TIMEOUT_SECONDS = 30.0
+
+# Timeout for long-running HTTP requests (seconds)
+LONG_RUNNING_HTTP_TIMEOUT_SECONDS = 60.0
+
+# Timeout for health check requests (seconds)
+HEALTH_CHECK_TIMEOUT_SECONDS = 10.0
+
+# ============================================================================
+# Elasticsearch Configuration
+# ============================================================================
+
+# Elasticsearch API key expiry duration (days)
+API_KEY_EXPIRY_DAYS = 365
+
+# Maximum number of results returned by Elasticsearch queries
+ELASTICSEARCH_MAX_SIZE = 10000
+
+# Default page size for log search results
+ELASTICSEARCH_DEFAULT_SIZE = 50
+
+# Page size used when streaming hits with search_after
+ELASTICSEARCH_STREAM_PAGE_SIZE = 500
+
+# Upper bound on hits returned by a single streamed search
+ELASTICSEARCH_STREAM_MAX_HITS = 100000
+
+# Point-in-time keep-alive between page requests
+ELASTICSEARCH_PIT_KEEP_ALIVE = "2m"
+
+# Maximum pooled HTTP connections to Elasticsearch
+ELASTICSEARCH_MAX_CONNECTIONS = 16
+
+# Fields log aggregations can group by (public name -> keyword field)
+LOG_AGGREGATION_FIELDS = {
+    "level": "level.keyword",
+    "pod": "kubernetes.pod_name.keyword",
+}
+
+# Maximum number of terms returned per aggregation bucket
+LOG_AGGREGATION_MAX_TERMS = 50
+
+# ============================================================================
+# Namespace Inventory Configuration
+# ============================================================================
+
+# How long a cached Kubernetes namespace listing is served before refreshing (seconds)
+NAMESPACE_INVENTORY_REFRESH_SECONDS = 15
+
 __all__ = [
+    "API_KEY_EXPIRY_DAYS",
     "CACHE_TTL_SECONDS",
     "CHAT_LIST_DEFAULT_LIMIT",
     "CHAT_LIST_MAX_LIMIT",
+    "DEFAULT_HTTP_TIMEOUT_SECONDS",
+    "ELASTICSEARCH_DEFAULT_SIZE",
+    "ELASTICSEARCH_MAX_CONNECTIONS",
+    "ELASTICSEARCH_MAX_SIZE",
+    "ELASTICSEARCH_PIT_KEEP_ALIVE",
+    "ELASTICSEARCH_STREAM_MAX_HITS",
+    "ELASTICSEARCH_STREAM_PAGE_SIZE",
+    "HEALTH_CHECK_TIMEOUT_SECONDS",
+    "LOG_AGGREGATION_FIELDS",
+    "LOG_AGGREGATION_MAX_TERMS",
+    "LONG_RUNNING_HTTP_TIMEOUT_SECONDS",
     "MAX_CONVERSATION_UPDATE_RETRIES",
+    "NAMESPACE_INVENTORY_REFRESH_SECONDS",
     "RETRY_BASE_DELAY_SECONDS",
 ]
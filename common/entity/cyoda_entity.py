@@ -75,9 +75,8 @@ class CyodaEntity(BaseModel):
 
     def add_metadata(self, key: str, value: Any) -> None:
         """Add or update metadata field"""
-        if self.metadata is None:
-            self.metadata = {}
-        self.metadata[key] = value
+        # Assign rather than mutate so the change is tracked as a set field
+        self.metadata = {**(self.metadata or {}), key: value}
         self.update_timestamp()
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
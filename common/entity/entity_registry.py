@@ -0,0 +1,220 @@
+"""
+Entity class registry for decoding Cyoda payloads.
+
+Maps Cyoda model keys (``ENTITY_NAME`` / ``ENTITY_VERSION``) to the concrete
+CyodaEntity subclasses defined by the application, so calc request handlers
+can validate payloads directly into the concrete type instead of building a
+generic CyodaEntity that processors then have to cast (a second validation).
+
+The registry is populated at startup by the ProcessorManager, which scans the
+entity packages alongside its processor and criteria discovery.
+"""
+
+import importlib
+import inspect
+import logging
+import pkgutil
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from common.entity.cyoda_entity import CyodaEntity
+
+logger = logging.getLogger(__name__)
+
+
+class EntityRegistry:
+    """Registry of entity classes keyed by model name and version."""
+
+    def __init__(self) -> None:
+        self._classes: Dict[Tuple[str, Optional[int]], Type[CyodaEntity]] = {}
+
+    def register(
+        self,
+        entity_class: Type[CyodaEntity],
+        model_name: Optional[str] = None,
+        model_version: Optional[int] = None,
+    ) -> None:
+        """
+        Register an entity class.
+
+        Args:
+            entity_class: CyodaEntity subclass to decode payloads into
+            model_name: Model key name (defaults to the class ENTITY_NAME)
+            model_version: Model version (defaults to the class ENTITY_VERSION)
+        """
+        name = model_name or getattr(entity_class, "ENTITY_NAME", None)
+        if not name:
+            raise ValueError(f"{entity_class.__name__} has no ENTITY_NAME")
+        version = model_version or getattr(entity_class, "ENTITY_VERSION", None)
+
+        key = name.lower()
+        self._classes[(key, version)] = entity_class
+        # Requests without a version decode into the latest registered one
+        latest = self._classes.get((key, None))
+        if latest is None or (version or 0) >= (
+            getattr(latest, "ENTITY_VERSION", 0) or 0
+        ):
+            self._classes[(key, None)] = entity_class
+        logger.debug(f"Registered entity: {name} v{version} ({entity_class.__name__})")
+
+    def discover(self, modules: List[str]) -> None:
+        """
+        Register all entity classes found in the given modules or packages.
+
+        Args:
+            modules: Module names to scan for classes declaring ENTITY_NAME
+        """
+        for module_name in modules:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as e:
+                logger.warning(f"Could not import entity module '{module_name}': {e}")
+                continue
+
+            self._discover_from_single_module(module)
+            for _importer, modname, _ispkg in pkgutil.walk_packages(
+                getattr(module, "__path__", []), module.__name__ + "."
+            ):
+                try:
+                    self._discover_from_single_module(importlib.import_module(modname))
+                except Exception as e:
+                    logger.warning(f"Failed to import entity module '{modname}': {e}")
+
+    def _discover_from_single_module(self, module: ModuleType) -> None:
+        for _name, obj in inspect.getmembers(module, inspect.isclass):
+            if (
+                getattr(obj, "__module__", None) == module.__name__
+                and issubclass(obj, CyodaEntity)
+                and "ENTITY_NAME" in vars(obj)
+            ):
+                self.register(obj)
+
+    def resolve(
+        self, model_name: str, model_version: Optional[Any] = None
+    ) -> Type[CyodaEntity]:
+        """
+        Get the entity class for a model key.
+
+        Args:
+            model_name: Model key name (case-insensitive)
+            model_version: Model key version; falls back to the latest version
+
+        Returns:
+            The registered class, or CyodaEntity for unknown models
+        """
+        key = model_name.lower()
+        try:
+            version = int(model_version) if model_version is not None else None
+        except (TypeError, ValueError):
+            version = None
+        return (
+            self._classes.get((key, version))
+            or self._classes.get((key, None))
+            or CyodaEntity
+        )
+
+    def decode(
+        self,
+        model_name: str,
+        data: Dict[str, Any],
+        model_version: Optional[Any] = None,
+    ) -> CyodaEntity:
+        """
+        Validate a payload into the entity class registered for its model key.
+
+        Payloads that do not match the concrete schema are decoded as a generic
+        CyodaEntity, as before, leaving the processor to handle them.
+
+        Args:
+            model_name: Model key name
+            data: Entity payload data
+            model_version: Model key version
+
+        Returns:
+            The decoded entity
+
+        Raises:
+            ValueError: If the payload cannot be decoded at all
+        """
+        entity_class = self.resolve(model_name, model_version)
+        if entity_class is not CyodaEntity:
+            try:
+                return entity_class.model_validate(data)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Payload does not match {entity_class.__name__}, "
+                    f"decoding as CyodaEntity: {e}"
+                )
+        try:
+            return CyodaEntity.model_validate(data)
+        except Exception as e:
+            raise ValueError(
+                f"Failed to create entity of type '{model_name}': {e}"
+            ) from e
+
+    def list_entities(self) -> List[str]:
+        """List registered model keys as 'name' or 'name/version'."""
+        return [
+            name if version is None else f"{name}/{version}"
+            for name, version in self._classes
+        ]
+
+
+def _payload_key(entity: CyodaEntity, name: str, raw: Dict[str, Any]) -> str:
+    """Key a field is stored under: as in the payload, else its alias."""
+    field = type(entity).model_fields.get(name)
+    alias = field and (field.serialization_alias or field.alias)
+    if alias and (alias in raw or name not in raw):
+        return alias
+    return name
+
+
+def encode_entity(entity: CyodaEntity, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Serialize a processed entity back into its payload data.
+
+    Starts from the payload the entity was decoded from and only dumps fields
+    that were assigned after decoding or whose value is no longer the object
+    taken from the payload. Defaults generated during decoding (entity_id,
+    created_at, ...) are not added to the payload. Each field is written under
+    the key the payload used for it (its alias or its name); fields the
+    payload did not have are written under their alias.
+
+    Args:
+        entity: The processed entity
+        raw: Payload data the entity was decoded from
+
+    Returns:
+        Payload data for the response
+    """
+    keys = {name: _payload_key(entity, name, raw) for name in entity.model_fields_set}
+    changed = {
+        name
+        for name, key in keys.items()
+        if key not in raw or getattr(entity, name, None) is not raw[key]
+    }
+    data = dict(raw)
+    aliased = {name for name in changed if keys[name] != name}
+    if aliased:
+        data.update(entity.model_dump(include=aliased, by_alias=True))
+    if changed - aliased:
+        data.update(entity.model_dump(include=changed - aliased))
+    return data
+
+
+# Global registry instance
+_entity_registry: Optional[EntityRegistry] = None
+
+
+def get_entity_registry() -> EntityRegistry:
+    """Get or create the global entity registry."""
+    global _entity_registry
+    if _entity_registry is None:
+        _entity_registry = EntityRegistry()
+    return _entity_registry
+
+
+def reset_entity_registry() -> None:
+    """Drop the global entity registry (used by tests)."""
+    global _entity_registry
+    _entity_registry = None
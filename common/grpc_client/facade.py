@@ -27,6 +27,8 @@ class GrpcStreamingFacade:
         outbox: Outbox,
         first_middleware: MiddlewareLink,
         grpc_client: Any | None = None,
+        address: str | None = None,
+        channel_credentials: grpc.ChannelCredentials | None = None,
     ) -> None:
         self.auth = auth
         self.router = router
@@ -35,6 +37,9 @@ class GrpcStreamingFacade:
         self.first_middleware = first_middleware
         # Reference to original GrpcClient for backward compatibility
         self.grpc_client = grpc_client
+        # Overrides for GRPC_ADDRESS / SKIP_SSL (e.g. an in-process server)
+        self.address: str = address or GRPC_ADDRESS
+        self._channel_credentials = channel_credentials
         self._running: bool = False
 
     def metadata_callback(
@@ -61,7 +66,7 @@ class GrpcStreamingFacade:
             self.metadata_callback
         )
 
-        ssl_creds = (
+        ssl_creds = self._channel_credentials or (
             grpc.local_channel_credentials()
             if SKIP_SSL
             else grpc.ssl_channel_credentials()
@@ -99,7 +104,7 @@ class GrpcStreamingFacade:
                 ]
 
                 async with grpc.aio.secure_channel(
-                    GRPC_ADDRESS, creds, options=keepalive_opts
+                    self.address, creds, options=keepalive_opts
                 ) as channel:
                     # Generated stubs are untyped; suppress no-untyped-call for this line.
                     stub: Any = CloudEventsServiceStub(channel)  # type: ignore[no-untyped-call]
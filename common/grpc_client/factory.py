@@ -4,7 +4,9 @@ This contains all the complex logic moved out of GrpcClient.
 """
 
 import types
-from typing import Any
+from typing import Any, Optional
+
+import grpc
 
 from common.grpc_client.constants import (
     CALC_REQ_EVENT_TYPE,
@@ -44,16 +46,33 @@ class GrpcStreamingFacadeFactory:
 
     @staticmethod
     def create(
-        auth: Any, processor_loop: Any, grpc_client: Any = None
+        auth: Any,
+        processor_loop: Any,
+        grpc_client: Any = None,
+        processor_manager: Any = None,
+        address: Optional[str] = None,
+        channel_credentials: Optional[grpc.ChannelCredentials] = None,
     ) -> GrpcStreamingFacade:
-        """Create a fully configured GrpcStreamingFacade with all components."""
+        """
+        Create a fully configured GrpcStreamingFacade with all components.
+
+        Args:
+            auth: Auth service providing access tokens
+            processor_loop: Background event loop for processors
+            grpc_client: Owning GrpcClient (backward compatibility)
+            processor_manager: Processor manager (defaults to the service one)
+            address: gRPC address (defaults to GRPC_ADDRESS)
+            channel_credentials: Channel credentials (defaults to SSL/local)
+        """
+        if processor_manager is None:
+            # Import here to avoid circular imports
+            from services.services import get_processor_manager
 
-        # Import here to avoid circular imports
-        from services.services import get_processor_manager
+            processor_manager = get_processor_manager()
 
         # Create services object for handlers with processor manager
         services = types.SimpleNamespace(
-            processor_loop=processor_loop, processor_manager=get_processor_manager()
+            processor_loop=processor_loop, processor_manager=processor_manager
         )
 
         # Create and configure EventRouter with handlers
@@ -98,4 +117,6 @@ class GrpcStreamingFacadeFactory:
             outbox=outbox,
             first_middleware=first_middleware,
             grpc_client=grpc_client,
+            address=address,
+            channel_credentials=channel_credentials,
         )
@@ -1,8 +1,8 @@
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-from common.entity.entity_factory import create_entity
+from common.entity.entity_registry import encode_entity, get_entity_registry
 from common.exception.grpc_exceptions import (
     HandlerError,
     ProcessingError,
@@ -22,20 +22,22 @@ class CalcRequestHandler(Handler):
     ) -> Optional[ResponseSpec]:
         data = json.loads(request.text_data)
         processor_name = data.get("processorName")
+        raw_data = data["payload"]["data"]
 
-        # Get entity type from model key
-        model_key = data["payload"]["meta"]["modelKey"]["name"]
-        entity_type = model_key.lower()  # Convert to lowercase for our entity factory
+        # Use processor_manager from services
+        processor_manager = services.processor_manager if services else None
 
-        # Create entity using our factory system
-        try:
-            entity = create_entity(entity_type, data["payload"]["data"])
-        except ValueError:
-            logger.error(f"Unknown entity type: {entity_type}")
-            # Fallback: create a generic CyodaEntity
-            from common.entity.cyoda_entity import CyodaEntity
+        # Processors that accept raw dicts get the payload without pydantic
+        if processor_manager and processor_manager.accepts_raw_data(processor_name):
+            return await self._handle_raw(data, processor_manager)
 
-            entity = CyodaEntity(**data["payload"]["data"])
+        # Decode directly into the entity class registered for the model key
+        model_key = data["payload"]["meta"]["modelKey"]
+        entity_type = model_key["name"]
+        try:
+            entity = get_entity_registry().decode(
+                entity_type, raw_data, model_key.get("version")
+            )
         except Exception as e:
             raise ValidationError(
                 message=f"Failed to create entity of type '{entity_type}'",
@@ -56,8 +58,6 @@ class CalcRequestHandler(Handler):
                 f"[PROCESSING] Starting {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}, RequestId: {data.get('requestId')}"
             )
 
-            # Use processor_manager from services
-            processor_manager = services.processor_manager if services else None
             if not processor_manager:
                 raise HandlerError(
                     handler_name="CalcRequestHandler",
@@ -71,7 +71,7 @@ class CalcRequestHandler(Handler):
             )
 
             # Convert entity back to dict for response
-            data["payload"]["data"] = entity.to_dict()
+            data["payload"]["data"] = encode_entity(entity, raw_data)
             logger.info(
                 f"[PROCESSING] Success {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}"
             )
@@ -96,11 +96,46 @@ class CalcRequestHandler(Handler):
             entity.set_state("FAILED")
 
             # Convert entity back to dict for response
-            data["payload"]["data"] = entity.to_dict()
+            data["payload"]["data"] = encode_entity(entity, raw_data)
 
             # Re-raise the error to be handled by error middleware
             raise processing_error
 
+        return self._response(data)
+
+    async def _handle_raw(
+        self, data: Dict[str, Any], processor_manager: Any
+    ) -> ResponseSpec:
+        """Run a raw-data processor on the payload dict."""
+        processor_name = data.get("processorName")
+        payload_data = data["payload"]["data"]
+        try:
+            logger.info(
+                f"[PROCESSING] Starting {CALC_REQ_EVENT_TYPE} (raw) - Processor: {processor_name}, EntityId: {data['entityId']}, RequestId: {data.get('requestId')}"
+            )
+            data["payload"]["data"] = await processor_manager.process_entity(
+                processor_name=processor_name,
+                entity=payload_data,
+                technical_id=data["entityId"],
+                transition=data.get("transition", {}).get("name"),
+            )
+            logger.info(
+                f"[PROCESSING] Success {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}"
+            )
+        except Exception as e:
+            logger.error(
+                f"[PROCESSING] Error {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}"
+            )
+            raise ProcessingError(
+                processor_name=processor_name,
+                entity_id=data["entityId"],
+                message=str(e),
+                original_error=e,
+            )
+        return self._response(data)
+
+    @staticmethod
+    def _response(data: Dict[str, Any]) -> ResponseSpec:
         return ResponseSpec(
             response_type=CALC_RESP_EVENT_TYPE,
             data={
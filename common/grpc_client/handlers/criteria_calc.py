@@ -2,7 +2,7 @@ import json
 import logging
 from typing import Any, Optional
 
-from common.entity.entity_factory import create_entity
+from common.entity.entity_registry import get_entity_registry
 from common.grpc_client.constants import (
     CRITERIA_CALC_REQ_EVENT_TYPE,
     CRITERIA_CALC_RESP_EVENT_TYPE,
@@ -21,19 +21,11 @@ class CriteriaCalcRequestHandler(Handler):
         data = json.loads(request.text_data)
         criteria_name = data.get("criteriaName")
 
-        # Get entity type from model key
-        model_key = data["payload"]["meta"]["modelKey"]["name"]
-        entity_type = model_key.lower()  # Convert to lowercase for our entity factory
-
-        # Create entity using our factory system
-        try:
-            entity = create_entity(entity_type, data["payload"]["data"])
-        except ValueError:
-            logger.error(f"Unknown entity type: {entity_type}")
-            # Fallback: create a generic CyodaEntity
-            from common.entity.cyoda_entity import CyodaEntity
-
-            entity = CyodaEntity(**data["payload"]["data"])
+        # Decode directly into the entity class registered for the model key
+        model_key = data["payload"]["meta"]["modelKey"]
+        entity = get_entity_registry().decode(
+            model_key["name"], data["payload"]["data"], model_key.get("version")
+        )
 
         # Set technical_id from gRPC request
         entity.technical_id = data["entityId"]
@@ -56,9 +48,6 @@ class CriteriaCalcRequestHandler(Handler):
             matches = await processor_manager.check_criteria(
                 criteria_name=criteria_name, entity=entity
             )
-
-            # Convert entity back to dict for response (criteria checking might modify entity)
-            data["payload"]["data"] = entity.to_dict()
             logger.info(
                 f"[PROCESSING] Success {CRITERIA_CALC_REQ_EVENT_TYPE} - Criteria: {criteria_name}, EntityId: {data['entityId']}"
             )
@@ -73,9 +62,6 @@ class CriteriaCalcRequestHandler(Handler):
             entity.add_metadata("failed", True)
             entity.add_metadata("error_message", str(e))
             entity.set_state("FAILED")
-
-            # Convert entity back to dict for response
-            data["payload"]["data"] = entity.to_dict()
             matches = False
 
         return ResponseSpec(
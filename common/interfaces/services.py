@@ -219,6 +219,10 @@ class IProcessorManager(ABC):
         """Process an entity using the specified processor."""
         pass
 
+    def accepts_raw_data(self, processor_name: str) -> bool:
+        """Whether the processor takes the entity payload as a plain dict."""
+        return False
+
     @abstractmethod
     async def check_criteria(
         self, criteria_name: str, entity: CyodaEntity, **kwargs: Any
@@ -0,0 +1,223 @@
+"""
+Tracing spans for the Cyoda HTTP and repository hot path.
+
+Spans follow the OpenTelemetry API and are exported through an SDK tracer
+provider configured with ``configure_tracing``. Until tracing is configured
+every helper here returns a shared non-recording span without touching the
+OpenTelemetry machinery, so instrumented code pays only for a flag check.
+Attributes are plain sizes, counts and status codes; payload bodies are never
+recorded on spans and are only logged through ``log_payload`` when
+``LOG_CYODA_PAYLOADS`` is set.
+"""
+
+import functools
+import inspect
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from common.config.config import (
+    LOG_CYODA_PAYLOADS,
+    TRACING_ENABLED,
+    TRACING_SAMPLE_RATIO,
+)
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Tracer
+except ImportError:  # pragma: no cover - opentelemetry-api ships with google-adk
+    trace = None  # type: ignore[assignment]
+    Tracer = Any  # type: ignore[misc,assignment]
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "cyoda"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_tracer: Optional["Tracer"] = None
+_provider: Any = None
+
+
+class _NoOpSpan:
+    """Stand-in span used when tracing is off (or OpenTelemetry is missing)."""
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+
+_NOOP_SPAN: Any = trace.INVALID_SPAN if trace is not None else _NoOpSpan()
+
+
+def configure_tracing(
+    exporter: Any = None,
+    sample_ratio: float = TRACING_SAMPLE_RATIO,
+) -> bool:
+    """
+    Enable span recording with a dedicated SDK tracer provider.
+
+    Args:
+        exporter: SpanExporter receiving finished spans. Defaults to the OTLP
+            HTTP exporter (configured through the standard OTEL_* variables).
+            Tests pass an ``InMemorySpanExporter``.
+        sample_ratio: Fraction of root spans to record (0.0-1.0); child spans
+            follow their parent's decision.
+
+    Returns:
+        True if tracing was enabled.
+    """
+    global _tracer, _provider
+    try:
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            SimpleSpanProcessor,
+        )
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError:
+        logger.warning("⚠️ Tracing requested but opentelemetry-sdk is not installed")
+        return False
+
+    if exporter is None:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError:
+            logger.warning(
+                "⚠️ Tracing requested but no span exporter is available "
+                "(install opentelemetry-exporter-otlp-proto-http)"
+            )
+            return False
+        processor = BatchSpanProcessor(OTLPSpanExporter())
+    else:
+        # Export synchronously so tests see spans as soon as they end
+        processor = SimpleSpanProcessor(exporter)
+
+    reset_tracing()
+    _provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(sample_ratio)))
+    _provider.add_span_processor(processor)
+    _tracer = _provider.get_tracer(TRACER_NAME)
+    logger.info(f"📈 Tracing enabled (sample ratio {sample_ratio})")
+    return True
+
+
+def configure_tracing_from_env() -> bool:
+    """Enable tracing if ``TRACING_ENABLED`` is set."""
+    if not TRACING_ENABLED:
+        return False
+    return configure_tracing()
+
+
+def reset_tracing() -> None:
+    """Disable tracing and shut the provider down (flushes pending spans)."""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are currently being recorded."""
+    return _tracer is not None
+
+
+@contextmanager
+def traced(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Open a span around a block.
+
+    Exceptions are recorded on the span and re-raised. When tracing is off
+    the shared non-recording span is yielded; guard any attribute that is
+    expensive to compute with ``span.is_recording()``.
+
+    Args:
+        name: Span name, e.g. ``cyoda.http POST``.
+        attributes: Cheap attributes known up front.
+
+    Yields:
+        The active span.
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def traced_method(name: str) -> Callable[[F], F]:
+    """
+    Decorate an async method with a span.
+
+    Records ``entity.class`` (from an ``entity_class`` argument or the
+    ``entity_model`` of a repository ``meta`` argument) and, for list
+    results, ``result.count``.
+
+    Args:
+        name: Span name.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with traced(name) as span:
+                if span.is_recording():
+                    entity_class = _entity_class_of(signature, args, kwargs)
+                    if entity_class:
+                        span.set_attribute("entity.class", entity_class)
+                result = await func(*args, **kwargs)
+                if isinstance(result, list):
+                    span.set_attribute("result.count", len(result))
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _entity_class_of(
+    signature: inspect.Signature, args: Any, kwargs: Dict[str, Any]
+) -> Optional[str]:
+    try:
+        bound = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return None
+    if isinstance(bound.get("entity_class"), str):
+        return bound["entity_class"]
+    meta = bound.get("meta")
+    if isinstance(meta, dict) and meta.get("entity_model"):
+        return str(meta["entity_model"])
+    return None
+
+
+def payload_size(payload: Any) -> Optional[int]:
+    """Size of a request/response body if known without serializing it."""
+    if isinstance(payload, (str, bytes, bytearray)):
+        return len(payload)
+    return None
+
+
+def log_payload(log: logging.Logger, message: str, payload: Callable[[], Any]) -> None:
+    """
+    Log a request/response body at DEBUG when payload logging is enabled.
+
+    ``payload`` is only called (and formatted) if the record will be emitted.
+
+    Args:
+        log: Logger to write to.
+        message: Message prefix.
+        payload: Zero-argument callable returning the body.
+    """
+    if LOG_CYODA_PAYLOADS and log.isEnabledFor(logging.DEBUG):
+        log.debug("%s: %s", message, payload())
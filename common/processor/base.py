@@ -4,7 +4,7 @@ Base classes for processors and criteria checkers.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict
 
 from common.entity.cyoda_entity import CyodaEntity
 
@@ -15,7 +15,16 @@ __all__ = ["CyodaProcessor", "CyodaCriteriaChecker", "CyodaEntity"]
 
 
 class CyodaProcessor(ABC):
-    """Base class for all entity processors."""
+    """
+    Base class for all entity processors.
+
+    Processors that set ``accepts_raw_data`` receive the entity payload as a
+    plain dict and return the (modified) dict, skipping pydantic validation
+    and serialization entirely. They get the request's ``technical_id`` and
+    ``transition`` name as keyword arguments.
+    """
+
+    accepts_raw_data: ClassVar[bool] = False
 
     def __init__(self, name: str, description: str = ""):
         """
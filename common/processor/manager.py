@@ -7,9 +7,11 @@ import inspect
 import logging
 import pkgutil
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type, Union
 
+from common.config.config import PROCESSOR_MANIFEST_PATH
 from common.entity.cyoda_entity import CyodaEntity
+from common.entity.entity_registry import get_entity_registry
 from common.interfaces.services import IProcessorManager
 
 from .base import CyodaCriteriaChecker, CyodaProcessor
@@ -19,6 +21,7 @@ from .errors import (
     ProcessorError,
     ProcessorNotFoundError,
 )
+from .manifest import DiscoveryManifest, package_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -28,22 +31,37 @@ class ProcessorManager(IProcessorManager):
     Manager for processors and criteria checkers with automatic discovery.
 
     This manager automatically discovers and registers processors and criteria checkers
-    from specified modules using OOP-friendly discovery methods.
+    from specified modules using OOP-friendly discovery methods. Entity classes
+    found in the entity modules are registered in the global entity registry so
+    calc requests are decoded directly into their concrete types.
     """
 
-    def __init__(self, modules: Optional[List[str]] = None) -> None:
+    def __init__(
+        self,
+        modules: Optional[List[str]] = None,
+        entity_modules: Optional[List[str]] = None,
+        manifest_path: Optional[str] = None,
+    ) -> None:
         """
         Initialize the processor manager.
 
         Args:
             modules: List of module names to scan for processors and criteria
+            entity_modules: List of module names to scan for entity classes
+            manifest_path: Discovery manifest file; when set, packages whose
+                files are unchanged are not walked again
         """
         self.processors: Dict[str, CyodaProcessor] = {}
         self.criteria: Dict[str, CyodaCriteriaChecker] = {}
         self.modules: List[str] = modules or []
+        self.entity_modules: List[str] = entity_modules or []
+        self._manifest = DiscoveryManifest(manifest_path) if manifest_path else None
 
         # Automatically discover and register processors and criteria
         self._discover_and_register()
+        if self._manifest is not None:
+            self._manifest.save()
+        get_entity_registry().discover(self.entity_modules)
 
     def _discover_and_register(self) -> None:
         """Discover and register all processors and criteria from specified modules."""
@@ -82,45 +100,101 @@ class ProcessorManager(IProcessorManager):
             package: The package to scan
         """
         package_name = package.__name__
+        fingerprint = ""
+        if self._manifest is not None:
+            fingerprint = package_fingerprint(package)
+            cached = self._manifest.lookup(package_name, fingerprint)
+            if cached is not None and self._register_cached_classes(cached):
+                logger.debug(f"Discovered {package_name} from manifest")
+                return
 
         # Walk through all modules in the package
+        found: List[str] = []
         for _importer, modname, _ispkg in pkgutil.walk_packages(
             getattr(package, "__path__", []), package_name + "."
         ):
             try:
                 module = importlib.import_module(modname)
-                self._discover_from_single_module(module)
+                found.extend(self._discover_from_single_module(module))
             except Exception as e:
                 logger.warning(f"Failed to import submodule '{modname}': {e}")
 
-    def _discover_from_single_module(self, module: ModuleType) -> None:
+        if self._manifest is not None:
+            self._manifest.store(package_name, fingerprint, found)
+
+    def _register_cached_classes(self, class_paths: List[str]) -> bool:
+        """
+        Import and register classes recorded in the discovery manifest.
+
+        Args:
+            class_paths: Dotted "module:Class" names
+
+        Returns:
+            False if any recorded class could not be loaded (the caller then
+            falls back to a full walk)
+        """
+        classes = []
+        for class_path in class_paths:
+            module_name, _, class_name = class_path.partition(":")
+            try:
+                classes.append(
+                    getattr(importlib.import_module(module_name), class_name)
+                )
+            except Exception as e:
+                logger.warning(f"Stale discovery manifest entry '{class_path}': {e}")
+                return False
+        for cls in classes:
+            self._register_class(cls)
+        return True
+
+    def _discover_from_single_module(self, module: ModuleType) -> List[str]:
         """
         Discover processors and criteria from a single module.
 
         Args:
             module: The module to scan
+
+        Returns:
+            Dotted "module:Class" names of the classes found
         """
+        found: List[str] = []
         # Get all classes from the module
-        for _name, obj in inspect.getmembers(module, inspect.isclass):
+        for name, obj in inspect.getmembers(module, inspect.isclass):
             # Skip if the class is not defined in this module
             if getattr(obj, "__module__", None) != module.__name__:
                 continue
+            if self._register_class(obj):
+                found.append(f"{module.__name__}:{name}")
+        return found
 
-            # Check if it's a processor
-            if (
-                issubclass(obj, CyodaProcessor)
-                and obj is not CyodaProcessor
-                and not inspect.isabstract(obj)
-            ):
-                self._register_processor_class(obj)
-
-            # Check if it's a criteria checker
-            elif (
-                issubclass(obj, CyodaCriteriaChecker)
-                and obj is not CyodaCriteriaChecker
-                and not inspect.isabstract(obj)
-            ):
-                self._register_criteria_class(obj)
+    def _register_class(self, obj: type) -> bool:
+        """
+        Register a class if it is a concrete processor or criteria checker.
+
+        Args:
+            obj: Candidate class
+
+        Returns:
+            True if the class is a processor or criteria checker
+        """
+        # Check if it's a processor
+        if (
+            issubclass(obj, CyodaProcessor)
+            and obj is not CyodaProcessor
+            and not inspect.isabstract(obj)
+        ):
+            self._register_processor_class(obj)
+            return True
+
+        # Check if it's a criteria checker
+        if (
+            issubclass(obj, CyodaCriteriaChecker)
+            and obj is not CyodaCriteriaChecker
+            and not inspect.isabstract(obj)
+        ):
+            self._register_criteria_class(obj)
+            return True
+        return False
 
     def _register_processor_class(self, processor_class: Type[CyodaProcessor]) -> None:
         """
@@ -194,15 +268,31 @@ class ProcessorManager(IProcessorManager):
         self.criteria[criteria.name] = criteria
         logger.debug(f"Registered criteria: {criteria.name}")
 
+    def accepts_raw_data(self, processor_name: str) -> bool:
+        """
+        Check whether a processor takes the entity payload as a plain dict.
+
+        Args:
+            processor_name: Name of the processor
+
+        Returns:
+            True if the processor declares ``accepts_raw_data``
+        """
+        processor = self.processors.get(processor_name)
+        return bool(processor and processor.accepts_raw_data)
+
     async def process_entity(
-        self, processor_name: str, entity: CyodaEntity, **kwargs: Any
-    ) -> CyodaEntity:
+        self,
+        processor_name: str,
+        entity: Union[CyodaEntity, Dict[str, Any]],
+        **kwargs: Any,
+    ) -> Union[CyodaEntity, Dict[str, Any]]:
         """
         Process an entity using the specified processor.
 
         Args:
             processor_name: Name of the processor to use
-            entity: The entity to process
+            entity: The entity to process (payload dict for raw-data processors)
             **kwargs: Additional processing parameters
 
         Returns:
@@ -226,7 +316,11 @@ class ProcessorManager(IProcessorManager):
                 processor_name=processor_name,
                 message=str(e),
                 original_error=e,
-                entity_id=entity.entity_id,
+                entity_id=(
+                    entity.get("entity_id")
+                    if isinstance(entity, dict)
+                    else entity.entity_id
+                ),
             )
 
     async def check_criteria(
@@ -289,13 +383,17 @@ class ProcessorManager(IProcessorManager):
 _processor_manager: Optional[ProcessorManager] = None
 
 
-def get_processor_manager(modules: Optional[List[str]] = None) -> ProcessorManager:
+def get_processor_manager(
+    modules: Optional[List[str]] = None, entity_modules: Optional[List[str]] = None
+) -> ProcessorManager:
     """
     Get the global processor manager instance.
 
     Args:
         modules: List of module names to scan for processors and criteria.
                 If None and no global instance exists, uses default modules.
+        entity_modules: List of module names to scan for entity classes.
+                If None and no global instance exists, uses default modules.
 
     Returns:
         The global processor manager instance
@@ -311,6 +409,10 @@ def get_processor_manager(modules: Optional[List[str]] = None) -> ProcessorManag
                 "example_application.processor",
                 "example_application.criterion",
             ]
-        _processor_manager = ProcessorManager(modules)
+        if entity_modules is None:
+            entity_modules = ["application.entity", "example_application.entity"]
+        _processor_manager = ProcessorManager(
+            modules, entity_modules, manifest_path=PROCESSOR_MANIFEST_PATH or None
+        )
 
     return _processor_manager
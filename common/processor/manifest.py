@@ -0,0 +1,126 @@
+"""
+On-disk cache of processor and criteria discovery results.
+
+Discovery walks every submodule of the configured packages and imports each
+one to look for processor and criteria classes. The manifest records which
+classes were found where, keyed by a fingerprint of the package's source files
+(path, size and mtime). While the fingerprint matches, the manager imports only
+the modules that actually define processors or criteria and skips the walk.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from types import ModuleType
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def package_fingerprint(package: ModuleType) -> str:
+    """
+    Fingerprint the source files of a package.
+
+    Args:
+        package: Imported package module
+
+    Returns:
+        Hex digest that changes when any .py file under the package is added,
+        removed or modified
+    """
+    digest = hashlib.sha256()
+    for root_dir in sorted(getattr(package, "__path__", [])):
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                relative = os.path.relpath(path, root_dir)
+                digest.update(
+                    f"{relative}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+                )
+    return digest.hexdigest()
+
+
+class DiscoveryManifest:
+    """Per-package record of discovered processor and criteria classes."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Load the manifest from disk (a missing or unreadable file is empty).
+
+        Args:
+            path: JSON file to read and write
+        """
+        self.path = path
+        self._packages: Dict[str, Dict[str, object]] = {}
+        self._dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self._packages = data.get("packages", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable discovery manifest {path}: {e}")
+
+    def lookup(self, package_name: str, fingerprint: str) -> Optional[List[str]]:
+        """
+        Get the cached classes of a package if its files are unchanged.
+
+        Args:
+            package_name: Dotted package name
+            fingerprint: Current package_fingerprint() of the package
+
+        Returns:
+            Dotted "module:Class" names, or None if there is no valid entry
+        """
+        entry = self._packages.get(package_name)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        classes = entry.get("classes")
+        return list(classes) if isinstance(classes, list) else None
+
+    def store(self, package_name: str, fingerprint: str, classes: List[str]) -> None:
+        """
+        Record the classes discovered in a package.
+
+        Args:
+            package_name: Dotted package name
+            fingerprint: package_fingerprint() the classes were found with
+            classes: Dotted "module:Class" names
+        """
+        entry = {"fingerprint": fingerprint, "classes": sorted(classes)}
+        if self._packages.get(package_name) != entry:
+            self._packages[package_name] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if it changed (atomically; errors are logged)."""
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": MANIFEST_VERSION, "packages": self._packages},
+                    f,
+                    indent=2,
+                    sort_keys=True,
+                )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write discovery manifest {self.path}: {e}")
@@ -10,8 +10,23 @@ import json
 import logging
 import threading
 import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, cast
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import httpx
 
 from common.config.config import CYODA_API_URL, CYODA_ENTITY_TYPE_EDGE_MESSAGE
 from common.config.conts import (
@@ -19,14 +34,39 @@ from common.config.conts import (
     TREE_NODE_ENTITY_CLASS,
     UPDATE_TRANSITION,
 )
+from common.performance.tracing import log_payload, traced_method
 from common.repository.crud_repository import CrudRepository
-from common.utils.utils import custom_serializer, send_cyoda_request
+from common.utils.utils import (
+    custom_serializer,
+    iter_json_rows,
+    open_streaming_request,
+    send_cyoda_request,
+)
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache for edge-message entities
+# In-memory cache for edge-message entities (skipped for metas with
+# "cache": False, e.g. attachment chunks)
 _edge_messages_cache: Dict[str, Any] = {}
 
+# Row cap of the direct search endpoint
+DIRECT_SEARCH_MAX_ROWS = 10000
+
+# Snapshot paging: rows per page and pages fetched ahead of the consumer
+SNAPSHOT_PAGE_SIZE = 1000
+SNAPSHOT_PREFETCH_PAGES = 2
+
+# Snapshot status polling backs off from the initial to the maximum interval
+SNAPSHOT_POLL_INITIAL_INTERVAL = 0.05
+SNAPSHOT_POLL_MAX_INTERVAL = 1.0
+
+
+class SearchStrategy(str, Enum):
+    """How find_all_by_criteria executes a search."""
+
+    DIRECT = "direct"
+    SNAPSHOT = "snapshot"
+
 
 class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
     """
@@ -102,9 +142,19 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         return out
 
     async def _wait_for_search_completion(
-        self, snapshot_id: str, timeout: float = 60.0, interval: float = 0.3
+        self,
+        snapshot_id: str,
+        timeout: float = 60.0,
+        interval: float = SNAPSHOT_POLL_INITIAL_INTERVAL,
+        max_interval: float = SNAPSHOT_POLL_MAX_INTERVAL,
     ) -> None:
-        """Poll the snapshot status endpoint until SUCCESSFUL or error/timeout."""
+        """
+        Poll the snapshot status endpoint until SUCCESSFUL or error/timeout.
+
+        The poll interval starts at ``interval`` and doubles up to
+        ``max_interval``, so small snapshots are picked up quickly without
+        hammering the status endpoint for large ones.
+        """
         start = time.monotonic()
         status_path = f"search/snapshot/{snapshot_id}/status"
 
@@ -125,11 +175,13 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
             if time.monotonic() - start > timeout:
                 raise TimeoutError(f"Timeout exceeded after {timeout} seconds")
             await asyncio.sleep(interval)
+            interval = min(interval * 2, max_interval)
 
     # -----------------------
     # CRUD Repository Methods
     # -----------------------
 
+    @traced_method("cyoda.repository.find_by_id")
     async def find_by_id(
         self,
         meta: Optional[Dict[str, Any]],
@@ -139,7 +191,8 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         """Find entity by ID, optionally at a specific point in time."""
         if meta and meta.get("type") == CYODA_ENTITY_TYPE_EDGE_MESSAGE:
             key = str(entity_id)
-            if key in _edge_messages_cache:
+            cache = meta.get("cache", True)
+            if cache and key in _edge_messages_cache:
                 return _edge_messages_cache[key]
             path = f"message/{entity_id}"
             resp: Dict[str, Any] = await send_cyoda_request(
@@ -151,7 +204,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
             content = resp.get("json", {}).get("content", "{}")
             parsed = self._json_loads_or_empty(content)
             data = parsed.get("edge_message_content")
-            if data is not None:
+            if cache and data is not None:
                 _edge_messages_cache[key] = data
             return data
 
@@ -183,6 +236,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         payload_data["technical_id"] = entity_id
         return payload_data
 
+    @traced_method("cyoda.repository.find_all")
     async def find_all(self, meta: Dict[str, Any]) -> List[Any]:
         """Find all entities of a specific model."""
         path = f"entity/{meta['entity_model']}/{meta['entity_version']}"
@@ -200,6 +254,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         json_data = resp.get("json", [])
         return json_data if isinstance(json_data, list) else []
 
+    @traced_method("cyoda.repository.find_all_by_criteria")
     async def find_all_by_criteria(
         self,
         meta: Dict[str, Any],
@@ -209,79 +264,285 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         offset: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Find entities matching specific criteria, optionally at a specific point in time."""
-        import time
-
         start_time = time.time()
+        result = [
+            entity
+            async for entity in self.iter_all_by_criteria(
+                meta, criteria, point_in_time, limit, offset
+            )
+        ]
+        logger.info(
+            f"✅ Search completed: found {len(result)} entities in "
+            f"{time.time() - start_time:.3f}s"
+        )
+        return result
 
-        # Use direct search endpoint: POST /search/{entityName}/{modelVersion}
-        search_path = f"search/{meta['entity_model']}/{meta['entity_version']}"
+    async def iter_all_by_criteria(
+        self,
+        meta: Dict[str, Any],
+        criteria: Any,
+        point_in_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield entities matching criteria as they arrive.
 
-        # Build query parameters
-        query_params = []
+        Bounded queries with ``offset + limit`` up to DIRECT_SEARCH_MAX_ROWS
+        (such as key lookups) stream NDJSON rows from the direct endpoint.
+        Queries without a limit, or asking for more rows than the direct
+        endpoint returns, create a search snapshot and page through it.
+        """
+        search_criteria: Dict[str, Any] = self._ensure_cyoda_format(criteria)
+        strategy = self._select_search_strategy(limit, offset)
+        logger.info(
+            f"🔍 {strategy.value} search on {meta['entity_model']} "
+            f"(limit={limit}, offset={offset})"
+        )
 
-        # Add clientPointTime parameter if provided (for cursor-based pagination)
-        # This gets entities created/updated BEFORE this timestamp
-        if point_in_time:
-            pit_str = point_in_time.isoformat()
-            query_params.append(f"clientPointTime={pit_str}")
+        if strategy is SearchStrategy.SNAPSHOT:
+            rows = self._iter_snapshot_search(
+                meta, search_criteria, point_in_time, limit, offset or 0
+            )
+        else:
+            rows = self._iter_direct_search(
+                meta, search_criteria, point_in_time, limit, offset or 0
+            )
 
-        # Add limit parameter if provided (Cyoda default is 1000, max is 10000)
-        if limit is not None:
-            query_params.append(f"limit={min(limit, 10000)}")
+        async for entity in rows:
+            yield self._ensure_technical_id_on_entities([entity])[0]
+
+    @staticmethod
+    def _select_search_strategy(
+        limit: Optional[int], offset: Optional[int]
+    ) -> SearchStrategy:
+        """Pick the direct endpoint only when it can return every row asked for.
+
+        The direct endpoint answers in one round trip but stops at
+        DIRECT_SEARCH_MAX_ROWS, so a search without a limit would silently
+        lose rows past the cap; it goes through a snapshot instead.
+        """
+        if limit is None or (offset or 0) + limit > DIRECT_SEARCH_MAX_ROWS:
+            return SearchStrategy.SNAPSHOT
+        return SearchStrategy.DIRECT
 
-        # Note: We don't use offset with clientPointTime (cursor-based pagination)
-        # offset is only for traditional pagination which we're not using
+    async def _iter_direct_search(
+        self,
+        meta: Dict[str, Any],
+        search_criteria: Dict[str, Any],
+        point_in_time: Optional[datetime],
+        limit: Optional[int],
+        offset: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream rows from POST search/{model}/{version}.
+
+        The endpoint has no offset, so ``offset + limit`` rows are requested
+        and the first ``offset`` are skipped.
+        """
+        search_path = f"search/{meta['entity_model']}/{meta['entity_version']}"
 
-        # Append query parameters to path
+        query_params = []
+        # clientPointTime returns entities as of that timestamp
+        if point_in_time:
+            query_params.append(f"clientPointTime={point_in_time.isoformat()}")
+        if limit is not None:
+            query_params.append(f"limit={min(offset + limit, DIRECT_SEARCH_MAX_ROWS)}")
         if query_params:
             search_path = f"{search_path}?{'&'.join(query_params)}"
 
-        logger.info(f"🔍 Using DIRECT IN-MEMORY search endpoint: POST /{search_path}")
+        search_data = json.dumps(search_criteria, default=custom_serializer)
+        log_payload(logger, f"🔍 POST /{search_path} body", lambda: search_data)
 
-        # Convert criteria to Cyoda-native format if needed
-        search_criteria: Dict[str, Any] = self._ensure_cyoda_format(criteria)
+        async with self._open_search_stream(search_path, search_data) as response:
+            if response.status_code != 200:
+                error_detail = (await response.aread()).decode(errors="replace")
+                logger.warning(
+                    f"❌ Direct search failed with status {response.status_code}: "
+                    f"{error_detail}"
+                )
+                return
 
-        logger.info(
-            f"🔍 Final search criteria: {json.dumps(search_criteria, indent=2)}"
+            position = 0
+            async for row in iter_json_rows(response):
+                if not isinstance(row, dict):
+                    continue
+                position += 1
+                if position <= offset:
+                    continue
+                yield row
+                if limit is not None and position - offset >= limit:
+                    return
+
+    async def _iter_snapshot_search(
+        self,
+        meta: Dict[str, Any],
+        search_criteria: Dict[str, Any],
+        point_in_time: Optional[datetime],
+        limit: Optional[int],
+        offset: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Create a search snapshot and page through it with bounded prefetch.
+
+        Falls back to the direct endpoint if the snapshot cannot be created.
+        """
+        snapshot_id = await self._create_search_snapshot(
+            meta, search_criteria, point_in_time
         )
+        if not snapshot_id:
+            async for row in self._iter_direct_search(
+                meta, search_criteria, point_in_time, limit, offset
+            ):
+                yield row
+            return
+        await self._wait_for_search_completion(snapshot_id)
+
+        page_size = SNAPSHOT_PAGE_SIZE
+        skip = offset % page_size
+        remaining = limit
+        async for row in self._iter_snapshot_pages(
+            snapshot_id, offset // page_size, page_size
+        ):
+            if skip:
+                skip -= 1
+                continue
+            yield row
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
 
-        search_data = json.dumps(search_criteria, default=custom_serializer)
-        full_url = f"{self._api_url or CYODA_API_URL}/{search_path}"
-        logger.info(f"🔍 Sending request to: POST {full_url}")
-        logger.info(f"🔍 Request body: {search_data}")
+    async def _create_search_snapshot(
+        self,
+        meta: Dict[str, Any],
+        search_criteria: Dict[str, Any],
+        point_in_time: Optional[datetime],
+    ) -> Optional[str]:
+        """Start an async search; returns the snapshot ID or None on failure."""
+        path = f"search/snapshot/{meta['entity_model']}/{meta['entity_version']}"
+        if point_in_time:
+            path = f"{path}?pointInTime={point_in_time.isoformat()}"
 
         resp = await self._send_search_request(
-            method="post", path=search_path, data=search_data
+            method="post",
+            path=path,
+            data=json.dumps(search_criteria, default=custom_serializer),
         )
-
-        elapsed_time = time.time() - start_time
-
-        logger.info(f"🔍 Response status: {resp.get('status')}")
-        logger.info(f"🔍 Response JSON length: {len(resp.get('json', []))} items")
-
         if resp.get("status") != 200:
-            error_detail = resp.get("json", resp.get("content", "No error details"))
             logger.warning(
-                f"❌ Direct search failed with status {resp.get('status')} (took {elapsed_time:.3f}s)"
+                f"❌ Snapshot search failed with status {resp.get('status')}: "
+                f"{resp.get('json')}"
             )
-            logger.warning(f"❌ Error details: {error_detail}")
-            return []
+            return None
 
-        # Handle the response - it should be a list of entities
-        entities_any = resp.get("json", [])
-        entities = self._coerce_list_of_dicts(entities_any)
-        result = self._ensure_technical_id_on_entities(entities)
+        snapshot = resp.get("json")
+        if isinstance(snapshot, dict):
+            snapshot = snapshot.get("snapshotId") or snapshot.get("id")
+        return str(snapshot) if snapshot else None
+
+    async def _iter_snapshot_pages(
+        self, snapshot_id: str, first_page: int, page_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield snapshot rows page by page, keeping a few pages in flight."""
+        pending: Deque["asyncio.Future[Tuple[List[Dict[str, Any]], Optional[int]]]"]
+        pending = deque()
+        next_page = first_page
+        total_pages: Optional[int] = None
+
+        def schedule() -> None:
+            nonlocal next_page
+            while len(pending) <= SNAPSHOT_PREFETCH_PAGES and (
+                total_pages is None or next_page < total_pages
+            ):
+                pending.append(
+                    asyncio.ensure_future(
+                        self._fetch_snapshot_page(snapshot_id, next_page, page_size)
+                    )
+                )
+                next_page += 1
 
-        logger.info(
-            f"✅ Direct search completed: found {len(result)} entities in {elapsed_time:.3f}s"
+        try:
+            schedule()
+            while pending:
+                rows, pages = await pending.popleft()
+                if pages is not None:
+                    total_pages = pages
+                for row in rows:
+                    yield row
+                if len(rows) < page_size:
+                    return
+                schedule()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _fetch_snapshot_page(
+        self, snapshot_id: str, page_number: int, page_size: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one snapshot page; returns (rows, total pages if reported)."""
+        resp = await send_cyoda_request(
+            cyoda_auth_service=self._cyoda_auth_service,
+            method="get",
+            path=(
+                f"search/snapshot/{snapshot_id}"
+                f"?pageSize={page_size}&pageNumber={page_number}"
+            ),
+            base_url=self._api_url or CYODA_API_URL,
         )
+        if resp.get("status") != 200:
+            raise Exception(
+                f"Snapshot page {page_number} failed with status {resp.get('status')}"
+            )
 
-        return result
+        body = resp.get("json")
+        if isinstance(body, dict):
+            page_info = body.get("page") or {}
+            total_pages = page_info.get("totalPages")
+            return self._coerce_list_of_dicts(body.get("content")), total_pages
+        return self._coerce_list_of_dicts(body), None
 
     # -----------------------
     # Internal HTTP utilities
     # -----------------------
 
+    @staticmethod
+    def _search_headers(token: str) -> Dict[str, str]:
+        """Headers for search endpoints (NDJSON preferred)."""
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/x-ndjson, application/json",
+            "Authorization": (
+                f"Bearer {token}" if not token.startswith("Bearer") else token
+            ),
+        }
+
+    @asynccontextmanager
+    async def _open_search_stream(
+        self, path: str, data: str
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        POST a search and yield the unread response for streaming.
+
+        Retries once on 401 by refreshing tokens, like _send_search_request.
+        """
+        url = f"{self._api_url or CYODA_API_URL}/{path}"
+        token: str = await self._cyoda_auth_service.get_access_token()
+
+        for attempt in range(2):
+            async with open_streaming_request(
+                self._search_headers(token), url, "post", data=data
+            ) as response:
+                if attempt == 0 and response.status_code == 401:
+                    logger.warning(
+                        f"Response from {path} returned status 401; invalidating tokens and retrying"
+                    )
+                    self._cyoda_auth_service.invalidate_tokens()
+                    token = await self._cyoda_auth_service.get_access_token()
+                    continue
+                yield response
+                return
+
+        raise RuntimeError(f"Failed request POST {path} after retry")
+
     async def _send_search_request(
         self,
         method: str,
@@ -302,36 +563,20 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         token: str = await self._cyoda_auth_service.get_access_token()
 
         for attempt in range(2):
-            # Prepare headers for search endpoint
-            headers: Dict[str, str] = {
-                "Content-Type": "application/json",
-                "Accept": "application/x-ndjson, application/json",
-                "Authorization": (
-                    f"Bearer {token}" if not token.startswith("Bearer") else token
-                ),
-            }
+            headers = self._search_headers(token)
 
             url = f"{base_url}/{path}"
-
-            # DEBUG: Log the actual request being sent
-            logger.info(f"🔍 SENDING TO CYODA: {method.upper()} {url}")
-            logger.info(f"🔍 Headers: {headers}")
-            logger.info(f"🔍 Body: {data}")
+            log_payload(logger, f"🔍 {method.upper()} {url} body", lambda: data)
 
             # Send request (transport errors bubble up; we only handle 401 responses here)
             response: Dict[str, Any] = await send_request(
                 headers, url, method, data=data
             )
-
-            # DEBUG: Log the response
-            logger.info(f"🔍 RESPONSE STATUS: {response.get('status')}")
-            resp_body = response.get("json", response.get("content", "NO CONTENT"))
-            if isinstance(resp_body, list):
-                logger.info(f"🔍 RESPONSE: List with {len(resp_body)} items")
-                if len(resp_body) > 0:
-                    logger.info(f"🔍 First item: {resp_body[0]}")
-            else:
-                logger.info(f"🔍 RESPONSE BODY: {resp_body}")
+            log_payload(
+                logger,
+                f"🔍 {method.upper()} {url} status {response.get('status')} response",
+                lambda: response.get("json"),
+            )
 
             status = response.get("status") if isinstance(response, dict) else None
             if attempt == 0 and status == 401:
@@ -378,6 +623,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
     # Mutations
     # -----------------------
 
+    @traced_method("cyoda.repository.save")
     async def save(self, meta: Dict[str, Any], entity: Any) -> Optional[str]:
         """Save a single entity."""
         if meta.get("type") == CYODA_ENTITY_TYPE_EDGE_MESSAGE:
@@ -393,7 +639,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
                 f"entity/JSON/{meta['entity_model']}/{meta['entity_version']}"
                 "?waitForConsistencyAfter=true"
             )
-            logger.info(f"DEBUG: Sending payload to Cyoda: {data}")  # Debug logging
+            log_payload(logger, "Sending payload to Cyoda", lambda: data)
 
         resp: Dict[str, Any] = await send_cyoda_request(
             cyoda_auth_service=self._cyoda_auth_service,
@@ -410,11 +656,16 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         result = resp.get("json", [])
         technical_id = self._extract_technical_id_from_result(result)
 
-        if meta.get("type") == CYODA_ENTITY_TYPE_EDGE_MESSAGE and technical_id:
+        if (
+            meta.get("type") == CYODA_ENTITY_TYPE_EDGE_MESSAGE
+            and technical_id
+            and meta.get("cache", True)
+        ):
             _edge_messages_cache[technical_id] = entity
 
         return technical_id
 
+    @traced_method("cyoda.repository.save_all")
     async def save_all(
         self, meta: Dict[str, Any], entities: List[Any]
     ) -> Optional[str]:
@@ -431,6 +682,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         result = resp.get("json", [])
         return self._extract_technical_id_from_result(result)
 
+    @traced_method("cyoda.repository.update")
     async def update(
         self, meta: Dict[str, Any], technical_id: Any, entity: Optional[Any] = None
     ) -> Optional[str]:
@@ -472,6 +724,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         logger.error("Cyoda update returned no entityIds. Body=%s", result)
         return None
 
+    @traced_method("cyoda.repository.delete_by_id")
     async def delete_by_id(self, meta: Dict[str, Any], technical_id: Any) -> None:
         """Delete entity by ID."""
         path = f"entity/{technical_id}"
@@ -499,9 +752,10 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         criteria: Dict[str, Any] = cast(
             Dict[str, Any], meta.get("condition") or {"key": key}
         )
-        entities = await self.find_all_by_criteria(meta, criteria)
+        entities = await self.find_all_by_criteria(meta, criteria, limit=1)
         return entities[0] if entities else None
 
+    @traced_method("cyoda.repository.delete_all")
     async def delete_all(self, meta: Dict[str, Any]) -> None:
         """Delete all entities of a specific model."""
         path = f"entity/{meta['entity_model']}/{meta['entity_version']}"
@@ -522,6 +776,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
             "entity_version": entity_version,
         }
 
+    @traced_method("cyoda.repository.launch_transition")
     async def _launch_transition(
         self, meta: Dict[str, Any], technical_id: str
     ) -> Dict[str, Any]:
@@ -551,6 +806,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
             json_payload if isinstance(json_payload, dict) else {"result": json_payload}
         )
 
+    @traced_method("cyoda.repository.get_entity_count")
     async def get_entity_count(
         self, meta: Dict[str, Any], point_in_time: Optional[datetime] = None
     ) -> int:
@@ -600,6 +856,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
 
         return 0
 
+    @traced_method("cyoda.repository.get_entity_changes_metadata")
     async def get_entity_changes_metadata(
         self, entity_id: Any, point_in_time: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
@@ -101,19 +101,23 @@ class EdgeMessageRepository:
     _instance = None
     _lock = threading.Lock()
 
-    def __new__(cls, cyoda_auth_service: Any) -> "EdgeMessageRepository":
+    def __new__(
+        cls, cyoda_auth_service: Any, api_url: Optional[str] = None
+    ) -> "EdgeMessageRepository":
         """Thread-safe singleton implementation."""
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
                 cls._instance._cyoda_auth_service = cyoda_auth_service  # type: ignore[attr-defined,has-type]
+                cls._instance._api_url = api_url  # type: ignore[attr-defined,has-type]
                 cls._instance._initialized = False  # type: ignore[attr-defined,has-type]
         return cls._instance
 
-    def __init__(self, cyoda_auth_service: Any) -> None:
+    def __init__(self, cyoda_auth_service: Any, api_url: Optional[str] = None) -> None:
         """Initialize the repository."""
         if not self._initialized:  # type: ignore[has-type]
             self._cyoda_auth_service = cyoda_auth_service
+            self._api_url = api_url
             self._initialized = True
             logger.info("EdgeMessageRepository initialized")
 
@@ -123,7 +127,7 @@ class EdgeMessageRepository:
         path: str,
         data: Optional[str] = None,
         custom_headers: Optional[Dict[str, str]] = None,
-        base_url: str = CYODA_API_URL,
+        base_url: Optional[str] = None,
     ) -> dict[str, Any]:
         """
         Send an HTTP request to the Cyoda API with custom headers and automatic retry on 401.
@@ -144,7 +148,7 @@ class EdgeMessageRepository:
                 if custom_headers:
                     headers.update(custom_headers)
 
-                url = f"{base_url}/{path}"
+                url = f"{base_url or self._api_url or CYODA_API_URL}/{path}"
 
                 # Send request
                 response = await send_request(headers, url, method, data=data)
@@ -192,7 +196,10 @@ class EdgeMessageRepository:
             logger.info(f"Retrieving edge message with ID: {message_id}")
 
             response = await send_cyoda_request(
-                cyoda_auth_service=self._cyoda_auth_service, method="get", path=path
+                cyoda_auth_service=self._cyoda_auth_service,
+                method="get",
+                path=path,
+                base_url=self._api_url or CYODA_API_URL,
             )
 
             if response.get("status") != 200:
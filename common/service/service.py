@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, cast
 
 from common.config.config import CHAT_REPOSITORY
+from common.performance.tracing import log_payload, traced_method
 from common.repository.crud_repository import CrudRepository
 from common.service.entity_service import (
     EntityMetadata,
@@ -218,6 +219,7 @@ class EntityServiceImpl(EntityService):
     # PRIMARY RETRIEVAL METHODS
     # ========================================
 
+    @traced_method("entity_service.get_by_id")
     async def get_by_id(
         self, entity_id: str, entity_class: str, entity_version: str = "1.0"
     ) -> Optional[EntityResponse]:
@@ -259,6 +261,7 @@ class EntityServiceImpl(EntityService):
                 f"Get by ID failed: {str(e)}", entity_class, entity_id
             )
 
+    @traced_method("entity_service.find_by_business_id")
     async def find_by_business_id(
         self,
         entity_class: str,
@@ -299,6 +302,7 @@ class EntityServiceImpl(EntityService):
                 f"Find by business ID failed: {str(e)}", entity_class, business_id
             )
 
+    @traced_method("entity_service.find_by_business_id_at_time")
     async def find_by_business_id_at_time(
         self,
         entity_class: str,
@@ -344,6 +348,7 @@ class EntityServiceImpl(EntityService):
                 business_id,
             )
 
+    @traced_method("entity_service.find_all")
     async def find_all(
         self, entity_class: str, entity_version: str = "1.0"
     ) -> List[EntityResponse]:
@@ -384,6 +389,7 @@ class EntityServiceImpl(EntityService):
             logger.exception(f"Failed to find all entities of type: {entity_class}")
             raise EntityServiceError(f"Find all failed: {str(e)}", entity_class)
 
+    @traced_method("entity_service.find_all_at_time")
     async def find_all_at_time(
         self, entity_class: str, point_in_time: datetime, entity_version: str = "1.0"
     ) -> List[EntityResponse]:
@@ -431,6 +437,7 @@ class EntityServiceImpl(EntityService):
             )
             raise EntityServiceError(f"Find all at time failed: {str(e)}", entity_class)
 
+    @traced_method("entity_service.search")
     async def search(
         self,
         entity_class: str,
@@ -453,15 +460,14 @@ class EntityServiceImpl(EntityService):
 
             # Convert SearchConditionRequest to repository format
             criteria = self._convert_search_condition(condition)
-            logger.info(f"🔍 Searching {entity_class} with criteria: {criteria}")
+            log_payload(
+                logger, f"🔍 Searching {entity_class} with criteria", lambda: criteria
+            )
 
             # Pass limit and offset to repository for server-side pagination
             data = await self._repository.find_all_by_criteria(
                 meta, criteria, limit=condition.limit, offset=condition.offset
             )
-            logger.info(
-                f"🔍 Repository returned {len(data) if isinstance(data, list) else 0} results"
-            )
 
             # Handle repository errors
             data = self._handle_repository_error(data, "search", entity_class)
@@ -510,6 +516,7 @@ class EntityServiceImpl(EntityService):
     # PRIMARY MUTATION METHODS
     # ========================================
 
+    @traced_method("entity_service.save")
     async def save(
         self, entity: Dict[str, Any], entity_class: str, entity_version: str = "1.0"
     ) -> EntityResponse:
@@ -554,6 +561,7 @@ class EntityServiceImpl(EntityService):
             logger.exception(f"Failed to save entity of type: {entity_class}")
             raise EntityServiceError(f"Save failed: {str(e)}", entity_class)
 
+    @traced_method("entity_service.update")
     async def update(
         self,
         entity_id: str,
@@ -607,6 +615,7 @@ class EntityServiceImpl(EntityService):
                 f"Update failed: {str(e)}", entity_class, entity_id
             )
 
+    @traced_method("entity_service.update_by_business_id")
     async def update_by_business_id(
         self,
         entity: Dict[str, Any],
@@ -662,6 +671,7 @@ class EntityServiceImpl(EntityService):
                 f"Update by business ID failed: {str(e)}", entity_class
             )
 
+    @traced_method("entity_service.delete_by_id")
     async def delete_by_id(
         self, entity_id: str, entity_class: str, entity_version: str = "1.0"
     ) -> str:
@@ -692,6 +702,7 @@ class EntityServiceImpl(EntityService):
                 f"Delete failed: {str(e)}", entity_class, entity_id
             )
 
+    @traced_method("entity_service.delete_by_business_id")
     async def delete_by_business_id(
         self,
         entity_class: str,
@@ -733,6 +744,7 @@ class EntityServiceImpl(EntityService):
     # BATCH OPERATIONS
     # ========================================
 
+    @traced_method("entity_service.save_all")
     async def save_all(
         self,
         entities: List[Dict[str, Any]],
@@ -790,6 +802,7 @@ class EntityServiceImpl(EntityService):
             )
             raise EntityServiceError(f"Batch save failed: {str(e)}", entity_class)
 
+    @traced_method("entity_service.delete_all")
     async def delete_all(self, entity_class: str, entity_version: str = "1.0") -> int:
         """
         Delete all entities of a type (DANGEROUS - use with caution).
@@ -823,6 +836,7 @@ class EntityServiceImpl(EntityService):
     # WORKFLOW AND TRANSITION METHODS
     # ========================================
 
+    @traced_method("entity_service.get_transitions")
     async def get_transitions(
         self, entity_id: str, entity_class: str, entity_version: str = "1.0"
     ) -> List[str]:
@@ -858,6 +872,7 @@ class EntityServiceImpl(EntityService):
                 f"Get transitions failed: {str(e)}", entity_class, entity_id
             )
 
+    @traced_method("entity_service.execute_transition")
     async def execute_transition(
         self,
         entity_id: str,
@@ -937,6 +952,7 @@ class EntityServiceImpl(EntityService):
     # TEMPORAL AND STATISTICS METHODS
     # ========================================
 
+    @traced_method("entity_service.get_by_id_at_time")
     async def get_by_id_at_time(
         self,
         entity_id: str,
@@ -979,6 +995,7 @@ class EntityServiceImpl(EntityService):
                 f"Get by ID at time failed: {str(e)}", entity_class, entity_id
             )
 
+    @traced_method("entity_service.search_at_time")
     async def search_at_time(
         self,
         entity_class: str,
@@ -1022,6 +1039,7 @@ class EntityServiceImpl(EntityService):
             logger.exception(f"Failed to search {entity_class} at time {point_in_time}")
             raise EntityServiceError(f"Search at time failed: {str(e)}", entity_class)
 
+    @traced_method("entity_service.get_entity_count")
     async def get_entity_count(
         self,
         entity_class: str,
@@ -1047,6 +1065,7 @@ class EntityServiceImpl(EntityService):
             logger.exception(f"Failed to get entity count for {entity_class}")
             return 0
 
+    @traced_method("entity_service.get_entity_changes_metadata")
     async def get_entity_changes_metadata(
         self,
         entity_id: str,
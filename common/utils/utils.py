@@ -1,10 +1,12 @@
+import asyncio
 import json
 import logging
 import queue
 import re
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiofiles
 import httpx
@@ -13,6 +15,7 @@ from jsonschema import validate
 
 from common.auth.cyoda_auth import CyodaAuthService
 from common.config.config import CYODA_API_URL
+from common.performance.tracing import payload_size, traced
 
 logger = logging.getLogger(__name__)
 
@@ -455,55 +458,149 @@ async def send_request(
 ) -> Any:
     from common.exception.exceptions import InvalidTokenException
 
-    async with httpx.AsyncClient(timeout=150.0) as client:
-        method = method.upper()
-        if method == "GET":
-            response = await client.get(url, headers=headers)
-            # Only process GET responses with status 200 or 404 as in your original code
-            if response.status_code in (200, 404):
+    method = method.upper()
+    with traced(f"http {method}", {"http.method": method, "http.url": url}) as span:
+        if span.is_recording():
+            request_size = payload_size(data)
+            if request_size is not None:
+                span.set_attribute("http.request.body.size", request_size)
+
+        async with httpx.AsyncClient(timeout=150.0) as client:
+            if method == "GET":
+                response = await client.get(url, headers=headers)
+                # Only process GET responses with status 200 or 404 as in your original code
+                if response.status_code in (200, 404):
+                    content = (
+                        response.json()
+                        if "application/json"
+                        in response.headers.get("Content-Type", "")
+                        else response.text
+                    )
+                else:
+                    content = None
+            elif method == "POST":
+                response = await client.post(url, headers=headers, data=data, json=json)
+                content_type = response.headers.get("Content-Type", "")
+
+                # Handle NDJSON responses (newline-delimited JSON)
+                if "application/x-ndjson" in content_type:
+                    import json as json_module
+
+                    content = [
+                        json_module.loads(line)
+                        for line in response.iter_lines()
+                        if line.strip()
+                    ]
+                elif "application/json" in content_type:
+                    content = response.json()
+                else:
+                    content = response.text
+            elif method == "PUT":
+                response = await client.put(url, headers=headers, data=data, json=json)
+                content = (
+                    response.json()
+                    if "application/json" in response.headers.get("Content-Type", "")
+                    else response.text
+                )
+            elif method == "DELETE":
+                response = await client.delete(url, headers=headers)
                 content = (
                     response.json()
                     if "application/json" in response.headers.get("Content-Type", "")
                     else response.text
                 )
             else:
-                content = None
-        elif method == "POST":
-            response = await client.post(url, headers=headers, data=data, json=json)
-            content_type = response.headers.get("Content-Type", "")
-
-            # Handle NDJSON responses (newline-delimited JSON)
-            if "application/x-ndjson" in content_type:
-                import json as json_module
-
-                lines = response.text.strip().split("\n")
-                content = [json_module.loads(line) for line in lines if line.strip()]
-            elif "application/json" in content_type:
-                content = response.json()
-            else:
-                content = response.text
-        elif method == "PUT":
-            response = await client.put(url, headers=headers, data=data, json=json)
-            content = (
-                response.json()
-                if "application/json" in response.headers.get("Content-Type", "")
-                else response.text
-            )
-        elif method == "DELETE":
-            response = await client.delete(url, headers=headers)
-            content = (
-                response.json()
-                if "application/json" in response.headers.get("Content-Type", "")
-                else response.text
-            )
-        else:
-            raise ValueError("Unsupported HTTP method")
+                raise ValueError("Unsupported HTTP method")
+
+            if span.is_recording():
+                span.set_attribute("http.status_code", response.status_code)
+                span.set_attribute("http.response.body.size", len(response.content))
+                if isinstance(content, list):
+                    span.set_attribute("http.response.rows", len(content))
+
+            # Raise InvalidTokenException for 401 status codes
+            if response.status_code == 401:
+                raise InvalidTokenException(f"Unauthorized access to {url}")
+
+            return {"status": response.status_code, "json": content}
+
+
+# Client shared by streamed requests so repeated searches reuse pooled
+# keep-alive connections; recreated if closed or used from another event loop
+_streaming_client: Optional[httpx.AsyncClient] = None
+_streaming_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_streaming_client() -> httpx.AsyncClient:
+    """Return the shared client for streamed requests, creating it on first use."""
+    global _streaming_client, _streaming_client_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _streaming_client is None
+        or _streaming_client.is_closed
+        or _streaming_client_loop is not loop
+    ):
+        _streaming_client = httpx.AsyncClient(timeout=150.0)
+        _streaming_client_loop = loop
+    return _streaming_client
+
+
+async def close_streaming_client() -> None:
+    """Close the shared streaming client (on application shutdown)."""
+    global _streaming_client, _streaming_client_loop
+    if _streaming_client is not None:
+        await _streaming_client.aclose()
+    _streaming_client = None
+    _streaming_client_loop = None
+
 
-        # Raise InvalidTokenException for 401 status codes
-        if response.status_code == 401:
-            raise InvalidTokenException(f"Unauthorized access to {url}")
+@asynccontextmanager
+async def open_streaming_request(
+    headers: Dict[str, str],
+    url: str,
+    method: str,
+    data: Optional[Any] = None,
+    timeout: float = 150.0,
+) -> AsyncIterator[httpx.Response]:
+    """
+    Send a request and yield the response before its body has been read.
+
+    Use with ``iter_json_rows`` to consume large result sets as they arrive.
+    Requests share one pooled client (see ``get_streaming_client``).
+    """
+    method = method.upper()
+    with traced(
+        f"http {method} stream", {"http.method": method, "http.url": url}
+    ) as span:
+        if span.is_recording():
+            request_size = payload_size(data)
+            if request_size is not None:
+                span.set_attribute("http.request.body.size", request_size)
+        client = get_streaming_client()
+        async with client.stream(
+            method, url, headers=headers, content=data, timeout=timeout
+        ) as response:
+            span.set_attribute("http.status_code", response.status_code)
+            yield response
+
+
+async def iter_json_rows(response: httpx.Response) -> AsyncIterator[Any]:
+    """
+    Yield the rows of a streamed response.
+
+    NDJSON bodies are parsed line by line as they are received; other JSON
+    bodies are read whole and yielded item by item (a non-list is one row).
+    """
+    if "application/x-ndjson" in response.headers.get("Content-Type", ""):
+        async for line in response.aiter_lines():
+            if line.strip():
+                yield json.loads(line)
+        return
 
-        return {"status": response.status_code, "json": content}
+    body = await response.aread()
+    content = json.loads(body) if body.strip() else []
+    for row in content if isinstance(content, list) else [content]:
+        yield row
 
 
 async def send_post_request(
@@ -614,9 +711,30 @@ async def send_cyoda_request(
     """
     Send an HTTP request to the Cyoda API with automatic retry on 401.
     """
+    with traced(
+        "cyoda.request", {"http.method": method.upper(), "cyoda.path": path}
+    ) as span:
+        resp = await _send_cyoda_request(
+            cyoda_auth_service, method, path, data, base_url, span
+        )
+        status = resp.get("status") if isinstance(resp, dict) else None
+        if status is not None:
+            span.set_attribute("http.status_code", status)
+        return resp
+
+
+async def _send_cyoda_request(
+    cyoda_auth_service: CyodaAuthService,
+    method: str,
+    path: str,
+    data: Any,
+    base_url: str,
+    span: Any,
+) -> Dict[str, Any]:
     token = await cyoda_auth_service.get_access_token()
     resp: Dict[str, Any] = {}
     for attempt in range(2):
+        span.set_attribute("cyoda.attempts", attempt + 1)
         try:
             if method.lower() == "get":
                 resp = await send_get_request(token, base_url, path)
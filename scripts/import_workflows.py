@@ -7,17 +7,20 @@ It provides a command-line interface for importing workflow definitions from JSO
 
 Usage:
     python scripts/import_workflows.py --entity ExampleEntity --version 1 --file path/to/workflow.json
+    python scripts/import_workflows.py --all [--dry-run]
     python scripts/import_workflows.py --help
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from services.config import get_service_config
 from services.services import get_workflow_management_service, initialize_services
@@ -32,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of entity/version imports running against Cyoda at once
+DEFAULT_BULK_CONCURRENCY = 4
+
 
 def validate_workflow_file(file_path: Path) -> Dict[str, Any]:
     """
@@ -291,6 +297,272 @@ def print_workflow_files(workflow_files: List[Dict[str, Any]]) -> None:
         print("-" * 40)
 
 
+def canonical_workflow_hash(workflows: List[Dict[str, Any]]) -> str:
+    """
+    Hash a list of workflows independently of key order, whitespace and list order.
+
+    Args:
+        workflows: Workflow definitions
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON form
+    """
+    canonical = sorted(_canonical_json(workflow) for workflow in workflows)
+    return hashlib.sha256("\n".join(canonical).encode("utf-8")).hexdigest()
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def diff_workflows(
+    current: List[Dict[str, Any]], desired: List[Dict[str, Any]]
+) -> Dict[str, List[str]]:
+    """
+    Compare workflows by name.
+
+    Args:
+        current: Workflows currently deployed in Cyoda
+        desired: Workflows loaded from files
+
+    Returns:
+        Dictionary with added, removed and changed workflow names
+    """
+    current_by_name = {w.get("name", ""): _canonical_json(w) for w in current}
+    desired_by_name = {w.get("name", ""): _canonical_json(w) for w in desired}
+    return {
+        "added": sorted(desired_by_name.keys() - current_by_name.keys()),
+        "removed": sorted(current_by_name.keys() - desired_by_name.keys()),
+        "changed": sorted(
+            name
+            for name in desired_by_name.keys() & current_by_name.keys()
+            if desired_by_name[name] != current_by_name[name]
+        ),
+    }
+
+
+def group_workflow_files(
+    workflow_files: List[Dict[str, Any]],
+) -> Tuple[Dict[Tuple[str, str], List[str]], List[str]]:
+    """
+    Group discovered workflow files by entity name and model version.
+
+    The entity name is the file name without extension (it matches the
+    entity class ENTITY_NAME, e.g. Conversation.json), the version comes
+    from the version_N directory. Files outside that layout are skipped.
+
+    Args:
+        workflow_files: Entries returned by list_workflow_files
+
+    Returns:
+        Tuple of ({(entity_name, model_version): [file paths]}, skipped file paths)
+    """
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    skipped: List[str] = []
+    for file_info in workflow_files:
+        model_version = file_info.get("model_version")
+        if not model_version:
+            skipped.append(file_info["file_path"])
+            continue
+        entity_name = Path(file_info["file_name"]).stem
+        groups.setdefault((entity_name, model_version), []).append(
+            file_info["file_path"]
+        )
+    return groups, skipped
+
+
+def validate_workflow_files(
+    file_paths: List[str], max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate workflow files in a process pool.
+
+    Args:
+        file_paths: Absolute paths of workflow files
+        max_workers: Worker processes (default: number of CPUs)
+
+    Returns:
+        Dictionary mapping file path to its validation result
+    """
+    paths = [Path(file_path) for file_path in file_paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_workflow_file, paths, chunksize=8)
+        return dict(zip(file_paths, results))
+
+
+async def _sync_entity_workflows(
+    workflow_management_service: Any,
+    entity_name: str,
+    model_version: str,
+    workflows: List[Dict[str, Any]],
+    import_mode: str,
+    dry_run: bool,
+) -> Dict[str, Any]:
+    """Import one entity/version unless Cyoda already has identical workflows."""
+    result: Dict[str, Any] = {
+        "entity_name": entity_name,
+        "model_version": model_version,
+        "workflows": len(workflows),
+    }
+
+    exported = await workflow_management_service.export_entity_workflows(
+        entity_name=entity_name, model_version=model_version
+    )
+    # A model without workflows (or not yet registered) exports nothing
+    current = exported.get("workflows", []) if exported.get("success") else []
+
+    if canonical_workflow_hash(current) == canonical_workflow_hash(workflows):
+        result["status"] = "unchanged"
+        return result
+
+    result["diff"] = diff_workflows(current, workflows)
+    if dry_run:
+        result["status"] = "would_import"
+        return result
+
+    import_result = await workflow_management_service.import_entity_workflows(
+        entity_name=entity_name,
+        model_version=model_version,
+        workflows=workflows,
+        import_mode=import_mode,
+    )
+    if import_result.get("success", False):
+        result["status"] = "imported"
+    else:
+        result["status"] = "failed"
+        result["error"] = import_result.get("error", "Unknown error")
+    return result
+
+
+async def import_all_workflows(
+    base_path: str = "application/resources/workflow",
+    import_mode: str = "REPLACE",
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    dry_run: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Import every workflow under base_path, skipping unchanged entities.
+
+    Files are validated in a process pool, grouped per entity/version (so
+    several files for one entity are imported together rather than replacing
+    each other), compared against the current export by canonical-JSON hash,
+    and only changed groups are imported, at most `concurrency` at a time.
+
+    Args:
+        base_path: Base directory containing entity/version_N/*.json files
+        import_mode: Import mode ("REPLACE" or other supported modes)
+        concurrency: Maximum concurrent export/import calls
+        dry_run: Report what would change without importing
+        max_workers: Worker processes used for validation
+
+    Returns:
+        Dictionary containing per-entity results and a summary
+    """
+    listing = list_workflow_files(base_path)
+    if not listing["success"]:
+        return listing
+
+    groups, skipped = group_workflow_files(listing["workflow_files"])
+    file_paths = [path for paths in groups.values() for path in paths]
+    loop = asyncio.get_running_loop()
+    validations = await loop.run_in_executor(
+        None, validate_workflow_files, file_paths, max_workers
+    )
+
+    results: List[Dict[str, Any]] = []
+    pending: List[Tuple[str, str, List[Dict[str, Any]]]] = []
+    for (entity_name, model_version), paths in sorted(groups.items()):
+        invalid = {
+            path: validations[path]
+            for path in paths
+            if not validations[path]["success"]
+        }
+        if invalid:
+            results.append(
+                {
+                    "entity_name": entity_name,
+                    "model_version": model_version,
+                    "status": "invalid",
+                    "error": "; ".join(
+                        f"{path}: {v.get('error') or ', '.join(v.get('errors', []))}"
+                        for path, v in invalid.items()
+                    ),
+                }
+            )
+            continue
+        workflows: List[Dict[str, Any]] = []
+        for path in paths:
+            data = validations[path]["workflows"]
+            workflows.extend(data if isinstance(data, list) else [data])
+        pending.append((entity_name, model_version, workflows))
+
+    workflow_management_service = get_workflow_management_service()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def sync(entity_name: str, model_version: str, workflows: List[Dict]):
+        async with semaphore:
+            try:
+                return await _sync_entity_workflows(
+                    workflow_management_service,
+                    entity_name,
+                    model_version,
+                    workflows,
+                    import_mode,
+                    dry_run,
+                )
+            except Exception as e:
+                logger.error(f"Failed to sync {entity_name} v{model_version}: {e}")
+                return {
+                    "entity_name": entity_name,
+                    "model_version": model_version,
+                    "status": "failed",
+                    "error": str(e),
+                }
+
+    results.extend(await asyncio.gather(*(sync(*group) for group in pending)))
+
+    summary: Dict[str, int] = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+
+    return {
+        "success": not any(r["status"] in ("failed", "invalid") for r in results),
+        "dry_run": dry_run,
+        "base_path": listing["base_path"],
+        "results": results,
+        "skipped_files": skipped,
+        "summary": summary,
+    }
+
+
+def print_bulk_report(report: Dict[str, Any]) -> None:
+    """Print a bulk import (or dry-run diff) report in a user-friendly format."""
+    title = "Dry run" if report["dry_run"] else "Bulk import"
+    print(f"\n{title} of workflows in {report['base_path']}:")
+    print("-" * 80)
+
+    for result in report["results"]:
+        label = f"{result['entity_name']} v{result['model_version']}"
+        print(f"{label}: {result['status']}")
+        diff = result.get("diff")
+        if diff:
+            for change, marker in (("added", "+"), ("removed", "-"), ("changed", "~")):
+                for name in diff[change]:
+                    print(f"   {marker} {name}")
+        if result.get("error"):
+            print(f"   Error: {result['error']}")
+
+    for file_path in report["skipped_files"]:
+        print(f"Skipped (not in <entity>/version_<n>/ layout): {file_path}")
+
+    print("-" * 80)
+    print(
+        ", ".join(f"{status}: {count}" for status, count in report["summary"].items())
+        or "Nothing to import."
+    )
+
+
 async def main() -> None:
     """Main function to handle command line arguments and execute workflow import."""
     # Initialize services first
@@ -312,6 +584,10 @@ Examples:
   python scripts/import_workflows.py --list
   # List workflow files in custom directory
   python scripts/import_workflows.py --list --base-path custom/workflow/directory
+  # Import every changed workflow under the base path
+  python scripts/import_workflows.py --all
+  # Show which workflows would change without importing
+  python scripts/import_workflows.py --all --dry-run
         """,
     )
 
@@ -337,6 +613,26 @@ Examples:
         "--list", "-l", action="store_true", help="List available workflow files"
     )
 
+    parser.add_argument(
+        "--all",
+        "-a",
+        action="store_true",
+        help="Import all workflow files under --base-path, skipping unchanged ones",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --all, report which workflows differ without importing",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BULK_CONCURRENCY,
+        help=f"With --all, maximum concurrent imports (default: {DEFAULT_BULK_CONCURRENCY})",
+    )
+
     parser.add_argument(
         "--base-path",
         "-b",
@@ -362,6 +658,22 @@ Examples:
             sys.exit(1)
         return
 
+    # Handle bulk import
+    if args.all:
+        report = await import_all_workflows(
+            base_path=args.base_path,
+            import_mode=args.mode,
+            concurrency=args.concurrency,
+            dry_run=args.dry_run,
+        )
+        if "results" not in report:
+            print(f"Error: {report['error']}")
+            sys.exit(1)
+        print_bulk_report(report)
+        if not report["success"]:
+            sys.exit(1)
+        return
+
     # Validate required arguments for import
     if not args.entity or not args.file:
         parser.error("--entity and --file are required for import operations")
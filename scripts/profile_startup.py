@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Startup Import Profiler
+
+Imports a module in a fresh interpreter with ``-X importtime`` and reports
+which modules dominate the import phase, so regressions in cold start can be
+traced to the import that caused them.
+
+Usage:
+    python scripts/profile_startup.py                      # application.app
+    python scripts/profile_startup.py --module services.services --top 30
+    python scripts/profile_startup.py --json > startup_profile.json
+
+Reports:
+    - total import time of the target module
+    - the top modules by cumulative time (the module and everything it imported)
+    - the top modules by self time
+    - self time grouped by top-level package
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def run_importtime(module: str) -> List[ImportRecord]:
+    """Import ``module`` in a subprocess and parse its -X importtime output."""
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr[-4000:])
+        raise SystemExit(f"Importing {module} failed (exit {result.returncode})")
+    return parse_importtime(result.stderr)
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse ``import time: self | cumulative | name`` lines."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(
+            ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return records
+
+
+def summarize(records: List[ImportRecord], module: str, top: int) -> Dict[str, Any]:
+    """Build the report for a parsed import profile."""
+    target = next((r for r in records if r.module == module), None)
+    by_package: Dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + record.self_us
+
+    def row(record: ImportRecord) -> Dict[str, Any]:
+        return {
+            "module": record.module,
+            "self_ms": round(record.self_us / 1000, 1),
+            "cumulative_ms": round(record.cumulative_us / 1000, 1),
+        }
+
+    return {
+        "module": module,
+        "total_ms": round((target.cumulative_us if target else 0) / 1000, 1),
+        "modules_imported": len(records),
+        "top_cumulative": [
+            row(r)
+            for r in sorted(records, key=lambda r: -r.cumulative_us)
+            if r.module != module
+        ][:top],
+        "top_self": [row(r) for r in sorted(records, key=lambda r: -r.self_us)][:top],
+        "by_package_ms": {
+            name: round(us / 1000, 1)
+            for name, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]
+        },
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"Importing {report['module']} took {report['total_ms']:.0f} ms "
+        f"({report['modules_imported']} modules)\n"
+    )
+    print("Top modules by cumulative time:")
+    for row in report["top_cumulative"]:
+        print(f"  {row['cumulative_ms']:9.1f} ms  {row['module']}")
+    print("\nTop modules by self time:")
+    for row in report["top_self"]:
+        print(f"  {row['self_ms']:9.1f} ms  {row['module']}")
+    print("\nSelf time by top-level package:")
+    for name, ms in report["by_package_ms"].items():
+        print(f"  {ms:9.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile module import cost")
+    parser.add_argument(
+        "--module", "-m", default="application.app", help="module to import"
+    )
+    parser.add_argument("--top", "-n", type=int, default=20, help="rows per table")
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+
+    report = summarize(run_importtime(args.module), args.module, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
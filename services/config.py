@@ -10,6 +10,12 @@ import os
 from typing import Any, Dict
 
 from common.config.config import (
+    AI_MODEL,
+    ASSISTANT_LEASE_TIMEOUT,
+    ASSISTANT_MAX_CONCURRENCY,
+    ASSISTANT_MODEL_CONCURRENCY,
+    ASSISTANT_POOL_SIZE,
+    ASSISTANT_WARMUP,
     CYODA_CLIENT_ID,
     CYODA_CLIENT_SECRET,
     CYODA_TOKEN_URL,
@@ -46,6 +52,18 @@ def get_service_config() -> Dict[str, Any]:
                 "example_application.processor",
                 "example_application.criterion",
             ],
+            "entity_modules": [
+                "application.entity",
+                "example_application.entity",
+            ],
+        },
+        "assistant": {
+            "warmup": ASSISTANT_WARMUP,
+            "model": AI_MODEL,
+            "pool_size": ASSISTANT_POOL_SIZE,
+            "max_concurrency": ASSISTANT_MAX_CONCURRENCY,
+            "model_concurrency": ASSISTANT_MODEL_CONCURRENCY,
+            "lease_timeout": ASSISTANT_LEASE_TIMEOUT,
         },
     }
 
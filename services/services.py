@@ -2,14 +2,20 @@
 Simple Service Management
 
 Direct access to services without unnecessary abstraction layers.
-Uses dependency-injector for dependency management but with a simple interface.
+Uses dependency-injector providers for dependency management but with a simple
+interface. The container is a plain class of providers rather than a
+DeclarativeContainer: ``dependency_injector.containers`` imports its wiring
+module, which imports FastAPI when it is installed, and that import alone was
+a large share of the time before the app could serve /health. Nothing here is
+wired, so only the providers are needed.
 """
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional, cast
 
-from dependency_injector import containers, providers
+from dependency_injector import providers
 
 from common.interfaces.services import IAuthService, IGrpcClient, IProcessorManager
 from common.repository.crud_repository import CrudRepository
@@ -138,139 +144,197 @@ def _create_task_service(entity_service: EntityService) -> Any:
     return cast(Any, TaskService(entity_service=entity_service))
 
 
-def _create_processor_manager(modules: List[str]) -> IProcessorManager:
+def _create_processor_manager(
+    modules: List[str], entity_modules: Optional[List[str]] = None
+) -> IProcessorManager:
     """Create processor manager with lazy import."""
     from common.processor import get_processor_manager
 
-    return cast(IProcessorManager, get_processor_manager(modules))
+    return cast(IProcessorManager, get_processor_manager(modules, entity_modules))
+
+
+def _create_assistant_pool(
+    entity_service: EntityService,
+    model: Optional[str] = None,
+    pool_size: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    model_concurrency: Optional[str] = None,
+    lease_timeout: Optional[float] = None,
+) -> Any:
+    """Create the assistant pool with lazy import (settings default to config)."""
+    from application.services.assistant.pool import AssistantPool, parse_model_limits
+    from common.config import config as app_config
+
+    model = model or app_config.AI_MODEL
+    limits = parse_model_limits(
+        model_concurrency
+        if model_concurrency is not None
+        else app_config.ASSISTANT_MODEL_CONCURRENCY
+    )
+    max_size = limits.get(
+        model, max_concurrency or app_config.ASSISTANT_MAX_CONCURRENCY
+    )
 
+    def build_assistant() -> Any:
+        from application.agents import create_cyoda_assistant
 
-class ServiceContainer(containers.DeclarativeContainer):
-    """Simple service container with all dependencies."""
+        return create_cyoda_assistant(
+            google_adk_service=None, entity_service=entity_service
+        )
 
-    # Configuration
-    config = providers.Configuration()
-
-    # Core services
-    auth_service = providers.Singleton(
-        _create_auth_service,
-        client_id=config.authentication.client_id,
-        client_secret=config.authentication.client_secret,
-        token_url=config.authentication.token_url,
-        skip_ssl=config.authentication.skip_ssl,
-        scope=config.authentication.scope,
+    return AssistantPool(
+        build_assistant,
+        model=model,
+        min_size=(
+            pool_size if pool_size is not None else app_config.ASSISTANT_POOL_SIZE
+        ),
+        max_size=max_size,
+        acquire_timeout=(
+            lease_timeout
+            if lease_timeout is not None
+            else app_config.ASSISTANT_LEASE_TIMEOUT
+        ),
+        on_build=_mark_assistant_ready,
     )
 
-    # Repository - can be either Cyoda or InMemory based on config
-    repository = providers.Singleton(
-        _create_repository,
-        auth_service=auth_service,
-        use_in_memory=config.repository.use_in_memory.as_(bool),
-    )
 
-    # Entity service
-    entity_service = providers.Singleton(
-        _create_entity_service,
-        repository=repository,
-    )
+class ServiceContainer:
+    """Simple service container with all dependencies."""
 
-    # Processor manager
-    processor_manager = providers.Singleton(
-        _create_processor_manager,
-        modules=config.processor.modules.as_(list),
-    )
+    def __init__(self) -> None:
+        # Configuration
+        self.config = providers.Configuration()
+
+        # Core services (thread-safe: first built by whichever of a request
+        # or the app's gRPC start-up thread needs them first)
+        self.auth_service = providers.ThreadSafeSingleton(
+            _create_auth_service,
+            client_id=self.config.authentication.client_id,
+            client_secret=self.config.authentication.client_secret,
+            token_url=self.config.authentication.token_url,
+            skip_ssl=self.config.authentication.skip_ssl,
+            scope=self.config.authentication.scope,
+        )
 
-    # gRPC client
-    grpc_client = providers.Singleton(
-        _create_grpc_client,
-        auth_service=auth_service,
-    )
+        # Repository - can be either Cyoda or InMemory based on config
+        self.repository = providers.ThreadSafeSingleton(
+            _create_repository,
+            auth_service=self.auth_service,
+            use_in_memory=self.config.repository.use_in_memory.as_(bool),
+        )
 
-    # Utilities
-    chat_lock = providers.Singleton(asyncio.Lock)
+        # Entity service
+        self.entity_service = providers.ThreadSafeSingleton(
+            _create_entity_service,
+            repository=self.repository,
+        )
 
-    # Google ADK Service
-    google_adk_service = providers.Singleton(
-        lambda: __import__(
-            "application.services.google_adk_service", fromlist=["GoogleADKService"]
-        ).GoogleADKService()
-    )
+        # Processor manager
+        self.processor_manager = providers.ThreadSafeSingleton(
+            _create_processor_manager,
+            modules=self.config.processor.modules.as_(list),
+            entity_modules=self.config.processor.entity_modules,
+        )
 
-    # Cyoda Assistant (Google ADK Sequential Pipeline with Cyoda-persistent sessions)
-    # Supports multiple models via AI_MODEL env var:
-    # - Google Gemini: gemini-2.0-flash-exp, gemini-2.5-pro-preview-03-25
-    # - OpenAI via LiteLLM: openai/gpt-4o-mini, openai/gpt-4o
-    # - Anthropic via LiteLLM: anthropic/claude-3-haiku-20240307
-    cyoda_assistant = providers.Singleton(
-        lambda google_adk, entity_svc: __import__(
-            "application.agents", fromlist=["create_cyoda_assistant"]
-        ).create_cyoda_assistant(
-            google_adk_service=google_adk, entity_service=entity_svc
-        ),
-        google_adk=google_adk_service,
-        entity_svc=entity_service,
-    )
+        # gRPC client
+        self.grpc_client = providers.ThreadSafeSingleton(
+            _create_grpc_client,
+            auth_service=self.auth_service,
+        )
 
-    # MCP Services
-    entity_management_service = providers.Singleton(
-        _create_entity_management_service,
-        entity_service=entity_service,
-    )
+        # Utilities
+        self.chat_lock = providers.Singleton(asyncio.Lock)
 
-    search_service = providers.Singleton(
-        _create_search_service,
-        entity_service=entity_service,
-    )
+        # Google ADK Service (thread-safe: built by the background assistant warm-up)
+        self.google_adk_service = providers.ThreadSafeSingleton(
+            lambda: __import__(
+                "application.services.google_adk_service", fromlist=["GoogleADKService"]
+            ).GoogleADKService()
+        )
 
-    # Edge Message Repository and Service
-    edge_message_repository = providers.Singleton(
-        _create_edge_message_repository,
-        auth_service=auth_service,
-    )
+        # Pre-built assistants leased one per chat turn, capped per model
+        self.assistant_pool = providers.Singleton(
+            _create_assistant_pool,
+            entity_service=self.entity_service,
+            model=self.config.assistant.model,
+            pool_size=self.config.assistant.pool_size,
+            max_concurrency=self.config.assistant.max_concurrency,
+            model_concurrency=self.config.assistant.model_concurrency,
+            lease_timeout=self.config.assistant.lease_timeout,
+        )
 
-    edge_message_service = providers.Singleton(
-        _create_edge_message_service,
-        edge_message_repository=edge_message_repository,
-    )
+        # MCP Services
+        self.entity_management_service = providers.Singleton(
+            _create_entity_management_service,
+            entity_service=self.entity_service,
+        )
 
-    # Workflow Repository and Management Service
-    workflow_repository = providers.Singleton(
-        _create_workflow_repository,
-        auth_service=auth_service,
-    )
+        self.search_service = providers.Singleton(
+            _create_search_service,
+            entity_service=self.entity_service,
+        )
 
-    workflow_management_service = providers.Singleton(
-        _create_workflow_management_service,
-        workflow_repository=workflow_repository,
-    )
+        # Edge Message Repository and Service
+        self.edge_message_repository = providers.Singleton(
+            _create_edge_message_repository,
+            auth_service=self.auth_service,
+        )
 
-    # Deployment Repository and Service
-    deployment_repository = providers.Singleton(
-        _create_deployment_repository,
-        auth_service=auth_service,
-    )
+        self.edge_message_service = providers.Singleton(
+            _create_edge_message_service,
+            edge_message_repository=self.edge_message_repository,
+        )
 
-    deployment_service = providers.Singleton(
-        _create_deployment_service,
-        deployment_repository=deployment_repository,
-    )
+        # Workflow Repository and Management Service
+        self.workflow_repository = providers.Singleton(
+            _create_workflow_repository,
+            auth_service=self.auth_service,
+        )
 
-    # Task Service
-    task_service = providers.Singleton(
-        _create_task_service,
-        entity_service=entity_service,
-    )
+        self.workflow_management_service = providers.Singleton(
+            _create_workflow_management_service,
+            workflow_repository=self.workflow_repository,
+        )
+
+        # Deployment Repository and Service
+        self.deployment_repository = providers.Singleton(
+            _create_deployment_repository,
+            auth_service=self.auth_service,
+        )
+
+        self.deployment_service = providers.Singleton(
+            _create_deployment_service,
+            deployment_repository=self.deployment_repository,
+        )
+
+        # Task Service
+        self.task_service = providers.Singleton(
+            _create_task_service,
+            entity_service=self.entity_service,
+        )
 
 
 # Global container instance
 _container: Optional[ServiceContainer] = None
 _initialized: bool = False
+_assistant_ready: bool = False
 
 
 def initialize_services(config: Dict[str, Any]) -> None:
     """
     Initialize services with the provided configuration.
 
+    Only the container is configured here; every service is built on first
+    use. Auth, repository and entity service pull in authlib and httpx, so
+    building them here would delay the first response. The app builds the
+    gRPC client (and the services behind it) in a worker thread once it is
+    serving.
+
+    The Cyoda Assistant (coordinator and sub-agent graph, and the agent SDK
+    behind it) takes seconds to import and build, so the assistant pool is only
+    filled here when ``assistant.warmup`` is "eager". Otherwise it is filled by
+    warm_up_cyoda_assistant() or grows on the first chat.
+
     Args:
         config: Configuration dictionary
     """
@@ -286,37 +350,18 @@ def initialize_services(config: Dict[str, Any]) -> None:
     _container = ServiceContainer()
     _container.config.from_dict(config)
 
-    # Eagerly initialize all services
-    logger.info("Eagerly initializing all services...")
     try:
-        _ = _container.auth_service()
-        logger.info("✓ Auth service initialized")
-
-        _ = _container.repository()
-        logger.info("✓ Repository initialized")
-
-        _ = _container.entity_service()
-        logger.info("✓ Entity service initialized")
-
-        _ = _container.processor_manager()
-        logger.info("✓ Processor manager initialized")
-
-        _ = _container.grpc_client()
-        logger.info("✓ gRPC client initialized")
-
-        _ = _container.chat_lock()
-        logger.info("✓ Chat lock initialized")
-
-        _ = _container.entity_management_service()
-        logger.info("✓ Entity management service initialized")
-
-        _ = _container.google_adk_service()
-        logger.info("✓ Google ADK service initialized")
-
-        _ = _container.cyoda_assistant()
-        logger.info(
-            "✓ Cyoda Assistant initialized (Sequential Pipeline: Validator → Processor → Reporter)"
-        )
+        if config.get("assistant", {}).get("warmup") == "eager":
+            _ = _container.google_adk_service()
+            logger.info("✓ Google ADK service initialized")
+
+            _container.assistant_pool().prefill()
+            _mark_assistant_ready()
+            logger.info(
+                "✓ Cyoda Assistant pool initialized (Sequential Pipeline: Validator → Processor → Reporter)"
+            )
+        else:
+            logger.info("⏳ Cyoda Assistant deferred until warm-up or first use")
 
         logger.info("All services initialized successfully")
     except Exception as e:
@@ -380,10 +425,35 @@ def get_google_adk_service() -> Any:
     return container.google_adk_service()
 
 
-def get_cyoda_assistant() -> Any:
-    """Get the Cyoda Assistant (main agent)."""
+def _mark_assistant_ready() -> None:
+    global _assistant_ready
+    _assistant_ready = True
+
+
+def is_cyoda_assistant_ready() -> bool:
+    """Check if the Cyoda Assistant has been built."""
+    return _assistant_ready
+
+
+def get_assistant_pool() -> Any:
+    """Get the pool of Cyoda Assistants that chat turns lease from."""
     container = _ensure_initialized()
-    return container.cyoda_assistant()
+    return container.assistant_pool()
+
+
+async def warm_up_cyoda_assistant() -> None:
+    """Build the pooled Cyoda Assistants in worker threads so the first chat is fast.
+
+    Failures are logged and left for the first chat to surface.
+    """
+    started = time.perf_counter()
+    try:
+        await get_assistant_pool().warm_up()
+        _mark_assistant_ready()
+    except Exception as e:
+        logger.warning(f"⚠️ Cyoda Assistant warm-up failed: {e}")
+        return
+    logger.info(f"🔥 Cyoda Assistant warmed up in {time.perf_counter() - started:.2f}s")
 
 
 def get_entity_management_service() -> Any:
@@ -447,11 +517,11 @@ def is_initialized() -> bool:
 
 def shutdown_services() -> None:
     """Shutdown services and clean up resources."""
-    global _container, _initialized
+    global _container, _initialized, _assistant_ready
 
     if _initialized and _container:
         logger.info("Shutting down services...")
-        _container.unwire()
         _container = None
         _initialized = False
+        _assistant_ready = False
         logger.info("Services shut down successfully")
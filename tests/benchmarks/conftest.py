@@ -0,0 +1,72 @@
+"""Fixtures wiring the repository stack to the local Cyoda REST stand-in."""
+
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Iterator, List
+
+import pytest
+
+from common.auth.cyoda_auth import CyodaAuthService
+from common.repository.cyoda.cyoda_repository import CyodaRepository
+from common.service.service import EntityServiceImpl
+from tests.benchmarks.fake_cyoda_rest import FakeCyodaRestServer
+
+BENCH_ENTITY = "BenchItem"
+BENCH_VERSION = "1"
+
+
+@pytest.fixture(scope="module")
+def fake_cyoda() -> Iterator[FakeCyodaRestServer]:
+    """One stand-in server per benchmark module."""
+    with FakeCyodaRestServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def bench_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Event loop shared by the benchmark rounds of a module."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def entity_service(fake_cyoda: FakeCyodaRestServer) -> Iterator[EntityServiceImpl]:
+    """
+    EntityServiceImpl over a CyodaRepository pointed at the stand-in.
+
+    Faults are reset for every test, and the auth service gets a unique client
+    id so cached tokens never leak between tests.
+    """
+    fake_cyoda.reset_faults()
+    auth = CyodaAuthService(
+        client_id=f"bench-{uuid.uuid4().hex}",
+        client_secret="bench-secret",
+        token_url=fake_cyoda.token_url,
+        skip_ssl=True,
+    )
+
+    previous = CyodaRepository._instance
+    CyodaRepository._instance = None
+    try:
+        repository = CyodaRepository(
+            cyoda_auth_service=auth, api_url=fake_cyoda.api_url
+        )
+    finally:
+        CyodaRepository._instance = previous
+    yield EntityServiceImpl(repository)
+
+
+@pytest.fixture
+def run_concurrently(
+    bench_loop: asyncio.AbstractEventLoop,
+) -> Callable[..., List[Any]]:
+    """Return a sync callable that awaits ``concurrency`` calls at once."""
+
+    def run(call: Callable[[int], Awaitable[Any]], concurrency: int) -> List[Any]:
+        async def batch() -> List[Any]:
+            return list(await asyncio.gather(*(call(i) for i in range(concurrency))))
+
+        return bench_loop.run_until_complete(batch())
+
+    return run
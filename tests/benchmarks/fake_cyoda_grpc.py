@@ -0,0 +1,196 @@
+"""
+In-process fake of the Cyoda gRPC processing endpoint.
+
+``FakeCyodaServer`` implements ``CloudEventsService.startStreaming`` on a
+local ``grpc.aio`` server. Once the client has sent its join event, the server
+replays a mix of CalcRequest / CriteriaCalcRequest events at a target rate and
+records the end-to-end latency of every response, matched by request id.
+Nothing leaves the process: the server listens on a loopback port with local
+credentials.
+"""
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import grpc
+
+from common.grpc_client.constants import (
+    CALC_REQ_EVENT_TYPE,
+    CALC_RESP_EVENT_TYPE,
+    CRITERIA_CALC_REQ_EVENT_TYPE,
+    CRITERIA_CALC_RESP_EVENT_TYPE,
+    JOIN_EVENT_TYPE,
+    SPEC_VERSION,
+)
+from common.proto.cloudevents_pb2 import CloudEvent
+from common.proto.cyoda_cloud_api_pb2_grpc import (
+    CloudEventsServiceServicer,
+    add_CloudEventsServiceServicer_to_server,
+)
+
+BENCH_PROCESSOR_NAME = "BenchProcessor"
+BENCH_CRITERIA_NAME = "BenchCriterion"
+BENCH_MODEL_NAME = "BenchEntity"
+
+_RESPONSE_TYPES = {
+    CALC_RESP_EVENT_TYPE: "calc",
+    CRITERIA_CALC_RESP_EVENT_TYPE: "criteria",
+}
+
+
+@dataclass
+class LoadProfile:
+    """Load offered by the fake server."""
+
+    rate: float = 200.0  # requests per second
+    duration: float = 5.0  # seconds of load
+    calc_ratio: float = 0.8  # share of CalcRequests, the rest are criteria
+    payload_bytes: int = 1024  # size of the padding field in entity data
+    processor_latency_ms: float = 0.0
+    criteria_latency_ms: float = 0.0
+    drain_timeout: float = 10.0  # seconds to wait for outstanding responses
+    seed: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return max(1, int(self.rate * self.duration))
+
+
+@dataclass
+class LoadStats:
+    """Raw measurements collected by the fake server."""
+
+    sent: int = 0
+    received: int = 0
+    failed: int = 0
+    first_sent_at: Optional[float] = None
+    last_received_at: Optional[float] = None
+    last_sent_at: Optional[float] = None
+    latencies: Dict[str, List[float]] = field(
+        default_factory=lambda: {"calc": [], "criteria": []}
+    )
+
+
+class FakeCyodaServer(CloudEventsServiceServicer):
+    """Cyoda stand-in that drives calc requests over a gRPC stream."""
+
+    def __init__(self, profile: LoadProfile) -> None:
+        self.profile = profile
+        self.stats = LoadStats()
+        self.finished = asyncio.Event()
+        self._joined = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._generating = False
+        self._in_flight: Dict[str, Tuple[str, float]] = {}
+        self._server: Optional[grpc.aio.Server] = None
+
+    async def start(self) -> str:
+        """Start listening on a free loopback port and return its address."""
+        self._server = grpc.aio.server()
+        add_CloudEventsServiceServicer_to_server(self, self._server)
+        port = self._server.add_secure_port(
+            "localhost:0",
+            grpc.local_server_credentials(grpc.LocalConnectionType.LOCAL_TCP),
+        )
+        await self._server.start()
+        return f"localhost:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            await self._server.stop(grace=None)
+
+    async def startStreaming(  # noqa: N802 - generated servicer method name
+        self, request_iterator: AsyncIterator[CloudEvent], context: object
+    ) -> AsyncIterator[CloudEvent]:
+        reader = asyncio.ensure_future(self._read_responses(request_iterator))
+        try:
+            await self._joined.wait()
+            self._generating = True
+            async for event in self._generate_requests():
+                yield event
+            self._generating = False
+            if self._in_flight:
+                try:
+                    await asyncio.wait_for(
+                        self._drained.wait(), self.profile.drain_timeout
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.finished.set()
+            reader.cancel()
+
+    async def _generate_requests(self) -> AsyncIterator[CloudEvent]:
+        """Yield requests on an open-loop schedule at the target rate."""
+        profile = self.profile
+        rng = random.Random(profile.seed)
+        padding = "x" * profile.payload_bytes
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for index in range(profile.total_requests):
+            delay = start + index / profile.rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            kind = "calc" if rng.random() < profile.calc_ratio else "criteria"
+            event = _build_request(kind, index, padding)
+
+            now = loop.time()
+            self._in_flight[f"req-{index}"] = (kind, now)
+            if self.stats.first_sent_at is None:
+                self.stats.first_sent_at = now
+            self.stats.last_sent_at = now
+            self.stats.sent += 1
+            yield event
+
+    async def _read_responses(
+        self, request_iterator: AsyncIterator[CloudEvent]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        async for event in request_iterator:
+            if event.type == JOIN_EVENT_TYPE:
+                self._joined.set()
+                continue
+            if event.type not in _RESPONSE_TYPES:
+                continue
+
+            data = json.loads(event.text_data)
+            sent = self._in_flight.pop(data.get("requestId"), None)
+            if sent is None:
+                continue
+            kind, sent_at = sent
+            now = loop.time()
+            self.stats.latencies[kind].append(now - sent_at)
+            self.stats.received += 1
+            self.stats.last_received_at = now
+            if not data.get("success", False):
+                self.stats.failed += 1
+            if not self._generating and not self._in_flight:
+                self._drained.set()
+
+
+def _build_request(kind: str, index: int, padding: str) -> CloudEvent:
+    request_id = f"req-{index}"
+    body = {
+        "requestId": request_id,
+        "entityId": f"entity-{index}",
+        "payload": {
+            "meta": {"modelKey": {"name": BENCH_MODEL_NAME, "version": 1}},
+            "data": {"name": f"bench-{index}", "value": index, "padding": padding},
+        },
+    }
+    if kind == "calc":
+        body["processorName"] = BENCH_PROCESSOR_NAME
+        event_type = CALC_REQ_EVENT_TYPE
+    else:
+        body["criteriaName"] = BENCH_CRITERIA_NAME
+        event_type = CRITERIA_CALC_REQ_EVENT_TYPE
+    return CloudEvent(
+        id=request_id,
+        source="FakeCyoda",
+        spec_version=SPEC_VERSION,
+        type=event_type,
+        text_data=json.dumps(body),
+    )
@@ -0,0 +1,511 @@
+"""
+Local stand-in for the Cyoda REST API.
+
+Implements the subset of endpoints called by CyodaRepository,
+EdgeMessageRepository and EntityServiceImpl on an in-memory store, served by
+hypercorn on a loopback port in a background thread. The repositories talk to
+it over real HTTP, so request building, auth retries, NDJSON streaming and
+snapshot paging are all exercised.
+
+Faults can be injected per request through ``FaultConfig``: fixed latency plus
+jitter, a 503 error rate, a random 401 rate and server-side token expiry.
+Tokens are issued by ``POST /api/oauth/token``, so the real CyodaAuthService
+can be pointed at the stand-in.
+"""
+
+import asyncio
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+from quart import Quart, Response, jsonify, request
+
+API_PREFIX = "/api"
+
+
+@dataclass
+class FaultConfig:
+    """Faults injected into every API request (token requests excluded)."""
+
+    latency_ms: float = 0.0  # added to every request
+    jitter_ms: float = 0.0  # uniform extra latency in [0, jitter_ms]
+    error_rate: float = 0.0  # share of requests answered with 503
+    unauthorized_rate: float = 0.0  # share of requests answered with 401
+    token_ttl: Optional[float] = None  # seconds before an issued token is rejected
+    seed: int = 0
+
+
+@dataclass
+class RequestStats:
+    """Counters of what the stand-in served."""
+
+    requests: int = 0
+    tokens_issued: int = 0
+    unauthorized: int = 0
+    errors: int = 0
+    by_route: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Record:
+    id: str
+    model: str
+    version: str
+    data: Dict[str, Any]
+    state: str = "CREATED"
+    created: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    changes: List[Dict[str, Any]] = field(default_factory=list)
+
+    def envelope(self) -> Dict[str, Any]:
+        return {
+            "data": self.data,
+            "meta": {
+                "id": self.id,
+                "state": self.state,
+                "creationDate": self.created,
+                "modelKey": {"name": self.model, "version": self.version},
+            },
+        }
+
+
+class FakeCyodaStore:
+    """In-memory entities, edge messages and search snapshots."""
+
+    def __init__(self) -> None:
+        self.entities: Dict[str, _Record] = {}
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.snapshots: Dict[str, List[str]] = {}
+
+    def add(self, model: str, version: str, data: Dict[str, Any]) -> str:
+        record = _Record(str(uuid.uuid4()), model, str(version), data)
+        record.changes.append(_change("CREATE", record))
+        self.entities[record.id] = record
+        return record.id
+
+    def of_model(self, model: str, version: str) -> List[_Record]:
+        return [
+            r
+            for r in self.entities.values()
+            if r.model == model and r.version == str(version)
+        ]
+
+    def search(
+        self, model: str, version: str, condition: Dict[str, Any]
+    ) -> List[_Record]:
+        return [r for r in self.of_model(model, version) if _matches(condition, r)]
+
+
+def _change(change_type: str, record: _Record) -> Dict[str, Any]:
+    return {
+        "changeType": change_type,
+        "timeOfChange": datetime.now(timezone.utc).isoformat(),
+        "state": record.state,
+    }
+
+
+# -----------------------
+# Search condition matching
+# -----------------------
+
+
+def _json_path(data: Any, path: str) -> Any:
+    for part in path.removeprefix("$.").split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(part)
+    return data
+
+
+def _compare(operator: str, actual: Any, expected: Any) -> bool:
+    if operator.startswith("I") and operator not in ("IS_NULL", "IS_CHANGED"):
+        operator = operator[1:]
+        actual = str(actual).lower() if actual is not None else None
+        expected = str(expected).lower() if expected is not None else None
+    negate = operator.startswith("NOT_") and operator != "NOT_NULL"
+    if operator == "NOT_EQUAL":
+        operator, negate = "EQUALS", True
+    elif negate:
+        operator = operator[4:]
+
+    if operator == "EQUALS":
+        result = actual == expected
+    elif operator == "IS_NULL":
+        result = actual is None
+    elif operator == "NOT_NULL":
+        result = actual is not None
+    elif operator == "CONTAINS":
+        result = actual is not None and str(expected) in str(actual)
+    elif operator == "STARTS_WITH":
+        result = actual is not None and str(actual).startswith(str(expected))
+    elif operator == "ENDS_WITH":
+        result = actual is not None and str(actual).endswith(str(expected))
+    elif operator in ("GREATER_THAN", "GREATER_OR_EQUAL", "LESS_THAN", "LESS_OR_EQUAL"):
+        try:
+            a, b = float(actual), float(expected)
+        except (TypeError, ValueError):
+            return False
+        result = {
+            "GREATER_THAN": a > b,
+            "GREATER_OR_EQUAL": a >= b,
+            "LESS_THAN": a < b,
+            "LESS_OR_EQUAL": a <= b,
+        }[operator]
+    elif operator in ("BETWEEN", "BETWEEN_INCLUSIVE"):
+        low, high = expected
+        result = _compare("GREATER_OR_EQUAL", actual, low) and _compare(
+            "LESS_OR_EQUAL" if operator == "BETWEEN_INCLUSIVE" else "LESS_THAN",
+            actual,
+            high,
+        )
+    elif operator in ("MATCHES_PATTERN", "LIKE"):
+        result = (
+            actual is not None and re.search(str(expected), str(actual)) is not None
+        )
+    else:
+        # IS_CHANGED / IS_UNCHANGED and unknown operators do not filter
+        result = True
+    return not result if negate else result
+
+
+def _matches(condition: Dict[str, Any], record: _Record) -> bool:
+    condition_type = condition.get("type")
+    if condition_type == "group":
+        results = (_matches(c, record) for c in condition.get("conditions", []))
+        if condition.get("operator", "AND").upper() == "OR":
+            return any(results) or not condition.get("conditions")
+        return all(results)
+    if condition_type == "lifecycle":
+        actual: Any = record.state
+    elif condition_type == "simple":
+        actual = _json_path(record.data, condition.get("jsonPath", ""))
+    else:
+        return True
+    return _compare(
+        condition.get("operatorType", "EQUALS"), actual, condition.get("value")
+    )
+
+
+# -----------------------
+# ASGI application
+# -----------------------
+
+
+def create_fake_cyoda_app(
+    store: Optional[FakeCyodaStore] = None,
+    faults: Optional[FaultConfig] = None,
+    stats: Optional[RequestStats] = None,
+    tokens: Optional[Dict[str, float]] = None,
+) -> Quart:
+    """
+    Create the Cyoda stand-in ASGI app.
+
+    Args:
+        store: Backing store (a new empty one by default)
+        faults: Fault injection settings, read on every request
+        stats: Request counters to update
+        tokens: Issued tokens by value, with their issue time; clearing it
+            revokes every token
+
+    Returns:
+        Quart application serving the API under /api
+    """
+    app = Quart(__name__)
+    store = store or FakeCyodaStore()
+    faults = faults or FaultConfig()
+    stats = stats or RequestStats()
+    tokens = tokens if tokens is not None else {}
+    rng = random.Random(faults.seed)
+
+    def error(status: int, message: str) -> Response:
+        response = jsonify({"error": message, "status": status})
+        response.status_code = status
+        return response
+
+    @app.before_request
+    async def inject_faults() -> Optional[Response]:
+        if request.path == f"{API_PREFIX}/oauth/token":
+            return None
+        stats.requests += 1
+        route = request.url_rule.rule if request.url_rule else request.path
+        key = f"{request.method} {route.removeprefix(API_PREFIX)}"
+        stats.by_route[key] = stats.by_route.get(key, 0) + 1
+
+        delay = faults.latency_ms + rng.uniform(0, faults.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        issued_at = tokens.get(token)
+        expired = issued_at is None or (
+            faults.token_ttl is not None
+            and time.monotonic() - issued_at > faults.token_ttl
+        )
+        if expired or rng.random() < faults.unauthorized_rate:
+            stats.unauthorized += 1
+            return error(401, "Unauthorized")
+        if rng.random() < faults.error_rate:
+            stats.errors += 1
+            return error(503, "Injected failure")
+        return None
+
+    @app.post(f"{API_PREFIX}/oauth/token")
+    async def issue_token() -> Response:
+        token = uuid.uuid4().hex
+        tokens[token] = time.monotonic()
+        stats.tokens_issued += 1
+        return jsonify(
+            {"access_token": token, "token_type": "Bearer", "expires_in": 3600}
+        )
+
+    # Entities
+
+    @app.post(f"{API_PREFIX}/entity/JSON/<model>/<version>")
+    async def save_entities(model: str, version: str) -> Response:
+        body = json.loads(await request.get_data(as_text=True))
+        items = body if isinstance(body, list) else [body]
+        ids = [store.add(model, version, item) for item in items]
+        return jsonify([{"entityIds": ids, "transactionId": str(uuid.uuid4())}])
+
+    @app.put(f"{API_PREFIX}/entity/JSON/<entity_id>")
+    @app.put(f"{API_PREFIX}/entity/JSON/<entity_id>/<transition>")
+    async def update_entity(entity_id: str, transition: Optional[str] = None) -> Any:
+        record = store.entities.get(entity_id)
+        if record is None:
+            return error(404, f"Entity {entity_id} not found")
+        record.data = json.loads(await request.get_data(as_text=True))
+        if transition:
+            record.state = transition
+        record.changes.append(_change("UPDATE", record))
+        return jsonify({"entityIds": [entity_id], "transactionId": str(uuid.uuid4())})
+
+    @app.get(f"{API_PREFIX}/entity/<entity_id>")
+    async def get_entity(entity_id: str) -> Any:
+        record = store.entities.get(entity_id)
+        if record is None:
+            return error(404, f"Entity {entity_id} not found")
+        return jsonify(record.envelope())
+
+    @app.delete(f"{API_PREFIX}/entity/<entity_id>")
+    async def delete_entity(entity_id: str) -> Any:
+        if store.entities.pop(entity_id, None) is None:
+            return error(404, f"Entity {entity_id} not found")
+        return jsonify({"id": entity_id})
+
+    @app.get(f"{API_PREFIX}/entity/<entity_id>/changes")
+    async def entity_changes(entity_id: str) -> Any:
+        record = store.entities.get(entity_id)
+        if record is None:
+            return error(404, f"Entity {entity_id} not found")
+        return jsonify(record.changes)
+
+    @app.get(f"{API_PREFIX}/entity/<model>/<version>")
+    async def list_entities(model: str, version: str) -> Any:
+        records = store.of_model(model, version)
+        if not records:
+            return error(404, f"No entities of {model}/{version}")
+        return jsonify([r.envelope() for r in records])
+
+    @app.delete(f"{API_PREFIX}/entity/<model>/<version>")
+    async def delete_entities(model: str, version: str) -> Response:
+        records = store.of_model(model, version)
+        for record in records:
+            del store.entities[record.id]
+        return jsonify({"deleted": len(records)})
+
+    @app.get(f"{API_PREFIX}/entity/stats/<model>/<version>")
+    async def entity_stats(model: str, version: str) -> Response:
+        count = len(store.of_model(model, version))
+        return jsonify({"modelName": model, "modelVersion": version, "count": count})
+
+    @app.put(f"{API_PREFIX}/platform-api/entity/transition")
+    async def launch_transition() -> Any:
+        entity_id = request.args.get("entityId", "")
+        record = store.entities.get(entity_id)
+        if record is None:
+            return error(404, f"Entity {entity_id} not found")
+        record.state = request.args.get("transitionName", record.state)
+        record.changes.append(_change("TRANSITION", record))
+        return jsonify({"entityId": entity_id, "state": record.state})
+
+    # Edge messages
+
+    @app.post(f"{API_PREFIX}/message/new/<subject>")
+    async def send_message(subject: str) -> Response:
+        body = json.loads(await request.get_data(as_text=True))
+        message_id = str(uuid.uuid4())
+        store.messages[message_id] = {
+            "header": {
+                "subject": subject,
+                "contentType": request.headers.get("Content-Type", ""),
+                "messageId": request.headers.get("X-Message-ID", message_id),
+                "userId": request.headers.get("X-User-ID", ""),
+            },
+            "metaData": {"values": body.get("meta-data", {}), "indexedValues": {}},
+            "content": json.dumps(body.get("payload", body)),
+        }
+        return jsonify([{"entityIds": [message_id], "success": True}])
+
+    @app.get(f"{API_PREFIX}/message/<message_id>")
+    async def get_message(message_id: str) -> Any:
+        message = store.messages.get(message_id)
+        if message is None:
+            return error(404, f"Message {message_id} not found")
+        return jsonify(message)
+
+    # Search
+
+    @app.post(f"{API_PREFIX}/search/<model>/<version>")
+    async def direct_search(model: str, version: str) -> Response:
+        condition = json.loads(await request.get_data(as_text=True) or "{}")
+        records = store.search(model, version, condition)
+        limit = request.args.get("limit", type=int)
+        if limit is not None:
+            records = records[:limit]
+
+        async def rows() -> AsyncIterator[bytes]:
+            for record in records:
+                yield (json.dumps(record.envelope()) + "\n").encode()
+
+        return Response(rows(), mimetype="application/x-ndjson")
+
+    @app.post(f"{API_PREFIX}/search/snapshot/<model>/<version>")
+    async def create_snapshot(model: str, version: str) -> Response:
+        condition = json.loads(await request.get_data(as_text=True) or "{}")
+        snapshot_id = str(uuid.uuid4())
+        store.snapshots[snapshot_id] = [
+            r.id for r in store.search(model, version, condition)
+        ]
+        return jsonify(snapshot_id)
+
+    @app.get(f"{API_PREFIX}/search/snapshot/<snapshot_id>/status")
+    async def snapshot_status(snapshot_id: str) -> Any:
+        if snapshot_id not in store.snapshots:
+            return error(404, f"Snapshot {snapshot_id} not found")
+        return jsonify(
+            {
+                "snapshotId": snapshot_id,
+                "snapshotStatus": "SUCCESSFUL",
+                "entitiesCount": len(store.snapshots[snapshot_id]),
+            }
+        )
+
+    @app.get(f"{API_PREFIX}/search/snapshot/<snapshot_id>")
+    async def snapshot_page(snapshot_id: str) -> Any:
+        ids = store.snapshots.get(snapshot_id)
+        if ids is None:
+            return error(404, f"Snapshot {snapshot_id} not found")
+        page_size = request.args.get("pageSize", 1000, type=int)
+        page_number = request.args.get("pageNumber", 0, type=int)
+        page_ids = ids[page_number * page_size : (page_number + 1) * page_size]
+        return jsonify(
+            {
+                "content": [
+                    store.entities[i].envelope()
+                    for i in page_ids
+                    if i in store.entities
+                ],
+                "page": {
+                    "number": page_number,
+                    "size": page_size,
+                    "totalElements": len(ids),
+                    "totalPages": -(-len(ids) // page_size),
+                },
+            }
+        )
+
+    return app
+
+
+# -----------------------
+# Server
+# -----------------------
+
+
+class FakeCyodaRestServer:
+    """Serves the stand-in app on a loopback port from a background thread."""
+
+    def __init__(self, faults: Optional[FaultConfig] = None) -> None:
+        self.faults = faults or FaultConfig()
+        self.store = FakeCyodaStore()
+        self.stats = RequestStats()
+        self.tokens: Dict[str, float] = {}
+        self.app = create_fake_cyoda_app(
+            self.store, self.faults, self.stats, self.tokens
+        )
+        self.port = _free_port()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown: Optional[asyncio.Event] = None
+
+    @property
+    def api_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}{API_PREFIX}"
+
+    @property
+    def token_url(self) -> str:
+        return f"{self.api_url}/oauth/token"
+
+    def start(self, timeout: float = 10.0) -> "FakeCyodaRestServer":
+        self._thread = threading.Thread(
+            target=self._serve, name="fake-cyoda-rest", daemon=True
+        )
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.1):
+                    return self
+            except OSError:
+                time.sleep(0.02)
+        raise RuntimeError(f"Fake Cyoda server did not start on port {self.port}")
+
+    def reset_faults(self) -> None:
+        """Restore the default (fault-free) settings in place."""
+        defaults = FaultConfig()
+        for f in fields(FaultConfig):
+            setattr(self.faults, f.name, getattr(defaults, f.name))
+
+    def expire_tokens(self) -> None:
+        """Reject every token issued so far, as if they had all expired."""
+        self.tokens.clear()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._shutdown is not None:
+            self._loop.call_soon_threadsafe(self._shutdown.set)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def __enter__(self) -> "FakeCyodaRestServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _serve(self) -> None:
+        config = Config()
+        config.bind = [f"127.0.0.1:{self.port}"]
+        config.accesslog = None
+        config.errorlog = None
+        self._loop = asyncio.new_event_loop()
+        self._shutdown = asyncio.Event()
+        try:
+            self._loop.run_until_complete(
+                serve(self.app, config, shutdown_trigger=self._shutdown.wait)
+            )
+        finally:
+            self._loop.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
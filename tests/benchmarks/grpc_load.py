@@ -0,0 +1,242 @@
+"""
+Load benchmark for the gRPC processing path.
+
+Runs the real client stack (GrpcStreamingFacade, middleware chain,
+CalcRequestHandler / CriteriaCalcRequestHandler, ProcessorManager and Outbox)
+against the in-process FakeCyodaServer and reports throughput, end-to-end
+latency, memory high-water mark and event-loop lag as JSON. Output is
+key-sorted and rounded so two runs can be diffed directly.
+
+Usage:
+    python -m tests.benchmarks.grpc_load --rate 200 500 --duration 5 \\
+        --calc-ratio 0.8 --payload-bytes 4096 --processor-latency-ms 2 \\
+        -o grpc_load.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+import grpc
+
+from common.grpc_client.factory import GrpcStreamingFacadeFactory
+from common.processor.base import CyodaCriteriaChecker, CyodaEntity, CyodaProcessor
+from common.processor.manager import ProcessorManager
+from tests.benchmarks.fake_cyoda_grpc import (
+    BENCH_CRITERIA_NAME,
+    BENCH_PROCESSOR_NAME,
+    FakeCyodaServer,
+    LoadProfile,
+)
+
+LOOP_LAG_INTERVAL = 0.01
+
+
+class BenchProcessor(CyodaProcessor):
+    """Processor with a configurable simulated latency."""
+
+    def __init__(self, latency_ms: float) -> None:
+        super().__init__(name=BENCH_PROCESSOR_NAME)
+        self.latency = latency_ms / 1000
+
+    async def process(self, entity: CyodaEntity, **kwargs: Any) -> CyodaEntity:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        entity.set_state("PROCESSED")
+        return entity
+
+
+class BenchCriterion(CyodaCriteriaChecker):
+    """Criteria checker with a configurable simulated latency."""
+
+    def __init__(self, latency_ms: float) -> None:
+        super().__init__(name=BENCH_CRITERIA_NAME)
+        self.latency = latency_ms / 1000
+
+    async def check(self, entity: CyodaEntity, **kwargs: Any) -> bool:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return True
+
+
+class _BenchAuth:
+    def get_access_token_sync(self) -> str:
+        return "bench-token"
+
+    def invalidate_tokens(self) -> None:
+        pass
+
+
+class _LoopLagMonitor:
+    """Samples how late the event loop wakes up from a short sleep."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional["asyncio.Future[None]"] = None
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def _latency_summary(seconds: List[float]) -> Dict[str, Any]:
+    return {
+        "count": len(seconds),
+        "p50_ms": round(_percentile(seconds, 50) * 1000, 3),
+        "p99_ms": round(_percentile(seconds, 99) * 1000, 3),
+        "max_ms": round(max(seconds, default=0.0) * 1000, 3),
+    }
+
+
+def _max_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 1)
+
+
+def _build_processor_manager(profile: LoadProfile) -> ProcessorManager:
+    manager = ProcessorManager(modules=[])
+    manager.register_processor(BenchProcessor(profile.processor_latency_ms))
+    manager.register_criteria(BenchCriterion(profile.criteria_latency_ms))
+    return manager
+
+
+async def run_benchmark(profile: LoadProfile) -> Dict[str, Any]:
+    """
+    Run one load profile against the in-process fake server.
+
+    Args:
+        profile: Load to offer
+
+    Returns:
+        JSON-serializable results for the profile
+    """
+    server = FakeCyodaServer(profile)
+    address = await server.start()
+    facade = GrpcStreamingFacadeFactory.create(
+        auth=_BenchAuth(),
+        processor_loop=None,
+        processor_manager=_build_processor_manager(profile),
+        address=address,
+        channel_credentials=grpc.local_channel_credentials(
+            grpc.LocalConnectionType.LOCAL_TCP
+        ),
+    )
+    lag = _LoopLagMonitor()
+    lag.start()
+    client = asyncio.ensure_future(facade.start())
+    try:
+        await server.finished.wait()
+    finally:
+        facade.stop()
+        await server.stop()
+        await asyncio.gather(client, return_exceptions=True)
+        await lag.stop()
+
+    stats = server.stats
+    elapsed = (stats.last_received_at or 0.0) - (stats.first_sent_at or 0.0)
+    send_window = (stats.last_sent_at or 0.0) - (stats.first_sent_at or 0.0)
+    all_latencies = stats.latencies["calc"] + stats.latencies["criteria"]
+    return {
+        "profile": asdict(profile),
+        "requests": {
+            "sent": stats.sent,
+            "received": stats.received,
+            "failed": stats.failed,
+            "unanswered": stats.sent - stats.received,
+        },
+        "throughput": {
+            "offered_per_sec": (
+                round(stats.sent / send_window, 1) if send_window else 0.0
+            ),
+            "events_per_sec": round(stats.received / elapsed, 1) if elapsed else 0.0,
+        },
+        "latency": {
+            "all": _latency_summary(all_latencies),
+            "calc": _latency_summary(stats.latencies["calc"]),
+            "criteria": _latency_summary(stats.latencies["criteria"]),
+        },
+        "event_loop_lag": {
+            "p99_ms": round(_percentile(lag.samples, 99) * 1000, 3),
+            "max_ms": round(max(lag.samples, default=0.0) * 1000, 3),
+        },
+        "max_rss_mib": _max_rss_mib(),
+    }
+
+
+async def run_benchmarks(profiles: List[LoadProfile]) -> Dict[str, Any]:
+    """Run profiles one after another (each against a fresh server)."""
+    return {"runs": [await run_benchmark(profile) for profile in profiles]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rate", type=float, nargs="+", default=[200.0], help="requests/sec"
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--calc-ratio", type=float, default=0.8)
+    parser.add_argument("--payload-bytes", type=int, default=1024)
+    parser.add_argument("--processor-latency-ms", type=float, default=0.0)
+    parser.add_argument("--criteria-latency-ms", type=float, default=0.0)
+    parser.add_argument("--drain-timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument(
+        "--log-level", default="WARNING", help="client log level (default WARNING)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper())
+    profiles = [
+        LoadProfile(
+            rate=rate,
+            duration=args.duration,
+            calc_ratio=args.calc_ratio,
+            payload_bytes=args.payload_bytes,
+            processor_latency_ms=args.processor_latency_ms,
+            criteria_latency_ms=args.criteria_latency_ms,
+            drain_timeout=args.drain_timeout,
+            seed=args.seed,
+        )
+        for rate in args.rate
+    ]
+    results = asyncio.run(run_benchmarks(profiles))
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Smoke test for the gRPC load benchmark."""
+
+import json
+
+import pytest
+
+from tests.benchmarks.fake_cyoda_grpc import LoadProfile
+from tests.benchmarks.grpc_load import main, run_benchmark
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_benchmark_answers_every_request():
+    profile = LoadProfile(
+        rate=400, duration=0.25, calc_ratio=0.5, processor_latency_ms=1, seed=1
+    )
+
+    result = await run_benchmark(profile)
+
+    assert result["requests"] == {
+        "sent": 100,
+        "received": 100,
+        "failed": 0,
+        "unanswered": 0,
+    }
+    latency = result["latency"]
+    assert latency["calc"]["count"] + latency["criteria"]["count"] == 100
+    assert 0 < latency["all"]["p50_ms"] <= latency["all"]["p99_ms"]
+    assert result["throughput"]["events_per_sec"] > 0
+    assert result["max_rss_mib"] > 0
+
+
+@pytest.mark.slow
+def test_cli_writes_sorted_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+
+    main(["--rate", "200", "--duration", "0.1", "-o", str(output)])
+
+    results = json.loads(output.read_text())
+    assert [run["profile"]["rate"] for run in results["runs"]] == [200.0]
+    assert output.read_text() == json.dumps(results, indent=2, sort_keys=True) + "\n"
@@ -0,0 +1,152 @@
+"""
+Repository benchmarks against the local Cyoda REST stand-in.
+
+Each benchmark awaits ``concurrency`` calls at once through EntityServiceImpl
+and CyodaRepository, over real HTTP to FakeCyodaRestServer. Run with
+``--benchmark-only`` for timings, or ``--benchmark-disable`` to run them once
+as functional checks.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from common.service.entity_service import SearchConditionRequest
+from tests.benchmarks.conftest import BENCH_ENTITY, BENCH_VERSION
+from tests.benchmarks.fake_cyoda_rest import FakeCyodaRestServer
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+SEEDED_ENTITIES = 200
+WRITE_ENTITY = "BenchWrite"
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def seeded_ids(fake_cyoda: FakeCyodaRestServer) -> List[str]:
+    return [
+        fake_cyoda.store.add(
+            BENCH_ENTITY,
+            BENCH_VERSION,
+            {"name": f"item-{i}", "value": i, "group": f"g{i % 10}"},
+        )
+        for i in range(SEEDED_ENTITIES)
+    ]
+
+
+def _pedantic(benchmark: Any, run: Any, *args: Any) -> Any:
+    return benchmark.pedantic(
+        run, args=args, rounds=ROUNDS, iterations=1, warmup_rounds=1
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 16])
+def test_get_by_id(
+    benchmark, entity_service, run_concurrently, seeded_ids, concurrency
+):
+    async def call(i: int) -> Any:
+        return await entity_service.get_by_id(
+            seeded_ids[i], BENCH_ENTITY, BENCH_VERSION
+        )
+
+    results = _pedantic(benchmark, run_concurrently, call, concurrency)
+
+    assert [r.data["technical_id"] for r in results] == seeded_ids[:concurrency]
+
+
+@pytest.mark.parametrize("concurrency", [1, 16])
+def test_find_all(benchmark, entity_service, run_concurrently, seeded_ids, concurrency):
+    async def call(i: int) -> Any:
+        return await entity_service.find_all(BENCH_ENTITY, BENCH_VERSION)
+
+    results = _pedantic(benchmark, run_concurrently, call, concurrency)
+
+    assert [len(r) for r in results] == [SEEDED_ENTITIES] * concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 16])
+def test_search_direct(
+    benchmark, entity_service, run_concurrently, seeded_ids, concurrency
+):
+    condition = SearchConditionRequest.builder().equals("group", "g3").limit(50).build()
+
+    async def call(i: int) -> Any:
+        return await entity_service.search(BENCH_ENTITY, condition, BENCH_VERSION)
+
+    results = _pedantic(benchmark, run_concurrently, call, concurrency)
+
+    assert [len(r) for r in results] == [SEEDED_ENTITIES // 10] * concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_search_snapshot(
+    benchmark, entity_service, run_concurrently, seeded_ids, concurrency
+):
+    # Unbounded searches go through a search snapshot and are paged
+    condition = SearchConditionRequest.builder().equals("group", "g3").build()
+
+    async def call(i: int) -> Any:
+        return await entity_service.search(BENCH_ENTITY, condition, BENCH_VERSION)
+
+    results = _pedantic(benchmark, run_concurrently, call, concurrency)
+
+    assert [len(r) for r in results] == [SEEDED_ENTITIES // 10] * concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_save_all(benchmark, entity_service, run_concurrently, concurrency):
+    batch: List[Dict[str, Any]] = [{"name": f"w-{i}", "value": i} for i in range(50)]
+
+    async def call(i: int) -> Any:
+        return await entity_service.save_all(batch, WRITE_ENTITY, BENCH_VERSION)
+
+    results = _pedantic(benchmark, run_concurrently, call, concurrency)
+
+    assert [len(r) for r in results] == [len(batch)] * concurrency
+
+
+def test_find_all_with_injected_latency(
+    benchmark, fake_cyoda, entity_service, run_concurrently, seeded_ids
+):
+    fake_cyoda.faults.latency_ms = 5
+    fake_cyoda.faults.jitter_ms = 5
+
+    async def call(i: int) -> Any:
+        return await entity_service.find_all(BENCH_ENTITY, BENCH_VERSION)
+
+    results = _pedantic(benchmark, run_concurrently, call, 16)
+
+    assert [len(r) for r in results] == [SEEDED_ENTITIES] * 16
+
+
+def test_expired_token_is_refetched(fake_cyoda, entity_service, bench_loop, seeded_ids):
+    bench_loop.run_until_complete(entity_service.find_all(BENCH_ENTITY, BENCH_VERSION))
+    issued = fake_cyoda.stats.tokens_issued
+    rejected = fake_cyoda.stats.unauthorized
+    fake_cyoda.expire_tokens()
+
+    result = bench_loop.run_until_complete(
+        entity_service.get_by_id(seeded_ids[0], BENCH_ENTITY, BENCH_VERSION)
+    )
+
+    assert result is not None
+    assert fake_cyoda.stats.unauthorized == rejected + 1
+    assert fake_cyoda.stats.tokens_issued == issued + 1
+
+
+def test_injected_errors_are_counted(
+    fake_cyoda, entity_service, run_concurrently, seeded_ids
+):
+    fake_cyoda.faults.error_rate = 1.0
+    errors = fake_cyoda.stats.errors
+
+    async def call(i: int) -> Any:
+        return await entity_service.find_all(BENCH_ENTITY, BENCH_VERSION)
+
+    results = run_concurrently(call, 4)
+
+    # CyodaRepository.find_all reports a failed request as an empty result
+    assert results == [[]] * 4
+    assert fake_cyoda.stats.errors == errors + 4
@@ -260,3 +260,117 @@ class TestConversationRepositorySearch:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestConversationRepositoryTransferOwnership:
+    """Test bulk ownership transfer."""
+
+    @pytest.mark.asyncio
+    async def test_transfer_rereads_before_writing(self):
+        """Test messages added after the search are kept by the transfer."""
+        searched = [
+            create_test_conversation(technical_id=f"conv-{i}", user_id="guest.1")
+            for i in range(3)
+        ]
+
+        async def get_by_id(**kwargs):
+            current = create_test_conversation_with_messages(num_messages=2)
+            current.technical_id = kwargs["entity_id"]
+            current.user_id = "guest.1"
+            return Mock(data=current.model_dump())
+
+        mock_entity_service = Mock()
+        mock_entity_service.update = AsyncMock(
+            side_effect=lambda **kwargs: Mock(data=kwargs["entity"])
+        )
+        mock_entity_service.get_by_id = AsyncMock(side_effect=get_by_id)
+        repo = ConversationRepository(mock_entity_service)
+
+        results = await repo.transfer_ownership(searched, "alice", concurrency=2)
+
+        assert sorted(r.conversation_id for r in results) == [
+            "conv-0",
+            "conv-1",
+            "conv-2",
+        ]
+        assert all(r.success for r in results)
+        assert mock_entity_service.get_by_id.await_count == 3
+        for call in mock_entity_service.update.await_args_list:
+            assert call.kwargs["entity"]["user_id"] == "alice"
+            assert len(call.kwargs["entity"]["chat_flow"]["finished_flow"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_transfer_conflict_reapplies_owner_on_fresh_version(self):
+        """Test a conflict re-reads and keeps concurrently added messages."""
+        stale = create_test_conversation(technical_id="conv-1", user_id="guest.1")
+        fresh = create_test_conversation_with_messages(num_messages=2)
+        fresh.technical_id = "conv-1"
+        fresh.user_id = "guest.1"
+
+        mock_entity_service = Mock()
+        mock_entity_service.update = AsyncMock(
+            side_effect=[Exception("422 version mismatch"), Mock(data={})]
+        )
+        mock_entity_service.get_by_id = AsyncMock(
+            return_value=Mock(data=fresh.model_dump())
+        )
+        repo = ConversationRepository(mock_entity_service)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            results = await repo.transfer_ownership([stale], "alice")
+
+        assert results[0].success
+        written = mock_entity_service.update.await_args.kwargs["entity"]
+        assert written["user_id"] == "alice"
+        assert len(written["chat_flow"]["finished_flow"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_transfer_reports_failures_per_chat(self):
+        """Test one failing chat does not stop the others."""
+        conversations = [
+            create_test_conversation(technical_id=f"conv-{i}", user_id="guest.1")
+            for i in range(2)
+        ]
+
+        async def update(**kwargs):
+            if kwargs["entity_id"] == "conv-0":
+                raise Exception("403 forbidden")
+            return Mock(data=kwargs["entity"])
+
+        mock_entity_service = Mock()
+        mock_entity_service.update = AsyncMock(side_effect=update)
+        mock_entity_service.get_by_id = AsyncMock(
+            side_effect=lambda **kwargs: Mock(
+                data=next(
+                    c.model_dump()
+                    for c in conversations
+                    if c.technical_id == kwargs["entity_id"]
+                )
+            )
+        )
+        repo = ConversationRepository(mock_entity_service)
+
+        results = {
+            r.conversation_id: r
+            for r in await repo.transfer_ownership(conversations, "alice")
+        }
+
+        assert results["conv-0"].success is False
+        assert "403" in results["conv-0"].error
+        assert results["conv-1"].success is True
+
+    @pytest.mark.asyncio
+    async def test_transfer_skips_deleted_conversation(self):
+        """Test a conversation deleted since the search is reported, not written."""
+        mock_entity_service = Mock()
+        mock_entity_service.get_by_id = AsyncMock(return_value=None)
+        mock_entity_service.update = AsyncMock()
+        repo = ConversationRepository(mock_entity_service)
+
+        results = await repo.transfer_ownership(
+            [create_test_conversation(technical_id="conv-1")], "alice"
+        )
+
+        assert results[0].success is False
+        assert results[0].error == "Conversation not found"
+        mock_entity_service.update.assert_not_called()
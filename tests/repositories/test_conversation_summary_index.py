@@ -0,0 +1,373 @@
+"""
+Unit tests for ConversationSummaryIndex and the repository hooks feeding it.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.repositories.conversation_repository import ConversationRepository
+from application.repositories.conversation_summary_index import (
+    ConversationSummaryIndex,
+)
+from application.services.chat.service import ChatService
+from tests.fixtures.conversation_fixtures import create_test_conversation
+
+
+def _summary(conversation_id, date, user_id="alice", name="Chat"):
+    return Mock(
+        data={
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "name": name,
+            "description": "",
+            "date": date,
+        },
+        metadata=Mock(id=f"summary-{conversation_id}"),
+    )
+
+
+def _entity_service():
+    service = Mock()
+    service.find_by_business_id = AsyncMock(return_value=None)
+    service.save = AsyncMock(return_value=Mock(metadata=Mock(id="summary-1")))
+    service.update = AsyncMock(return_value=Mock(metadata=Mock(id="summary-1")))
+    service.delete_by_id = AsyncMock()
+    service.search = AsyncMock(return_value=[])
+    service.find_all = AsyncMock(return_value=[])
+    return service
+
+
+def _listing_service(summaries=(), conversations=(), backfilled=True):
+    """Entity service whose search answers per entity class."""
+    service = _entity_service()
+    service.summaries = list(summaries)
+    service.markers = [Mock(data={"scope": "*"})] if backfilled else []
+
+    async def search(entity_class, condition, entity_version):
+        if entity_class == "ConversationSummaryBackfill":
+            return service.markers
+        if entity_class == "Conversation":
+            return list(conversations)
+        return list(service.summaries)
+
+    async def save(entity, entity_class, entity_version):
+        if entity_class == "ConversationSummary":
+            service.summaries.append(
+                Mock(data=entity, metadata=Mock(id=entity["conversation_id"]))
+            )
+        elif entity_class == "ConversationSummaryBackfill":
+            service.markers.append(Mock(data=entity))
+        return Mock(metadata=Mock(id=f"id-{len(service.save.await_args_list)}"))
+
+    service.search.side_effect = search
+    service.save.side_effect = save
+    service.find_all.side_effect = lambda **kwargs: list(conversations)
+    return service
+
+
+def _conversation_response(conversation):
+    return {"technical_id": conversation.technical_id, **conversation.model_dump()}
+
+
+class TestSummaryMaintenance:
+    """Test summaries written through ConversationRepository hooks."""
+
+    @pytest.mark.asyncio
+    async def test_create_writes_summary_and_update_skips_unchanged(self):
+        service = _entity_service()
+        conversation = create_test_conversation(user_id="alice")
+        service.save.side_effect = [
+            Mock(data=conversation.model_dump()),
+            Mock(metadata=Mock(id="summary-1")),
+        ]
+        service.update.side_effect = lambda **kwargs: (
+            Mock(data=kwargs["entity"], metadata=Mock(id="x"))
+        )
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+
+        created = await repo.create(conversation)
+        created.add_message("user", "msg-1")
+        await repo.update_with_retry(created)
+
+        summary_saves = [
+            call
+            for call in service.save.await_args_list
+            if call.kwargs["entity_class"] == "ConversationSummary"
+        ]
+        assert len(summary_saves) == 1
+        # Appending a message leaves the summary alone
+        assert [c.kwargs["entity_class"] for c in service.update.await_args_list] == [
+            "Conversation"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rename_updates_summary_and_notifies_owner(self):
+        service = _entity_service()
+        index = ConversationSummaryIndex(service)
+        changed = []
+        index.add_listener(changed.append)
+        conversation = create_test_conversation(user_id="alice")
+
+        await index.upsert(conversation)
+        conversation.name = "Renamed"
+        await index.upsert(conversation)
+
+        assert service.update.await_args.kwargs["entity"]["name"] == "Renamed"
+        assert service.update.await_args.kwargs["entity_id"] == "summary-1"
+        assert changed == ["alice", "alice"]
+
+    @pytest.mark.asyncio
+    async def test_transfer_notifies_previous_owner(self):
+        service = _entity_service()
+        conversation = create_test_conversation(user_id="alice")
+        service.find_by_business_id.return_value = _summary(
+            conversation.technical_id, conversation.date, user_id="guest.1"
+        )
+        index = ConversationSummaryIndex(service)
+        changed = []
+        index.add_listener(changed.append)
+
+        await index.upsert(conversation)
+
+        assert sorted(changed) == ["alice", "guest.1"]
+        service.save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_summary(self):
+        service = _entity_service()
+        service.find_by_business_id.return_value = _summary("conv-1", "2024-01-01")
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+
+        await repo.delete("conv-1", "alice")
+
+        entity_classes = [
+            c.kwargs["entity_class"] for c in service.delete_by_id.await_args_list
+        ]
+        assert entity_classes == ["Conversation", "ConversationSummary"]
+
+    @pytest.mark.asyncio
+    async def test_summary_failure_does_not_fail_update(self):
+        service = _entity_service()
+        conversation = create_test_conversation()
+        service.update.return_value = Mock(data=conversation.model_dump())
+        service.find_by_business_id.side_effect = Exception("search down")
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+
+        result = await repo.update_with_retry(conversation)
+
+        assert result.technical_id == conversation.technical_id
+
+    @pytest.mark.asyncio
+    async def test_cached_summaries_are_bounded(self):
+        service = _entity_service()
+        index = ConversationSummaryIndex(service, max_cached=2)
+        conversations = [
+            create_test_conversation(technical_id=f"conv-{i}") for i in range(3)
+        ]
+
+        for conversation in conversations:
+            await index.upsert(conversation)
+        # conv-0 was evicted, so an unchanged upsert looks its summary up again
+        await index.upsert(conversations[0])
+
+        assert list(index._written) == ["conv-2", "conv-0"]
+        assert len(index._technical_ids) == 2
+        assert service.find_by_business_id.await_count == 4
+
+
+class TestKeysetListing:
+    """Test keyset pagination over summaries."""
+
+    @pytest.mark.asyncio
+    async def test_pages_with_ties_on_date(self):
+        service = _entity_service()
+        rows = [
+            _summary("c", "2024-01-03"),
+            _summary("a", "2024-01-02"),
+            _summary("b", "2024-01-02"),
+            _summary("d", "2024-01-01"),
+        ]
+        service.search.return_value = rows
+        index = ConversationSummaryIndex(service)
+
+        first = await index.list_page("alice", limit=2)
+        service.search.return_value = rows[1:]
+        second = await index.list_page("alice", limit=2, cursor=("2024-01-02", "b"))
+
+        assert [row["technical_id"] for row in first] == ["c", "b"]
+        assert [row["technical_id"] for row in second] == ["a", "d"]
+        condition = service.search.await_args.kwargs["condition"]
+        assert [(c.field, c.operator.value) for c in condition.conditions] == [
+            ("user_id", "EQUALS"),
+            ("date", "LESS_OR_EQUAL"),
+            ("date", "GREATER_OR_EQUAL"),
+        ]
+        assert set(first[0]) == {"technical_id", "name", "description", "date"}
+
+    @pytest.mark.asyncio
+    async def test_widens_date_window_until_page_is_filled(self):
+        service = _entity_service()
+        windows = [
+            [_summary("c", "2024-01-03")],
+            [],
+            [_summary("b", "2023-06-01"), _summary("a", "2023-05-01")],
+        ]
+        service.search.side_effect = windows
+        index = ConversationSummaryIndex(service)
+
+        page = await index.list_page("alice", limit=2, cursor=("2024-01-04", "z"))
+
+        assert [row["technical_id"] for row in page] == ["c", "b"]
+        bounds = [
+            [
+                (c.operator.value, c.value)
+                for c in call.kwargs["condition"].conditions
+                if c.field == "date"
+            ]
+            for call in service.search.await_args_list
+        ]
+        assert bounds == [
+            [
+                ("LESS_OR_EQUAL", "2024-01-04"),
+                ("GREATER_OR_EQUAL", "2023-12-05T00:00:00+00:00"),
+            ],
+            [
+                ("LESS_THAN", "2023-12-05T00:00:00+00:00"),
+                ("GREATER_OR_EQUAL", "2023-09-06T00:00:00+00:00"),
+            ],
+            [
+                ("LESS_THAN", "2023-09-06T00:00:00+00:00"),
+                ("GREATER_OR_EQUAL", "2022-09-11T00:00:00+00:00"),
+            ],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_last_window_reads_remaining_history(self):
+        service = _entity_service()
+        service.search.side_effect = [[], [], [], [_summary("a", "1999-01-01")]]
+        index = ConversationSummaryIndex(service)
+
+        page = await index.list_page("alice", limit=2)
+
+        assert [row["technical_id"] for row in page] == ["a"]
+        last = service.search.await_args.kwargs["condition"].conditions
+        assert [(c.field, c.operator.value) for c in last] == [
+            ("user_id", "EQUALS"),
+            ("date", "LESS_THAN"),
+        ]
+
+
+class TestChatServiceWithSummaryIndex:
+    """Test listing and cache invalidation through ChatService."""
+
+    @pytest.mark.asyncio
+    async def test_listing_reads_summaries_and_returns_cursor(self):
+        service = _listing_service(
+            summaries=[
+                _summary("c", "2024-01-03"),
+                _summary("b", "2024-01-02"),
+                _summary("a", "2024-01-01"),
+            ]
+        )
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+        chat_service = ChatService(repo, Mock())
+
+        result = await chat_service.list_conversations(
+            user_id="alice", limit=2, use_cache=False
+        )
+        service.summaries = [_summary("a", "2024-01-01")]
+        following = await chat_service.list_conversations(
+            user_id="alice", limit=2, before=result["next_cursor"], use_cache=False
+        )
+
+        assert [chat["technical_id"] for chat in result["chats"]] == ["c", "b"]
+        assert result["has_more"] is True
+        assert [chat["technical_id"] for chat in following["chats"]] == ["a"]
+        assert following["has_more"] is False
+        # Full conversations are never searched once the scope is backfilled
+        assert "Conversation" not in {
+            c.kwargs["entity_class"] for c in service.search.await_args_list
+        }
+
+    @pytest.mark.asyncio
+    async def test_legacy_conversations_are_backfilled_once(self):
+        legacy = create_test_conversation(user_id="alice")
+        service = _listing_service(
+            # A chat created after the index existed is already summarized
+            summaries=[_summary("new", "2030-01-01")],
+            conversations=[_conversation_response(legacy)],
+            backfilled=False,
+        )
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+        chat_service = ChatService(repo, Mock())
+
+        result = await chat_service.list_conversations(user_id="alice", limit=10)
+        await ChatService(repo, Mock()).list_conversations(
+            user_id="alice", limit=10, use_cache=False
+        )
+
+        assert [chat["technical_id"] for chat in result["chats"]] == [
+            "new",
+            legacy.technical_id,
+        ]
+        saved = [c.kwargs["entity_class"] for c in service.save.await_args_list]
+        assert saved == ["ConversationSummary", "ConversationSummaryBackfill"]
+        assert service.save.await_args.kwargs["entity"]["scope"] == "alice"
+
+    @pytest.mark.asyncio
+    async def test_superuser_listing_backfills_all_users(self):
+        legacy = create_test_conversation(user_id="bob")
+        service = _listing_service(
+            conversations=[_conversation_response(legacy)], backfilled=False
+        )
+        index = ConversationSummaryIndex(service)
+        chat_service = ChatService(ConversationRepository(service, index), Mock())
+
+        result = await chat_service.list_conversations(user_id=None, limit=10)
+
+        assert [chat["technical_id"] for chat in result["chats"]] == [
+            legacy.technical_id
+        ]
+        service.find_all.assert_awaited_once()
+        assert service.summaries[0].data["user_id"] == "bob"
+        assert service.save.await_args.kwargs["entity"]["scope"] == "*"
+        # The all-users marker covers every user's listing
+        assert await index.ensure_backfilled("bob") is False
+
+    @pytest.mark.asyncio
+    async def test_failed_backfill_writes_no_marker(self):
+        legacy = create_test_conversation(user_id="alice")
+        service = _listing_service(
+            conversations=[_conversation_response(legacy)], backfilled=False
+        )
+        service.find_by_business_id.side_effect = Exception("search down")
+        index = ConversationSummaryIndex(service)
+
+        assert await index.ensure_backfilled("alice") is False
+        assert service.markers == []
+
+    @pytest.mark.asyncio
+    async def test_cache_is_invalidated_by_summary_changes_only(self):
+        service = _entity_service()
+        conversation = create_test_conversation(user_id="alice")
+        service.update.side_effect = lambda **kwargs: (
+            Mock(data=kwargs["entity"], metadata=Mock(id="summary-1"))
+        )
+        repo = ConversationRepository(service, ConversationSummaryIndex(service))
+        chat_service = ChatService(repo, Mock())
+        await repo.summary_index.upsert(conversation)
+        cache = chat_service.cache_manager
+        cache.update_cache("chats:alice", [{"technical_id": "x"}], 0)
+
+        conversation.add_message("user", "msg-1")
+        await chat_service.update_conversation(conversation)
+        assert "chats:alice" in cache._chat_list_cache
+        assert cache.get_from_cache("chats:alice", 50, 1).hit is True
+        # The TTL still bounds staleness from writes on other instances
+        assert cache.get_from_cache("chats:alice", 50, 10**9).hit is False
+        cache.update_cache("chats:alice", [{"technical_id": "x"}], 0)
+
+        conversation.name = "Renamed"
+        await chat_service.update_conversation(conversation)
+        assert "chats:alice" not in cache._chat_list_cache
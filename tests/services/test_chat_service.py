@@ -4,13 +4,16 @@ Unit tests for ChatService.
 Tests business logic without HTTP dependencies.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from application.entity.conversation import Conversation
+from application.repositories.conversation_repository import OwnershipTransferResult
 from application.services.chat.service import ChatService
+from application.services.chat.service.core import conversation_operations
 from tests.fixtures.conversation_fixtures import (
     create_conversation_list_response,
     create_test_conversation,
@@ -159,26 +162,75 @@ class TestChatServiceTransfer:
         """Test successful chat transfer from guest to user."""
         # Arrange
         guest_chats = create_conversation_list_response(count=3, user_id="guest.123")
+        for i, chat in enumerate(guest_chats):
+            chat.metadata.id = f"conv-{i}"
 
         mock_repo = Mock()
         mock_repo.search = AsyncMock(return_value=guest_chats)
-        mock_repo.get_by_id = AsyncMock(
-            side_effect=[
-                create_test_conversation(technical_id=f"conv-{i}", user_id="guest.123")
-                for i in range(3)
+        mock_repo.get_by_id = AsyncMock()
+        mock_repo.transfer_ownership = AsyncMock(
+            side_effect=lambda conversations, user_id: [
+                OwnershipTransferResult(c.technical_id, True) for c in conversations
             ]
         )
-        mock_repo.update_with_retry = AsyncMock(side_effect=lambda conv: conv)
         mock_persistence = Mock()
 
         service = ChatService(mock_repo, mock_persistence)
 
         # Act
-        count = await service.transfer_guest_chats("guest.123", "alice")
+        result = await service.transfer_guest_chats("guest.123", "alice")
 
         # Assert
-        assert count == 3
-        assert mock_repo.update_with_retry.call_count == 3
+        assert result.transferred_count == 3
+        assert [r["conversation_id"] for r in result.results] == [
+            "conv-0",
+            "conv-1",
+            "conv-2",
+        ]
+        # Search results are reused, not re-read
+        mock_repo.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transfer_many_guest_chats_runs_in_background(self):
+        """Test large transfers run as a background task with progress."""
+        # Arrange
+        guest_chats = create_conversation_list_response(count=25, user_id="guest.123")
+        for i, chat in enumerate(guest_chats):
+            chat.metadata.id = f"conv-{i}"
+
+        async def transfer(conversations, user_id):
+            for conversation in conversations:
+                yield OwnershipTransferResult(conversation.technical_id, True)
+
+        mock_repo = Mock()
+        mock_repo.search = AsyncMock(return_value=guest_chats)
+        mock_repo.iter_transfer_ownership = transfer
+        task_service = Mock()
+        task_service.create_task = AsyncMock(return_value=Mock(technical_id="task-1"))
+        task_service.update_task_status = AsyncMock()
+
+        service = ChatService(mock_repo, Mock())
+
+        # Act
+        with patch(
+            "application.services.chat.service.core.conversation_operations."
+            "get_task_service",
+            return_value=task_service,
+        ):
+            result = await service.transfer_guest_chats("guest.123", "alice")
+            await asyncio.gather(*conversation_operations._background_transfers)
+
+        # Assert
+        assert result.task_id == "task-1"
+        assert result.total == 25
+        final = task_service.update_task_status.await_args
+        assert final.args[:2] == ("task-1", "completed")
+        assert final.kwargs["result"]["transferred_count"] == 25
+        progress = [
+            call.kwargs["progress"]
+            for call in task_service.update_task_status.await_args_list
+        ]
+        assert progress == sorted(progress) and len(progress) < 25
 
     @pytest.mark.asyncio
     async def test_transfer_guest_chats_validates_source(self):
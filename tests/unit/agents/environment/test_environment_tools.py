@@ -29,6 +29,10 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from application.agents.environment import tools
+from application.services.core.logs_service import LogSearchEngine
+from application.services.environment_management.namespace_inventory import (
+    reset_namespace_inventory,
+)
 
 
 @pytest.fixture
@@ -74,6 +78,14 @@ def disable_adk_test_mode():
         yield
 
 
+@pytest.fixture(autouse=True)
+def fresh_namespace_inventory():
+    """Start each test with an empty namespace inventory."""
+    reset_namespace_inventory()
+    yield
+    reset_namespace_inventory()
+
+
 @pytest.fixture(autouse=True)
 def mock_cloud_manager_base():
     """Auto-mock get_cloud_manager_service to prevent real network calls.
@@ -2175,9 +2187,27 @@ class TestMonitorDeploymentProgress:
             )
 
 
+def _mock_elk_search(mock_async_client, search_response):
+    """Answer the point-in-time open, then the search, then the PIT close."""
+    pit_response = MagicMock()
+    pit_response.status_code = 200
+    pit_response.json.return_value = {"id": "pit-1"}
+    mock_async_client.post = AsyncMock(side_effect=[pit_response, search_response])
+    mock_async_client.request = AsyncMock()
+
+
 class TestSearchLogs:
     """Comprehensive tests for search_logs function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_log_search_engine(self):
+        """Use a fresh engine so each test's patched httpx client is picked up."""
+        with patch(
+            "application.agents.environment.tool_definitions.other.search_logs_tool.get_log_search_engine",
+            return_value=LogSearchEngine(),
+        ):
+            yield
+
     @pytest.mark.asyncio
     async def test_search_logs_guest_user(
         self, mock_tool_context, disable_adk_test_mode
@@ -2262,7 +2292,7 @@ class TestSearchLogs:
                 ],
             }
         }
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2276,7 +2306,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2317,7 +2347,7 @@ class TestSearchLogs:
                 ],
             }
         }
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2331,7 +2361,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2369,7 +2399,7 @@ class TestSearchLogs:
                 ],
             }
         }
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2383,7 +2413,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2402,7 +2432,7 @@ class TestSearchLogs:
         """Test log search with time_range parameter."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2416,7 +2446,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2453,7 +2483,7 @@ class TestSearchLogs:
                 ],
             }
         }
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2467,7 +2497,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2489,7 +2519,7 @@ class TestSearchLogs:
         """Test that size parameter is limited to max 50."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2503,7 +2533,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 # Request 1000 logs, should be limited to 50
@@ -2524,7 +2554,7 @@ class TestSearchLogs:
         """Test log search with no results."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2538,7 +2568,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
@@ -2643,7 +2673,7 @@ class TestSearchLogs:
                 ],
             }
         }
-        mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
 
         with patch.dict(
             os.environ,
@@ -2657,7 +2687,7 @@ class TestSearchLogs:
                 mock_async_client = MagicMock()
                 mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
                 mock_async_client.__aexit__ = AsyncMock()
-                mock_async_client.post = AsyncMock(return_value=mock_response)
+                _mock_elk_search(mock_async_client, mock_response)
                 mock_client.return_value = mock_async_client
 
                 result = await tools.search_logs(
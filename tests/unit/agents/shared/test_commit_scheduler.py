@@ -0,0 +1,190 @@
+"""
+Unit tests for change-driven progress commits.
+"""
+
+import subprocess
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.agents.shared.commit_scheduler import (
+    CommitScheduler,
+    parse_porcelain_z,
+    reset_push_gate,
+    scan_working_tree,
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    yield tmp_path
+    reset_push_gate()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _git_commit(repo):
+    async def commit(message):
+        subprocess.run(["git", "-C", str(repo), "add", "-A"], check=True)
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(repo),
+                "-c",
+                "user.name=t",
+                "-c",
+                "user.email=t@t",
+                "commit",
+                "-qm",
+                message,
+            ],
+            check=True,
+        )
+        return {"success": True, "canvas_resources": {}}
+
+    return AsyncMock(side_effect=commit)
+
+
+def test_parse_porcelain_z_handles_renames_and_spaces():
+    output = b"?? new file.txt\0R  b.py\0a.py\0 M src/c.py\0"
+
+    assert parse_porcelain_z(output) == (
+        ("??", "new file.txt"),
+        ("R ", "b.py"),
+        (" M", "src/c.py"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_sees_rewrites_of_an_already_changed_file(repo):
+    (repo / "a.txt").write_text("one")
+    first = await scan_working_tree(str(repo))
+    (repo / "a.txt").write_text("one two")
+    second = await scan_working_tree(str(repo))
+
+    assert first.entries == second.entries == (("??", "a.txt"),)
+    assert first.signature != second.signature
+    assert await scan_working_tree(str(repo / "missing")) is None
+
+
+@pytest.mark.asyncio
+async def test_commits_only_after_changes_settle(repo):
+    clock = _Clock()
+    commit = _git_commit(repo)
+    task_service = AsyncMock()
+    scheduler = CommitScheduler(
+        str(repo),
+        "feature",
+        commit,
+        task_id="task-1",
+        task_service=task_service,
+        debounce_seconds=20,
+        clock=clock,
+    )
+
+    assert await scheduler.poll() is None  # clean tree
+    (repo / "a.txt").write_text("one")
+    assert await scheduler.poll(10) is None
+    clock.now += 15
+    assert await scheduler.poll(25) is None
+    clock.now += 10
+    assert await scheduler.poll(35) is not None
+    clock.now += 60
+    assert await scheduler.poll(95) is None  # committed tree is clean
+
+    commit.assert_awaited_once_with("Progress on feature (35s)")
+    messages = [
+        c.kwargs["message"] for c in task_service.add_progress_update.call_args_list
+    ]
+    # Scans that only see changes are not written to the task
+    assert messages == ["Progress committed (1 files)"]
+
+
+@pytest.mark.asyncio
+async def test_tree_that_never_settles_commits_at_max_delay(repo):
+    clock = _Clock()
+    commit = _git_commit(repo)
+    scheduler = CommitScheduler(
+        str(repo),
+        "feature",
+        commit,
+        debounce_seconds=20,
+        max_delay_seconds=30,
+        clock=clock,
+    )
+
+    for step in range(3):
+        (repo / "a.txt").write_text("x" * (step + 1))
+        await scheduler.poll()
+        clock.now += 10
+    (repo / "a.txt").write_text("final")
+    await scheduler.poll()
+
+    assert scheduler.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_pushes_are_coalesced_per_branch(repo):
+    clock = _Clock()
+    commit = _git_commit(repo)
+    scheduler = CommitScheduler(
+        str(repo),
+        "feature",
+        commit,
+        debounce_seconds=0,
+        push_interval_seconds=60,
+        clock=clock,
+    )
+
+    (repo / "a.txt").write_text("one")
+    await scheduler.poll()
+    (repo / "b.txt").write_text("two")
+    clock.now += 10
+    assert await scheduler.poll() is None  # pushed 10s ago
+    (repo / "c.txt").write_text("three")
+    clock.now += 50
+    await scheduler.poll()
+
+    assert commit.await_count == 2
+    assert (await scan_working_tree(str(repo))).clean
+
+
+@pytest.mark.asyncio
+async def test_push_gate_drops_finished_and_expired_branches(repo):
+    from application.agents.shared.commit_scheduler import _push_gate
+
+    clock = _Clock()
+    commit = _git_commit(repo)
+
+    def scheduler(branch):
+        return CommitScheduler(
+            str(repo),
+            branch,
+            commit,
+            debounce_seconds=0,
+            push_interval_seconds=60,
+            clock=clock,
+        )
+
+    first, second = scheduler("first"), scheduler("second")
+    (repo / "a.txt").write_text("one")
+    await first.poll()
+    assert first._key in _push_gate._last_push
+
+    # A push more than an interval later prunes the older branch
+    clock.now += 60
+    (repo / "b.txt").write_text("two")
+    await second.poll()
+    assert list(_push_gate._last_push) == [second._key]
+
+    second.close()
+    assert _push_gate._last_push == {}
+    assert _push_gate._locks == {}
@@ -4,11 +4,24 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from application.agents.shared.repository_tools.conv import leases
+from application.agents.shared.repository_tools.conv.leases import (
+    ConversationLockManager,
+    InMemoryLeaseStore,
+)
 from application.agents.shared.repository_tools.conversation import (
     _update_conversation_with_lock,
 )
 
 
+@pytest.fixture(autouse=True)
+def conversation_leases():
+    """Keeps conversation leases in memory instead of Cyoda."""
+    manager = ConversationLockManager(store=InMemoryLeaseStore())
+    with patch.object(leases, "_manager", manager):
+        yield manager
+
+
 class TestUpdateConversationWithLock:
     """Test _update_conversation_with_lock function."""
 
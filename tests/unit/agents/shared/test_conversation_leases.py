@@ -0,0 +1,227 @@
+"""Tests for lease-based conversation locks."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from application.agents.shared.repository_tools.conv import leases
+from application.agents.shared.repository_tools.conv.leases import (
+    ConversationLockManager,
+    EntityLeaseStore,
+    InMemoryLeaseStore,
+    LeaseRecord,
+    LeaseUnavailableError,
+)
+
+
+class _Barrier:
+    """Reusable rendezvous for a fixed number of tasks."""
+
+    def __init__(self, parties):
+        self.parties = parties
+        self.arrived = 0
+        self.released = asyncio.Event()
+
+    async def wait(self):
+        self.arrived += 1
+        if self.arrived == self.parties:
+            self.arrived = 0
+            self.released.set()
+            self.released = asyncio.Event()
+            return
+        await self.released.wait()
+
+
+def _manager(**kwargs):
+    kwargs.setdefault("max_attempts", 2)
+    return ConversationLockManager(store=InMemoryLeaseStore(), **kwargs)
+
+
+class TestConversationLockManager:
+    """Test lease acquisition, release, renewal and fencing."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_and_release_bumps_fencing_token(self):
+        manager = _manager()
+
+        async with manager.hold("conv-1") as first:
+            assert manager.held("conv-1") is first
+        async with manager.hold("conv-1") as second:
+            pass
+
+        assert (first.fencing_token, second.fencing_token) == (1, 2)
+        record = await manager.store.get("conv-1")
+        assert record.expires_at == 0.0
+        assert manager.held("conv-1") is None
+        assert manager._local_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_same_process_writers_are_serialized(self):
+        manager = _manager()
+        active = 0
+        max_active = 0
+
+        async def writer():
+            nonlocal active, max_active
+            async with manager.hold("conv-1"):
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        await asyncio.gather(*(writer() for _ in range(5)))
+
+        assert max_active == 1
+        assert (await manager.store.get("conv-1")).fencing_token == 5
+
+    @pytest.mark.asyncio
+    async def test_active_lease_elsewhere_is_unavailable(self):
+        manager = _manager()
+        await manager.store.put(LeaseRecord("conv-1", "other-pod", 3, time.time() + 60))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(LeaseUnavailableError):
+                await manager.acquire("conv-1")
+
+        assert manager._local_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_taken_over(self):
+        manager = _manager()
+        await manager.store.put(
+            LeaseRecord("conv-1", "crashed-pod", 3, time.time() - 1)
+        )
+
+        lease = await manager.acquire("conv-1")
+        await manager.release(lease)
+
+        assert lease.fencing_token == 4
+
+    @pytest.mark.asyncio
+    async def test_check_fence_fails_after_takeover(self):
+        manager = _manager()
+        lease = await manager.acquire("conv-1")
+        await manager.store.put(LeaseRecord("conv-1", "other-pod", 2, time.time() + 60))
+
+        assert await manager.check_fence(lease) is False
+        assert lease.lost is True
+        await manager.release(lease)
+        # The newer holder's record is left alone
+        assert (await manager.store.get("conv-1")).holder_id == "other-pod"
+
+    @pytest.mark.asyncio
+    async def test_renewal_extends_lease(self):
+        manager = _manager(ttl_seconds=30, renew_interval_seconds=0.01)
+        lease = await manager.acquire("conv-1")
+        first_expiry = lease.expires_at
+
+        await asyncio.sleep(0.05)
+
+        assert lease.expires_at > first_expiry
+        assert await manager.check_fence(lease) is True
+        await manager.release(lease)
+
+    @pytest.mark.asyncio
+    async def test_local_wait_times_out(self):
+        manager = _manager(acquire_timeout_seconds=0.01)
+        lease = await manager.acquire("conv-1")
+
+        with pytest.raises(LeaseUnavailableError):
+            await manager.acquire("conv-1")
+
+        await manager.release(lease)
+        assert manager._local_locks == {}
+
+
+class TestEntityLeaseStore:
+    """Test lease records persisted through the entity service."""
+
+    @pytest.mark.asyncio
+    async def test_save_then_update_by_technical_id(self):
+        service = AsyncMock()
+        service.search.return_value = []
+        service.save.return_value = MagicMock(metadata=MagicMock(id="lease-uuid"))
+        service.update.return_value = MagicMock(metadata=MagicMock(id="lease-uuid"))
+        service.get_by_id.return_value = MagicMock(
+            data={"holder_id": "me", "fencing_token": 1, "expires_at": 99.0},
+            metadata=MagicMock(id="lease-uuid"),
+        )
+        store = EntityLeaseStore()
+
+        with patch.object(leases, "get_entity_service", return_value=service):
+            assert await store.get("conv-1") is None
+            record = await store.put(LeaseRecord("conv-1", "me", 1, 99.0))
+            fetched = await store.get("conv-1")
+            await store.put(fetched)
+
+        assert record.technical_id == "lease-uuid"
+        assert fetched.fencing_token == 1
+        service.get_by_id.assert_awaited_once()
+        assert service.update.await_args.kwargs["entity_id"] == "lease-uuid"
+        assert service.update.await_args.kwargs["entity_class"] == "ConversationLease"
+        # The conversation entity is never written by the lock
+        for call in service.save.await_args_list + service.update.await_args_list:
+            assert call.kwargs["entity_class"] == "ConversationLease"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_creation_has_single_winner(self):
+        records = {}
+
+        async def save(entity, **kwargs):
+            technical_id = "lease-" + entity["holder_id"][len("pod-")]
+            records[technical_id] = dict(entity)
+            return MagicMock(metadata=MagicMock(id=technical_id))
+
+        async def update(entity_id, entity, **kwargs):
+            records[entity_id] = dict(entity)
+            return MagicMock(metadata=MagicMock(id=entity_id))
+
+        async def get_by_id(entity_id, **kwargs):
+            data = records.get(entity_id)
+            return MagicMock(data=data, metadata=MagicMock(id=entity_id))
+
+        async def search(**kwargs):
+            return [
+                MagicMock(data=data, metadata=MagicMock(id=technical_id))
+                for technical_id, data in records.items()
+            ]
+
+        async def delete_by_id(entity_id, **kwargs):
+            records.pop(entity_id)
+            return entity_id
+
+        service = AsyncMock(
+            save=save,
+            update=update,
+            get_by_id=get_by_id,
+            search=search,
+            delete_by_id=delete_by_id,
+        )
+        # Both pods saw no record and both create one before either reads back
+        pod_a = ConversationLockManager(store=EntityLeaseStore(), node_id="pod-a")
+        pod_b = ConversationLockManager(store=EntityLeaseStore(), node_id="pod-b")
+        real_put = EntityLeaseStore.put
+        barrier = _Barrier(2)
+
+        async def put_then_wait(store, record):
+            await barrier.wait()
+            result = await real_put(store, record)
+            await barrier.wait()
+            return result
+
+        with (
+            patch.object(leases, "get_entity_service", return_value=service),
+            patch.object(EntityLeaseStore, "put", put_then_wait),
+        ):
+            won_b, won_a = await asyncio.gather(
+                pod_b._try_claim("conv-1"), pod_a._try_claim("conv-1")
+            )
+
+            assert won_b is None
+            assert won_a is not None and won_a.holder_id.startswith("pod-a")
+            assert list(records) == ["lease-a"]
+            assert await pod_b.store.get("conv-1") is not None
+            assert (await pod_b.store.get("conv-1")).holder_id == won_a.holder_id
+            assert await pod_a.check_fence(won_a) is True
@@ -0,0 +1,188 @@
+"""
+Unit tests for process output capture: ring buffer, spool file and tailing.
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from application.agents.shared.process_output import (
+    OUTPUT_CHECKPOINT_KEY,
+    OutputRingBuffer,
+    ProcessOutputRegistry,
+    get_output_registry,
+    reset_output_registry,
+)
+from application.agents.shared.repository_tools.monitoring import (
+    _stream_process_output,
+)
+from application.services.streaming.output_stream import OutputStreamProcessor
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    reset_output_registry()
+    yield
+    reset_output_registry()
+
+
+def _process(*chunks):
+    stdout = asyncio.StreamReader()
+    for chunk in chunks:
+        stdout.feed_data(chunk)
+    stdout.feed_eof()
+    stderr = asyncio.StreamReader()
+    stderr.feed_eof()
+    return MagicMock(pid=42, stdout=stdout, stderr=stderr)
+
+
+class TestOutputRingBuffer:
+    """Test absolute-offset reads across wrap-around."""
+
+    def test_wraps_and_keeps_newest_bytes(self):
+        buffer = OutputRingBuffer(capacity=8)
+        buffer.write(b"abcdef")
+        buffer.write(b"ghij")
+
+        assert (buffer.start, buffer.end) == (2, 10)
+        assert buffer.read(0) == (b"cdefghij", 10)
+        assert buffer.read(7, limit=2) == (b"hi", 9)
+        assert buffer.tail(3) == b"hij"
+
+    def test_oversized_write_keeps_its_tail(self):
+        buffer = OutputRingBuffer(capacity=4)
+        buffer.write(b"x")
+        buffer.write(b"0123456789")
+
+        assert buffer.read(0) == (b"6789", 11)
+
+
+class TestProcessOutput:
+    """Test spooling and live subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_follow_resumes_from_offset_and_ends_on_close(self, tmp_path):
+        output = ProcessOutputRegistry().open("task/1", spool_dir=str(tmp_path))
+        output.append(b"hello ")
+
+        async def produce():
+            await asyncio.sleep(0)
+            output.append(b"world")
+            output.close()
+
+        producer = asyncio.ensure_future(produce())
+        chunks = [chunk async for _, chunk in output.follow(offset=2)]
+        await producer
+        await output.flush()
+
+        assert b"".join(chunks) == b"llo world"
+        assert (tmp_path / "task_1.log").read_bytes() == b"hello world"
+
+    @pytest.mark.asyncio
+    async def test_follow_reads_overwritten_output_from_spool(self, tmp_path):
+        registry = ProcessOutputRegistry(spool_dir=str(tmp_path))
+        # An earlier run of the task left its log in the same spool file
+        registry.open("task-1", capacity=4, spool_dir=str(tmp_path)).append(b"old")
+        output = registry.open("task-1", capacity=4, spool_dir=str(tmp_path))
+        output.append(b"0123456789")
+        output.close()
+
+        chunks = [chunk async for _, chunk in output.follow(offset=1)]
+
+        assert output.buffer.start == 6
+        assert b"".join(chunks) == b"123456789"
+
+    @pytest.mark.asyncio
+    async def test_spool_is_kept_until_retention_expires(self, tmp_path):
+        registry = ProcessOutputRegistry(retention_seconds=60, spool_dir=None)
+        output = registry.open("task-1", spool_dir=str(tmp_path))
+        output.append(b"log")
+        output.close()
+        await output.flush()
+        assert (tmp_path / "task-1.log").exists()
+
+        output.finished_at -= 61
+        assert registry.get("task-1") is None
+        await output.flush()
+        assert not (tmp_path / "task-1.log").exists()
+
+    @pytest.mark.asyncio
+    async def test_expired_spools_of_earlier_processes_are_swept(self, tmp_path):
+        stale = tmp_path / "old-task.log"
+        stale.write_bytes(b"old")
+        os.utime(stale, (0, 0))
+        registry = ProcessOutputRegistry(spool_dir=str(tmp_path))
+
+        output = registry.open("task-1", spool_dir=str(tmp_path))
+        await output.flush()
+
+        assert not stale.exists()
+        assert (tmp_path / "task-1.log").exists()
+
+    @pytest.mark.asyncio
+    async def test_idle_follow_yields_heartbeats(self, tmp_path):
+        output = ProcessOutputRegistry().open("task-1", spool_dir=None)
+        follower = output.follow(idle_timeout=0.01)
+
+        assert await follower.__anext__() == (0, b"")
+        output.close()
+        with pytest.raises(StopAsyncIteration):
+            await follower.__anext__()
+
+
+class TestStreamProcessOutput:
+    """Test capture into the registry with coarse task checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_captures_output_and_checkpoints_once(self):
+        task = MagicMock(workflow_cache={})
+        task_service = AsyncMock()
+        task_service.get_task.return_value = task
+        with patch(
+            "application.agents.shared.repository_tools.monitoring_helpers."
+            "output_streaming.get_task_service",
+            return_value=task_service,
+        ):
+            await _stream_process_output(
+                _process(b"x" * 100_000, b"done\n"), task_id="task-1"
+            )
+        output = get_output_registry().get("task-1")
+
+        assert output.closed and output.buffer.end == 100_005
+        task_service.update_task.assert_awaited_once_with(task)
+        task_service.add_progress_update.assert_not_awaited()
+        checkpoint = task.workflow_cache[OUTPUT_CHECKPOINT_KEY]
+        assert checkpoint["output"].endswith("done\n")
+        assert checkpoint["output_bytes"] == 100_005
+        # The full log stays in the spool after the process ends
+        assert output.spool_path is not None
+
+
+class TestOutputStreamProcessor:
+    """Test SSE events produced from the buffer."""
+
+    @pytest.mark.asyncio
+    async def test_events_carry_byte_offsets(self):
+        output = ProcessOutputRegistry().open("task-1", spool_dir=None)
+        output.append("héllo".encode())
+        output.close()
+
+        events = [e async for e in OutputStreamProcessor("task-1", output).process()]
+
+        assert events[0].startswith("id: 6\nevent: output\n")
+        assert '"text": "h\\u00e9llo"' in events[0]
+        assert "event: done" in events[-1]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_checkpoint(self):
+        events = [
+            e
+            async for e in OutputStreamProcessor(
+                "task-1", None, checkpoint="last lines"
+            ).process()
+        ]
+
+        assert '"text": "last lines"' in events[0]
+        assert '"source": "checkpoint"' in events[1]
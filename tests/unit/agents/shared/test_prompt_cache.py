@@ -0,0 +1,160 @@
+"""Tests for split agent instructions and prompt cache metrics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from application.agents.shared import prompt_loader
+from application.agents.shared.prompt_cache import (
+    get_prompt_cache_stats,
+    reset_prompt_cache_stats,
+)
+from application.agents.shared.prompt_cache_plugin import PromptCachePlugin
+from application.agents.shared.prompt_loader import create_split_instruction
+
+TEMPLATES = {
+    "agent": (
+        "You work on {repository_name} for {owner}.\n"
+        "{template_if:language==python:python_rules}"
+        "{template_if:mode==strict:strict_rules}"
+        "Escaped {{braces}} stay."
+    ),
+    "plain": "You answer questions about {owner}.",
+    "python_rules": "Use pytest for {repository_name}.",
+    "strict_rules": "Be strict.",
+}
+
+
+@pytest.fixture(autouse=True)
+def templates():
+    with patch.object(
+        prompt_loader,
+        "load_template",
+        side_effect=lambda name, caller_file=None: TEMPLATES[name],
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    reset_prompt_cache_stats()
+    yield
+    reset_prompt_cache_stats()
+
+
+def _context(**state):
+    context = MagicMock()
+    context._invocation_context.session.state = state
+    return context
+
+
+def test_static_prefix_excludes_session_variables():
+    split = create_split_instruction("agent", owner="cyoda", mode="strict")
+
+    assert split.static_instruction == (
+        "You work on <repository_name> for cyoda.\nBe strict.Escaped {braces} stay."
+    )
+
+
+def test_volatile_suffix_carries_session_values():
+    split = create_split_instruction("agent", owner="cyoda")
+
+    suffix = split.instruction(_context(repository_name="shop-app", language="python"))
+
+    assert suffix == (
+        "## Session context\n"
+        "Values of the <placeholders> used in your instructions:\n"
+        "- repository_name: shop-app\n\n"
+        "Use pytest for shop-app."
+    )
+
+
+def test_prefix_is_stable_across_sessions():
+    first = create_split_instruction("agent", owner="cyoda")
+    second = create_split_instruction("agent", owner="cyoda")
+    other = create_split_instruction("agent", owner="someone-else")
+
+    assert first.fingerprint == second.fingerprint
+    assert first.fingerprint != other.fingerprint
+
+
+def test_template_without_session_parts_has_no_suffix():
+    split = create_split_instruction("plain", owner="cyoda")
+
+    assert split.static_instruction == "You answer questions about cyoda."
+    assert split.instruction == ""
+
+
+def _request(system_instruction):
+    return LlmRequest(
+        config=types.GenerateContentConfig(system_instruction=system_instruction)
+    )
+
+
+def _response(prompt_tokens, cached_tokens, partial=False):
+    return LlmResponse(
+        partial=partial,
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens,
+            cached_content_token_count=cached_tokens,
+        ),
+    )
+
+
+def _callback_context(agent_name="coordinator"):
+    context = MagicMock()
+    context.invocation_id = "inv-1"
+    context.agent_name = agent_name
+    return context
+
+
+@pytest.mark.asyncio
+async def test_plugin_records_prefix_hits_and_cached_tokens():
+    plugin = PromptCachePlugin()
+    context = _callback_context()
+
+    for prompt_tokens, cached_tokens in ((1000, 0), (1200, 900)):
+        await plugin.before_model_callback(
+            callback_context=context, llm_request=_request("static prefix")
+        )
+        await plugin.after_model_callback(
+            callback_context=context, llm_response=_response(10, 10, partial=True)
+        )
+        await plugin.after_model_callback(
+            callback_context=context,
+            llm_response=_response(prompt_tokens, cached_tokens),
+        )
+    invocation = MagicMock()
+    invocation.invocation_id = "inv-1"
+    await plugin.after_run_callback(invocation_context=invocation)
+
+    stats = get_prompt_cache_stats().to_dict()
+    assert stats["turns"] == 1
+    assert stats["last_turn"] == {
+        "model_calls": 2,
+        "prefix_hits": 1,
+        "prompt_tokens": 2200,
+        "cached_tokens": 900,
+        "prefix_hit_ratio": 0.5,
+        "cached_token_ratio": 0.409,
+        "tokens_saved": 900,
+    }
+
+
+@pytest.mark.asyncio
+async def test_plugin_tracks_prefix_per_agent():
+    plugin = PromptCachePlugin()
+
+    for agent_name in ("coordinator", "qa_agent", "coordinator"):
+        await plugin.before_model_callback(
+            callback_context=_callback_context(agent_name),
+            llm_request=_request(f"{agent_name} prefix"),
+        )
+    invocation = MagicMock()
+    invocation.invocation_id = "inv-1"
+    await plugin.after_run_callback(invocation_context=invocation)
+
+    assert get_prompt_cache_stats().to_dict()["prefix_hits"] == 1
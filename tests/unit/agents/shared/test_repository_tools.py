@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import subprocess
+import time
 import uuid
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
@@ -30,6 +31,13 @@ from application.agents.shared.repository_tools import (
     set_repository_config,
     wait_before_next_check,
 )
+from application.agents.shared.repository_tools.constants import MAX_LOCK_RETRIES
+from application.agents.shared.repository_tools.conv import leases
+from application.agents.shared.repository_tools.conv.leases import (
+    ConversationLockManager,
+    InMemoryLeaseStore,
+    LeaseRecord,
+)
 from application.entity.conversation.version_1.conversation import Conversation
 from application.services.github.auth.installation_token_manager import (
     InstallationTokenManager,
@@ -164,6 +172,14 @@ def mock_asyncio_sleep():
         yield mock_sleep
 
 
+@pytest.fixture(autouse=True)
+def conversation_leases():
+    """Keeps conversation leases in memory instead of Cyoda."""
+    manager = ConversationLockManager(store=InMemoryLeaseStore())
+    with patch.object(leases, "_manager", manager):
+        yield manager
+
+
 @pytest.fixture
 def mock_conversation_response():
     """Fixture for a mock conversation entity response."""
@@ -190,15 +206,9 @@ class TestUpdateConversationWithLock:
         conversation_id = "test_conversation_id"
         updated_repo_name = "new_repo"
 
-        # Initial conversation state (unlocked)
         initial_conv = MockConversation(
             technical_id=conversation_id, user_id="test_user_id", locked=False
         )
-        # Conversation state after lock (locked=True)
-        locked_conv = MockConversation(
-            technical_id=conversation_id, user_id="test_user_id", locked=True
-        )
-        # Conversation state after update (unlocked, updated name)
         updated_conv = MockConversation(
             technical_id=conversation_id,
             user_id="test_user_id",
@@ -207,17 +217,10 @@ class TestUpdateConversationWithLock:
         )
 
         mock_get_entity_service.get_by_id.side_effect = [
-            MagicMock(data=initial_conv),  # First get (before lock)
-            MagicMock(data=initial_conv),  # Second get (in _acquire_lock)
-            MagicMock(
-                data=locked_conv
-            ),  # Third get (after successful lock, to be updated)
-            MagicMock(data=updated_conv),  # Fourth get (for verification after update)
-        ]
-        mock_get_entity_service.update.side_effect = [
-            MagicMock(status_code=200),  # Lock acquisition successful
-            MagicMock(status_code=200),  # Update with changes and unlock successful
+            MagicMock(data=initial_conv),  # Fetch under the lease
+            MagicMock(data=updated_conv),  # Verification after update
         ]
+        mock_get_entity_service.update.return_value = MagicMock(status_code=200)
 
         def update_fn(
             conversation: MockConversation,
@@ -227,20 +230,11 @@ class TestUpdateConversationWithLock:
         result = await _update_conversation_with_lock(conversation_id, update_fn)
 
         assert result is True
-        assert mock_get_entity_service.get_by_id.call_count == 4
-        assert mock_get_entity_service.update.call_count == 2
-
-        # Verify the content of the updated conversation sent to service
-        # First update (locking)
-        called_entity_lock = mock_get_entity_service.update.call_args_list[0].kwargs[
-            "entity"
-        ]
-        assert called_entity_lock["locked"] is True
+        assert mock_get_entity_service.get_by_id.call_count == 2
+        # Locking lives in the lease record: the conversation is written once
+        assert mock_get_entity_service.update.call_count == 1
 
-        # Second update (actual change + unlocking)
-        called_entity_update = mock_get_entity_service.update.call_args_list[1].kwargs[
-            "entity"
-        ]
+        called_entity_update = mock_get_entity_service.update.call_args.kwargs["entity"]
         assert called_entity_update["locked"] is False
         assert called_entity_update["repository_name"] == updated_repo_name
 
@@ -259,45 +253,60 @@ class TestUpdateConversationWithLock:
         mock_get_entity_service.update.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_already_locked(
-        self, mock_get_entity_service, mock_conversation_response, mock_asyncio_sleep
+    async def test_lease_held_elsewhere(
+        self, mock_get_entity_service, mock_asyncio_sleep, conversation_leases
     ):
-        """Test case where conversation is already locked."""
+        """Test case where another holder keeps the conversation lease."""
         conversation_id = "test_conversation_id"
-        # Simulate initial locked state for get_by_id
-        locked_conv = MockConversation(
-            technical_id=conversation_id, user_id="test_user_id", locked=True
+        await conversation_leases.store.put(
+            LeaseRecord(
+                conversation_id=conversation_id,
+                holder_id="other-pod",
+                fencing_token=7,
+                expires_at=time.time() + 60,
+            )
         )
-        mock_get_entity_service.get_by_id.return_value = MagicMock(data=locked_conv)
 
         def update_fn(conversation: MockConversation):
             conversation.repository_name = "new_repo"
 
         result = await _update_conversation_with_lock(conversation_id, update_fn)
 
-        assert result is False  # Fails after max retries
-        # It gets the conversation once, finds it locked, sleeps, and repeats 9 more times.
-        # So, 10 get_by_id calls.
-        assert mock_get_entity_service.get_by_id.call_count == 10
-        # For 10 attempts to get a locked conv and retry, there are 9 sleeps.
-        assert mock_asyncio_sleep.call_count == 10
+        assert result is False
+        mock_get_entity_service.get_by_id.assert_not_called()
         mock_get_entity_service.update.assert_not_called()
+        assert mock_asyncio_sleep.call_count == MAX_LOCK_RETRIES - 1
 
     @pytest.mark.asyncio
-    async def test_lock_acquisition_failure_then_success(
+    async def test_legacy_locked_flag_is_ignored_and_cleared(
+        self, mock_get_entity_service
+    ):
+        """Test that a stale locked=True from the old protocol does not block."""
+        conversation_id = "test_conversation_id"
+        locked_conv = MockConversation(
+            technical_id=conversation_id, user_id="test_user_id", locked=True
+        )
+        mock_get_entity_service.get_by_id.return_value = MagicMock(data=locked_conv)
+        mock_get_entity_service.update.return_value = MagicMock(status_code=200)
+
+        result = await _update_conversation_with_lock(conversation_id, lambda c: None)
+
+        assert result is True
+        assert (
+            mock_get_entity_service.update.call_args.kwargs["entity"]["locked"] is False
+        )
+
+    @pytest.mark.asyncio
+    async def test_persist_failure_then_success(
         self, mock_get_entity_service, mock_conversation_response, mock_asyncio_sleep
     ):
-        """Test case where lock acquisition fails initially but succeeds later."""
+        """Test case where persisting fails initially but succeeds on retry."""
         conversation_id = "test_conversation_id"
         updated_repo_name = "new_repo"
 
-        # Define conversation states for side_effect
         unlocked_conv = MockConversation(
             technical_id=conversation_id, user_id="test_user_id", locked=False
         )
-        locked_conv = MockConversation(
-            technical_id=conversation_id, user_id="test_user_id", locked=True
-        )
         updated_conv = MockConversation(
             technical_id=conversation_id,
             user_id="test_user_id",
@@ -306,23 +315,13 @@ class TestUpdateConversationWithLock:
         )
 
         mock_get_entity_service.get_by_id.side_effect = [
-            MagicMock(
-                data=unlocked_conv
-            ),  # 1st get: attempt to get lock, conv unlocked
-            MagicMock(data=unlocked_conv),  # 2nd get: in _acquire_lock
-            MagicMock(data=unlocked_conv),  # 3rd get: retry after lock failure
-            MagicMock(data=unlocked_conv),  # 4th get: in _acquire_lock on retry
-            MagicMock(
-                data=locked_conv
-            ),  # 5th get: after successful lock, actual update
-            MagicMock(data=updated_conv),  # 6th get: verification after update
+            MagicMock(data=unlocked_conv),  # 1st attempt: fetch under the lease
+            MagicMock(data=unlocked_conv),  # 2nd attempt: fetch under the lease
+            MagicMock(data=updated_conv),  # Verification after update
         ]
         mock_get_entity_service.update.side_effect = [
-            Exception("Version conflict"),  # 1st update: Lock acquisition fails
-            MagicMock(
-                status_code=200
-            ),  # 2nd update: Lock acquisition succeeds on retry
-            MagicMock(status_code=200),  # 3rd update: Final update and unlock succeeds
+            Exception("Version conflict"),  # 1st update fails
+            MagicMock(status_code=200),  # Retry succeeds
         ]
 
         def update_fn(conversation: MockConversation):
@@ -331,19 +330,43 @@ class TestUpdateConversationWithLock:
         result = await _update_conversation_with_lock(conversation_id, update_fn)
 
         assert result is True
-        assert mock_get_entity_service.get_by_id.call_count == 6
-        assert mock_get_entity_service.update.call_count == 3
-        assert (
-            mock_asyncio_sleep.call_count == 1
-        )  # Only one sleep after first lock acquisition failure
+        assert mock_get_entity_service.get_by_id.call_count == 3
+        assert mock_get_entity_service.update.call_count == 2
+        assert mock_asyncio_sleep.call_count == 1
 
-        # Verify the final state sent
-        called_entity = mock_get_entity_service.update.call_args_list[2].kwargs[
+        called_entity = mock_get_entity_service.update.call_args_list[1].kwargs[
             "entity"
         ]
         assert called_entity["locked"] is False
         assert called_entity["repository_name"] == updated_repo_name
 
+    @pytest.mark.asyncio
+    async def test_stale_lease_discards_update(
+        self, mock_get_entity_service, mock_asyncio_sleep, conversation_leases
+    ):
+        """Test that a holder whose lease was taken over does not write."""
+        conversation_id = "test_conversation_id"
+        mock_get_entity_service.get_by_id.return_value = MagicMock(
+            data=MockConversation(technical_id=conversation_id)
+        )
+        store = conversation_leases.store
+
+        def update_fn(conversation: MockConversation):
+            # Simulate another pod taking over the lease mid-update
+            record = store._records[conversation_id]
+            store._records[conversation_id] = LeaseRecord(
+                conversation_id=conversation_id,
+                holder_id="other-pod",
+                fencing_token=record.fencing_token + 1,
+                expires_at=time.time() + 60,
+            )
+
+        result = await _update_conversation_with_lock(conversation_id, update_fn)
+
+        assert result is False
+        mock_get_entity_service.update.assert_not_called()
+        assert store._records[conversation_id].holder_id == "other-pod"
+
 
 # End TestUpdateConversationWithLock
 
@@ -387,12 +410,12 @@ class TestUpdateConversationBuildContext:
                     conversation_id, language, branch_name, repository_name
                 )
 
-            # _update_conversation_with_lock will call get_by_id four times and update twice
-            assert mock_get_entity_service.get_by_id.call_count == 4
-            assert mock_get_entity_service.update.call_count == 2
+            # _update_conversation_with_lock fetches, updates once, and verifies
+            assert mock_get_entity_service.get_by_id.call_count == 2
+            assert mock_get_entity_service.update.call_count == 1
 
             # Verify update_fn applied changes correctly
-            final_update_call = mock_get_entity_service.update.call_args_list[1]
+            final_update_call = mock_get_entity_service.update.call_args_list[0]
             updated_conv_data = final_update_call.kwargs["entity"]
 
             assert updated_conv_data["locked"] is False
@@ -461,7 +484,7 @@ class TestUpdateConversationBuildContext:
             )
 
         # Verify that repository_owner was extracted from URL
-        final_update_call = mock_get_entity_service.update.call_args_list[1]
+        final_update_call = mock_get_entity_service.update.call_args_list[0]
         updated_conv_data = final_update_call.kwargs["entity"]
 
         assert updated_conv_data["repository_owner"] == expected_owner
@@ -510,7 +533,7 @@ class TestUpdateConversationBuildContext:
         )
 
         # Verify that provided repository_owner was used
-        final_update_call = mock_get_entity_service.update.call_args_list[1]
+        final_update_call = mock_get_entity_service.update.call_args_list[0]
         updated_conv_data = final_update_call.kwargs["entity"]
 
         assert updated_conv_data["repository_owner"] == provided_owner
@@ -531,26 +554,20 @@ class TestAddTaskToConversation:
         )
         # Configure get_by_id to simulate successful update_conversation_with_lock
         mock_get_entity_service.get_by_id.side_effect = [
-            MagicMock(data=mock_conv_obj),  # Initial get (unlocked)
-            MagicMock(data=mock_conv_obj),  # In _acquire_lock
-            MagicMock(data=mock_conv_obj),  # After lock acquired, to get fresh data
+            MagicMock(data=mock_conv_obj),  # Fetch under the lease
             MagicMock(data=mock_conv_obj),  # For verification
         ]
-        # Configure update to simulate successful lock and update
-        mock_get_entity_service.update.side_effect = [
-            MagicMock(status_code=200),  # Lock acquisition
-            MagicMock(status_code=200),  # Update and unlock
-        ]
+        mock_get_entity_service.update.return_value = MagicMock(status_code=200)
 
         await _add_task_to_conversation(conversation_id, task_id)
 
-        # Expect get_by_id four times (initial, in _acquire_lock, after lock, verification)
-        assert mock_get_entity_service.get_by_id.call_count == 4
-        # Expect update twice (lock, then update+unlock)
-        assert mock_get_entity_service.update.call_count == 2
+        # Expect get_by_id twice (fetch under the lease, verification)
+        assert mock_get_entity_service.get_by_id.call_count == 2
+        # Expect a single conversation write; the lock is a separate lease
+        assert mock_get_entity_service.update.call_count == 1
 
         # Verify the final update call
-        final_update_call = mock_get_entity_service.update.call_args_list[1]
+        final_update_call = mock_get_entity_service.update.call_args_list[0]
         updated_conv_data = final_update_call.kwargs["entity"]
 
         assert updated_conv_data["locked"] is False
@@ -570,23 +587,17 @@ class TestAddTaskToConversation:
         )
         # Configure get_by_id to simulate successful update_conversation_with_lock
         mock_get_entity_service.get_by_id.side_effect = [
-            MagicMock(data=mock_conv_obj),  # Initial get (unlocked)
-            MagicMock(data=mock_conv_obj),  # In _acquire_lock
-            MagicMock(data=mock_conv_obj),  # After lock acquired, to get fresh data
+            MagicMock(data=mock_conv_obj),  # Fetch under the lease
             MagicMock(data=mock_conv_obj),  # For verification
         ]
-        # Configure update to simulate successful lock and update
-        mock_get_entity_service.update.side_effect = [
-            MagicMock(status_code=200),  # Lock acquisition
-            MagicMock(status_code=200),  # Update and unlock
-        ]
+        mock_get_entity_service.update.return_value = MagicMock(status_code=200)
 
         await _add_task_to_conversation(conversation_id, task_id)
 
-        assert mock_get_entity_service.get_by_id.call_count == 4
-        assert mock_get_entity_service.update.call_count == 2
+        assert mock_get_entity_service.get_by_id.call_count == 2
+        assert mock_get_entity_service.update.call_count == 1
 
-        final_update_call = mock_get_entity_service.update.call_args_list[1]
+        final_update_call = mock_get_entity_service.update.call_args_list[0]
         updated_conv_data = final_update_call.kwargs["entity"]
         assert task_id in updated_conv_data["background_task_ids"]
         assert (
@@ -0,0 +1,120 @@
+"""Tests for model call record/replay in application/agents/eval_cassettes.py."""
+
+from types import SimpleNamespace
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from application.agents.eval_cassettes import (
+    CassetteMissError,
+    CassetteRecorder,
+    CassetteStore,
+    cassette_key,
+    install_cassette_callbacks,
+)
+
+
+def _request(call_id="call-1"):
+    return LlmRequest(
+        model="openai/gpt-5-mini",
+        contents=[
+            types.Content(role="user", parts=[types.Part(text="Build me an app")]),
+            types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id=call_id,
+                            name="transfer_to_agent",
+                            args={"agent_name": "github"},
+                        )
+                    )
+                ],
+            ),
+        ],
+        config=types.GenerateContentConfig(system_instruction="You route requests."),
+    )
+
+
+def _response(text="On it"):
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=120, candidates_token_count=8, total_token_count=128
+        ),
+    )
+
+
+def _context(invocation_id="inv-1"):
+    return SimpleNamespace(invocation_id=invocation_id, agent_name="coordinator")
+
+
+class TestCassetteKey:
+    def test_ignores_generated_function_call_ids(self):
+        assert cassette_key(_request("call-1")) == cassette_key(_request("call-2"))
+
+    def test_changes_with_conversation(self):
+        changed = _request()
+        changed.contents[0].parts[0].text = "Deploy my app"
+
+        assert cassette_key(changed) != cassette_key(_request())
+
+
+class TestCassetteRecorder:
+    def test_records_then_replays_without_model(self, tmp_path):
+        store = CassetteStore(str(tmp_path))
+        recorder = CassetteRecorder(store, mode="record")
+
+        assert recorder.before_model_callback(_context(), _request()) is None
+        recorder.after_model_callback(_context(), _response())
+        assert store.path(cassette_key(_request())).exists()
+
+        replayer = CassetteRecorder(store, mode="replay")
+        replayed = replayer.before_model_callback(_context("inv-2"), _request("x"))
+
+        assert replayed.content.parts[0].text == "On it"
+        assert replayer.stats.to_dict() == {
+            "model_calls": 1,
+            "hits": 1,
+            "recorded": 0,
+            "prompt_tokens": 120,
+            "completion_tokens": 8,
+            "total_tokens": 128,
+        }
+
+    def test_replay_miss_raises(self, tmp_path):
+        recorder = CassetteRecorder(CassetteStore(str(tmp_path)), mode="replay")
+
+        with pytest.raises(CassetteMissError):
+            recorder.before_model_callback(_context(), _request())
+
+    def test_partial_responses_are_not_recorded(self, tmp_path):
+        recorder = CassetteRecorder(CassetteStore(str(tmp_path)), mode="auto")
+        recorder.before_model_callback(_context(), _request())
+        partial = _response("On")
+        partial.partial = True
+
+        recorder.after_model_callback(_context(), partial)
+        recorder.after_model_callback(_context(), _response())
+
+        assert recorder.stats.recorded == 1
+        assert recorder.stats.total_tokens == 128
+
+
+def test_install_covers_sub_agents_and_keeps_existing_callbacks(tmp_path):
+    existing = lambda callback_context, llm_request: None  # noqa: E731
+    child = LlmAgent(name="child", model="openai/gpt-5-mini")
+    root = LlmAgent(
+        name="root",
+        model="openai/gpt-5-mini",
+        sub_agents=[child],
+        before_model_callback=existing,
+    )
+    recorder = CassetteRecorder(CassetteStore(str(tmp_path)))
+
+    assert install_cassette_callbacks(root, recorder) == 2
+    assert root.before_model_callback == [existing, recorder.before_model_callback]
+    assert child.after_model_callback == recorder.after_model_callback
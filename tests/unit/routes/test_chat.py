@@ -5,6 +5,7 @@ Tests all chat-related API endpoints including CRUD operations,
 streaming, canvas questions, and chat transfer functionality.
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -15,7 +16,21 @@ from quart.testing import QuartClient
 
 from application.entity.conversation import Conversation
 from application.routes.chat import chat_bp
+from application.services.assistant.pool import AssistantPool
+from application.services.chat.service.core import ChatTransferResult
 from application.services.service_factory import ServiceFactory
+from application.services.streaming.detached_runs import (
+    get_run_registry,
+    reset_run_registry,
+)
+from application.services.streaming.events import StreamEvent
+
+
+@pytest.fixture(autouse=True)
+def fresh_run_registry():
+    reset_run_registry()
+    yield
+    reset_run_registry()
 
 
 @pytest.fixture
@@ -42,7 +57,7 @@ def mock_service_factory():
         patch("application.routes.chat_endpoints.stream.get_chat_service"),
         patch("application.routes.chat_endpoints.workflow.get_chat_service"),
         patch("application.routes.chat_endpoints.helpers.get_repository"),
-        patch("application.routes.chat_endpoints.helpers.get_cyoda_assistant"),
+        patch("application.routes.chat_endpoints.helpers.get_assistant_pool"),
     ]
     mocks = [p.start() for p in patches]
 
@@ -60,9 +75,9 @@ def mock_service_factory():
     mock_repo.save = AsyncMock(return_value="msg_123")
     mocks[5].return_value = mock_repo
 
-    # Mock Cyoda assistant
+    # Pool of mock Cyoda assistants
     mock_assistant = MagicMock()
-    mocks[6].return_value = mock_assistant
+    mocks[6].return_value = AssistantPool(lambda: mock_assistant, model="test")
 
     yield factory
     for p in patches:
@@ -637,7 +652,7 @@ class TestStreamChatMessage:
             yield 'event: done\ndata: {"response": "Hello"}\n\n'
 
         mock_service_factory.chat_stream_service.prepare_stream = AsyncMock(
-            return_value=(sample_conversation, "Test message", MagicMock())
+            return_value=(sample_conversation, "Test message")
         )
         mock_service_factory.chat_stream_service.stream_and_save = MagicMock(
             return_value=mock_stream()
@@ -679,7 +694,7 @@ class TestStreamChatMessage:
             yield 'event: done\ndata: {"response": "OK"}\n\n'
 
         mock_service_factory.chat_stream_service.prepare_stream = AsyncMock(
-            return_value=(sample_conversation, "Test message", MagicMock())
+            return_value=(sample_conversation, "Test message")
         )
         mock_service_factory.chat_stream_service.stream_and_save = MagicMock(
             return_value=mock_stream()
@@ -722,7 +737,7 @@ class TestStreamChatMessage:
             yield 'event: done\ndata: {"response": "OK"}\n\n'
 
         mock_service_factory.chat_stream_service.prepare_stream = AsyncMock(
-            return_value=(sample_conversation, "", MagicMock())
+            return_value=(sample_conversation, "")
         )
         mock_service_factory.chat_stream_service.stream_and_save = MagicMock(
             return_value=mock_stream()
@@ -756,11 +771,11 @@ class TestStreamChatMessage:
         """Test stream with multiple content chunks."""
 
         async def mock_stream():
-            yield "event: start\ndata: {}\n\n"
-            yield 'event: content\ndata: {"chunk": "Hello "}\n\n'
-            yield 'event: content\ndata: {"chunk": "world"}\n\n'
-            yield 'event: content\ndata: {"chunk": "!"}\n\n'
-            yield 'event: done\ndata: {"response": "Hello world!"}\n\n'
+            yield StreamEvent("start", {})
+            yield StreamEvent("content", {"chunk": "Hello "})
+            yield StreamEvent("content", {"chunk": "world"})
+            yield StreamEvent("content", {"chunk": "!"})
+            yield StreamEvent("done", {"response": "Hello world!"})
 
         mock_service_factory.chat_service.get_conversation = AsyncMock(
             return_value=sample_conversation
@@ -770,33 +785,27 @@ class TestStreamChatMessage:
         )
 
         with patch(
-            "application.routes.chat_endpoints.helpers.get_cyoda_assistant_instance"
-        ) as mock_assistant:
-            mock_assistant.return_value = MagicMock()
+            "application.routes.chat_endpoints.stream.StreamingService"
+        ) as mock_streaming:
+            mock_streaming.stream_agent_events = MagicMock(return_value=mock_stream())
             with patch(
-                "application.routes.chat_endpoints.stream.StreamingService"
-            ) as mock_streaming:
-                mock_streaming.stream_agent_response = MagicMock(
-                    return_value=mock_stream()
+                "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
+            ) as mock_persistence:
+                mock_persistence.return_value.save_message_as_edge_message = AsyncMock(
+                    return_value="msg_123"
+                )
+                mock_persistence.return_value.save_response_with_history = AsyncMock(
+                    return_value="resp_123"
                 )
-                with patch(
-                    "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
-                ) as mock_persistence:
-                    mock_persistence.return_value.save_message_as_edge_message = (
-                        AsyncMock(return_value="msg_123")
-                    )
-                    mock_persistence.return_value.save_response_with_history = (
-                        AsyncMock(return_value="resp_123")
-                    )
-
-                    response = await client.post(
-                        "/api/v1/chats/conv_123/stream",
-                        json={"message": "Test message"},
-                    )
-                    assert response.status_code == 200
-                    content = await response.get_data(as_text=True)
-                    assert "event: content" in content
-                    assert "Hello" in content
+
+                response = await client.post(
+                    "/api/v1/chats/conv_123/stream",
+                    json={"message": "Test message"},
+                )
+                assert response.status_code == 200
+                content = await response.get_data(as_text=True)
+                assert "event: content" in content
+                assert "Hello" in content
 
     @pytest.mark.asyncio
     async def test_stream_with_hook_in_response(
@@ -805,9 +814,11 @@ class TestStreamChatMessage:
         """Test stream with hook data in done event."""
 
         async def mock_stream():
-            yield "event: start\ndata: {}\n\n"
-            yield 'event: content\ndata: {"chunk": "Response"}\n\n'
-            yield 'event: done\ndata: {"response": "Response", "hook": {"type": "entity_config"}}\n\n'
+            yield StreamEvent("start", {})
+            yield StreamEvent("content", {"chunk": "Response"})
+            yield StreamEvent(
+                "done", {"response": "Response", "hook": {"type": "entity_config"}}
+            )
 
         mock_service_factory.chat_service.get_conversation = AsyncMock(
             return_value=sample_conversation
@@ -817,31 +828,25 @@ class TestStreamChatMessage:
         )
 
         with patch(
-            "application.routes.chat_endpoints.helpers.get_cyoda_assistant_instance"
-        ) as mock_assistant:
-            mock_assistant.return_value = MagicMock()
+            "application.routes.chat_endpoints.stream.StreamingService"
+        ) as mock_streaming:
+            mock_streaming.stream_agent_events = MagicMock(return_value=mock_stream())
             with patch(
-                "application.routes.chat_endpoints.stream.StreamingService"
-            ) as mock_streaming:
-                mock_streaming.stream_agent_response = MagicMock(
-                    return_value=mock_stream()
+                "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
+            ) as mock_persistence:
+                mock_persistence.return_value.save_message_as_edge_message = AsyncMock(
+                    return_value="msg_123"
+                )
+                mock_persistence.return_value.save_response_with_history = AsyncMock(
+                    return_value="resp_123"
                 )
-                with patch(
-                    "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
-                ) as mock_persistence:
-                    mock_persistence.return_value.save_message_as_edge_message = (
-                        AsyncMock(return_value="msg_123")
-                    )
-                    mock_persistence.return_value.save_response_with_history = (
-                        AsyncMock(return_value="resp_123")
-                    )
-
-                    response = await client.post(
-                        "/api/v1/chats/conv_123/stream", json={"message": "Test"}
-                    )
-                    assert response.status_code == 200
-                    content = await response.get_data(as_text=True)
-                    assert "hook" in content
+
+                response = await client.post(
+                    "/api/v1/chats/conv_123/stream", json={"message": "Test"}
+                )
+                assert response.status_code == 200
+                content = await response.get_data(as_text=True)
+                assert "hook" in content
 
     @pytest.mark.asyncio
     async def test_stream_with_adk_session_id(
@@ -850,8 +855,10 @@ class TestStreamChatMessage:
         """Test stream with ADK session ID in response."""
 
         async def mock_stream():
-            yield "event: start\ndata: {}\n\n"
-            yield 'event: done\ndata: {"response": "OK", "adk_session_id": "session_123"}\n\n'
+            yield StreamEvent("start", {})
+            yield StreamEvent(
+                "done", {"response": "OK", "adk_session_id": "session_123"}
+            )
 
         sample_conversation.adk_session_id = None
         mock_service_factory.chat_service.get_conversation = AsyncMock(
@@ -862,7 +869,7 @@ class TestStreamChatMessage:
         with patch(
             "application.routes.chat_endpoints.stream.StreamingService"
         ) as mock_streaming:
-            mock_streaming.stream_agent_response = MagicMock(return_value=mock_stream())
+            mock_streaming.stream_agent_events = MagicMock(return_value=mock_stream())
             with patch(
                 "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
             ) as mock_persistence:
@@ -890,13 +897,13 @@ class TestStreamChatMessage:
         )
 
         async def mock_stream():
-            yield "event: start\ndata: {}\n\n"
-            yield 'event: done\ndata: {"response": "OK"}\n\n'
+            yield StreamEvent("start", {})
+            yield StreamEvent("done", {"response": "OK"})
 
         with patch(
             "application.routes.chat_endpoints.stream.StreamingService"
         ) as mock_streaming:
-            mock_streaming.stream_agent_response = MagicMock(return_value=mock_stream())
+            mock_streaming.stream_agent_events = MagicMock(return_value=mock_stream())
             with patch(
                 "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
             ) as mock_persistence:
@@ -919,7 +926,7 @@ class TestStreamChatMessage:
         """Test stream error handling during streaming."""
 
         async def mock_stream_with_error():
-            yield "event: start\ndata: {}\n\n"
+            yield StreamEvent("start", {})
             raise ValueError("Streaming error")
 
         mock_service_factory.chat_service.get_conversation = AsyncMock(
@@ -930,7 +937,7 @@ class TestStreamChatMessage:
         with patch(
             "application.routes.chat_endpoints.stream.StreamingService"
         ) as mock_streaming:
-            mock_streaming.stream_agent_response = MagicMock(
+            mock_streaming.stream_agent_events = MagicMock(
                 return_value=mock_stream_with_error()
             )
             with patch(
@@ -957,11 +964,11 @@ class TestStreamChatMessage:
         """Test stream with various event types (start, agent, tool, content, done)."""
 
         async def mock_stream():
-            yield "event: start\ndata: {}\n\n"
-            yield 'event: agent\ndata: {"agent": "test_agent"}\n\n'
-            yield 'event: tool\ndata: {"tool": "test_tool"}\n\n'
-            yield 'event: content\ndata: {"chunk": "Response"}\n\n'
-            yield 'event: done\ndata: {"response": "Response"}\n\n'
+            yield StreamEvent("start", {})
+            yield StreamEvent("agent", {"agent": "test_agent"})
+            yield StreamEvent("tool", {"tool": "test_tool"})
+            yield StreamEvent("content", {"chunk": "Response"})
+            yield StreamEvent("done", {"response": "Response"})
 
         mock_service_factory.chat_service.get_conversation = AsyncMock(
             return_value=sample_conversation
@@ -971,35 +978,198 @@ class TestStreamChatMessage:
         )
 
         with patch(
-            "application.routes.chat_endpoints.helpers.get_cyoda_assistant_instance"
-        ) as mock_assistant:
-            mock_assistant.return_value = MagicMock()
+            "application.routes.chat_endpoints.stream.StreamingService"
+        ) as mock_streaming:
+            mock_streaming.stream_agent_events = MagicMock(return_value=mock_stream())
             with patch(
-                "application.routes.chat_endpoints.stream.StreamingService"
-            ) as mock_streaming:
-                mock_streaming.stream_agent_response = MagicMock(
-                    return_value=mock_stream()
+                "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
+            ) as mock_persistence:
+                mock_persistence.return_value.save_message_as_edge_message = AsyncMock(
+                    return_value="msg_123"
                 )
-                with patch(
-                    "application.routes.chat_endpoints.helpers.get_edge_message_persistence_service"
-                ) as mock_persistence:
-                    mock_persistence.return_value.save_message_as_edge_message = (
-                        AsyncMock(return_value="msg_123")
-                    )
-                    mock_persistence.return_value.save_response_with_history = (
-                        AsyncMock(return_value="resp_123")
-                    )
-
-                    response = await client.post(
-                        "/api/v1/chats/conv_123/stream", json={"message": "Test"}
-                    )
-                    assert response.status_code == 200
-                    content = await response.get_data(as_text=True)
-                    assert "event: start" in content
-                    assert "event: agent" in content
-                    assert "event: tool" in content
-                    assert "event: content" in content
-                    assert "event: done" in content
+                mock_persistence.return_value.save_response_with_history = AsyncMock(
+                    return_value="resp_123"
+                )
+
+                response = await client.post(
+                    "/api/v1/chats/conv_123/stream", json={"message": "Test"}
+                )
+                assert response.status_code == 200
+                content = await response.get_data(as_text=True)
+                assert "event: start" in content
+                assert "event: agent" in content
+                assert "event: tool" in content
+                assert "event: content" in content
+                assert "event: done" in content
+
+    @pytest.mark.asyncio
+    async def test_attach_replays_after_last_event_id(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test GET reconnect replays only events after Last-Event-ID."""
+
+        async def turn():
+            yield StreamEvent("content", {"chunk": "Hel"})
+            yield StreamEvent("content", {"chunk": "lo"})
+            yield StreamEvent("done", {"response": "Hello"})
+
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+        run = get_run_registry().start("conv_123", turn())
+        await run.task
+
+        response = await client.get(
+            "/api/v1/chats/conv_123/stream",
+            headers={"Last-Event-ID": f"{run.run_id}:1"},
+        )
+        content = await response.get_data(as_text=True)
+
+        assert f"id: {run.run_id}:1\n" not in content
+        assert f"id: {run.run_id}:2\n" in content
+        assert f"id: {run.run_id}:3\n" in content
+        assert "event: done" in content
+
+    @pytest.mark.asyncio
+    async def test_post_during_active_run_attaches(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test a POST without a message joins the running turn."""
+        gate = asyncio.Event()
+
+        async def turn():
+            yield StreamEvent("content", {"chunk": "first"})
+            await gate.wait()
+            yield StreamEvent("done", {"response": "first"})
+
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+        get_run_registry().start("conv_123", turn())
+
+        with patch(
+            "application.routes.chat_endpoints.stream._save_user_message_to_conversation"
+        ) as mock_save:
+            pending = asyncio.create_task(
+                client.post("/api/v1/chats/conv_123/stream", json={})
+            )
+            await asyncio.sleep(0.01)
+            gate.set()
+            response = await pending
+            content = await response.get_data(as_text=True)
+
+        mock_save.assert_not_called()
+        assert "first" in content and "event: done" in content
+
+    @pytest.mark.asyncio
+    async def test_new_message_during_active_run_is_rejected(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test a new message sent while a turn runs gets 409, not dropped."""
+        gate = asyncio.Event()
+
+        async def turn():
+            yield StreamEvent("content", {"chunk": "first"})
+            await gate.wait()
+
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+        run = get_run_registry().start("conv_123", turn())
+
+        with patch(
+            "application.routes.chat_endpoints.stream._save_user_message_to_conversation"
+        ) as mock_save:
+            response = await client.post(
+                "/api/v1/chats/conv_123/stream", json={"message": "Hi"}
+            )
+        gate.set()
+        await run.task
+
+        assert response.status_code == 409
+        assert (await response.get_json())["details"]["run_id"] == run.run_id
+        mock_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_new_messages_start_one_run(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test the second of two racing POSTs gets 409 before its message is saved."""
+        saving = asyncio.Event()
+        release = asyncio.Event()
+
+        async def save(*args, **kwargs):
+            saving.set()
+            await release.wait()
+            return sample_conversation
+
+        async def turn():
+            yield StreamEvent("done", {"response": "ok"})
+
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+        stream_module = "application.routes.chat_endpoints.stream"
+        with (
+            patch(
+                f"{stream_module}._parse_stream_request",
+                AsyncMock(return_value=("Hi", [], None)),
+            ),
+            patch(
+                f"{stream_module}._save_user_message_to_conversation",
+                side_effect=save,
+            ) as mock_save,
+            patch(
+                f"{stream_module}._create_agent_turn_generator",
+                side_effect=lambda *args: turn(),
+            ),
+        ):
+            first = asyncio.create_task(
+                client.post("/api/v1/chats/conv_123/stream", json={"message": "Hi"})
+            )
+            await saving.wait()
+            second = await asyncio.wait_for(
+                client.post(
+                    "/api/v1/chats/conv_123/stream", json={"message": "Hi again"}
+                ),
+                5,
+            )
+            release.set()
+            first_response = await first
+
+        assert second.status_code == 409
+        assert first_response.status_code == 200
+        assert mock_save.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_save_releases_reserved_run(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test a POST whose message cannot be saved leaves no active run."""
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+        with patch(
+            "application.routes.chat_endpoints.stream._save_user_message_to_conversation",
+            AsyncMock(side_effect=RuntimeError("store unavailable")),
+        ):
+            await client.post("/api/v1/chats/conv_123/stream", json={"message": "Hi"})
+
+        assert get_run_registry().get_active("conv_123") is None
+
+    @pytest.mark.asyncio
+    async def test_attach_without_run(
+        self, client, mock_auth, mock_service_factory, sample_conversation
+    ):
+        """Test GET attach reports when no run exists."""
+        mock_service_factory.chat_service.get_conversation = AsyncMock(
+            return_value=sample_conversation
+        )
+
+        response = await client.get("/api/v1/chats/conv_123/stream")
+        content = await response.get_data(as_text=True)
+
+        assert "no active stream" in content.lower()
 
 
 class TestCanvasQuestions:
@@ -1172,7 +1342,14 @@ class TestTransferChats:
     ):
         """Test successful chat transfer."""
         mock_service_factory.chat_service.transfer_guest_chats = AsyncMock(
-            return_value=3
+            return_value=ChatTransferResult(
+                total=3,
+                transferred_count=3,
+                results=[
+                    {"conversation_id": f"conv-{i}", "success": True, "error": None}
+                    for i in range(3)
+                ],
+            )
         )
 
         with patch(
@@ -1187,6 +1364,29 @@ class TestTransferChats:
 
             data = await response.get_json()
             assert data["transferred_count"] == 3
+            assert len(data["results"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_transfer_chats_in_background(
+        self, client, mock_auth, mock_service_factory
+    ):
+        """Test large transfers return the background task ID."""
+        mock_service_factory.chat_service.transfer_guest_chats = AsyncMock(
+            return_value=ChatTransferResult(total=40, task_id="task-1")
+        )
+
+        with patch(
+            "application.routes.chat_endpoints.workflow.get_user_info_from_token"
+        ) as mock_token:
+            mock_token.return_value = ("guest.12345", False)
+
+            response = await client.post(
+                "/api/v1/chats/transfer", json={"guest_token": "mock_jwt_token"}
+            )
+
+        assert response.status_code == 202
+        data = await response.get_json()
+        assert data["task_id"] == "task-1"
 
     @pytest.mark.asyncio
     async def test_transfer_chats_to_guest(self, client, mock_guest_auth):
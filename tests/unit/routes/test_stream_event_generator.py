@@ -1,207 +1,146 @@
 """Tests for stream event generator."""
 
-import json
-from datetime import datetime, timezone
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from application.entity.conversation import Conversation
-from application.routes.chat_endpoints.stream import _create_stream_event_generator
+from application.routes.chat_endpoints.stream import (
+    _create_agent_turn_generator,
+    _process_streaming_event,
+    _StreamState,
+)
+from application.services.streaming.events import StreamComment, StreamEvent
+
+
+def _conversation(adk_session_id=None):
+    return Conversation(
+        technical_id="conv-123",
+        user_id="user-123",
+        messages=[],
+        adk_session_id=adk_session_id,
+    )
+
+
+@asynccontextmanager
+async def _lease(conversation_id):
+    yield MagicMock()
+
+
+async def _run(stream, conversation=None):
+    """Drive the route generator over a fake typed stream."""
+    with (
+        patch(
+            "application.routes.chat_endpoints.stream.StreamingService.stream_agent_events",
+            return_value=stream,
+        ),
+        patch("application.routes.chat_endpoints.stream.lease_cyoda_assistant", _lease),
+    ):
+        with patch(
+            "application.routes.chat_endpoints.stream._finalize_stream",
+            new_callable=AsyncMock,
+        ) as mock_finalize:
+            generator = _create_agent_turn_generator(
+                technical_id="conv-123",
+                user_id="user-123",
+                conversation=conversation or _conversation(),
+                message_to_process="Test message",
+            )
+            events = [event async for event in generator]
+    return events, mock_finalize
 
 
 class TestCreateStreamEventGenerator:
-    """Tests for _create_stream_event_generator function."""
+    """Tests for _create_agent_turn_generator function."""
 
     @pytest.mark.asyncio
     async def test_event_generator_with_content_events(self):
-        """Test event generator processes content events."""
-        conversation = Conversation(
-            technical_id="conv-123",
-            user_id="user-123",
-            messages=[],
-            adk_session_id=None,
-        )
-
-        assistant = MagicMock()
+        """Test event generator accumulates content and yields typed events."""
 
-        # Mock streaming generator
         async def mock_stream():
-            yield 'event: content\ndata: {"text": "Hello"}\n\n'
-            yield 'event: done\ndata: {"response": "Hello"}\n\n'
-
-        with patch(
-            "application.routes.chat_endpoints.stream.StreamingService.stream_agent_response",
-            return_value=mock_stream(),
-        ):
-            with patch(
-                "application.routes.chat_endpoints.stream.process_content_event"
-            ) as mock_process_content:
-                with patch(
-                    "application.routes.chat_endpoints.stream.process_done_event"
-                ) as mock_process_done:
-                    with patch(
-                        "application.routes.chat_endpoints.stream._finalize_stream",
-                        new_callable=AsyncMock,
-                    ):
-                        mock_process_content.return_value = ("Hello", [])
-                        mock_process_done.return_value = (
-                            True,
-                            "event: done\ndata: {}\n\n",
-                            "Hello",
-                            None,
-                            None,
-                            [],
-                        )
-
-                        generator = _create_stream_event_generator(
-                            technical_id="conv-123",
-                            user_id="user-123",
-                            conversation=conversation,
-                            assistant=assistant,
-                            message_to_process="Test message",
-                        )
-
-                        events = []
-                        async for event in generator:
-                            events.append(event)
-
-                        assert len(events) > 0
+            yield StreamEvent("content", {"chunk": "Hel"})
+            yield StreamEvent("content", {"chunk": "lo"})
+            yield StreamEvent("done", {"response": "Hello"})
+
+        events, mock_finalize = await _run(mock_stream())
+
+        assert len(events) == 3
+        assert all(isinstance(event, StreamEvent) for event in events)
+        assert events[0].event_type == "content"
+        state = mock_finalize.await_args.args[2]
+        assert state.accumulated_response == "Hello"
+        assert [e["type"] for e in state.streaming_events] == [
+            "content",
+            "content",
+            "done",
+        ]
 
     @pytest.mark.asyncio
     async def test_event_generator_handles_error(self):
         """Test event generator handles streaming errors."""
-        conversation = Conversation(
-            technical_id="conv-123",
-            user_id="user-123",
-            messages=[],
-            adk_session_id=None,
-        )
-
-        assistant = MagicMock()
 
-        # Mock streaming generator that raises error
         async def mock_stream():
             raise ValueError("Stream error")
             yield  # Make it a generator
 
-        with patch(
-            "application.routes.chat_endpoints.stream.StreamingService.stream_agent_response",
-            return_value=mock_stream(),
-        ):
-            with patch(
-                "application.routes.chat_endpoints.stream._finalize_stream",
-                new_callable=AsyncMock,
-            ):
-                generator = _create_stream_event_generator(
-                    technical_id="conv-123",
-                    user_id="user-123",
-                    conversation=conversation,
-                    assistant=assistant,
-                    message_to_process="Test message",
-                )
-
-                events = []
-                async for event in generator:
-                    events.append(event)
-
-                # Should have error event
-                assert any("error" in event for event in events)
+        events, _ = await _run(mock_stream())
+
+        # Should have error event and fallback done event
+        assert any(event.event_type == "error" for event in events)
+        done = events[-1]
+        assert done.event_type == "done"
+        assert done.data["error"] == "Stream error"
 
     @pytest.mark.asyncio
     async def test_event_generator_with_adk_session(self):
-        """Test event generator with existing ADK session."""
-        conversation = Conversation(
-            technical_id="conv-123",
-            user_id="user-123",
-            messages=[],
-            adk_session_id="session-456",
-        )
-
-        assistant = MagicMock()
+        """Test event generator captures done metadata."""
 
         async def mock_stream():
-            yield 'event: done\ndata: {"response": "Test"}\n\n'
+            yield StreamEvent(
+                "done",
+                {"response": "Test", "adk_session_id": "s-1", "hook": {"type": "x"}},
+            )
 
-        with patch(
-            "application.routes.chat_endpoints.stream.StreamingService.stream_agent_response",
-            return_value=mock_stream(),
-        ):
-            with patch(
-                "application.routes.chat_endpoints.stream.process_done_event"
-            ) as mock_process_done:
-                with patch(
-                    "application.routes.chat_endpoints.stream._finalize_stream",
-                    new_callable=AsyncMock,
-                ):
-                    mock_process_done.return_value = (
-                        True,
-                        "event: done\ndata: {}\n\n",
-                        "Test",
-                        None,
-                        None,
-                        [],
-                    )
-
-                    generator = _create_stream_event_generator(
-                        technical_id="conv-123",
-                        user_id="user-123",
-                        conversation=conversation,
-                        assistant=assistant,
-                        message_to_process="Test message",
-                    )
-
-                    events = []
-                    async for event in generator:
-                        events.append(event)
-
-                    assert len(events) > 0
+        events, mock_finalize = await _run(mock_stream(), _conversation("s-0"))
+
+        assert len(events) == 1
+        state = mock_finalize.await_args.args[2]
+        assert state.done_event_sent is True
+        assert state.adk_session_id == "s-1"
+        assert state.hook == {"type": "x"}
 
     @pytest.mark.asyncio
     async def test_event_generator_finalizes_on_completion(self):
-        """Test event generator calls finalize on completion."""
-        conversation = Conversation(
-            technical_id="conv-123",
-            user_id="user-123",
-            messages=[],
-            adk_session_id=None,
-        )
-
-        assistant = MagicMock()
+        """Test event generator calls finalize and sends fallback done."""
 
         async def mock_stream():
-            yield 'event: done\ndata: {"response": "Done"}\n\n'
+            yield StreamComment("heartbeat 1")
+            yield StreamEvent("content", {"chunk": "Done"})
 
-        with patch(
-            "application.routes.chat_endpoints.stream.StreamingService.stream_agent_response",
-            return_value=mock_stream(),
-        ):
-            with patch(
-                "application.routes.chat_endpoints.stream.process_done_event"
-            ) as mock_process_done:
-                with patch(
-                    "application.routes.chat_endpoints.stream._finalize_stream",
-                    new_callable=AsyncMock,
-                ) as mock_finalize:
-                    mock_process_done.return_value = (
-                        True,
-                        "event: done\ndata: {}\n\n",
-                        "Done",
-                        None,
-                        None,
-                        [],
-                    )
-
-                    generator = _create_stream_event_generator(
-                        technical_id="conv-123",
-                        user_id="user-123",
-                        conversation=conversation,
-                        assistant=assistant,
-                        message_to_process="Test message",
-                    )
-
-                    async for _ in generator:
-                        pass
-
-                    # Verify finalize was called
-                    assert mock_finalize.called
+        events, mock_finalize = await _run(mock_stream())
+
+        assert mock_finalize.called
+        assert events[0].to_sse() == ": heartbeat 1\n\n"
+        assert events[-1].event_type == "done"
+        state = mock_finalize.await_args.args[2]
+        # Heartbeats are not recorded in the timeline
+        assert [e["type"] for e in state.streaming_events] == ["content"]
+
+
+class TestProcessStreamingEvent:
+    """Tests for _process_streaming_event."""
+
+    def test_records_payload_with_timestamp(self):
+        state = _StreamState()
+        event = StreamEvent("tool_call", {"tool_name": "build"})
+
+        _process_streaming_event(event, state)
+
+        recorded = state.streaming_events[0]
+        assert recorded["type"] == "tool_call"
+        assert recorded["data"] == {
+            "tool_name": "build",
+            "timestamp": event.timestamp,
+        }
+        assert state.accumulated_response == ""
@@ -0,0 +1,192 @@
+"""Tests for bulk workflow import helpers in scripts/import_workflows.py."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scripts import import_workflows
+
+WORKFLOW = {
+    "name": "order_flow",
+    "version": "1",
+    "states": {"none": {"transitions": [{"name": "start", "next": "new"}]}},
+}
+
+
+def _reordered(workflow):
+    """Same workflow with keys in reverse insertion order."""
+    if isinstance(workflow, dict):
+        return {key: _reordered(workflow[key]) for key in reversed(list(workflow))}
+    if isinstance(workflow, list):
+        return [_reordered(item) for item in workflow]
+    return workflow
+
+
+def _write_workflow(base: Path, relative: str, content) -> Path:
+    path = base / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content))
+    return path
+
+
+def _validate_serially(file_paths, max_workers=None):
+    return {
+        path: import_workflows.validate_workflow_file(Path(path)) for path in file_paths
+    }
+
+
+class TestCanonicalWorkflowHash:
+    """Test canonical_workflow_hash."""
+
+    def test_hash_ignores_key_order(self):
+        assert import_workflows.canonical_workflow_hash(
+            [WORKFLOW]
+        ) == import_workflows.canonical_workflow_hash([_reordered(WORKFLOW)])
+
+    def test_hash_ignores_workflow_order(self):
+        other = {"name": "refund_flow", "states": {}}
+
+        assert import_workflows.canonical_workflow_hash(
+            [WORKFLOW, other]
+        ) == import_workflows.canonical_workflow_hash([other, WORKFLOW])
+
+    def test_hash_changes_with_content(self):
+        changed = dict(WORKFLOW, states={})
+
+        assert import_workflows.canonical_workflow_hash(
+            [WORKFLOW]
+        ) != import_workflows.canonical_workflow_hash([changed])
+
+
+class TestDiffWorkflows:
+    """Test diff_workflows."""
+
+    def test_unchanged_workflows_have_empty_diff(self):
+        diff = import_workflows.diff_workflows([WORKFLOW], [_reordered(WORKFLOW)])
+
+        assert diff == {"added": [], "removed": [], "changed": []}
+
+    def test_diff_reports_added_removed_and_changed(self):
+        current = [WORKFLOW, {"name": "legacy_flow", "states": {}}]
+        desired = [dict(WORKFLOW, states={}), {"name": "new_flow", "states": {}}]
+
+        diff = import_workflows.diff_workflows(current, desired)
+
+        assert diff == {
+            "added": ["new_flow"],
+            "removed": ["legacy_flow"],
+            "changed": ["order_flow"],
+        }
+
+
+class TestGroupWorkflowFiles:
+    """Test group_workflow_files."""
+
+    def test_groups_by_entity_and_version_and_skips_other_layouts(self):
+        files = [
+            {
+                "file_path": "/wf/order/version_1/Order.json",
+                "file_name": "Order.json",
+                "entity_name": "order",
+                "model_version": "1",
+            },
+            {
+                "file_path": "/wf/order/version_1/OrderExtra.json",
+                "file_name": "OrderExtra.json",
+                "entity_name": "order",
+                "model_version": "1",
+            },
+            {
+                "file_path": "/wf/order/version_2/Order.json",
+                "file_name": "Order.json",
+                "entity_name": "order",
+                "model_version": "2",
+            },
+            {"file_path": "/wf/loose.json", "file_name": "loose.json"},
+        ]
+
+        groups, skipped = import_workflows.group_workflow_files(files)
+
+        assert groups == {
+            ("Order", "1"): ["/wf/order/version_1/Order.json"],
+            ("OrderExtra", "1"): ["/wf/order/version_1/OrderExtra.json"],
+            ("Order", "2"): ["/wf/order/version_2/Order.json"],
+        }
+        assert skipped == ["/wf/loose.json"]
+
+
+class TestImportAllWorkflows:
+    """Test import_all_workflows."""
+
+    @pytest.fixture
+    def service(self):
+        service = MagicMock()
+        service.import_entity_workflows = AsyncMock(return_value={"success": True})
+        return service
+
+    async def _run(self, service, base_path, **kwargs):
+        with (
+            patch.object(
+                import_workflows,
+                "get_workflow_management_service",
+                return_value=service,
+            ),
+            patch.object(
+                import_workflows, "validate_workflow_files", _validate_serially
+            ),
+        ):
+            return await import_workflows.import_all_workflows(
+                base_path=str(base_path), **kwargs
+            )
+
+    @pytest.mark.asyncio
+    async def test_imports_changed_and_skips_unchanged(self, tmp_path, service):
+        _write_workflow(tmp_path, "order/version_1/Order.json", WORKFLOW)
+        _write_workflow(tmp_path, "refund/version_1/Refund.json", [WORKFLOW])
+        _write_workflow(tmp_path, "loose.json", WORKFLOW)
+
+        async def export(entity_name, model_version):
+            if entity_name == "Order":
+                return {"success": True, "workflows": [_reordered(WORKFLOW)]}
+            return {"success": False}
+
+        service.export_entity_workflows = AsyncMock(side_effect=export)
+
+        report = await self._run(service, tmp_path)
+
+        statuses = {r["entity_name"]: r["status"] for r in report["results"]}
+        assert statuses == {"Order": "unchanged", "Refund": "imported"}
+        service.import_entity_workflows.assert_awaited_once_with(
+            entity_name="Refund",
+            model_version="1",
+            workflows=[WORKFLOW],
+            import_mode="REPLACE",
+        )
+        assert report["skipped_files"] == [str(tmp_path / "loose.json")]
+        assert report["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_diff_without_importing(self, tmp_path, service):
+        _write_workflow(tmp_path, "order/version_1/Order.json", WORKFLOW)
+        service.export_entity_workflows = AsyncMock(
+            return_value={"success": True, "workflows": []}
+        )
+
+        report = await self._run(service, tmp_path, dry_run=True)
+
+        assert report["results"][0]["status"] == "would_import"
+        assert report["results"][0]["diff"]["added"] == ["order_flow"]
+        service.import_entity_workflows.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_file_fails_report(self, tmp_path, service):
+        _write_workflow(tmp_path, "order/version_1/Order.json", {"name": "x"})
+        service.export_entity_workflows = AsyncMock()
+
+        report = await self._run(service, tmp_path)
+
+        assert report["results"][0]["status"] == "invalid"
+        assert report["success"] is False
+        service.export_entity_workflows.assert_not_awaited()
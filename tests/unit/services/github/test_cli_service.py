@@ -3,11 +3,21 @@
 import asyncio
 import os
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from application.agents.shared.job_scheduler import (
+    CLIJobScheduler,
+    JobPriority,
+    QueuedJob,
+    ResourceLimits,
+    get_job_scheduler,
+    pod_job_capacity,
+    reset_job_scheduler,
+)
 from application.services.github.cli_service import GitHubCLIService
 from application.services.github.operations_service import GitHubOperationsService
 
@@ -21,7 +31,9 @@ def mock_git_service():
 @pytest.fixture
 def cli_service(mock_git_service):
     """Create a GitHubCLIService instance for testing."""
-    return GitHubCLIService(git_service=mock_git_service)
+    reset_job_scheduler()
+    yield GitHubCLIService(git_service=mock_git_service)
+    reset_job_scheduler()
 
 
 class TestGitHubCLIServiceInit:
@@ -826,12 +838,21 @@ class TestStartApplicationBuildExtended:
 
     @pytest.mark.asyncio
     async def test_start_application_build_process_limit_exceeded(self, cli_service):
-        """Test start_application_build when process limit is exceeded."""
+        """Test start_application_build queues the job when no slot is free."""
         with (
             patch("application.services.github.cli_service.load_template") as mock_load,
             patch(
                 "application.agents.shared.process_manager.get_process_manager"
             ) as mock_pm,
+            patch(
+                "application.services.github.cli_service.get_task_service"
+            ) as mock_ts,
+            patch(
+                "application.agents.shared.job_scheduler.get_task_service"
+            ) as mock_scheduler_ts,
+            patch(
+                "application.services.github.cli_service.asyncio.create_subprocess_exec"
+            ) as mock_exec,
             patch(
                 "application.services.github.cli_service.Path.exists", return_value=True
             ),
@@ -842,17 +863,37 @@ class TestStartApplicationBuildExtended:
             mock_pm_instance.can_start_process = AsyncMock(return_value=False)
             mock_pm.return_value = mock_pm_instance
 
-            with pytest.raises(RuntimeError) as exc_info:
-                await cli_service.start_application_build(
-                    repository_path="/test/repo",
-                    branch_name="test-branch",
-                    requirements="Build",
-                    language="python",
-                    user_id="user-123",
-                    conversation_id="conv-123",
-                    repo_auth_config={},
-                )
-            assert "Maximum concurrent" in str(exc_info.value)
+            mock_ts_instance = AsyncMock()
+            mock_ts_instance.create_task = AsyncMock(
+                return_value=MagicMock(technical_id="task-queued")
+            )
+            mock_ts.return_value = mock_ts_instance
+            mock_scheduler_ts.return_value = mock_ts_instance
+
+            result = await cli_service.start_application_build(
+                repository_path="/test/repo",
+                branch_name="test-branch",
+                requirements="Build",
+                language="python",
+                user_id="user-123",
+                conversation_id="conv-123",
+                repo_auth_config={},
+            )
+            await asyncio.sleep(0.01)
+
+            assert result == {
+                "task_id": "task-queued",
+                "pid": None,
+                "output_file": None,
+                "queue_position": 1,
+            }
+            mock_exec.assert_not_called()
+            create_kwargs = mock_ts_instance.create_task.await_args.kwargs
+            queue_entry = create_kwargs["cli_job_queue"]
+            assert queue_entry["priority"] == 0
+            assert queue_entry["owner"] == get_job_scheduler().owner_id
+            progress = mock_ts_instance.add_progress_update.await_args.kwargs
+            assert progress["metadata"]["queue_position"] == 1
 
     @pytest.mark.asyncio
     async def test_start_application_build_register_failure(
@@ -1202,3 +1243,176 @@ class TestMonitorCliProcessExtended:
 
             # Task should still be updated despite error
             assert mock_ts_instance.update_task_status.called
+
+
+class TestCLIJobScheduler:
+    """Test admission, queueing and dispatch order of the CLI job scheduler."""
+
+    @pytest.fixture
+    def process_manager(self):
+        manager = AsyncMock()
+        manager.can_start_process = AsyncMock(return_value=True)
+        with patch(
+            "application.agents.shared.process_manager.get_process_manager",
+            return_value=manager,
+        ):
+            yield manager
+
+    @pytest.fixture
+    def task_service(self):
+        service = AsyncMock()
+        with patch(
+            "application.agents.shared.job_scheduler.get_task_service",
+            return_value=service,
+        ):
+            yield service
+
+    @staticmethod
+    def _job(task_id, user_id, priority, started):
+        async def start(slot):
+            started.append((task_id, slot))
+
+        return QueuedJob(task_id, user_id, priority, start)
+
+    def test_capacity_from_pod_budget(self):
+        assert pod_job_capacity("8", "16384", 1, 4096) == 4
+        assert pod_job_capacity("2", None, 1, 4096) == 2
+        assert pod_job_capacity("0.5", None, 1, 4096) == 1
+        assert pod_job_capacity(None, None, 1, 4096) == 5
+
+    def test_rlimits_preexec(self):
+        assert ResourceLimits(cpu_seconds=0, memory_mb=0).preexec_fn() is None
+        limits = ResourceLimits(cpu_seconds=60, memory_mb=512)
+        with patch("application.agents.shared.job_scheduler.resource") as resource:
+            limits.preexec_fn()()
+
+        limited = {c.args[0] for c in resource.setrlimit.call_args_list}
+        assert limited == {resource.RLIMIT_CPU, resource.RLIMIT_DATA}
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_capacity(self, process_manager, task_service):
+        scheduler = CLIJobScheduler(capacity=2)
+
+        first = await scheduler.try_acquire("alice")
+        second = await scheduler.try_acquire("bob")
+        third = await scheduler.try_acquire("carol")
+        first.release()
+        first.release()
+
+        assert first and second and third is None
+        assert scheduler.running_count == 1
+        assert await scheduler.try_acquire("carol") is not None
+
+    @pytest.mark.asyncio
+    async def test_dispatch_prefers_priority_then_fair_share(
+        self, process_manager, task_service
+    ):
+        scheduler = CLIJobScheduler(capacity=2)
+        started = []
+        alice_slot = await scheduler.try_acquire("alice")
+        bob_slot = await scheduler.try_acquire("bob")
+
+        await scheduler.enqueue(
+            self._job("alice-2", "alice", JobPriority.BATCH, started)
+        )
+        await scheduler.enqueue(
+            self._job("alice-3", "alice", JobPriority.INTERACTIVE, started)
+        )
+        await scheduler.enqueue(
+            self._job("carol-1", "carol", JobPriority.INTERACTIVE, started)
+        )
+        # An interactive job cannot jump ahead of queued interactive work
+        assert await scheduler.try_acquire("dave") is None
+        assert scheduler.queue_position("carol-1") == 1
+
+        bob_slot.release()
+        await asyncio.sleep(0.01)
+        alice_slot.release()
+        await asyncio.sleep(0.01)
+
+        assert [task_id for task_id, _ in started] == ["carol-1", "alice-3"]
+        assert scheduler.queue_position("alice-2") == 1
+        messages = [
+            c.kwargs["message"]
+            for c in task_service.add_progress_update.await_args_list
+        ]
+        assert "Queued: position 1 of 1" in messages
+
+    @pytest.mark.asyncio
+    async def test_failed_start_releases_slot_and_fails_task(
+        self, process_manager, task_service
+    ):
+        scheduler = CLIJobScheduler(capacity=1)
+        held = await scheduler.try_acquire("alice")
+
+        async def start(slot):
+            raise OSError("exec failed")
+
+        await scheduler.enqueue(QueuedJob("job-1", "bob", JobPriority.BATCH, start))
+        held.release()
+        await asyncio.sleep(0.01)
+
+        assert scheduler.running_count == 0
+        assert task_service.update_task_status.await_args.kwargs["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_recovery_fails_orphaned_queued_tasks(self, task_service):
+        task_service.entity_service.search = AsyncMock(
+            return_value=[
+                MagicMock(
+                    data={
+                        "technical_id": "t-1",
+                        "workflow_cache": {"cli_job_queue": {}},
+                    }
+                ),
+                MagicMock(data={"technical_id": "t-2", "workflow_cache": {}}),
+            ]
+        )
+
+        failed = await CLIJobScheduler(capacity=1).recover_orphaned_jobs()
+
+        assert failed == 1
+        assert task_service.update_task_status.await_args.kwargs["task_id"] == "t-1"
+
+    @pytest.mark.asyncio
+    async def test_recovery_leaves_jobs_of_live_owners_alone(self, task_service):
+        now = time.time()
+
+        def queued(task_id, owner, heartbeat_at):
+            entry = {"priority": 0, "owner": owner, "heartbeat_at": heartbeat_at}
+            return MagicMock(
+                data={
+                    "technical_id": task_id,
+                    "workflow_cache": {"cli_job_queue": entry},
+                }
+            )
+
+        task_service.entity_service.search = AsyncMock(
+            return_value=[
+                queued("mine", "pod-a:100", now - 3600),
+                queued("restarted", "pod-a:99", now),
+                queued("sibling-live", "pod-a:101", now - 10),
+                queued("sibling-stale", "pod-a:101", now - 3600),
+                queued("other-live", "pod-b:100", now - 10),
+                queued("other-dead", "pod-b:100", now - 3600),
+            ]
+        )
+
+        scheduler = CLIJobScheduler(capacity=1, owner_id="pod-a:100")
+        with patch(
+            "application.agents.shared.job_scheduler._process_alive",
+            side_effect=lambda pid: pid != 99,
+        ):
+            failed = await scheduler.recover_orphaned_jobs()
+
+        assert failed == 3
+        assert {
+            c.kwargs["task_id"] for c in task_service.update_task_status.await_args_list
+        } == {"restarted", "sibling-stale", "other-dead"}
+
+    def test_process_alive_checks_the_pid(self):
+        from application.agents.shared.job_scheduler import _process_alive
+
+        assert _process_alive(os.getpid())
+        with patch("os.kill", side_effect=ProcessLookupError):
+            assert not _process_alive(12345)
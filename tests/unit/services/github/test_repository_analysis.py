@@ -1,14 +1,36 @@
 """Tests for RepositoryAnalysisService.scan_versioned_resources function."""
 
 import json
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
 from application.services.github.repository_analysis_service import (
     RepositoryAnalysisService,
 )
+from application.services.github.repository_analysis_service.analysis import (
+    ResourceScanner,
+    get_resource_scanner,
+    reset_resource_scanner,
+)
+from application.services.github.repository_analysis_service.analysis import (
+    resource_scanner as resource_scanner_module,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_scanner():
+    reset_resource_scanner()
+    yield
+    reset_resource_scanner()
+
+
+def _write_json(path: Path, content) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content))
+    return path
 
 
 class TestScanVersionedResources:
@@ -26,130 +48,171 @@ class TestScanVersionedResources:
             )
             assert result == []
 
-    def test_scan_single_json_file(self):
+    def test_scan_single_json_file(self, tmp_path):
         """Test function scans single JSON file in directory."""
         service = RepositoryAnalysisService()
+        _write_json(tmp_path / "entity" / "entity.json", {"name": "test"})
 
-        mock_item = MagicMock()
-        mock_item.name = "entity.json"
-        mock_item.suffix = ".json"
-        mock_item.stem = "entity"
-        mock_item.is_file.return_value = True
-        mock_item.is_dir.return_value = False
-        mock_item.relative_to.return_value = Path("entity.json")
-
-        mock_dir = MagicMock()
-        mock_dir.exists.return_value = True
-        mock_dir.iterdir.return_value = [mock_item]
+        result = service.scan_versioned_resources(
+            resources_dir=tmp_path / "entity",
+            resource_type="entity",
+            repo_path_obj=tmp_path,
+        )
 
-        with patch("builtins.open", mock_open(read_data='{"name": "test"}')):
-            result = service.scan_versioned_resources(
-                resources_dir=mock_dir,
-                resource_type="entity",
-                repo_path_obj=Path("/repo"),
-            )
-            assert len(result) == 1
-            assert result[0]["name"] == "entity"
-            assert result[0]["version"] is None
+        assert len(result) == 1
+        assert result[0]["name"] == "entity"
+        assert result[0]["version"] is None
+        assert result[0]["path"] == "entity/entity.json"
 
-    def test_scan_skips_underscore_files(self):
+    def test_scan_skips_underscore_files(self, tmp_path):
         """Test function skips files starting with underscore."""
         service = RepositoryAnalysisService()
+        _write_json(tmp_path / "entity" / "_internal.json", {"name": "test"})
 
-        mock_item = MagicMock()
-        mock_item.name = "_internal.json"
+        result = service.scan_versioned_resources(
+            resources_dir=tmp_path / "entity",
+            resource_type="entity",
+            repo_path_obj=tmp_path,
+        )
+        assert result == []
 
-        mock_dir = MagicMock()
-        mock_dir.exists.return_value = True
-        mock_dir.iterdir.return_value = [mock_item]
+    def test_scan_versioned_directory(self, tmp_path):
+        """Test function scans versioned resource directories in version order."""
+        service = RepositoryAnalysisService()
+        entity_dir = tmp_path / "entity" / "pet"
+        for version in (10, 2, 1):
+            _write_json(
+                entity_dir / f"version_{version}" / "Pet.json", {"version": version}
+            )
 
         result = service.scan_versioned_resources(
-            resources_dir=mock_dir, resource_type="entity", repo_path_obj=Path("/repo")
+            resources_dir=tmp_path / "entity",
+            resource_type="entity",
+            repo_path_obj=tmp_path,
         )
-        assert result == []
 
-    def test_scan_versioned_directory(self):
-        """Test function scans versioned resource directories."""
+        assert [r["version"] for r in result] == [
+            "version_1",
+            "version_2",
+            "version_10",
+        ]
+        assert result[0]["name"] == "pet"
+        assert result[0]["path"] == "entity/pet/version_1/Pet.json"
+
+    def test_scan_falls_back_to_file_in_resource_directory(self, tmp_path):
+        """Test unparseable versions fall back to the resource directory file."""
         service = RepositoryAnalysisService()
+        entity_dir = tmp_path / "entity" / "pet"
+        (entity_dir / "version_1").mkdir(parents=True)
+        (entity_dir / "version_1" / "pet.json").write_text("invalid json")
+        _write_json(entity_dir / "pet.json", {"name": "pet"})
 
-        # Mock version directory
-        version_dir = MagicMock()
-        version_dir.name = "version_1"
-        version_dir.is_dir.return_value = True
-
-        # Mock resource file in version directory
-        resource_file = MagicMock()
-        resource_file.stem = "entity"
-        resource_file.exists.return_value = True
-        resource_file.relative_to.return_value = Path("entity/version_1/entity.json")
-
-        version_dir.__truediv__ = MagicMock(return_value=resource_file)
-        version_dir.iterdir.return_value = []
-        version_dir.glob.return_value = [resource_file]
-
-        # Mock main directory
-        mock_item = MagicMock()
-        mock_item.name = "entity"
-        mock_item.is_file.return_value = False
-        mock_item.is_dir.return_value = True
-        mock_item.iterdir.return_value = [version_dir]
-
-        mock_dir = MagicMock()
-        mock_dir.exists.return_value = True
-        mock_dir.iterdir.return_value = [mock_item]
-
-        with patch("builtins.open", mock_open(read_data='{"name": "test"}')):
-            result = service.scan_versioned_resources(
-                resources_dir=mock_dir,
-                resource_type="entity",
-                repo_path_obj=Path("/repo"),
-            )
-            assert len(result) >= 0  # May be 0 or 1 depending on mock setup
+        result = service.scan_versioned_resources(
+            resources_dir=tmp_path / "entity",
+            resource_type="entity",
+            repo_path_obj=tmp_path,
+        )
+
+        assert [(r["version"], r["path"]) for r in result] == [
+            (None, "entity/pet/pet.json")
+        ]
 
-    def test_scan_workflow_with_entity_name(self):
+    def test_scan_workflow_with_entity_name(self, tmp_path):
         """Test function extracts entity_name from workflow content."""
         service = RepositoryAnalysisService()
+        _write_json(tmp_path / "workflow" / "workflow.json", {"entity_name": "User"})
 
-        mock_item = MagicMock()
-        mock_item.name = "workflow.json"
-        mock_item.suffix = ".json"
-        mock_item.stem = "workflow"
-        mock_item.is_file.return_value = True
-        mock_item.is_dir.return_value = False
-        mock_item.relative_to.return_value = Path("workflow.json")
-
-        mock_dir = MagicMock()
-        mock_dir.exists.return_value = True
-        mock_dir.iterdir.return_value = [mock_item]
+        result = service.scan_versioned_resources(
+            resources_dir=tmp_path / "workflow",
+            resource_type="workflow",
+            repo_path_obj=tmp_path,
+        )
 
-        workflow_content = '{"entity_name": "User"}'
-        with patch("builtins.open", mock_open(read_data=workflow_content)):
-            result = service.scan_versioned_resources(
-                resources_dir=mock_dir,
-                resource_type="workflow",
-                repo_path_obj=Path("/repo"),
-            )
-            assert len(result) == 1
-            assert result[0]["entity_name"] == "User"
+        assert len(result) == 1
+        assert result[0]["entity_name"] == "User"
 
-    def test_scan_invalid_json_file(self):
+    def test_scan_invalid_json_file(self, tmp_path):
         """Test function handles invalid JSON gracefully."""
         service = RepositoryAnalysisService()
+        (tmp_path / "entity").mkdir()
+        (tmp_path / "entity" / "invalid.json").write_text("invalid json")
 
-        mock_item = MagicMock()
-        mock_item.name = "invalid.json"
-        mock_item.suffix = ".json"
-        mock_item.is_file.return_value = True
-        mock_item.is_dir.return_value = False
+        result = service.scan_versioned_resources(
+            resources_dir=tmp_path / "entity",
+            resource_type="entity",
+            repo_path_obj=tmp_path,
+        )
+        assert result == []
 
-        mock_dir = MagicMock()
-        mock_dir.exists.return_value = True
-        mock_dir.iterdir.return_value = [mock_item]
 
-        with patch("builtins.open", mock_open(read_data="invalid json")):
-            result = service.scan_versioned_resources(
-                resources_dir=mock_dir,
-                resource_type="entity",
-                repo_path_obj=Path("/repo"),
-            )
-            assert result == []
+class TestResourceScannerCache:
+    """Test that repeated scans only re-read changed files."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_rescan_reads_only_changed_files(self, tmp_path, max_workers):
+        scanner = ResourceScanner(max_workers=max_workers)
+        entity_dir = tmp_path / "entity"
+        files = [
+            _write_json(entity_dir / f"e{i}" / "version_1" / f"e{i}.json", {"i": i})
+            for i in range(5)
+        ]
+        scanner.scan_versioned_resources(entity_dir, "entity", tmp_path)
+
+        files[2].write_text(json.dumps({"i": 2, "changed": True}))
+        os.utime(files[2], ns=(0, files[2].stat().st_mtime_ns + 1_000_000))
+        with patch.object(
+            scanner, "_load_json_file", wraps=scanner._load_json_file
+        ) as load:
+            result = scanner.scan_versioned_resources(entity_dir, "entity", tmp_path)
+
+        assert [call.args[0] for call in load.call_args_list] == [files[2]]
+        assert result[2]["content"] == {"i": 2, "changed": True}
+        assert [r["content"]["i"] for r in result] == [0, 1, 2, 3, 4]
+
+    def test_scanners_share_one_parse_pool(self, tmp_path):
+        entity_dir = tmp_path / "entity"
+        for i in range(3):
+            _write_json(entity_dir / f"e{i}.json", {"i": i})
+
+        with (
+            patch.object(resource_scanner_module, "_parse_pool", None),
+            patch.object(
+                resource_scanner_module,
+                "ThreadPoolExecutor",
+                wraps=resource_scanner_module.ThreadPoolExecutor,
+            ) as executor,
+        ):
+            for scanner in (ResourceScanner(max_workers=2), ResourceScanner()):
+                result = scanner.scan_versioned_resources(
+                    entity_dir, "entity", tmp_path
+                )
+                assert [r["content"]["i"] for r in result] == [0, 1, 2]
+            resource_scanner_module._parse_pool.shutdown()
+
+        executor.assert_called_once()
+
+    def test_agent_scan_reuses_shared_parse_cache(self, tmp_path):
+        from application.agents.github.tool_definitions.repository.helpers import (
+            scan_versioned_resources,
+        )
+
+        _write_json(tmp_path / "entity" / "pet.json", {"name": "pet"})
+        scan_versioned_resources(tmp_path / "entity", "entity", tmp_path)
+
+        scanner = get_resource_scanner()
+        with patch.object(
+            scanner, "_load_json_file", wraps=scanner._load_json_file
+        ) as load:
+            result = scan_versioned_resources(tmp_path / "entity", "entity", tmp_path)
+
+        load.assert_not_called()
+        assert result[0]["content"] == {"name": "pet"}
+
+    def test_is_textual_file_matches_by_suffix(self):
+        scanner = ResourceScanner()
+
+        assert scanner.is_textual_file("README.MD") is True
+        assert scanner.is_textual_file(".env") is True
+        assert scanner.is_textual_file("Dockerfile") is True
+        assert scanner.is_textual_file("image.png") is False
+        assert scanner.is_textual_file("noextension") is False
@@ -0,0 +1,210 @@
+"""Tests for the pool of pre-built Cyoda Assistants."""
+
+import asyncio
+import itertools
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.services.assistant.pool import (
+    AssistantPool,
+    AssistantPoolTimeoutError,
+    parse_model_limits,
+)
+
+
+def _pool(**kwargs):
+    counter = itertools.count()
+
+    def build():
+        assistant = MagicMock()
+        assistant.number = next(counter)
+        return assistant
+
+    kwargs.setdefault("model", "test-model")
+    return AssistantPool(build, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_builds_min_size_assistants():
+    pool = _pool(min_size=3, max_size=5)
+
+    await pool.warm_up()
+
+    stats = pool.stats()
+    assert (stats["size"], stats["idle"], stats["in_use"]) == (3, 3, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_leases_get_distinct_assistants():
+    pool = _pool(min_size=2, max_size=2)
+    await pool.warm_up()
+
+    async with pool.lease("a") as first, pool.lease("b") as second:
+        assert first is not second
+        assert pool.stats()["utilization"] == 1.0
+
+    assert pool.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_grows_on_demand_up_to_max_size():
+    pool = _pool(min_size=0, max_size=2)
+
+    async with pool.lease("a"), pool.lease("b"):
+        assert pool.size == 2
+
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_queues_until_release():
+    pool = _pool(min_size=1, max_size=1)
+    await pool.warm_up()
+    order = []
+
+    async def turn(name, hold):
+        async with pool.lease(name):
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    await asyncio.gather(turn("first", 0.05), turn("second", 0))
+
+    assert order == ["first", "second"]
+    stats = pool.stats()
+    assert stats["queued_total"] == 1
+    assert stats["leases_total"] == 2
+    assert stats["wait_seconds_max"] >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_wait_beyond_timeout_raises():
+    pool = _pool(min_size=1, max_size=1, acquire_timeout=0.01)
+    await pool.warm_up()
+
+    async with pool.lease("a"):
+        with pytest.raises(AssistantPoolTimeoutError):
+            async with pool.lease("b"):
+                pass
+
+    stats = pool.stats()
+    assert stats["timeouts_total"] == 1
+    assert stats["waiting"] == 0
+    assert stats["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_prefers_assistant_that_served_conversation():
+    pool = _pool(min_size=2, max_size=2)
+    await pool.warm_up()
+
+    async with pool.lease("conv") as assistant:
+        served = assistant
+    async with pool.lease("other"):
+        pass
+
+    async with pool.lease("conv") as assistant:
+        assert assistant is served
+    served.runner.session_service.clear_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_moving_conversation_clears_stale_session_cache():
+    pool = _pool(min_size=2, max_size=2)
+    await pool.warm_up()
+    async with pool.lease("conv") as served:
+        pass
+
+    async with pool.lease("other"):
+        async with pool.lease("conv") as moved:
+            pass
+
+    # "other" took the warmest assistant, so "conv" moved to the second one
+    assert moved is not served
+    moved.runner.session_service.clear_cache.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_failed_build_frees_capacity():
+    calls = []
+
+    def build():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model unavailable")
+        return MagicMock()
+
+    pool = AssistantPool(build, model="test-model", min_size=0, max_size=1)
+
+    with pytest.raises(RuntimeError):
+        async with pool.lease("a"):
+            pass
+    async with pool.lease("a"):
+        pass
+
+    assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_build_hands_capacity_to_waiter():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = []
+
+    async def first_build():
+        started.set()
+        await release.wait()
+        raise RuntimeError("model unavailable")
+
+    loop = asyncio.get_running_loop()
+
+    def build():
+        calls.append(1)
+        if len(calls) == 1:
+            return asyncio.run_coroutine_threadsafe(first_build(), loop).result()
+        return MagicMock()
+
+    pool = AssistantPool(
+        build, model="test-model", min_size=0, max_size=1, acquire_timeout=5
+    )
+
+    async def lease_once():
+        async with pool.lease("a") as assistant:
+            return assistant
+
+    first = asyncio.ensure_future(lease_once())
+    await started.wait()
+    second = asyncio.ensure_future(lease_once())
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await first
+    assert await asyncio.wait_for(second, 1) is not None
+    assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_on_build_runs_for_every_built_assistant():
+    built = []
+    pool = _pool(min_size=1, max_size=2, on_build=lambda: built.append(1))
+
+    await pool.warm_up()
+    async with pool.lease("a"), pool.lease("b"):
+        pass
+
+    assert len(built) == 2
+
+
+def test_prefill_builds_synchronously():
+    pool = _pool(min_size=2, max_size=4)
+
+    pool.prefill()
+
+    assert pool.size == 2
+
+
+def test_parse_model_limits_skips_invalid_entries():
+    assert parse_model_limits(
+        "gemini-2.5-flash=4, openai/gpt-4o=16,broken,zero=0,"
+    ) == {"gemini-2.5-flash": 4, "openai/gpt-4o": 16}
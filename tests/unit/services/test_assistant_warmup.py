@@ -0,0 +1,100 @@
+"""Tests for deferred construction of the Cyoda Assistant."""
+
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import services.services as services
+from application.services.assistant.pool import AssistantPool
+
+
+@pytest.fixture
+def container():
+    """Fake service container for the module-level getters."""
+    fake = MagicMock()
+    services._assistant_ready = False
+    with patch.object(services, "_ensure_initialized", return_value=fake):
+        yield fake
+    services._assistant_ready = False
+
+
+@pytest.mark.asyncio
+async def test_lazy_lease_builds_off_the_event_loop_and_marks_ready(container):
+    built_on = []
+    agents = MagicMock()
+    agents.create_cyoda_assistant.side_effect = lambda **kwargs: built_on.append(
+        threading.current_thread()
+    )
+    with patch.dict(sys.modules, {"application.agents": agents}):
+        pool = services._create_assistant_pool(
+            MagicMock(), model="test", pool_size=0, max_concurrency=1
+        )
+        async with pool.lease("conv"):
+            pass
+
+    assert len(built_on) == 1
+    assert built_on[0] is not threading.current_thread()
+    assert services.is_cyoda_assistant_ready()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_fills_assistant_pool(container):
+    pool = AssistantPool(lambda: "assistant", model="test", min_size=2)
+    container.assistant_pool.return_value = pool
+
+    await services.warm_up_cyoda_assistant()
+
+    assert pool.size == 2
+    assert services.is_cyoda_assistant_ready()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_is_logged_not_raised(container):
+    def fail():
+        raise RuntimeError("no model")
+
+    container.assistant_pool.return_value = AssistantPool(fail, model="test")
+
+    await services.warm_up_cyoda_assistant()
+
+    assert not services.is_cyoda_assistant_ready()
+
+
+def test_initialize_services_defers_assistant_unless_eager():
+    config = {"assistant": {"warmup": "background"}}
+    fake = MagicMock()
+    with (
+        patch.object(services, "ServiceContainer", return_value=fake),
+        patch.object(services, "_initialized", False),
+        patch.object(services, "_container", None),
+    ):
+        services.initialize_services(config)
+        fake.assistant_pool.return_value.prefill.assert_not_called()
+
+    with (
+        patch.object(services, "ServiceContainer", return_value=fake),
+        patch.object(services, "_initialized", False),
+        patch.object(services, "_container", None),
+    ):
+        services.initialize_services({"assistant": {"warmup": "eager"}})
+        fake.assistant_pool.return_value.prefill.assert_called_once()
+    services._assistant_ready = False
+
+
+def test_initialize_services_builds_core_services_on_first_use():
+    fake = MagicMock()
+    with (
+        patch.object(services, "ServiceContainer", return_value=fake),
+        patch.object(services, "_initialized", False),
+        patch.object(services, "_container", None),
+    ):
+        services.initialize_services({"assistant": {"warmup": "background"}})
+
+        fake.auth_service.assert_not_called()
+        fake.repository.assert_not_called()
+        fake.entity_service.assert_not_called()
+        fake.grpc_client.assert_not_called()
+
+        assert services.get_entity_service() is fake.entity_service.return_value
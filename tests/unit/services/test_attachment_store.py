@@ -0,0 +1,193 @@
+"""Tests for the content-addressed chat attachment store."""
+
+import asyncio
+import base64
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from application.agents.shared.repository_tools.files.file_operations import (
+    _save_all_files,
+)
+from application.services.attachment_store import (
+    AttachmentStore,
+    ChunkedAttachment,
+    InlineAttachment,
+)
+
+
+class FakeRepository:
+    """Edge message store recording saves and peak write concurrency."""
+
+    def __init__(self):
+        self.messages = {}
+        self.saved_metas = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def save(self, meta, entity):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        message_id = f"edge-{len(self.messages)}"
+        self.messages[message_id] = entity
+        self.saved_metas.append(meta)
+        return message_id
+
+    async def find_by_id(self, meta, entity_id):
+        return self.messages.get(entity_id)
+
+    async def delete_by_id(self, meta, technical_id):
+        del self.messages[technical_id]
+
+    def chunk_count(self):
+        return sum(1 for m in self.messages.values() if m.get("type") == "file_chunk")
+
+
+class FakeEntityService:
+    """Digest index records keyed by technical id."""
+
+    def __init__(self):
+        self.records = {}
+        self.saved = 0
+
+    async def search(self, entity_class, condition, entity_version):
+        digest = condition.conditions[0].value
+        return [
+            SimpleNamespace(data=dict(data), metadata=SimpleNamespace(id=record_id))
+            for record_id, data in self.records.items()
+            if data["digest"] == digest
+        ]
+
+    async def save(self, entity, entity_class, entity_version):
+        self.saved += 1
+        record_id = f"blob-{self.saved}"
+        self.records[record_id] = entity
+        await asyncio.sleep(0)
+        return SimpleNamespace(metadata=SimpleNamespace(id=record_id))
+
+    async def delete_by_id(self, entity_id, entity_class, entity_version):
+        del self.records[entity_id]
+
+
+@pytest.fixture
+def repository():
+    return FakeRepository()
+
+
+@pytest.fixture
+def entity_service():
+    return FakeEntityService()
+
+
+def _store(repository, entity_service, **kwargs):
+    return AttachmentStore(repository, entity_service, chunk_size=4, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_put_stores_chunks_and_reads_ranges(repository, entity_service):
+    store = _store(repository, entity_service)
+
+    handle = await store.put(io.BytesIO(b"0123456789"), "spec.md", "text/markdown")
+
+    assert isinstance(handle, ChunkedAttachment)
+    assert (handle.size, len(handle.chunk_ids)) == (10, 3)
+    assert all(meta["cache"] is False for meta in repository.saved_metas)
+    assert await handle.read(3, 4) == b"3456"
+    assert await handle.read(8) == b"89"
+    assert await handle.read_text() == "0123456789"
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_reuse_chunks(repository, entity_service):
+    first = await _store(repository, entity_service).save_upload(
+        io.BytesIO(b"same content"), "a.txt", "conv-1", "user-1"
+    )
+    # A fresh store (another pod) finds the content through the digest index
+    second = await _store(repository, entity_service).save_upload(
+        io.BytesIO(b"same content"), "b.txt", "conv-2", "user-1"
+    )
+
+    assert first != second
+    assert repository.chunk_count() == 3
+    opened = await _store(repository, entity_service).open(second)
+    assert opened.filename == "b.txt"
+    assert await opened.read() == b"same content"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_uploads_keep_one_index_entry(
+    repository, entity_service
+):
+    first, second = await asyncio.gather(
+        _store(repository, entity_service).put(io.BytesIO(b"same content"), "a"),
+        _store(repository, entity_service).put(io.BytesIO(b"same content"), "b"),
+    )
+
+    assert list(entity_service.records) == ["blob-1"]
+    assert first.chunk_ids == second.chunk_ids
+    assert repository.chunk_count() == 3
+    assert await second.read() == b"same content"
+
+
+@pytest.mark.asyncio
+async def test_index_cache_is_bounded(repository, entity_service):
+    store = _store(repository, entity_service, index_cache_entries=2)
+
+    for content in (b"first", b"second", b"third"):
+        await store.put(io.BytesIO(content), "f")
+
+    cached = [blob.technical_id for blob in store._blobs.values()]
+    assert cached == ["blob-2", "blob-3"]
+
+
+@pytest.mark.asyncio
+async def test_discarded_blob_leaves_index_cache(repository, entity_service):
+    store = _store(repository, entity_service)
+    await store.put(io.BytesIO(b"content"), "a")
+    (blob,) = store._blobs.values()
+
+    await store._discard_blob(blob)
+
+    assert blob.digest not in store._blobs
+    assert entity_service.records == {}
+
+
+@pytest.mark.asyncio
+async def test_chunk_writes_are_bounded(repository, entity_service):
+    store = _store(repository, entity_service, concurrency=2)
+
+    await store.put(io.BytesIO(b"x" * 40), "big.bin")
+
+    assert repository.chunk_count() == 10
+    assert repository.peak_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_legacy_base64_message_opens_inline(repository, entity_service):
+    repository.messages["legacy"] = {
+        "message": base64.b64encode(b"old upload").decode(),
+        "metadata": {"filename": "old.txt", "encoding": "base64"},
+    }
+
+    handle = await _store(repository, entity_service).open("legacy")
+
+    assert isinstance(handle, InlineAttachment)
+    assert await handle.read(4) == b"upload"
+    assert await _store(repository, entity_service).open("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_handles_are_streamed_to_disk(repository, entity_service, tmp_path):
+    handle = await _store(repository, entity_service).put(
+        io.BytesIO(b"\x00\x01binary\xff"), "image.png", "image/png"
+    )
+
+    saved = await _save_all_files(
+        [{"filename": "../image.png", "content": handle}], tmp_path
+    )
+
+    assert saved == ["../image.png"]
+    assert (tmp_path / "image.png").read_bytes() == b"\x00\x01binary\xff"
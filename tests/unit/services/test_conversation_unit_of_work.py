@@ -0,0 +1,177 @@
+"""Tests for the write-coalescing conversation unit of work."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.entity.conversation import Conversation
+from application.services.chat.unit_of_work import (
+    ConversationUnitOfWork,
+    ConversationWriteCoalescer,
+)
+
+
+def _conversation(**kwargs):
+    return Conversation(technical_id="conv-1", user_id="user-1", **kwargs)
+
+
+def _edge_ids(conversation):
+    return [m["edge_message_id"] for m in conversation.chat_flow["finished_flow"]]
+
+
+@pytest.fixture
+def chat_service():
+    service = AsyncMock()
+    service.get_conversation.side_effect = lambda _: _conversation()
+    service.update_conversation.side_effect = lambda conversation: conversation
+    return service
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_all_changes_in_one_update(chat_service):
+    unit_of_work = ConversationUnitOfWork(
+        "conv-1",
+        chat_service,
+        base=_conversation(),
+        coalescer=ConversationWriteCoalescer(),
+    )
+    unit_of_work.set_adk_session_id("session-1")
+    unit_of_work.append_message("user", AsyncMock(return_value="edge-1")(), ["f1"])
+    unit_of_work.add_file_blob_ids(["f1"])
+
+    updated = await unit_of_work.flush()
+
+    chat_service.get_conversation.assert_not_awaited()
+    chat_service.update_conversation.assert_awaited_once()
+    assert _edge_ids(updated) == ["edge-1"]
+    assert updated.adk_session_id == "session-1"
+    assert updated.file_blob_ids == ["f1"]
+    assert await unit_of_work.flush() is None  # nothing staged
+
+
+@pytest.mark.asyncio
+async def test_edge_write_overlaps_conversation_read(chat_service):
+    read_started = asyncio.Event()
+
+    async def get_conversation(_):
+        read_started.set()
+        return _conversation(adk_session_id="existing")
+
+    async def save_response():
+        # Completes only if the read runs at the same time
+        await asyncio.wait_for(read_started.wait(), timeout=1)
+        return "edge-ai"
+
+    chat_service.get_conversation.side_effect = get_conversation
+    unit_of_work = ConversationUnitOfWork(
+        "conv-1", chat_service, coalescer=ConversationWriteCoalescer()
+    )
+    unit_of_work.append_message("ai", save_response(), metadata={"hook": {}})
+    unit_of_work.set_adk_session_id("new")
+
+    updated = await unit_of_work.flush()
+
+    assert _edge_ids(updated) == ["edge-ai"]
+    assert updated.adk_session_id == "existing"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_flushes_are_merged_into_one_write(chat_service):
+    release = asyncio.Event()
+    written = []
+
+    async def update_conversation(conversation):
+        written.append(_edge_ids(conversation))
+        if len(written) == 1:
+            await release.wait()
+        return conversation
+
+    chat_service.update_conversation.side_effect = update_conversation
+    coalescer = ConversationWriteCoalescer()
+
+    async def flush(edge_id):
+        unit_of_work = ConversationUnitOfWork(
+            "conv-1", chat_service, coalescer=coalescer
+        )
+        unit_of_work.append_message("ai", edge_id)
+        return await unit_of_work.flush()
+
+    first = asyncio.ensure_future(flush("edge-1"))
+    await asyncio.sleep(0.01)
+    others = asyncio.gather(flush("edge-2"), flush("edge-3"))
+    await asyncio.sleep(0.01)
+    release.set()
+    await first
+    second, third = await others
+
+    assert written == [["edge-1"], ["edge-2", "edge-3"]]
+    assert second is third
+
+
+@pytest.mark.asyncio
+async def test_unsaved_edge_message_is_not_linked(chat_service):
+    unit_of_work = ConversationUnitOfWork(
+        "conv-1", chat_service, coalescer=ConversationWriteCoalescer()
+    )
+    unit_of_work.append_message("user", AsyncMock(return_value=None)())
+    unit_of_work.add_background_task("task-1")
+
+    updated = await unit_of_work.flush()
+
+    assert _edge_ids(updated) == []
+    assert updated.background_task_ids == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_abort_merged_write(chat_service):
+    release = asyncio.Event()
+    written = []
+
+    async def update_conversation(conversation):
+        await release.wait()
+        written.append(_edge_ids(conversation))
+        return conversation
+
+    chat_service.update_conversation.side_effect = update_conversation
+    coalescer = ConversationWriteCoalescer()
+
+    async def flush(edge_id):
+        unit_of_work = ConversationUnitOfWork(
+            "conv-1", chat_service, coalescer=coalescer
+        )
+        unit_of_work.append_message("ai", edge_id)
+        return await unit_of_work.flush()
+
+    first = asyncio.ensure_future(flush("edge-1"))
+    second = asyncio.ensure_future(flush("edge-2"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    release.set()
+
+    assert _edge_ids(await second) == ["edge-1", "edge-2"]
+    assert written == [["edge-1", "edge-2"]]
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_failed_edge_write_fails_only_its_caller(chat_service):
+    coalescer = ConversationWriteCoalescer()
+
+    async def failing_edge_write():
+        raise RuntimeError("edge write failed")
+
+    async def flush(edge_id):
+        unit_of_work = ConversationUnitOfWork(
+            "conv-1", chat_service, coalescer=coalescer
+        )
+        unit_of_work.append_message("ai", edge_id)
+        return await unit_of_work.flush()
+
+    failed, saved = await asyncio.gather(
+        flush(failing_edge_write()), flush("edge-2"), return_exceptions=True
+    )
+
+    assert isinstance(failed, RuntimeError)
+    assert _edge_ids(saved) == ["edge-2"]
+    chat_service.update_conversation.assert_awaited_once()
@@ -436,6 +436,44 @@ class TestDeploymentService:
                     cyoda_client_secret="client-secret",
                 )
 
+    @pytest.mark.asyncio
+    async def test_deploys_invalidate_namespace_inventory(self, deployment_service):
+        """Test new namespaces are visible to the next listing right away."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "build_id": "build-abc123",
+            "build_namespace": "client-testuser-dev",
+        }
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        inventory = MagicMock()
+
+        with (
+            patch(
+                "application.services.deployment.service.get_cloud_manager_service",
+                return_value=mock_client,
+            ),
+            patch(
+                "application.services.deployment.service.get_namespace_inventory",
+                return_value=inventory,
+            ),
+        ):
+            await deployment_service.deploy_cyoda_environment(
+                user_id="user", conversation_id="conv-123", env_name="dev"
+            )
+            await deployment_service.deploy_user_application(
+                user_id="user",
+                conversation_id="conv-123",
+                env_name="dev",
+                app_name="app",
+                repository_url="https://github.com/user/repo",
+                branch_name="main",
+                cyoda_client_id="client-id",
+                cyoda_client_secret="client-secret",
+            )
+
+        assert inventory.invalidate.call_count == 2
+
 
 class TestDeploymentResult:
     """Test DeploymentResult dataclass."""
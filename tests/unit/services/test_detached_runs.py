@@ -0,0 +1,201 @@
+"""Tests for detached agent runs and Last-Event-ID replay."""
+
+import asyncio
+
+import pytest
+
+from application.services.streaming.detached_runs import (
+    InMemoryRunBuffer,
+    RunRegistry,
+)
+from application.services.streaming.events import StreamComment, StreamEvent
+
+
+async def _collect(subscription):
+    return [item async for item in subscription]
+
+
+def _gated_producer(gate, count=3):
+    async def producer():
+        for i in range(count):
+            yield StreamEvent("content", {"chunk": str(i)})
+            await gate.wait()
+        yield StreamEvent("done", {"response": "ok"})
+
+    return producer()
+
+
+class TestInMemoryRunBuffer:
+    """Test the ring buffer backend."""
+
+    @pytest.mark.asyncio
+    async def test_assigns_monotonic_ids_and_replays_after(self):
+        buffer = InMemoryRunBuffer()
+        for chunk in "abc":
+            await buffer.append(StreamEvent("content", {"chunk": chunk}, "7"))
+
+        replay = await buffer.read_after(1)
+
+        assert [e.event_id for e in replay] == ["2", "3"]
+        assert await buffer.read_after(3) == []
+
+    @pytest.mark.asyncio
+    async def test_event_ids_are_prefixed_with_run_id(self):
+        buffer = InMemoryRunBuffer("run-a")
+        await buffer.append(StreamEvent("content", {}))
+
+        assert [e.event_id for e in await buffer.read_after(0)] == ["run-a:1"]
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest_when_full(self):
+        buffer = InMemoryRunBuffer(maxlen=2)
+        for chunk in "abcd":
+            await buffer.append(StreamEvent("content", {"chunk": chunk}))
+
+        assert [e.data["chunk"] for e in await buffer.read_after(0)] == ["c", "d"]
+        assert [e.data["chunk"] for e in await buffer.read_after(3)] == ["d"]
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_then_wakes_on_append(self):
+        buffer = InMemoryRunBuffer()
+
+        assert await buffer.wait(0, timeout=0.01) is False
+        waiter = asyncio.create_task(buffer.wait(0, timeout=5))
+        await asyncio.sleep(0)
+        await buffer.append(StreamEvent("content", {}))
+
+        assert await waiter is True
+
+
+class TestDetachedRun:
+    """Test runs outliving subscribers and resuming from Last-Event-ID."""
+
+    @pytest.mark.asyncio
+    async def test_run_completes_after_subscriber_disconnects(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        run = registry.start("conv-1", _gated_producer(gate))
+
+        subscription = run.subscribe()
+        first = await subscription.__anext__()
+        await subscription.aclose()
+        gate.set()
+        await run.task
+
+        assert first.event_id == f"{run.run_id}:1"
+        assert run.done
+        assert run.buffer.last_event_id == 4
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_only_missed_events(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        gate.set()
+        run = registry.start("conv-1", _gated_producer(gate))
+        await run.task
+
+        resumed = await _collect(
+            registry.get("conv-1").subscribe(last_event_id=f"{run.run_id}:2")
+        )
+
+        assert [e.event_id for e in resumed] == [f"{run.run_id}:3", f"{run.run_id}:4"]
+        assert resumed[-1].event_type == "done"
+
+    @pytest.mark.asyncio
+    async def test_last_event_id_from_previous_run_replays_whole_run(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        gate.set()
+        previous = registry.start("conv-1", _gated_producer(gate))
+        await previous.task
+        run = registry.start("conv-1", _gated_producer(gate))
+        await run.task
+
+        resumed = await _collect(run.subscribe(last_event_id=f"{previous.run_id}:3"))
+
+        assert run is not previous
+        assert [e.event_id for e in resumed] == [
+            f"{run.run_id}:{seq}" for seq in range(1, 5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_second_subscriber_attaches_to_same_run(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        run = registry.start("conv-1", _gated_producer(gate))
+        second = registry.start("conv-1", _gated_producer(asyncio.Event()))
+
+        tabs = asyncio.gather(_collect(run.subscribe()), _collect(second.subscribe()))
+        gate.set()
+        first_tab, second_tab = await tabs
+
+        assert second is run
+        expected = [f"{run.run_id}:{seq}" for seq in range(1, 5)]
+        assert [e.event_id for e in first_tab] == expected
+        assert [e.event_id for e in second_tab] == expected
+
+    @pytest.mark.asyncio
+    async def test_idle_subscriber_gets_heartbeat(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        run = registry.start("conv-1", _gated_producer(gate))
+
+        subscription = run.subscribe(
+            last_event_id=f"{run.run_id}:1", heartbeat_interval=0.01
+        )
+        item = await subscription.__anext__()
+        await subscription.aclose()
+        gate.set()
+        await run.task
+
+        assert isinstance(item, StreamComment)
+
+    @pytest.mark.asyncio
+    async def test_producer_failure_ends_run_with_error_event(self):
+        async def producer():
+            yield StreamEvent("content", {"chunk": "a"})
+            raise RuntimeError("boom")
+
+        registry = RunRegistry()
+        run = registry.start("conv-1", producer())
+
+        events = await _collect(run.subscribe())
+
+        assert [e.event_type for e in events] == ["content", "error"]
+        assert registry.get_active("conv-1") is None
+
+    @pytest.mark.asyncio
+    async def test_finished_runs_expire_after_retention(self):
+        registry = RunRegistry(retention_seconds=0)
+        gate = asyncio.Event()
+        gate.set()
+        run = registry.start("conv-1", _gated_producer(gate))
+        await run.task
+        run.finished_at -= 1
+
+        assert registry.get("conv-1") is None
+
+    @pytest.mark.asyncio
+    async def test_reserved_run_blocks_second_reservation_until_released(self):
+        registry = RunRegistry()
+
+        run = registry.reserve("conv-1")
+        assert registry.reserve("conv-1") is None
+        subscriber = asyncio.create_task(_collect(run.subscribe()))
+        await registry.release(run)
+
+        assert await subscriber == []
+        assert registry.get("conv-1") is None
+        assert registry.reserve("conv-1") is not None
+
+    @pytest.mark.asyncio
+    async def test_launch_starts_reserved_run(self):
+        registry = RunRegistry()
+        gate = asyncio.Event()
+        gate.set()
+
+        run = registry.reserve("conv-1")
+        registry.launch(run, _gated_producer(gate, count=1))
+        events = await _collect(run.subscribe())
+
+        assert [e.event_type for e in events] == ["content", "done"]
@@ -0,0 +1,198 @@
+"""Tests for point-in-time cursor pagination and aggregations over log search."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.services.core.logs_service import (
+    LogQuery,
+    LogSearchEngine,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.text = str(payload)
+    return response
+
+
+def _hits(*timestamps):
+    return [
+        {"_source": {"@timestamp": ts}, "sort": [ts, index]}
+        for index, ts in enumerate(timestamps)
+    ]
+
+
+def _search(hits, total=None):
+    result = {"pit_id": "pit-1", "hits": {"hits": hits}}
+    if total is not None:
+        result["hits"]["total"] = {"value": total}
+    return _response(result)
+
+
+def _make_engine(*post_responses):
+    engine = LogSearchEngine()
+    client = MagicMock()
+    client.is_closed = False
+    client.post = AsyncMock(side_effect=[_response({"id": "pit-1"}), *post_responses])
+    client.request = AsyncMock()
+    engine._client = client
+    return engine, client
+
+
+def _request(page_size=2):
+    return LogQuery(
+        host="elk.example.com",
+        index_pattern="logs-client-myorg-dev*",
+        authorization="ApiKey abc",
+        source_fields=["@timestamp", "message"],
+        page_size=page_size,
+    )
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor("pit-1", ["t", 3], {"match_all": {}}, 10)
+
+        assert decode_cursor(cursor) == {
+            "pit": "pit-1",
+            "after": ["t", 3],
+            "query": {"match_all": {}},
+            "total": 10,
+        }
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor!")
+
+
+class TestSearchPage:
+    """Test LogSearchEngine.search_page."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_opens_pit_and_returns_cursor(self):
+        engine, client = _make_engine(_search(_hits("a", "b"), total=5))
+
+        page = await engine.search_page(_request())
+
+        assert page.total == 5
+        assert len(page.hits) == 2
+        assert decode_cursor(page.next_cursor)["after"] == ["b", 1]
+        body = client.post.await_args_list[1].kwargs["json"]
+        assert body["pit"]["id"] == "pit-1"
+        assert body["_source"] == ["@timestamp", "message"]
+        assert body["track_total_hits"] is True
+        assert "search_after" not in body
+        client.request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_next_page_uses_search_after_and_closes_pit(self):
+        engine, client = _make_engine()
+        client.post.side_effect = [_search(_hits("c"))]
+        cursor = encode_cursor("pit-1", ["b", 1], {"match_all": {}}, 5)
+
+        page = await engine.search_page(_request(), cursor)
+
+        assert page.total == 5
+        assert page.next_cursor is None
+        body = client.post.await_args.kwargs["json"]
+        assert body["search_after"] == ["b", 1]
+        assert body["track_total_hits"] is False
+        client.request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_api_key_raises_value_error(self):
+        expired = _response({}, status_code=401)
+        expired.text = "API key expired"
+        engine, client = _make_engine()
+        client.post.side_effect = [expired]
+
+        with pytest.raises(ValueError, match="ELK_API_KEY_EXPIRED"):
+            await engine.search_page(_request())
+
+
+class TestIterHits:
+    """Test LogSearchEngine.iter_hits."""
+
+    @pytest.mark.asyncio
+    async def test_streams_all_pages(self):
+        engine, client = _make_engine(
+            _search(_hits("a", "b")), _search(_hits("c", "d")), _search([])
+        )
+
+        hits = [hit async for hit in engine.iter_hits(_request())]
+
+        assert [hit["_source"]["@timestamp"] for hit in hits] == ["a", "b", "c", "d"]
+        assert client.post.await_count == 4
+        client.request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_max_hits_stops_early_and_closes_pit(self):
+        engine, client = _make_engine(_search(_hits("a", "b")))
+
+        hits = [hit async for hit in engine.iter_hits(_request(), max_hits=1)]
+
+        assert len(hits) == 1
+        assert client.post.await_count == 2
+        client.request.assert_awaited_once()
+
+
+class TestAggregate:
+    """Test LogSearchEngine.aggregate."""
+
+    @pytest.mark.asyncio
+    async def test_summarizes_buckets(self):
+        engine = LogSearchEngine()
+        client = MagicMock()
+        client.is_closed = False
+        client.post = AsyncMock(
+            return_value=_response(
+                {
+                    "hits": {"total": {"value": 7}},
+                    "aggregations": {
+                        "over_time": {
+                            "buckets": [
+                                {
+                                    "key_as_string": "2024-12-24T10:00:00Z",
+                                    "doc_count": 7,
+                                    "groups": {
+                                        "buckets": [
+                                            {"key": "INFO", "doc_count": 5},
+                                            {"key": "ERROR", "doc_count": 2},
+                                        ]
+                                    },
+                                }
+                            ]
+                        }
+                    },
+                }
+            )
+        )
+        engine._client = client
+
+        summary = await engine.aggregate(_request(), "level", "1m")
+
+        assert summary == {
+            "total": 7,
+            "buckets": [
+                {
+                    "timestamp": "2024-12-24T10:00:00Z",
+                    "count": 7,
+                    "groups": {"INFO": 5, "ERROR": 2},
+                }
+            ],
+        }
+        body = client.post.await_args.kwargs["json"]
+        assert body["size"] == 0
+        assert body["aggs"]["over_time"]["date_histogram"]["fixed_interval"] == "1m"
+
+    @pytest.mark.asyncio
+    async def test_unknown_group_by_raises(self):
+        with pytest.raises(ValueError, match="Unknown group_by"):
+            await LogSearchEngine().aggregate(_request(), "host")
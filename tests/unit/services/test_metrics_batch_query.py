@@ -0,0 +1,257 @@
+"""Tests for batched Prometheus queries and the step-aligned result cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Import routes first so the routes <-> services import cycle resolves
+import application.routes  # noqa: F401
+from application.services.metrics_service import MetricsService
+from application.services.metrics_service.result_cache import (
+    PrometheusResultCache,
+    align_to_step,
+    parse_duration_seconds,
+    parse_timestamp_seconds,
+)
+
+
+def _matrix(values, metric=None):
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "matrix",
+            "result": [{"metric": metric or {"pod": "a"}, "values": values}],
+        },
+    }
+
+
+def _make_service():
+    config_service = MagicMock()
+    config_service.get_prometheus_config.return_value = MagicMock(
+        host="prometheus.example.com"
+    )
+    service = MetricsService(config_service)
+    service.result_cache = PrometheusResultCache(
+        max_entries=100, instant_ttl_seconds=15, range_ttl_seconds=600
+    )
+    return service
+
+
+class TestParsing:
+    """Test duration and timestamp helpers."""
+
+    def test_parse_duration(self):
+        assert parse_duration_seconds("15s") == 15
+        assert parse_duration_seconds("1m30s") == 90
+        assert parse_duration_seconds("60") == 60
+
+    def test_parse_duration_invalid(self):
+        with pytest.raises(ValueError):
+            parse_duration_seconds("15 parsecs")
+        with pytest.raises(ValueError):
+            parse_duration_seconds("0s")
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp_seconds("1700000000") == 1700000000
+        assert parse_timestamp_seconds("1970-01-01T00:01:00Z") == 60
+
+    def test_align_to_step(self):
+        assert align_to_step(1007, 15) == 1005
+
+
+class TestPrometheusResultCache:
+    """Test instant and range caching behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_instant_query_is_cached(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value={"status": "success", "data": {}})
+
+        first = await cache.get_instant("up", None, fetch)
+        second = await cache.get_instant("up", None, fetch)
+
+        assert first is second
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_instant_errors_are_not_cached(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value={"status": "error"})
+
+        await cache.get_instant("up", None, fetch)
+        await cache.get_instant("up", None, fetch)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_instant_query_timeout_is_part_of_key(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value={"status": "success", "data": {}})
+
+        await cache.get_instant("up", None, fetch, "1s")
+        await cache.get_instant("up", None, fetch, "30s")
+        await cache.get_instant("up", None, fetch, "30s")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_range_is_step_aligned(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value=_matrix([[1005, "1"], [1020, "2"]]))
+
+        result = await cache.get_range("up", "1007", "1033", "15s", fetch)
+
+        fetch.assert_awaited_once_with(1005, 1020)
+        assert result["data"]["result"][0]["values"] == [[1005, "1"], [1020, "2"]]
+
+    @pytest.mark.asyncio
+    async def test_range_refresh_fetches_only_newest_window(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(
+            side_effect=[
+                _matrix([[990, "1"], [1005, "2"], [1020, "3"]]),
+                _matrix([[1020, "3b"], [1035, "4"]]),
+            ]
+        )
+
+        await cache.get_range("up", "990", "1020", "15s", fetch)
+        result = await cache.get_range("up", "1005", "1035", "15s", fetch)
+
+        assert fetch.await_args_list[1].args == (1020, 1035)
+        assert result["data"]["result"][0]["values"] == [
+            [1005, "2"],
+            [1020, "3b"],
+            [1035, "4"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_range_before_cached_window_refetches(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value=_matrix([[1005, "1"]]))
+
+        await cache.get_range("up", "1005", "1005", "15s", fetch)
+        await cache.get_range("up", "900", "1005", "15s", fetch)
+
+        assert fetch.await_args_list[1].args == (900, 1005)
+
+    @pytest.mark.asyncio
+    async def test_range_with_different_step_is_separate(self):
+        cache = PrometheusResultCache(10, 15, 600)
+        fetch = AsyncMock(return_value=_matrix([[960, "1"]]))
+
+        await cache.get_range("up", "960", "960", "15s", fetch)
+        await cache.get_range("up", "960", "960", "1m", fetch)
+
+        assert fetch.await_count == 2
+
+
+class TestQueryPrometheusBatch:
+    """Test MetricsService.query_prometheus_batch."""
+
+    @pytest.mark.asyncio
+    async def test_instant_batch_runs_each_query_type(self):
+        service = _make_service()
+        service.prometheus_ops.query = AsyncMock(
+            return_value={"status": "success", "data": {"result": []}}
+        )
+
+        results = await service.query_prometheus_batch(
+            org_id="myorg",
+            env_name="dev",
+            query_types=["cpu_usage_rate", "memory_usage", "cpu_usage_rate"],
+        )
+
+        assert set(results) == {"cpu_usage_rate", "memory_usage"}
+        assert service.prometheus_ops.query.await_count == 2
+        queries = [
+            call.args[1] for call in service.prometheus_ops.query.await_args_list
+        ]
+        assert all('namespace="client-myorg-dev"' in query for query in queries)
+
+    @pytest.mark.asyncio
+    async def test_batch_isolates_failures(self):
+        service = _make_service()
+
+        async def query(host, query, time=None, timeout=None):
+            if "memory" in query:
+                raise Exception("boom")
+            return {"status": "success", "data": {}}
+
+        service.prometheus_ops.query = query
+
+        results = await service.query_prometheus_batch(
+            org_id="myorg",
+            env_name="dev",
+            query_types=["cpu_usage_rate", "memory_usage"],
+        )
+
+        assert results["cpu_usage_rate"]["status"] == "success"
+        assert results["memory_usage"] == {"status": "error", "error": "boom"}
+
+    @pytest.mark.asyncio
+    async def test_range_batch_uses_range_endpoint(self):
+        service = _make_service()
+        service.prometheus_ops.query_range = AsyncMock(
+            return_value=_matrix([[1005, "1"]])
+        )
+
+        results = await service.query_prometheus_batch(
+            org_id="myorg",
+            env_name="dev",
+            query_types=["pod_count"],
+            start="1005",
+            end="1010",
+        )
+
+        assert results["pod_count"]["data"]["resultType"] == "matrix"
+        service.prometheus_ops.query_range.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_type_raises(self):
+        service = _make_service()
+
+        with pytest.raises(ValueError, match="Invalid query_type"):
+            await service.query_prometheus_batch(
+                org_id="myorg", env_name="dev", query_types=["nope"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_start_without_end_raises(self):
+        service = _make_service()
+
+        with pytest.raises(ValueError, match="together"):
+            await service.query_prometheus_batch(
+                org_id="myorg",
+                env_name="dev",
+                query_types=["pod_count"],
+                start="1000",
+            )
+
+
+class TestQueryPrometheus:
+    """Test MetricsService.query_prometheus."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_instant_query_is_cached(self):
+        service = _make_service()
+        service.prometheus_ops.query = AsyncMock(
+            return_value={"status": "success", "data": {"result": []}}
+        )
+
+        for _ in range(2):
+            result = await service.query_prometheus("up", time="1000", timeout="5s")
+
+        assert result["status"] == "success"
+        service.prometheus_ops.query.assert_awaited_once_with(
+            "prometheus.example.com", "up", "1000", "5s"
+        )
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pooled_client(self):
+        service = _make_service()
+        client = service.prometheus_ops.get_client()
+
+        await service.aclose()
+
+        assert client.is_closed
+        assert service.prometheus_ops._client is None
@@ -0,0 +1,215 @@
+"""Tests for the cached namespace inventory behind environment listings."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from application.services.environment_management import (
+    application_operations,
+    environment_operations,
+)
+from application.services.environment_management.namespace_inventory import (
+    NamespaceInventory,
+    reset_namespace_inventory,
+)
+
+
+def _listing(names, etag=None, resource_version=None):
+    response = MagicMock()
+    data = {"namespaces": [{"name": name, "status": "Active"} for name in names]}
+    if resource_version:
+        data["resourceVersion"] = resource_version
+    response.json.return_value = data
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+def _not_modified():
+    response = MagicMock()
+    response.status_code = 304
+    return httpx.HTTPStatusError("Not Modified", request=MagicMock(), response=response)
+
+
+@pytest.fixture(autouse=True)
+def fresh_inventory():
+    reset_namespace_inventory()
+    yield
+    reset_namespace_inventory()
+
+
+class TestNamespaceInventory:
+    """Test NamespaceInventory refresh and lookups."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_lookup(self):
+        inventory = NamespaceInventory(refresh_seconds=60)
+        client = AsyncMock()
+        client.get.return_value = _listing(
+            ["client-bob-dev", "client-alice-prod", "client-alice-dev", "client-al-x"]
+        )
+
+        matches = await inventory.find_by_prefix(client, "client-alice-")
+
+        assert [ns["name"] for ns in matches] == [
+            "client-alice-dev",
+            "client-alice-prod",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reads_within_refresh_window_use_cache(self):
+        inventory = NamespaceInventory(refresh_seconds=60)
+        client = AsyncMock()
+        client.get.return_value = _listing(["client-alice-dev"])
+
+        await inventory.find_by_prefix(client, "client-alice-")
+        await inventory.find_by_prefix(client, "client-bob-")
+
+        client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_conditional_and_applies_changes(self):
+        inventory = NamespaceInventory(refresh_seconds=0)
+        client = AsyncMock()
+        client.get.side_effect = [
+            _listing(["client-alice-dev", "client-alice-old"], etag='"v1"'),
+            _listing(["client-alice-dev", "client-alice-new"], etag='"v2"'),
+        ]
+
+        await inventory.find_by_prefix(client, "client-alice-")
+        matches = await inventory.find_by_prefix(client, "client-alice-")
+
+        assert [ns["name"] for ns in matches] == [
+            "client-alice-dev",
+            "client-alice-new",
+        ]
+        assert client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_not_modified_keeps_listing(self):
+        inventory = NamespaceInventory(refresh_seconds=0)
+        client = AsyncMock()
+        client.get.side_effect = [
+            _listing(["client-alice-dev"], etag='"v1"'),
+            _not_modified(),
+        ]
+
+        await inventory.find_by_prefix(client, "client-alice-")
+        matches = await inventory.find_by_prefix(client, "client-alice-")
+
+        assert [ns["name"] for ns in matches] == ["client-alice-dev"]
+
+    @pytest.mark.asyncio
+    async def test_resource_version_is_sent_on_refresh(self):
+        inventory = NamespaceInventory(refresh_seconds=0)
+        client = AsyncMock()
+        client.get.side_effect = [
+            _listing(["client-alice-dev"], resource_version="41"),
+            _listing(["client-alice-dev"], resource_version="41"),
+        ]
+
+        await inventory.find_by_prefix(client, "client-alice-")
+        await inventory.find_by_prefix(client, "client-alice-")
+
+        assert client.get.await_args.kwargs["params"] == {"resourceVersion": "41"}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_previous_listing(self):
+        inventory = NamespaceInventory(refresh_seconds=0)
+        client = AsyncMock()
+        client.get.side_effect = [
+            _listing(["client-alice-dev"]),
+            httpx.ConnectError("down"),
+        ]
+
+        await inventory.find_by_prefix(client, "client-alice-")
+        matches = await inventory.find_by_prefix(client, "client-alice-")
+
+        assert [ns["name"] for ns in matches] == ["client-alice-dev"]
+
+    @pytest.mark.asyncio
+    async def test_first_listing_failure_raises(self):
+        inventory = NamespaceInventory(refresh_seconds=60)
+        client = AsyncMock()
+        client.get.side_effect = httpx.ConnectError("down")
+
+        with pytest.raises(httpx.ConnectError):
+            await inventory.find_by_prefix(client, "client-alice-")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_namespace_and_forces_refresh(self):
+        inventory = NamespaceInventory(refresh_seconds=60)
+        client = AsyncMock()
+        client.get.return_value = _listing(
+            ["client-alice-dev", "client-alice-prod"], etag='"v1"'
+        )
+        await inventory.find_by_prefix(client, "client-alice-")
+
+        inventory.invalidate("client-alice-dev")
+        client.get.return_value = _listing(["client-alice-prod"])
+        matches = await inventory.find_by_prefix(client, "client-alice-")
+
+        assert [ns["name"] for ns in matches] == ["client-alice-prod"]
+        assert client.get.await_count == 2
+        assert client.get.await_args.kwargs["headers"] == {}
+
+
+class TestListingOperations:
+    """Test that listing and mutations go through the shared inventory."""
+
+    @pytest.mark.asyncio
+    async def test_list_environments_and_apps_share_one_listing(self):
+        client = AsyncMock()
+        client.get.return_value = _listing(
+            ["client-alice-dev", "client-1-alice-dev-shop", "client-bob-dev"]
+        )
+        with (
+            patch.object(
+                environment_operations,
+                "get_cloud_manager_service",
+                AsyncMock(return_value=client),
+            ),
+            patch.object(
+                application_operations,
+                "get_cloud_manager_service",
+                AsyncMock(return_value=client),
+            ),
+        ):
+            environments = await environment_operations.list_environments("alice")
+            apps = await application_operations.list_user_apps("alice", "dev")
+
+        assert [env["name"] for env in environments] == ["dev"]
+        assert [app["name"] for app in apps] == ["shop"]
+        client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_environment_invalidates(self):
+        client = AsyncMock()
+        client.get.return_value = _listing(["client-alice-dev"])
+        with patch.object(
+            environment_operations,
+            "get_cloud_manager_service",
+            AsyncMock(return_value=client),
+        ):
+            await environment_operations.list_environments("alice")
+            await environment_operations.delete_environment("alice", "dev")
+            client.get.return_value = _listing([])
+            environments = await environment_operations.list_environments("alice")
+
+        assert environments == []
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scale_application_invalidates(self):
+        client = AsyncMock()
+        client.get.return_value = _listing(["client-alice-dev"])
+        with patch.object(
+            environment_operations,
+            "get_cloud_manager_service",
+            AsyncMock(return_value=client),
+        ):
+            await environment_operations.list_environments("alice")
+            await environment_operations.scale_application("alice", "dev", "api", 2)
+            await environment_operations.list_environments("alice")
+
+        assert client.get.await_count == 2
@@ -908,3 +908,52 @@ class TestStreamEventCounterManagement:
 
         assert event_counter == 4, "Should have 4 content events"
         assert response_text == "Hello world from streaming"
+
+
+class TestStreamAgentEvents:
+    """Test the typed event pipeline behind stream_agent_response."""
+
+    @pytest.mark.asyncio
+    async def test_yields_typed_events_and_accumulates_text(self):
+        """Content chunks are typed events and the done event carries the text."""
+        mock_agent = AsyncMock()
+        mock_agent.runner = MagicMock()
+        mock_agent.runner.session_service = AsyncMock()
+        mock_agent.runner.session_service.get_session = AsyncMock(return_value=None)
+        mock_agent._load_session_state = AsyncMock(return_value={})
+        created_session = MagicMock()
+        created_session.state = {"__cyoda_technical_id__": "tech-123"}
+        mock_agent.runner.session_service.create_session = AsyncMock(
+            return_value=created_session
+        )
+
+        async def mock_event_generator():
+            for text in ["Hello ", "typed ", "world"]:
+                part = MagicMock(function_call=None, function_response=None)
+                part.text = text
+                part.partial = True
+                event = MagicMock(author="agent", actions=None)
+                event.content.parts = [part]
+                yield event
+
+        mock_agent.runner.run_async = MagicMock(return_value=mock_event_generator())
+
+        events = [
+            event
+            async for event in StreamingService.stream_agent_events(
+                agent_wrapper=mock_agent,
+                user_message="test",
+                conversation_history=[],
+                conversation_id="conv1",
+                adk_session_id=None,
+                user_id="user1",
+            )
+        ]
+
+        assert all(isinstance(event, StreamEvent) for event in events)
+        content = [e for e in events if e.event_type == "content"]
+        assert [e.data["chunk"] for e in content] == ["Hello ", "typed ", "world"]
+        assert [e.data["accumulated_length"] for e in content] == [6, 12, 17]
+        done = events[-1]
+        assert done.event_type == "done"
+        assert done.data["response"] == "Hello typed world"
@@ -0,0 +1,150 @@
+"""Tests for the structured output response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from application.services.google_adk_service import GoogleADKService
+from application.services.structured_output_cache import (
+    StructuredOutputCache,
+    reset_structured_output_cache,
+)
+
+SCHEMA = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+
+class Entity(BaseModel):
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_structured_output_cache()
+    yield
+    reset_structured_output_cache()
+
+
+def _key(cache, prompt="Create a Pet entity", **overrides):
+    kwargs = {"model": "m", "temperature": 0.0, "schema": SCHEMA, "prompt": prompt}
+    kwargs.update(overrides)
+    return cache.key_for(**kwargs)
+
+
+def _generator(result, tokens=100):
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return dict(result), tokens
+
+    return generate, calls
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_served_from_cache():
+    cache = StructuredOutputCache()
+    generate, calls = _generator({"name": "Pet"})
+
+    first = await cache.get_or_generate(_key(cache), generate)
+    first["name"] = "changed by caller"
+    second = await cache.get_or_generate(
+        _key(cache, prompt="  Create a Pet entity \r\n"), generate
+    )
+
+    assert second == {"name": "Pet"}
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["tokens_saved"]) == (1, 1, 100)
+
+
+def test_key_depends_on_model_temperature_schema_and_content():
+    cache = StructuredOutputCache(any_temperature=True)
+    base = _key(cache)
+
+    assert base != _key(cache, model="other")
+    assert base != _key(cache, temperature=0.2)
+    assert base != _key(cache, schema=Entity)
+    assert base != _key(cache, system_instruction="Be brief")
+    assert base != _key(cache, context=[{"role": "user", "content": "hi"}])
+
+
+def test_nonzero_temperature_bypasses_unless_enabled():
+    assert _key(StructuredOutputCache(), temperature=0.7) is None
+    assert _key(StructuredOutputCache(any_temperature=True), temperature=0.7)
+    assert _key(StructuredOutputCache(enabled=False)) is None
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_call_model_once():
+    cache = StructuredOutputCache()
+    generate, calls = _generator({"name": "Pet"})
+
+    results = await asyncio.gather(
+        *(cache.get_or_generate(_key(cache), generate) for _ in range(3))
+    )
+
+    assert results == [{"name": "Pet"}] * 3
+    assert len(calls) == 1
+    assert cache.stats()["deduplicated"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_waiters_and_is_not_cached():
+    cache = StructuredOutputCache()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("quota exceeded")
+
+    results = await asyncio.gather(
+        cache.get_or_generate(_key(cache), fail),
+        cache.get_or_generate(_key(cache), fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_and_least_recently_used_entries_are_dropped():
+    cache = StructuredOutputCache(max_entries=2, ttl_seconds=60)
+    generate, calls = _generator({"name": "Pet"})
+
+    with patch("application.services.structured_output_cache.time") as clock:
+        clock.monotonic.return_value = 0.0
+        for prompt in ("a", "b", "a", "c"):
+            await cache.get_or_generate(_key(cache, prompt=prompt), generate)
+        # "b" was least recently used when "c" arrived
+        assert cache.stats()["evictions"] == 1
+        await cache.get_or_generate(_key(cache, prompt="a"), generate)
+        assert len(calls) == 3
+
+        clock.monotonic.return_value = 61.0
+        await cache.get_or_generate(_key(cache, prompt="a"), generate)
+        assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_google_service_reuses_deterministic_structured_output():
+    with patch.dict("os.environ", {"GOOGLE_API_KEY": ""}):
+        service = GoogleADKService()
+    response = MagicMock()
+    response.json.return_value = {"name": "Pet"}
+    response.usage_metadata.total_token_count = 250
+    service.client = MagicMock()
+    service.client.aio.models.generate_content = AsyncMock(return_value=response)
+
+    for _ in range(2):
+        result = await service.generate_structured_output(
+            prompt="Create a Pet entity", schema=SCHEMA, temperature=0.0
+        )
+    await service.generate_structured_output(
+        prompt="Create a Pet entity", schema=SCHEMA, temperature=0.7
+    )
+
+    assert result == {"name": "Pet"}
+    assert service.client.aio.models.generate_content.await_count == 2
@@ -72,6 +72,7 @@ class TestUpdateTask:
         task.status = "running"
         task.progress = 50
         task.progress_messages = []
+        task.workflow_cache = {}
         task.started_at = None
         task.completed_at = None
         task.result = None
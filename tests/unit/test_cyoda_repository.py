@@ -3,13 +3,50 @@ Unit tests for CyodaRepository.
 """
 
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from common.repository.cyoda.cyoda_repository import CyodaRepository
+from common.repository.cyoda.cyoda_repository import (
+    CyodaRepository,
+    SearchStrategy,
+)
+
+
+class FakeStreamingResponse:
+    """Minimal streaming httpx response replaying NDJSON rows."""
+
+    def __init__(self, rows: List[Any], status_code: int = 200):
+        self.status_code = status_code
+        self.headers = httpx.Headers({"content-type": "application/x-ndjson"})
+        self.lines = [json.dumps(row) for row in rows]
+        self.lines_read = 0
+
+    async def aiter_lines(self):
+        for line in self.lines:
+            self.lines_read += 1
+            yield line
+
+    async def aread(self) -> bytes:
+        return "\n".join(self.lines).encode()
+
+
+def fake_streaming_request(*responses: FakeStreamingResponse) -> MagicMock:
+    """Patchable stand-in for open_streaming_request serving responses in order."""
+    queue = list(responses)
+    calls = MagicMock()
+
+    @asynccontextmanager
+    async def open_stream(headers, url, method, data=None, timeout=150.0):
+        calls(headers=headers, url=url, method=method, data=data)
+        yield queue.pop(0)
+
+    calls.open_stream = open_stream
+    return calls
 
 
 class MockCyodaAuthService:
@@ -266,19 +303,23 @@ class TestCyodaRepository:
     @pytest.mark.asyncio
     async def test_find_all_by_criteria_success(self, repository, sample_meta):
         """Test finding entities by criteria successfully."""
-        with patch.object(
-            repository, "_send_search_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {
-                "json": [{"name": "Test", "id": "id-1"}],
-                "status": 200,
-            }
-
+        stream = fake_streaming_request(
+            FakeStreamingResponse([{"name": "Test", "id": "id-1"}])
+        )
+        with patch(
+            "common.repository.cyoda.cyoda_repository.open_streaming_request",
+            stream.open_stream,
+        ):
             criteria = {"name": "Test"}
-            result = await repository.find_all_by_criteria(sample_meta, criteria)
+            result = await repository.find_all_by_criteria(
+                sample_meta, criteria, limit=10
+            )
 
             assert len(result) == 1
             assert result[0]["technical_id"] == "id-1"
+            assert stream.call_args.kwargs["url"].endswith(
+                "search/TestEntity/1?limit=10"
+            )
 
     @pytest.mark.asyncio
     async def test_save_success(self, repository, sample_meta, sample_entity_data):
@@ -534,21 +575,23 @@ class TestCyodaRepository:
     @pytest.mark.asyncio
     async def test_find_all_by_criteria_at_time(self, repository, sample_meta):
         """Test finding entities by criteria at specific point in time."""
-        with patch.object(
-            repository, "_send_search_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {
-                "json": [{"name": "Test", "id": "id-1"}],
-                "status": 200,
-            }
-
+        stream = fake_streaming_request(
+            FakeStreamingResponse([{"name": "Test", "id": "id-1"}])
+        )
+        with patch(
+            "common.repository.cyoda.cyoda_repository.open_streaming_request",
+            stream.open_stream,
+        ):
             point_in_time = datetime(2024, 1, 1, 12, 0, 0)
             criteria = {"name": "Test"}
             result = await repository.find_all_by_criteria(
-                sample_meta, criteria, point_in_time
+                sample_meta, criteria, point_in_time, limit=100
             )
 
             assert len(result) == 1
+            assert (
+                "clientPointTime=2024-01-01T12:00:00" in stream.call_args.kwargs["url"]
+            )
 
     # Additional Edge Cases and Error Handling Tests
 
@@ -676,16 +719,17 @@ class TestCyodaRepository:
     @pytest.mark.asyncio
     async def test_find_all_by_criteria_non_200_response(self, repository, sample_meta):
         """Test find_all_by_criteria with non-200 response returns empty list."""
-        with patch.object(
-            repository, "_send_search_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {
-                "json": {"error": "Bad request"},
-                "status": 400,
-            }
-
+        stream = fake_streaming_request(
+            FakeStreamingResponse([{"error": "Bad request"}], status_code=400)
+        )
+        with patch(
+            "common.repository.cyoda.cyoda_repository.open_streaming_request",
+            stream.open_stream,
+        ):
             criteria = {"name": "Test"}
-            result = await repository.find_all_by_criteria(sample_meta, criteria)
+            result = await repository.find_all_by_criteria(
+                sample_meta, criteria, limit=10
+            )
 
             assert result == []
 
@@ -1413,3 +1457,252 @@ class TestCyodaRepository:
 
             # Should return empty list for non-list response
             assert result == []
+
+
+class TestSearchStrategies:
+    """Test direct vs snapshot search selection and paging."""
+
+    @pytest.fixture
+    def repository(self):
+        CyodaRepository._instance = None
+        return CyodaRepository(MockCyodaAuthService())
+
+    @pytest.fixture
+    def meta(self):
+        return {"entity_model": "TestEntity", "entity_version": "1"}
+
+    def test_select_strategy(self):
+        select = CyodaRepository._select_search_strategy
+
+        assert select(100, None) is SearchStrategy.DIRECT
+        assert select(9000, 1000) is SearchStrategy.DIRECT
+        assert select(9000, 1001) is SearchStrategy.SNAPSHOT
+        # No limit: the direct endpoint would cap the rows, so use a snapshot
+        assert select(None, None) is SearchStrategy.SNAPSHOT
+        assert select(None, 50) is SearchStrategy.SNAPSHOT
+
+    @pytest.mark.asyncio
+    async def test_key_lookup_uses_direct_search(self, repository, meta):
+        stream = fake_streaming_request(FakeStreamingResponse([{"id": "id-1"}]))
+        with (
+            patch.object(
+                repository, "_send_search_request", new_callable=AsyncMock
+            ) as mock_create,
+            patch(
+                "common.repository.cyoda.cyoda_repository.open_streaming_request",
+                stream.open_stream,
+            ),
+        ):
+            found = await repository.find_by_key(meta, "id-1")
+
+        assert found["technical_id"] == "id-1"
+        assert stream.call_args.kwargs["url"].endswith("?limit=1")
+        mock_create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unbounded_search_pages_through_snapshot(self, repository, meta):
+        pages = {0: [{"id": "a"}, {"id": "b"}], 1: [{"id": "c"}]}
+
+        async def cyoda_request(cyoda_auth_service, method, path, base_url, **_):
+            if path.endswith("/status"):
+                return {"status": 200, "json": {"snapshotStatus": "SUCCESSFUL"}}
+            page_number = int(path.rsplit("pageNumber=", 1)[1])
+            return {"status": 200, "json": {"content": pages.get(page_number, [])}}
+
+        with (
+            patch.object(
+                repository, "_send_search_request", new_callable=AsyncMock
+            ) as mock_create,
+            patch(
+                "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+                side_effect=cyoda_request,
+            ),
+            patch("common.repository.cyoda.cyoda_repository.SNAPSHOT_PAGE_SIZE", 2),
+        ):
+            mock_create.return_value = {"status": 200, "json": "snap-1"}
+            rows = await repository.find_all_by_criteria(meta, {"name": "x"})
+
+        assert [row["technical_id"] for row in rows] == ["a", "b", "c"]
+        mock_create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_direct_search_applies_offset_and_stops_at_limit(
+        self, repository, meta
+    ):
+        response = FakeStreamingResponse([{"id": f"id-{i}"} for i in range(10)])
+        stream = fake_streaming_request(response)
+        with patch(
+            "common.repository.cyoda.cyoda_repository.open_streaming_request",
+            stream.open_stream,
+        ):
+            result = await repository.find_all_by_criteria(meta, {}, limit=3, offset=2)
+
+        assert [row["technical_id"] for row in result] == ["id-2", "id-3", "id-4"]
+        assert stream.call_args.kwargs["url"].endswith("?limit=5")
+        # Rows past the limit are never parsed
+        assert response.lines_read == 5
+
+    @pytest.mark.asyncio
+    async def test_direct_search_retries_on_401(self, repository, meta):
+        stream = fake_streaming_request(
+            FakeStreamingResponse([], status_code=401),
+            FakeStreamingResponse([{"id": "id-1"}]),
+        )
+        with patch(
+            "common.repository.cyoda.cyoda_repository.open_streaming_request",
+            stream.open_stream,
+        ):
+            result = await repository.find_all_by_criteria(meta, {}, limit=10)
+
+        assert [row["technical_id"] for row in result] == ["id-1"]
+        assert stream.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_beyond_direct_cap_pages_through_snapshot(
+        self, repository, meta
+    ):
+        pages = {
+            0: [{"id": "a"}, {"id": "b"}],
+            1: [{"id": "c"}, {"id": "d"}],
+            2: [{"id": "e"}],
+        }
+
+        async def cyoda_request(cyoda_auth_service, method, path, base_url, **_):
+            if path.endswith("/status"):
+                return {"status": 200, "json": {"snapshotStatus": "SUCCESSFUL"}}
+            page_number = int(path.rsplit("pageNumber=", 1)[1])
+            return {
+                "status": 200,
+                "json": {"content": pages.get(page_number, [])},
+            }
+
+        with (
+            patch.object(
+                repository, "_send_search_request", new_callable=AsyncMock
+            ) as mock_create,
+            patch(
+                "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+                side_effect=cyoda_request,
+            ) as mock_request,
+            patch("common.repository.cyoda.cyoda_repository.SNAPSHOT_PAGE_SIZE", 2),
+            patch("common.repository.cyoda.cyoda_repository.DIRECT_SEARCH_MAX_ROWS", 4),
+        ):
+            mock_create.return_value = {"status": 200, "json": "snap-1"}
+            result = await repository.find_all_by_criteria(
+                meta, {"name": "x"}, limit=100
+            )
+
+        assert [row["technical_id"] for row in result] == ["a", "b", "c", "d", "e"]
+        assert mock_create.await_args.kwargs["path"] == "search/snapshot/TestEntity/1"
+        page_paths = [
+            c.kwargs["path"]
+            for c in mock_request.call_args_list
+            if "pageNumber" in c.kwargs["path"]
+        ]
+        # Prefetch stays bounded: nothing is requested past the short page
+        assert len(page_paths) <= 3 + 2
+
+    @pytest.mark.asyncio
+    async def test_large_offset_starts_at_containing_page(self, repository, meta):
+        requested = []
+
+        async def cyoda_request(cyoda_auth_service, method, path, base_url, **_):
+            if path.endswith("/status"):
+                return {"status": 200, "json": {"snapshotStatus": "SUCCESSFUL"}}
+            page_number = int(path.rsplit("pageNumber=", 1)[1])
+            requested.append(page_number)
+            rows = [{"id": f"{page_number}-{i}"} for i in range(2)]
+            return {
+                "status": 200,
+                "json": {"content": rows, "page": {"totalPages": 10}},
+            }
+
+        with (
+            patch.object(
+                repository, "_send_search_request", new_callable=AsyncMock
+            ) as mock_create,
+            patch(
+                "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+                side_effect=cyoda_request,
+            ),
+            patch("common.repository.cyoda.cyoda_repository.SNAPSHOT_PAGE_SIZE", 2),
+            patch("common.repository.cyoda.cyoda_repository.DIRECT_SEARCH_MAX_ROWS", 4),
+        ):
+            mock_create.return_value = {"status": 200, "json": {"id": "snap-1"}}
+            result = await repository.find_all_by_criteria(meta, {}, limit=3, offset=5)
+
+        assert [row["technical_id"] for row in result] == ["2-1", "3-0", "3-1"]
+        assert min(requested) == 2
+
+    @pytest.mark.asyncio
+    async def test_snapshot_creation_failure_falls_back_to_direct(
+        self, repository, meta
+    ):
+        stream = fake_streaming_request(FakeStreamingResponse([{"id": "id-1"}]))
+        with (
+            patch.object(
+                repository, "_send_search_request", new_callable=AsyncMock
+            ) as mock_create,
+            patch(
+                "common.repository.cyoda.cyoda_repository.open_streaming_request",
+                stream.open_stream,
+            ),
+            patch("common.repository.cyoda.cyoda_repository.DIRECT_SEARCH_MAX_ROWS", 4),
+        ):
+            mock_create.return_value = {"status": 404, "json": {}}
+            result = await repository.find_all_by_criteria(meta, {}, limit=100)
+
+        assert [row["technical_id"] for row in result] == ["id-1"]
+        assert stream.call_args.kwargs["url"].endswith("?limit=4")
+
+    @pytest.mark.asyncio
+    async def test_status_polling_backs_off(self, repository):
+        statuses = iter(["RUNNING", "RUNNING", "RUNNING", "SUCCESSFUL"])
+
+        async def cyoda_request(**_):
+            return {"status": 200, "json": {"snapshotStatus": next(statuses)}}
+
+        with (
+            patch(
+                "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+                side_effect=cyoda_request,
+            ),
+            patch(
+                "common.repository.cyoda.cyoda_repository.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            await repository._wait_for_search_completion(
+                "snap-1", interval=0.1, max_interval=0.3
+            )
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.1, 0.2, 0.3]
+
+
+class TestStreamingClient:
+    """Test the pooled client behind open_streaming_request."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_requests_share_one_client(self):
+        from common.utils import utils
+
+        await utils.close_streaming_client()
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json=[{"id": "id-1"}])
+        )
+        real_client = httpx.AsyncClient
+
+        with patch.object(
+            utils.httpx,
+            "AsyncClient",
+            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+        ) as client_factory:
+            for _ in range(2):
+                async with utils.open_streaming_request(
+                    {}, "http://cyoda.test/search/TestEntity/1", "post", "{}"
+                ) as response:
+                    rows = [row async for row in utils.iter_json_rows(response)]
+
+        assert rows == [{"id": "id-1"}]
+        assert client_factory.call_count == 1
+        await utils.close_streaming_client()
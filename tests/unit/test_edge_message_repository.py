@@ -134,6 +134,21 @@ class TestEdgeMessageRepository:
             assert result.content == '{"message": "Hello"}'
             mock_request.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_message_by_id_uses_configured_api_url(self, auth_service):
+        """Test that a repository created with api_url sends requests there."""
+        EdgeMessageRepository._instance = None
+        repository = EdgeMessageRepository(auth_service, api_url="http://local/api")
+        with patch(
+            "common.repository.cyoda.edge_message_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.return_value = {"json": {}, "status": 404}
+
+            await repository.get_message_by_id("msg-123")
+
+            assert mock_request.call_args.kwargs["base_url"] == "http://local/api"
+        EdgeMessageRepository._instance = None
+
     @pytest.mark.asyncio
     async def test_get_message_by_id_not_found(self, repository):
         """Test getting message by ID when not found."""
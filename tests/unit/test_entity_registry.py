@@ -0,0 +1,122 @@
+"""
+Unit tests for the entity class registry.
+"""
+
+from typing import Any, ClassVar, Dict, List, Optional
+
+import pytest
+from pydantic import Field
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.entity.entity_casting import cast_entity
+from common.entity.entity_registry import EntityRegistry, encode_entity
+
+
+class OrderEntity(CyodaEntity):
+    """Test entity registered by model key."""
+
+    ENTITY_NAME: ClassVar[str] = "Order"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    amount: int
+    items: List[str] = []
+
+
+class OrderEntityV2(OrderEntity):
+    """Second version of the test entity."""
+
+    ENTITY_VERSION: ClassVar[int] = 2
+
+    currency: str = "EUR"
+
+
+class AccountEntity(CyodaEntity):
+    """Test entity whose payload uses camelCase aliases."""
+
+    ENTITY_NAME: ClassVar[str] = "Account"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    is_active: bool = Field(default=True, alias="isActive")
+    processed_data: Optional[Dict[str, Any]] = Field(
+        default=None, alias="processedData"
+    )
+    owner_name: Optional[str] = Field(default=None, alias="ownerName")
+
+
+@pytest.fixture
+def registry():
+    registry = EntityRegistry()
+    registry.register(OrderEntity)
+    registry.register(OrderEntityV2)
+    registry.register(AccountEntity)
+    return registry
+
+
+class TestEntityRegistry:
+    """Test suite for EntityRegistry."""
+
+    def test_resolve_by_model_key(self, registry):
+        """Model keys resolve case-insensitively, by version or to the latest."""
+        assert registry.resolve("order", 1) is OrderEntity
+        assert registry.resolve("ORDER", "2") is OrderEntityV2
+        assert registry.resolve("Order") is OrderEntityV2
+        assert registry.resolve("Unknown", 1) is CyodaEntity
+
+    def test_decode_into_concrete_type(self, registry):
+        """Payloads are validated once, into the registered class."""
+        entity = registry.decode("Order", {"amount": "5"}, 1)
+
+        assert type(entity) is OrderEntity
+        assert entity.amount == 5
+        assert cast_entity(entity, OrderEntity) is entity
+
+    def test_decode_mismatch_falls_back_to_generic(self, registry):
+        """Payloads not matching the schema decode as a generic CyodaEntity."""
+        entity = registry.decode("Order", {"title": "no amount"}, 1)
+
+        assert type(entity) is CyodaEntity
+        assert entity.title == "no amount"
+
+    def test_discover_registers_module_entities(self):
+        """Discovery registers classes declaring ENTITY_NAME."""
+        registry = EntityRegistry()
+        registry.discover(["example_application.entity", "missing.module"])
+
+        assert registry.resolve("ExampleEntity", 1).__name__ == "ExampleEntity"
+        assert registry.resolve("otherentity", 1).__name__ == "OtherEntity"
+
+
+class TestEncodeEntity:
+    """Test suite for encode_entity."""
+
+    def test_only_changed_fields_are_serialized(self, registry):
+        """Generated defaults are skipped; assigned fields are written back."""
+        raw = {"amount": 5, "items": ["a"], "extra": {"k": 1}}
+        entity = registry.decode("Order", raw, 1)
+
+        entity.items.append("b")
+        entity.technical_id = "tech-1"
+        entity.add_metadata("current_transition", "approve")
+        data = encode_entity(entity, raw)
+
+        assert data["amount"] == 5
+        assert data["extra"] is raw["extra"]
+        assert data["items"] == ["a", "b"]
+        assert data["technical_id"] == "tech-1"
+        assert data["metadata"] == {"current_transition": "approve"}
+        assert "entity_id" not in data and "created_at" not in data
+        assert raw == {"amount": 5, "items": ["a"], "extra": {"k": 1}}
+
+    def test_aliased_fields_keep_payload_keys(self, registry):
+        """Changed aliased fields overwrite the payload key, not add a twin."""
+        raw = {"isActive": True, "processedData": {"old": 1}, "owner_name": "Ann"}
+        entity = registry.decode("Account", raw, 1)
+
+        entity.processed_data = {"new": 2}
+        entity.owner_name = "Bob"
+        data = encode_entity(entity, raw)
+
+        assert data["processedData"] == {"new": 2}
+        assert data["isActive"] is True
+        assert data["owner_name"] == "Bob"
+        assert not {"processed_data", "is_active", "ownerName"} & data.keys()
@@ -3,11 +3,13 @@ Unit tests for gRPC calc and criteria_calc handlers.
 """
 
 import json
-from unittest.mock import AsyncMock, Mock
+from typing import ClassVar
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from common.entity.cyoda_entity import CyodaEntity
+from common.entity.entity_registry import EntityRegistry
 from common.exception.grpc_exceptions import (
     HandlerError,
     ProcessingError,
@@ -33,6 +35,7 @@ class TestCalcRequestHandler:
         """Create mock processor manager."""
         manager = Mock()
         manager.process_entity = AsyncMock()
+        manager.accepts_raw_data = Mock(return_value=False)
         return manager
 
     @pytest.fixture
@@ -178,6 +181,58 @@ class TestCalcRequestHandler:
         assert error.entity_id == "entity-456"
         assert "Processing failed" in str(error)
 
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_decodes_registered_entity(
+        self, handler, services, processor_manager, calc_event
+    ):
+        """Test calc request decoded into the class registered for its model key."""
+
+        class TestEntity(CyodaEntity):
+            ENTITY_NAME: ClassVar[str] = "TestEntity"
+            ENTITY_VERSION: ClassVar[int] = 1
+
+            name: str
+            value: int
+
+        registry = EntityRegistry()
+        registry.register(TestEntity)
+
+        async def process_entity(processor_name, entity):
+            assert type(entity) is TestEntity
+            entity.value = 100
+            return entity
+
+        processor_manager.process_entity = process_entity
+
+        with patch(
+            "common.grpc_client.handlers.calc.get_entity_registry",
+            return_value=registry,
+        ):
+            result = await handler.handle(calc_event, services)
+
+        payload_data = result.data["payload"]["data"]
+        assert payload_data["value"] == 100
+        assert payload_data["technical_id"] == "entity-456"
+        assert "entity_id" not in payload_data
+
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_raw_data_processor(
+        self, handler, services, processor_manager, calc_event
+    ):
+        """Test calc request for a processor that accepts raw dicts."""
+        processor_manager.accepts_raw_data.return_value = True
+
+        async def process_entity(processor_name, entity, **kwargs):
+            assert entity == {"name": "Test", "value": 42}
+            assert kwargs["technical_id"] == "entity-456"
+            return {**entity, "value": 7}
+
+        processor_manager.process_entity = process_entity
+
+        result = await handler.handle(calc_event, services)
+
+        assert result.data["payload"]["data"] == {"name": "Test", "value": 7}
+
 
 class TestCriteriaCalcRequestHandler:
     """Test suite for CriteriaCalcRequestHandler."""
@@ -0,0 +1,117 @@
+"""Tests for cached processor/criteria discovery."""
+
+import importlib
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+from common.processor.manager import ProcessorManager
+from common.processor.manifest import DiscoveryManifest, package_fingerprint
+
+PROCESSOR_SOURCE = textwrap.dedent(
+    """
+    from common.processor.base import CyodaProcessor
+
+
+    class ManifestProcessor(CyodaProcessor):
+        def __init__(self):
+            super().__init__(name="ManifestProcessor")
+
+        async def process(self, entity, **kwargs):
+            return entity
+    """
+)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """A throwaway package with one processor module and one helper module."""
+    root = tmp_path / "manifest_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "processors.py").write_text(PROCESSOR_SOURCE)
+    (root / "helpers.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for name in [m for m in sys.modules if m.startswith("manifest_pkg")]:
+        del sys.modules[name]
+
+
+def _forget_submodules():
+    for name in ("manifest_pkg.processors", "manifest_pkg.helpers"):
+        sys.modules.pop(name, None)
+
+
+def test_first_discovery_writes_manifest(package, tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+
+    manager = ProcessorManager(["manifest_pkg"], manifest_path=str(manifest_path))
+
+    assert manager.list_processors() == ["ManifestProcessor"]
+    data = json.loads(manifest_path.read_text())
+    assert data["packages"]["manifest_pkg"]["classes"] == [
+        "manifest_pkg.processors:ManifestProcessor"
+    ]
+
+
+def test_cached_discovery_skips_unrelated_modules(package, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    ProcessorManager(["manifest_pkg"], manifest_path=manifest_path)
+    _forget_submodules()
+
+    manager = ProcessorManager(["manifest_pkg"], manifest_path=manifest_path)
+
+    assert manager.list_processors() == ["ManifestProcessor"]
+    assert "manifest_pkg.processors" in sys.modules
+    assert "manifest_pkg.helpers" not in sys.modules
+
+
+def test_changed_package_is_walked_again(package, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    ProcessorManager(["manifest_pkg"], manifest_path=manifest_path)
+    (package / "more.py").write_text(
+        PROCESSOR_SOURCE.replace("ManifestProcessor", "OtherProcessor")
+    )
+    _forget_submodules()
+
+    manager = ProcessorManager(["manifest_pkg"], manifest_path=manifest_path)
+
+    assert sorted(manager.list_processors()) == [
+        "ManifestProcessor",
+        "OtherProcessor",
+    ]
+    assert "manifest_pkg.helpers" in sys.modules
+
+
+def test_stale_entry_falls_back_to_walk(package, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    manifest = DiscoveryManifest(manifest_path)
+    fingerprint = package_fingerprint(importlib.import_module("manifest_pkg"))
+    manifest.store("manifest_pkg", fingerprint, ["manifest_pkg.gone:Missing"])
+    manifest.save()
+
+    manager = ProcessorManager(["manifest_pkg"], manifest_path=manifest_path)
+
+    assert manager.list_processors() == ["ManifestProcessor"]
+    assert DiscoveryManifest(manifest_path).lookup("manifest_pkg", fingerprint) == [
+        "manifest_pkg.processors:ManifestProcessor"
+    ]
+
+
+def test_unreadable_manifest_is_ignored(package, tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{not json")
+
+    manager = ProcessorManager(["manifest_pkg"], manifest_path=str(manifest_path))
+
+    assert manager.list_processors() == ["ManifestProcessor"]
+    assert json.loads(manifest_path.read_text())["version"] == 1
+
+
+def test_manager_without_manifest_writes_nothing(package, tmp_path):
+    ProcessorManager(["manifest_pkg"])
+
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".json")]
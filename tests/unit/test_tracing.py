@@ -0,0 +1,131 @@
+"""
+Unit tests for tracing spans on the Cyoda request path.
+"""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from common.performance import tracing
+from common.performance.tracing import (
+    configure_tracing,
+    log_payload,
+    reset_tracing,
+    traced,
+    traced_method,
+)
+from common.repository.cyoda.cyoda_repository import CyodaRepository
+from common.utils.utils import send_cyoda_request
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter=exporter, sample_ratio=1.0)
+    yield exporter
+    reset_tracing()
+
+
+class _Auth:
+    async def get_access_token(self):
+        return "token"
+
+    def invalidate_tokens(self):
+        pass
+
+
+class TestDisabled:
+    """Test instrumentation is inert until tracing is configured."""
+
+    @pytest.mark.asyncio
+    async def test_spans_are_not_recorded(self):
+        @traced_method("test.op")
+        async def op():
+            return [1, 2]
+
+        with traced("block") as span:
+            assert span.is_recording() is False
+
+        assert await op() == [1, 2]
+        assert tracing.tracing_enabled() is False
+
+    def test_payload_is_not_built_unless_enabled(self):
+        payload = MagicMock(return_value="body")
+
+        log_payload(logging.getLogger("test"), "body", payload)
+
+        payload.assert_not_called()
+
+    def test_payload_is_logged_when_enabled(self, caplog):
+        log = logging.getLogger("test.payload")
+        with patch.object(tracing, "LOG_CYODA_PAYLOADS", True):
+            with caplog.at_level(logging.DEBUG, logger="test.payload"):
+                log_payload(log, "POST body", lambda: '{"a": 1}')
+
+        assert 'POST body: {"a": 1}' in caplog.text
+
+
+class TestSpans:
+    """Test spans and attributes recorded with an in-memory exporter."""
+
+    @pytest.mark.asyncio
+    async def test_cyoda_request_records_status_and_attempts(self, exporter):
+        with patch(
+            "common.utils.utils.send_get_request",
+            new_callable=AsyncMock,
+            side_effect=[{"status": 401}, {"status": 200, "json": {}}],
+        ):
+            await send_cyoda_request(_Auth(), "get", "entity/1", base_url="http://x")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "cyoda.request"
+        assert span.attributes["cyoda.path"] == "entity/1"
+        assert span.attributes["cyoda.attempts"] == 2
+        assert span.attributes["http.status_code"] == 200
+
+    @pytest.mark.asyncio
+    async def test_repository_method_records_entity_and_count(self, exporter):
+        CyodaRepository._instance = None
+        repository = CyodaRepository(_Auth())
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+            new_callable=AsyncMock,
+            return_value={"status": 200, "json": [{"id": "a"}, {"id": "b"}]},
+        ):
+            await repository.find_all({"entity_model": "Order", "entity_version": 1})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "cyoda.repository.find_all"
+        assert span.attributes["entity.class"] == "Order"
+        assert span.attributes["result.count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_nested_spans_and_errors(self, exporter):
+        @traced_method("outer")
+        async def outer(entity_class):
+            with traced("inner", {"step": 1}):
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await outer(entity_class="Chat")
+
+        inner, outer_span = exporter.get_finished_spans()
+        assert inner.parent.span_id == outer_span.context.span_id
+        assert outer_span.attributes["entity.class"] == "Chat"
+        assert not outer_span.status.is_ok
+        assert outer_span.events[0].name == "exception"
+
+    def test_sampling_ratio_zero_drops_root_spans(self):
+        exporter = InMemorySpanExporter()
+        configure_tracing(exporter=exporter, sample_ratio=0.0)
+        try:
+            with traced("dropped") as span:
+                assert span.is_recording() is False
+        finally:
+            reset_tracing()
+
+        assert exporter.get_finished_spans() == ()